@@ -0,0 +1,13 @@
+@echo off
+echo ===============================================
+echo    Combined Share Price and Shares Extractor
+echo ===============================================
+echo.
+echo Extracting share prices and outstanding shares in one pass...
+python combined_updater.py
+echo.
+echo ===============================================
+echo All data extraction completed!
+echo Results saved to: data/Custodians_Results.xlsx
+echo ===============================================
+pause
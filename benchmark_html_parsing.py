@@ -0,0 +1,78 @@
+"""
+Benchmark the HTML parse layer (src.html_parsing) on the saved pages in html_debug/.
+
+For every page it times:
+  - html.parser: one BeautifulSoup(html, "html.parser") per consumer, as the
+    extractors used to do
+  - each available backend: a single parse_html() shared by all consumers
+
+Usage:
+    python benchmark_html_parsing.py [--consumers 3] [--repeat 3] [--dir html_debug]
+"""
+
+import argparse
+import glob
+import os
+import time
+
+from bs4 import BeautifulSoup
+
+from src.html_parsing import available_parsers, clear_cache, page_text, parse_html
+
+
+def time_call(func, repeat):
+    """Best wall time of repeat calls in seconds."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def per_consumer_parse(html, consumers):
+    for _ in range(consumers):
+        BeautifulSoup(html, "html.parser").get_text()
+
+
+def shared_parse(html, consumers, parser):
+    clear_cache()
+    for _ in range(consumers):
+        page_text(parse_html(html, parser))
+
+
+def main(directory="html_debug", consumers=3, repeat=3):
+    files = sorted(glob.glob(os.path.join(directory, "*.html")))
+    if not files:
+        print(f"No .html files in {directory}")
+        return
+
+    parsers = available_parsers()
+    columns = ["html.parser x%d" % consumers] + [f"{name} shared" for name in parsers]
+    print(f"{'file':45} {'KB':>6} " + " ".join(f"{column:>18}" for column in columns))
+
+    totals = [0.0] * len(columns)
+    for path in files:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            html = f.read()
+        timings = [time_call(lambda: per_consumer_parse(html, consumers), repeat)]
+        timings += [time_call(lambda: shared_parse(html, consumers, name), repeat) for name in parsers]
+        totals = [total + timing for total, timing in zip(totals, timings)]
+        print(f"{os.path.basename(path)[:45]:45} {len(html) // 1024:6d} "
+              + " ".join(f"{timing * 1000:16.0f}ms" for timing in timings))
+
+    print(f"{'TOTAL':45} {'':6} " + " ".join(f"{total * 1000:16.0f}ms" for total in totals))
+    for column, total in zip(columns[1:], totals[1:]):
+        print(f"{column}: {totals[0] / total:.1f}x faster than html.parser x{consumers}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark HTML parsing on saved pages")
+    parser.add_argument("--dir", default="html_debug", help="Directory with saved .html pages (default: html_debug)")
+    parser.add_argument("--consumers", type=int, default=3,
+                        help="Extraction tiers reading the same page (default: 3)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing runs per file, best is kept (default: 3)")
+    args = parser.parse_args()
+
+    main(directory=args.dir, consumers=args.consumers, repeat=args.repeat)
@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+from src.bf_salt import SALT_PROVIDER, is_rejected
+
+
 class BF4PyConnector():
     def __init__(self, salt: str=None):
-        import requests, re
+        import requests
         
         self.session = requests.Session()
         
@@ -11,72 +14,11 @@ class BF4PyConnector():
                                      'origin': 'https://www.boerse-frankfurt.de',
                                      'referer': 'https://www.boerse-frankfurt.de/',})
         
-        if salt is None:
-            # Step 1: Get Homepage
-            response = self.session.get('https://www.boerse-frankfurt.de/')
-            if response.status_code != 200:
-                raise Exception('Could not connect to boerse-frankfurt.de homepage (status code: {})'.format(response.status_code))
-            
-            homepage_html = response.text
-
-            # Step 2: Find all local JS file URLs mentioned in script tags
-            # Regex looks for <script ... src="/path/to/file.js" ...> or src='/path/to/file.js'
-            # It also handles potential query strings like /main.123.js?v=4
-            js_file_paths = re.findall(r'<script[^>]+src\\s*=\\s*["\'](/[^"\']+\\.js(?:\\?[^"\']*)?)["\']', homepage_html)
-
-            if not js_file_paths:
-                # Fallback: Sometimes script tags might be relative without leading slash but still local.
-                # This is less common for main bundles but good to have a slightly broader search if the first fails.
-                # However, the original bf4py and our attempts focused on paths starting with '/', let's stick to that for now
-                # to avoid fetching external scripts unintentionally if the regex is too broad.
-                # If the above strictly local path fails, this is a critical point.
-                raise Exception('Could not find any local JS file references (starting with /) in homepage HTML')
-
-            found_salt = None
-            # print(f"BF4PY_DEBUG: Found {len(js_file_paths)} potential JS files: {js_file_paths}")
-
-            for js_path in js_file_paths:
-                # Construct full URL for the JS file
-                if js_path.startswith('//'): # schemaless URL
-                    js_url = 'https:' + js_path
-                elif js_path.startswith('/'): # Expected case
-                    js_url = 'https://www.boerse-frankfurt.de' + js_path
-                else:
-                    # This case should ideally not be hit with the current regex focusing on paths starting with '/'
-                    # print(f"BF4PY_DEBUG: Skipping JS path with unexpected format: {js_path}")
-                    continue 
-
-                try:
-                    # print(f"BF4PY_DEBUG: Trying JS file: {js_url}")
-                    js_response = self.session.get(js_url, timeout=10) # Timeout for fetching each JS file
-                    if js_response.status_code == 200:
-                        js_content = js_response.text
-                        # Look for salt:"..." or salt:'...' or salt : "..." etc.
-                        salt_match = re.search(r'salt\\s*:\\s*["\'](\\w+)["\']', js_content) 
-                        if salt_match:
-                            found_salt = salt_match.group(1)
-                            # print(f"BF4PY_DEBUG: Found salt '{found_salt}' in {js_url}")
-                            break # Salt found, exit loop
-                        # else:
-                            # print(f"BF4PY_DEBUG: Salt pattern not found in {js_url}")
-                    # else:
-                        # print(f"BF4PY_DEBUG: Failed to fetch {js_url}, status: {js_response.status_code}")
-                except requests.exceptions.RequestException as e:
-                    # print(f"BF4PY_DEBUG: RequestException for {js_url}: {e}")
-                    continue # Try next JS file if one fails to download
-
-            if found_salt:
-                self.salt = found_salt
-            else:
-                # More detailed error if salt is not found after checking all candidates
-                error_message = 'Could not find tracing-salt in any of the {} linked JS files checked. '.format(len(js_file_paths))
-                if not js_file_paths: # Should be caught earlier, but as a safeguard
-                    error_message = 'No JS files were identified to search for salt. '
-                # Consider logging the paths checked if this error persists, for manual inspection.
-                # For now, keeping the exception message concise.
-                raise Exception(error_message + 'The website structure for salt extraction might have changed.')
-        else:
-            self.salt = salt
+        # Without an explicit salt the shared provider is used: it keeps the salt
+        # on disk (see src/bf_salt.py), so a connector no longer downloads the
+        # homepage and its JS bundles every time it is created
+        self._shared_salt = salt is None
+        self.salt = SALT_PROVIDER.get(self.session) if salt is None else salt
    
     def __del__(self):
         self.session.close()
@@ -100,6 +42,20 @@ class BF4PyConnector():
     
     
     
+    def _json_headers(self, url):
+        header = self._create_ids(url)
+        header['accept'] = 'application/json, text/plain, */*'
+        return header
+    
+    def _send(self, request):
+        """Send a request; if the API rejects the shared salt, rediscover it and retry once."""
+        response = request()
+        if self._shared_salt and is_rejected(response):
+            SALT_PROVIDER.invalidate(self.salt)
+            self.salt = SALT_PROVIDER.get(self.session)
+            response = request()
+        return response
+    
     def _get_data_url(self, function: str, params:dict):
         import urllib
         baseurl = "https://api.boerse-frankfurt.de/v1/data/"
@@ -111,9 +67,7 @@ class BF4PyConnector():
         import json
         
         url = self._get_data_url(function, params)
-        header = self._create_ids(url)
-        header['accept'] = 'application/json, text/plain, */*'
-        req = self.session.get(url, headers=header, timeout=(3.5, 15))
+        req = self._send(lambda: self.session.get(url, headers=self._json_headers(url), timeout=(3.5, 15)))
         
         if req.text is None:
             raise Exception('Boerse Frankfurt returned no data, check parameters, especially period!')
@@ -135,10 +89,13 @@ class BF4PyConnector():
         import json
         
         url = self._get_search_url(function, {})
-        header = self._create_ids(url)
-        header['accept'] = 'application/json, text/plain, */*'
-        header['content-type'] = 'application/json; charset=UTF-8'
-        req = self.session.post(url, headers=header, timeout=(3.5, 15), json=params)
+        
+        def post():
+            header = self._json_headers(url)
+            header['content-type'] = 'application/json; charset=UTF-8'
+            return self.session.post(url, headers=header, timeout=(3.5, 15), json=params)
+        
+        req = self._send(post)
         data = json.loads(req.text)
         
         return data
@@ -0,0 +1,380 @@
+"""
+Combined share price and outstanding shares updater.
+
+excel_stock_updater.py (column L) and outstanding_shares_updater.py (column M)
+read the same column P URLs, so running them back to back renders every page
+twice and loads/saves the workbook twice. This script visits each URL once:
+the price extraction loads the page, the outstanding-shares tiers run on the
+same render, and both columns are written in a single workbook session.
+"""
+
+import itertools
+import logging
+import shutil
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from openpyxl import load_workbook
+
+import excel_stock_updater
+from excel_stock_updater import (
+    PRICE_KEYWORDS,
+    cache_price_result,
+    choose_price_output,
+    close_vaneck_driver,
+    create_price_driver,
+    fetch_and_extract_data,
+    is_blue_cell,
+    is_valid_share_price,
+    preserve_cell_color_and_set_value,
+)
+from outstanding_shares_updater import (
+    current_driver_url,
+    find_processable_rows_and_get_urls,
+    process_shares_row,
+    shares_cell_value,
+)
+from src.domain_scheduler import DEFAULT_MAX_IN_FLIGHT, DEFAULT_MIN_INTERVAL, registrable_domain
+from src.driver_factory import resolve_chromedriver
+from src.driver_manager import DEFAULT_MAX_PAGES, DEFAULT_MAX_RSS_MB
+from src.page_snapshot import capture_snapshot
+from src.parallel_runner import run_rows
+from src.result_cache import DEFAULT_SHARES_TTL, ResultCache
+from src.run_journal import RunJournal
+from src.tab_pool import TabBrowser
+from src.workbook_writer import WorkbookWriter, timestamped_alt_path
+
+ORIGINAL_WORKBOOK_PATH = "data/Custodians.xlsx"
+WORKBOOK_PATH = "data/Custodians_Results.xlsx"
+SHEET_NAME = "Non-derivative exposures"
+PRICE_COL = "L"
+SHARES_COL = "M"
+URL_COL = "P"
+
+
+def process_combined_row(driver, row, url, fallback_url=None):
+    """
+    Extract the share price and outstanding shares for one row from a single page load.
+
+    Returns:
+        dict with "price" (fetch_and_extract_data result), "shares" (shares
+        result) and "shares_url" (URL the shares came from)
+    """
+    if url.lower().endswith(".pdf"):
+        # The price updater skips PDFs; the shares tiers still get a chance
+        shares_data, shares_url = process_shares_row(driver, row, url, fallback_url)
+        return {"price": {"error": "PDF file - cannot process"}, "shares": shares_data, "shares_url": shares_url}
+
+    previous_url = current_driver_url(driver)
+    try:
+        price_data = fetch_and_extract_data(driver, url, PRICE_KEYWORDS)
+    except Exception as e:
+        logging.error(f"Row {row}: price extraction failed for {url}: {e}", exc_info=True)
+        price_data = {"error": str(e)}
+
+    # Whatever the price extractors rendered is handed to the shares tiers; if the
+    # price came from the HTTP tier nothing was rendered and the shares tiers load it
+    snapshot = capture_snapshot(driver, url, previous_url)
+    if snapshot is not None:
+        logging.info(f"Row {row}: reusing rendered page for outstanding shares")
+    shares_data, shares_url = process_shares_row(driver, row, url, fallback_url, snapshot=snapshot)
+    return {"price": price_data, "shares": shares_data, "shares_url": shares_url}
+
+
+def main(workers=1, max_per_domain=DEFAULT_MAX_IN_FLIGHT, domain_delay=DEFAULT_MIN_INTERVAL,
+         page_load_strategy="normal", max_pages_per_browser=DEFAULT_MAX_PAGES,
+         max_browser_rss_mb=DEFAULT_MAX_RSS_MB, resume=False, vaneck_headless=None, tabs=1, prefetch=False,
+         refresh=False, shares_ttl=DEFAULT_SHARES_TTL):
+    """
+    Update share prices (column L) and outstanding shares (column M) in one pass.
+
+    Args:
+        workers: number of parallel browser workers (1 = serial run)
+        max_per_domain: max rows in flight per registrable domain
+        domain_delay: minimum seconds between requests to the same domain
+        page_load_strategy: Chrome page load strategy for the workers ("normal" or "eager")
+        max_pages_per_browser: rows served by one browser session before it is recycled
+        max_browser_rss_mb: browser memory (MB) above which the session is recycled
+        resume: skip rows already journaled by an unfinished previous run
+        vaneck_headless: run the shared VanEck browser with --headless=new (True),
+                         visibly (False) or decide from the display (None)
+        tabs: run this many rows at once as tabs of a single browser instead of
+              one browser per worker (replaces workers when above 1)
+        prefetch: give each tab a spare tab that starts loading the next row while
+                  the current one is extracted (implies tab mode)
+        refresh: fetch every row even if the result cache holds its price and shares
+        shares_ttl: how long cached outstanding shares are reused (timedelta)
+    """
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    excel_stock_updater.VANECK_HEADLESS = vaneck_headless
+
+    shutil.copy2(ORIGINAL_WORKBOOK_PATH, WORKBOOK_PATH)
+    logging.info(f"Copied {ORIGINAL_WORKBOOK_PATH} to {WORKBOOK_PATH}")
+
+    try:
+        wb = load_workbook(WORKBOOK_PATH)
+        ws = wb[SHEET_NAME]
+    except Exception as e:
+        logging.error(f"Error loading workbook: {e}")
+        return
+
+    rows_urls, fallback_urls = find_processable_rows_and_get_urls(ws, URL_COL)
+    if not rows_urls:
+        logging.info("No URLs found to process.")
+        return
+
+    stats = {
+        "processed": 0,
+        "price_ok": 0,
+        "shares_ok": 0,
+        "invalid_prices": 0,
+    }
+    price_error_domains = defaultdict(int)
+    shares_error_domains = defaultdict(int)
+    browser_stats = []
+    start = time.monotonic()
+
+    # Every finished row is journaled so a crashed run can be resumed
+    journal = RunJournal.open("combined_updater", resume=resume)
+    resumed_rows = journal.completed(rows_urls)
+    fetch_rows = dict(rows_urls)
+    for row, _, _ in resumed_rows:
+        del fetch_rows[row]
+    if resumed_rows:
+        logging.info(f"Skipping {len(resumed_rows)} rows already done by the interrupted run")
+
+    # A row is only skipped if both its price and its outstanding shares are still cached
+    result_cache = ResultCache(shares_ttl=shares_ttl)
+    cached_rows = []
+    for row, url in ([] if refresh else sorted(fetch_rows.items())):
+        price = result_cache.get("price", url)
+        shares = result_cache.get("shares", url)
+        if price is not None and shares is not None:
+            cached_rows.append((row, url, {"price": price, "shares": shares[0], "shares_url": shares[1]}))
+            del fetch_rows[row]
+    if cached_rows:
+        logging.info(f"Skipping {len(cached_rows)} rows whose cached price and shares have not expired")
+
+    def process_row(driver, row, url):
+        logging.info(f"Row {row}: {url}")
+        return process_combined_row(driver, row, url, fallback_urls.get(row))
+
+    # Blue cells are read up front: once the writer starts, only its thread touches the workbook
+    blue_price_rows = {row for row in rows_urls if is_blue_cell(ws[f"{PRICE_COL}{row}"])}
+    blue_shares_rows = {row for row in rows_urls if is_blue_cell(ws[f"{SHARES_COL}{row}"])}
+    writer = WorkbookWriter(
+        wb,
+        WORKBOOK_PATH,
+        set_value=preserve_cell_color_and_set_value,
+        alt_path_factory=timestamped_alt_path(WORKBOOK_PATH),
+    ).start()
+
+    resolve_chromedriver()
+    # With --tabs the workers share one browser, each driving its own tab
+    tab_browser = TabBrowser(lambda: create_price_driver(tab_mode=True)) if tabs > 1 or prefetch else None
+    if tab_browser is not None:
+        logging.info(f"Tab mode: {tabs} tabs in one browser" + (", each with a prefetch tab" if prefetch else ""))
+    fetched = run_rows(
+        fetch_rows,
+        process_row,
+        tab_browser.new_tab if tab_browser else lambda: create_price_driver(page_load_strategy),
+        workers=tabs if tab_browser else workers,
+        max_per_domain=max_per_domain,
+        domain_delay=domain_delay,
+        max_pages_per_driver=max_pages_per_browser,
+        max_driver_rss_mb=max_browser_rss_mb,
+        driver_stats=browser_stats,
+        prefetch=prefetch,
+    )
+    try:
+        for row, url, result in itertools.chain(resumed_rows, cached_rows, fetched):
+            stats["processed"] += 1
+            if "price" not in result:
+                # The runner could not process the row at all (e.g. no browser available)
+                result = {"price": result, "shares": result, "shares_url": url}
+            if row in fetch_rows:
+                journal.record(row, url, result)
+                cache_price_result(result_cache, url, result["price"])
+                if "error" not in result["shares"]:
+                    result_cache.store("shares", url, [result["shares"], result["shares_url"]])
+
+            # Column L - share price
+            out, chosen_key, chosen_result = choose_price_output(result["price"])
+            if chosen_key in ("error", "no_data"):
+                if row not in blue_price_rows:
+                    price_error_domains[registrable_domain(url)] += 1
+            elif isinstance(chosen_result, (int, float)) and not is_valid_share_price(chosen_result, out, url):
+                stats["invalid_prices"] += 1
+            else:
+                stats["price_ok"] += 1
+            writer.put(SHEET_NAME, f"{PRICE_COL}{row}", out)
+
+            # Column M - outstanding shares
+            shares_data = result["shares"]
+            shares_out = shares_cell_value(shares_data)
+            if "error" in shares_data:
+                if row not in blue_shares_rows:
+                    shares_error_domains[registrable_domain(result["shares_url"])] += 1
+            else:
+                stats["shares_ok"] += 1
+            writer.put(SHEET_NAME, f"{SHARES_COL}{row}", shares_out)
+            writer.row_done()
+
+            logging.info(f"Row {row}: price -> {out} | shares -> {shares_out}")
+    except BaseException:
+        # Save the rows applied so far; --resume picks up the rest from the journal
+        try:
+            writer.close()
+        except Exception as save_err:
+            logging.error(f"Error saving workbook: {save_err}")
+        journal.close()
+        raise
+    finally:
+        # The VanEck rows share one browser outside the worker pool
+        close_vaneck_driver()
+        if tab_browser is not None:
+            tab_browser.close()
+        try:
+            result_cache.save()
+        except OSError as e:
+            logging.error(f"Error saving result cache: {e}")
+
+    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    writer.put(SHEET_NAME, f"{PRICE_COL}1", f"Share price (Last updated: {current_time})")
+    writer.put(SHEET_NAME, f"{SHARES_COL}1", f"Outstanding shares (Last updated: {current_time})")
+    try:
+        workbook_path = writer.close()
+        logging.info(f"Saved updates to {workbook_path} ({writer.saves} saves, {writer.save_seconds:.1f}s writing)")
+        journal.finish()
+        shutil.copy2(workbook_path, ORIGINAL_WORKBOOK_PATH)
+        logging.info(f"Created copy: {workbook_path} -> {ORIGINAL_WORKBOOK_PATH}")
+    except Exception as e:
+        logging.error(f"Error saving workbook: {e}")
+    finally:
+        journal.close()
+
+    elapsed = time.monotonic() - start
+    log_filename = f"combined_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+    try:
+        with open(log_filename, 'w', encoding='utf-8') as log_file:
+            log_file.write("COMBINED PRICE AND OUTSTANDING SHARES LOG\n")
+            log_file.write("=" * 50 + "\n")
+            log_file.write(f"Run Date: {current_time}\n")
+            log_file.write("Script: combined_updater.py\n")
+            log_file.write(f"Run time: {elapsed:.0f}s for {stats['processed']} rows\n\n")
+
+            log_file.write("SUMMARY:\n")
+            log_file.write("-" * 10 + "\n")
+            log_file.write(f"Share prices found: {stats['price_ok']}/{stats['processed']}\n")
+            log_file.write(f"Invalid prices: {stats['invalid_prices']}\n")
+            log_file.write(f"Outstanding shares found: {stats['shares_ok']}/{stats['processed']}\n")
+
+            for title, domains in (("SHARE PRICE ERRORS BY DOMAIN", price_error_domains),
+                                   ("OUTSTANDING SHARES ERRORS BY DOMAIN", shares_error_domains)):
+                log_file.write(f"\n{title}:\n")
+                log_file.write("-" * 40 + "\n")
+                if domains:
+                    for domain, count in sorted(domains.items(), key=lambda x: x[1], reverse=True):
+                        log_file.write(f"{count:3d} errors: {domain}\n")
+                else:
+                    log_file.write("No errors encountered!\n")
+
+            log_file.write("\nBROWSER SESSIONS:\n")
+            log_file.write("-" * 20 + "\n")
+            for browser in browser_stats:
+                recycles = browser["recycles"]
+                log_file.write(f"{browser['label']}: {browser['pages']} pages, {browser['sessions']} sessions, "
+                               f"recycles (pages/memory/crash): {recycles['pages']}/{recycles['memory']}/{recycles['crash']}\n")
+        logging.info(f"Log file created: {log_filename}")
+    except Exception as e:
+        logging.error(f"Error creating log file: {e}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Update share prices (column L) and outstanding shares (column M) in one pass"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of parallel headless Chrome workers (default: 1)"
+    )
+    parser.add_argument(
+        "--max-per-domain",
+        type=int,
+        default=DEFAULT_MAX_IN_FLIGHT,
+        help=f"Max concurrent requests per domain (default: {DEFAULT_MAX_IN_FLIGHT})"
+    )
+    parser.add_argument(
+        "--domain-delay",
+        type=float,
+        default=DEFAULT_MIN_INTERVAL,
+        help=f"Minimum seconds between requests to the same domain (default: {DEFAULT_MIN_INTERVAL})"
+    )
+    parser.add_argument(
+        "--page-load-strategy",
+        choices=["normal", "eager"],
+        default="normal",
+        help="Chrome page load strategy; 'eager' returns at DOMContentLoaded (default: normal)"
+    )
+    parser.add_argument(
+        "--max-pages-per-browser",
+        type=int,
+        default=DEFAULT_MAX_PAGES,
+        help=f"Rows served by one browser session before it is recycled (default: {DEFAULT_MAX_PAGES})"
+    )
+    parser.add_argument(
+        "--max-browser-rss-mb",
+        type=int,
+        default=DEFAULT_MAX_RSS_MB,
+        help=f"Recycle a browser once it uses more than this much memory in MB (default: {DEFAULT_MAX_RSS_MB})"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip rows already finished by an interrupted previous run"
+    )
+    parser.add_argument(
+        "--vaneck-headless",
+        action="store_true",
+        default=None,
+        help="Run the VanEck browser with --headless=new instead of a visible window "
+             "(default: visible when a display is available)"
+    )
+    parser.add_argument(
+        "--tabs",
+        type=int,
+        default=1,
+        help="Process this many rows at once as tabs of one headless Chrome instead of "
+             "one Chrome per worker; replaces --workers (default: 1)"
+    )
+    parser.add_argument(
+        "--prefetch",
+        action="store_true",
+        help="Start loading each tab's next row in a spare tab while the current row "
+             "is extracted (runs in tab mode, also with a single tab)"
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Fetch every row, also those whose cached price and outstanding shares have not expired"
+    )
+    parser.add_argument(
+        "--shares-ttl-hours",
+        type=float,
+        default=DEFAULT_SHARES_TTL.total_seconds() / 3600,
+        help=f"Reuse outstanding shares found by an earlier run for this many hours "
+             f"(default: {DEFAULT_SHARES_TTL.total_seconds() / 3600:g})"
+    )
+    args = parser.parse_args()
+
+    main(workers=args.workers, max_per_domain=args.max_per_domain, domain_delay=args.domain_delay,
+         page_load_strategy=args.page_load_strategy, max_pages_per_browser=args.max_pages_per_browser,
+         max_browser_rss_mb=args.max_browser_rss_mb, resume=args.resume,
+         vaneck_headless=args.vaneck_headless, tabs=args.tabs,
+         prefetch=args.prefetch, refresh=args.refresh,
+         shares_ttl=timedelta(hours=args.shares_ttl_hours))
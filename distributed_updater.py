@@ -0,0 +1,324 @@
+"""
+Distributed price / outstanding shares run over a shared work queue.
+
+One coordinator reads the column P URLs, enqueues a job per row in a SQLite
+work queue (src/work_queue.py) and writes the results into the workbook as
+they come back. Any number of worker processes - on this machine or on other
+hosts that can reach the queue file - lease rows, process them with their own
+browser and post the results. Workers never open the workbook.
+
+    python distributed_updater.py coordinator --mode combined --queue //share/queue.sqlite
+    python distributed_updater.py worker --queue //share/queue.sqlite
+
+For a single box, `coordinator --local-workers 4` starts the workers itself.
+"""
+
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime
+
+from openpyxl import load_workbook
+
+from combined_updater import process_combined_row
+from excel_stock_updater import (
+    PRICE_KEYWORDS,
+    choose_price_output,
+    close_vaneck_driver,
+    create_price_driver,
+    fetch_and_extract_data,
+    preserve_cell_color_and_set_value,
+)
+from outstanding_shares_updater import (
+    create_shares_driver,
+    find_processable_rows_and_get_urls,
+    process_shares_row,
+    shares_cell_value,
+)
+from src.domain_scheduler import registrable_domain
+from src.driver_factory import resolve_chromedriver
+from src.driver_manager import DEFAULT_MAX_PAGES, DEFAULT_MAX_RSS_MB, ManagedDriver
+from src.work_queue import (
+    DEFAULT_MAX_ATTEMPTS,
+    DEFAULT_QUEUE_PATH,
+    DEFAULT_VISIBILITY_TIMEOUT,
+    WorkQueue,
+    default_worker_id,
+)
+from src.workbook_writer import WorkbookWriter, timestamped_alt_path
+
+ORIGINAL_WORKBOOK_PATH = "data/Custodians.xlsx"
+WORKBOOK_PATH = "data/Custodians_Results.xlsx"
+SHEET_NAME = "Non-derivative exposures"
+PRICE_COL = "L"
+SHARES_COL = "M"
+URL_COL = "P"
+
+MODES = ("price", "shares", "combined")
+POLL_INTERVAL = 5
+
+
+def process_job(driver, mode, row, url, payload):
+    """
+    Run one leased row in a worker.
+
+    Returns:
+        A JSON-serializable result: the price dict, [shares_data, used_url] or the combined dict
+    """
+    fallback_url = (payload or {}).get("fallback_url")
+    if mode == "price":
+        return fetch_and_extract_data(driver, url, PRICE_KEYWORDS)
+    if mode == "shares":
+        shares_data, used_url = process_shares_row(driver, row, url, fallback_url)
+        return [shares_data, used_url]
+    if mode == "combined":
+        return process_combined_row(driver, row, url, fallback_url)
+    raise ValueError(f"Unknown mode: {mode}")
+
+
+def cell_updates(mode, result):
+    """
+    Cell values for one row's result.
+
+    Returns:
+        list of (column, value) pairs
+    """
+    if mode == "price":
+        return [(PRICE_COL, choose_price_output(result)[0])]
+    if mode == "shares":
+        shares_data = result[0] if isinstance(result, list) else result
+        return [(SHARES_COL, shares_cell_value(shares_data))]
+    if "price" not in result:
+        # The row failed as a whole (e.g. every attempt raised)
+        result = {"price": result, "shares": result}
+    return [(PRICE_COL, choose_price_output(result["price"])[0]),
+            (SHARES_COL, shares_cell_value(result["shares"]))]
+
+
+def run_worker(queue_path=DEFAULT_QUEUE_PATH, run_id=None, visibility_timeout=DEFAULT_VISIBILITY_TIMEOUT,
+               idle_wait=POLL_INTERVAL, page_load_strategy="normal",
+               max_pages_per_browser=DEFAULT_MAX_PAGES, max_browser_rss_mb=DEFAULT_MAX_RSS_MB):
+    """
+    Lease and process rows until the run is finished or closed.
+
+    Args:
+        queue_path: shared SQLite queue file
+        run_id: run to work on (default: the most recent open run; waits for one)
+        visibility_timeout: seconds before a leased row is handed to another worker
+        idle_wait: seconds to wait when no row is available
+        page_load_strategy: Chrome page load strategy for price/combined runs
+        max_pages_per_browser: rows served by one browser session before it is recycled
+        max_browser_rss_mb: browser memory (MB) above which the session is recycled
+    """
+    work_queue = WorkQueue(queue_path)
+    worker_id = default_worker_id()
+
+    while run_id is None:
+        run_id, mode = work_queue.open_run()
+        if run_id is None:
+            logging.info(f"Worker {worker_id}: no open run in {queue_path}, waiting...")
+            time.sleep(idle_wait)
+    mode = work_queue.run_mode(run_id)
+    if mode is None:
+        logging.error(f"Worker {worker_id}: run {run_id} not found in {queue_path}")
+        return
+
+    if mode == "shares":
+        create_driver = create_shares_driver
+    else:
+        create_driver = lambda: create_price_driver(page_load_strategy)
+    resolve_chromedriver()
+    manager = ManagedDriver(create_driver, max_pages=max_pages_per_browser,
+                            max_rss_mb=max_browser_rss_mb, label=f"Worker {worker_id}")
+    logging.info(f"Worker {worker_id}: working on run {run_id} ({mode})")
+
+    processed = 0
+    try:
+        while True:
+            job = work_queue.lease(run_id, worker_id, visibility_timeout)
+            if job is None:
+                if work_queue.is_closed(run_id) or work_queue.is_finished(run_id):
+                    break
+                time.sleep(idle_wait)
+                continue
+
+            row, url = job["row"], job["url"]
+            logging.info(f"Worker {worker_id}: row {row} (attempt {job['attempt']}): {url}")
+            error = None
+            try:
+                result = process_job(manager.acquire(), mode, row, url, job["payload"])
+            except Exception as e:
+                logging.error(f"Worker {worker_id}: row {row} failed for {url}: {e}", exc_info=True)
+                error = e
+                work_queue.fail(run_id, row, worker_id, f"Worker error: {e}")
+            else:
+                if not work_queue.complete(run_id, row, worker_id, result):
+                    logging.info(f"Worker {worker_id}: row {row} was already finished by another worker")
+                processed += 1
+            manager.page_done(error)
+    finally:
+        manager.close()
+        close_vaneck_driver()
+    logging.info(f"Worker {worker_id}: finished, {processed} rows processed")
+
+
+def start_local_workers(count, queue_path, run_id, visibility_timeout):
+    """Start worker processes on this machine for the given run."""
+    command = [sys.executable, os.path.abspath(__file__), "worker", "--queue", queue_path,
+               "--run-id", run_id, "--visibility-timeout", str(visibility_timeout)]
+    return [subprocess.Popen(command) for _ in range(count)]
+
+
+def run_coordinator(mode="combined", queue_path=DEFAULT_QUEUE_PATH, attach=None, local_workers=0,
+                    max_attempts=DEFAULT_MAX_ATTEMPTS, visibility_timeout=DEFAULT_VISIBILITY_TIMEOUT,
+                    poll_interval=POLL_INTERVAL):
+    """
+    Enqueue the workbook's rows and write results back as workers finish them.
+
+    Args:
+        mode: "price" (column L), "shares" (column M) or "combined" (both)
+        queue_path: shared SQLite queue file
+        attach: id of an existing run to continue collecting (after a coordinator restart)
+        local_workers: number of worker processes to start on this machine
+        max_attempts: times a row is tried before it is reported as failed
+        visibility_timeout: seconds before a leased row is handed to another worker
+        poll_interval: seconds between checks for new results
+    """
+    work_queue = WorkQueue(queue_path)
+
+    shutil.copy2(ORIGINAL_WORKBOOK_PATH, WORKBOOK_PATH)
+    logging.info(f"Copied {ORIGINAL_WORKBOOK_PATH} to {WORKBOOK_PATH}")
+    try:
+        wb = load_workbook(WORKBOOK_PATH)
+        ws = wb[SHEET_NAME]
+    except Exception as e:
+        logging.error(f"Error loading workbook: {e}")
+        return
+
+    writer = WorkbookWriter(wb, WORKBOOK_PATH, set_value=preserve_cell_color_and_set_value,
+                            alt_path_factory=timestamped_alt_path(WORKBOOK_PATH))
+
+    if attach:
+        run_id = attach
+        mode = work_queue.run_mode(run_id)
+        if mode is None:
+            logging.error(f"Run {run_id} not found in {queue_path}")
+            return
+        work_queue.reset_collected(run_id)
+        logging.info(f"Attached to run {run_id} ({mode})")
+    else:
+        rows_urls, fallback_urls = find_processable_rows_and_get_urls(ws, URL_COL)
+        if not rows_urls:
+            logging.info("No URLs found to process.")
+            return
+        results = {}
+        if mode == "price":
+            # Same as excel_stock_updater: PDFs are not fetched for prices. They are queued
+            # as finished rows, so they are written like worker results (also after --attach)
+            results = {row: {"error": "PDF file - cannot process"}
+                       for row, url in rows_urls.items() if url.lower().endswith(".pdf")}
+        payloads = {row: {"fallback_url": fallback_urls[row]} for row in rows_urls if row in fallback_urls}
+        run_id = work_queue.create_run(mode, rows_urls, payloads, max_attempts=max_attempts, results=results)
+
+    writer.start()
+    workers = start_local_workers(local_workers, queue_path, run_id, visibility_timeout) if local_workers else []
+
+    written = 0
+    error_domains = defaultdict(int)
+    try:
+        while True:
+            finished = work_queue.is_finished(run_id)
+            for row, url, result in work_queue.collect(run_id):
+                for column, value in cell_updates(mode, result):
+                    writer.put(SHEET_NAME, f"{column}{row}", value)
+                    if isinstance(value, str) and value.startswith("Error"):
+                        error_domains[registrable_domain(url)] += 1
+                writer.row_done()
+                written += 1
+            if finished:
+                break
+            counts = work_queue.counts(run_id)
+            logging.info(f"Run {run_id}: {written} rows written, "
+                         f"{counts.get('pending', 0)} pending, {counts.get('leased', 0)} in progress")
+            time.sleep(poll_interval)
+    except BaseException:
+        # Save the rows applied so far; a restarted coordinator continues with --attach
+        try:
+            writer.close()
+        except Exception as save_err:
+            logging.error(f"Error saving workbook: {save_err}")
+        raise
+    finally:
+        work_queue.close_run(run_id)
+        for process in workers:
+            try:
+                process.wait(timeout=60)
+            except subprocess.TimeoutExpired:
+                process.terminate()
+
+    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    if mode in ("price", "combined"):
+        writer.put(SHEET_NAME, f"{PRICE_COL}1", f"Share price (Last updated: {current_time})")
+    if mode in ("shares", "combined"):
+        writer.put(SHEET_NAME, f"{SHARES_COL}1", f"Outstanding shares (Last updated: {current_time})")
+    try:
+        workbook_path = writer.close()
+        logging.info(f"Saved {written} rows to {workbook_path}")
+        shutil.copy2(workbook_path, ORIGINAL_WORKBOOK_PATH)
+        logging.info(f"Created copy: {workbook_path} -> {ORIGINAL_WORKBOOK_PATH}")
+    except Exception as e:
+        logging.error(f"Error saving workbook: {e}")
+
+    counts = work_queue.counts(run_id)
+    logging.info(f"Run {run_id} finished: {counts.get('done', 0)} done, {counts.get('failed', 0)} failed")
+    for domain, count in sorted(error_domains.items(), key=lambda x: x[1], reverse=True):
+        logging.info(f"{count:3d} errors: {domain}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(description="Split an update run across worker processes and hosts")
+    subparsers = parser.add_subparsers(dest="role", required=True)
+
+    coordinator = subparsers.add_parser("coordinator", help="Enqueue rows and write results to the workbook")
+    coordinator.add_argument("--mode", choices=MODES, default="combined",
+                             help="Columns to update: price (L), shares (M) or combined (default: combined)")
+    coordinator.add_argument("--attach", metavar="RUN_ID",
+                             help="Continue collecting an existing run after a coordinator restart")
+    coordinator.add_argument("--local-workers", type=int, default=0,
+                             help="Worker processes to start on this machine (default: 0)")
+    coordinator.add_argument("--max-attempts", type=int, default=DEFAULT_MAX_ATTEMPTS,
+                             help=f"Times a row is tried before it is reported as failed (default: {DEFAULT_MAX_ATTEMPTS})")
+
+    worker = subparsers.add_parser("worker", help="Lease rows from the queue and process them")
+    worker.add_argument("--run-id", help="Run to work on (default: the most recent open run)")
+    worker.add_argument("--page-load-strategy", choices=["normal", "eager"], default="normal",
+                        help="Chrome page load strategy for price runs (default: normal)")
+    worker.add_argument("--max-pages-per-browser", type=int, default=DEFAULT_MAX_PAGES,
+                        help=f"Rows served by one browser session before it is recycled (default: {DEFAULT_MAX_PAGES})")
+    worker.add_argument("--max-browser-rss-mb", type=int, default=DEFAULT_MAX_RSS_MB,
+                        help=f"Recycle a browser above this memory use in MB (default: {DEFAULT_MAX_RSS_MB})")
+
+    for sub in (coordinator, worker):
+        sub.add_argument("--queue", default=DEFAULT_QUEUE_PATH,
+                         help=f"Shared SQLite queue file (default: {DEFAULT_QUEUE_PATH})")
+        sub.add_argument("--visibility-timeout", type=int, default=DEFAULT_VISIBILITY_TIMEOUT,
+                         help=f"Seconds before a leased row is retried elsewhere (default: {DEFAULT_VISIBILITY_TIMEOUT})")
+    args = parser.parse_args()
+
+    if args.role == "coordinator":
+        run_coordinator(mode=args.mode, queue_path=args.queue, attach=args.attach,
+                        local_workers=args.local_workers, max_attempts=args.max_attempts,
+                        visibility_timeout=args.visibility_timeout)
+    else:
+        run_worker(queue_path=args.queue, run_id=args.run_id, visibility_timeout=args.visibility_timeout,
+                   page_load_strategy=args.page_load_strategy,
+                   max_pages_per_browser=args.max_pages_per_browser,
+                   max_browser_rss_mb=args.max_browser_rss_mb)
@@ -1,23 +1,38 @@
 import re
+import os
+import sys
 import logging
 import hashlib
+import threading
 from urllib.parse import urlencode, urlparse
-from bs4 import BeautifulSoup
-from openpyxl import load_workbook
-from openpyxl.styles import Font, PatternFill, Color
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.common.exceptions import TimeoutException
 import requests
 from datetime import datetime, date, timedelta
-from bf4py import BF4Py
 import time
 import json
+import itertools
 from collections import defaultdict
+from src.parallel_runner import run_rows
+from src.domain_scheduler import DEFAULT_MAX_IN_FLIGHT, DEFAULT_MIN_INTERVAL
+from src.driver_manager import ManagedDriver
+from src.http_fetch import fetch_static_html, get_http_session, should_try_http, record_http_result
+from src.http_cache import cached_get
+from src.bf_salt import salted_get
+from src.driver_factory import create_chrome_driver, resolve_chromedriver, apply_resource_blocking
+from src.readiness import Selector
+from src.page_snapshot import load_snapshot, capture_snapshot
+from src.html_parsing import parse_html, page_text
+from src.keyword_scanner import KeywordScanner, context_window
+from src.network_capture import drain_network_log
+from src.run_journal import RunJournal
+from src.result_cache import ResultCache
+from src.tab_pool import TabBrowser, TAB_MODE_ARGUMENTS
+from src.extractor_registry import ExtractorRegistry
+from src.plugins import load_plugin, module_available
 
 def normalize_price_format(raw_price):
     """
@@ -47,12 +62,10 @@ def normalize_price_format(raw_price):
         return float(normalized)
     except ValueError:
         raise ValueError(f"Could not parse price '{raw_price}' (normalized: '{normalized}')")
-# NEW: Import for Groq AI analysis
-try:
-    from groq import Groq
-    GROQ_AVAILABLE = True
-except ImportError:
-    GROQ_AVAILABLE = False
+
+# NEW: Groq AI analysis (the client library is imported on first use)
+GROQ_AVAILABLE = module_available("groq")
+if not GROQ_AVAILABLE:
     logging.warning("Groq library not available. AI fallback will be disabled.")
 
 # Groq AI Configuration
@@ -128,14 +141,10 @@ def clean_html_for_ai(html_content, max_length=6000):  # Reduced from 8000 to sa
     OPTIMIZED: Shorter content to reduce token usage and avoid rate limits.
     """
     try:
-        soup = BeautifulSoup(html_content, "html.parser")
-        
-        # Remove script and style elements
-        for script in soup(["script", "style", "nav", "header", "footer"]):
-            script.decompose()
-        
-        # Get text content
-        text = soup.get_text()
+        # The tree is usually the one the extractors already parsed; skip
+        # navigation/header/footer text without modifying it
+        soup = parse_html(html_content)
+        text = page_text(soup, skip_tags=("nav", "header", "footer"))
         
         # Clean up whitespace
         lines = (line.strip() for line in text.splitlines())
@@ -172,7 +181,7 @@ def clean_html_for_ai(html_content, max_length=6000):  # Reduced from 8000 to sa
     except Exception as e:
         logging.error(f"Error cleaning HTML for AI: {e}")
         # Fallback: just truncate raw text
-        soup = BeautifulSoup(html_content, "html.parser")
+        soup = parse_html(html_content)
         return soup.get_text()[:max_length]
 
 def analyze_website_with_groq(html_content, url):
@@ -185,6 +194,7 @@ def analyze_website_with_groq(html_content, url):
     
     try:
         # Initialize Groq client
+        from groq import Groq
         client = Groq(api_key=GROQ_API_KEY)
         
         # Clean HTML content for AI analysis (reduced size to save tokens)
@@ -278,9 +288,14 @@ Current trading price:"""
             logging.error(f"Groq AI analysis error for {url}: {e}")
             return {"error": f"AI analysis failed: {str(e)}"}
 
-def try_ai_fallback(driver, url):
+def try_ai_fallback(driver, url, html_content=None, snapshot=None):
     """
     Try AI analysis as a fallback when traditional scraping fails.
+
+    The page is normally already loaded by the extractor that just failed, so
+    its content is reused: html_content or snapshot if given, otherwise the
+    driver's current page if it is showing this URL. The page is only loaded
+    again if none of those is available.
     """
     if not GROQ_AVAILABLE:
         return {"error": "AI fallback not available"}
@@ -288,15 +303,24 @@ def try_ai_fallback(driver, url):
     try:
         logging.info(f"Attempting AI fallback analysis for: {url}")
         
-        # Get fresh page content for AI analysis
-        driver.get(url)
-        WebDriverWait(driver, 15).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-        
-        # Allow time for dynamic content to load
-        time.sleep(3)
-        
-        # Get the page source
-        html_content = driver.page_source
+        if html_content is None and snapshot is not None:
+            html_content = snapshot.html
+        if html_content is None:
+            current = capture_snapshot(driver, url, require_same_page=True)
+            if current is not None:
+                html_content = current.html
+        if html_content is None:
+            # Get fresh page content for AI analysis
+            driver.get(url)
+            WebDriverWait(driver, 15).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+            
+            # Allow time for dynamic content to load
+            time.sleep(3)
+            
+            # Get the page source
+            html_content = driver.page_source
+        else:
+            logging.info(f"AI fallback reusing already loaded page for {url}")
         
         # Analyze with AI
         result = analyze_website_with_groq(html_content, url)
@@ -319,10 +343,8 @@ def _extract_isin_bf(url: str, timeout: float = 5.0) -> str:
     if m:
         return m.group(1).upper()
 
-    # 2️⃣  fallback – one cheap GET and one regex
-    # Ensure requests is imported if this function is moved to a module where it's not already imported.
-    # For this script, requests is imported globally.
-    r = requests.get(url, headers={"User-Agent": "Mozilla/5.0"}, timeout=timeout)
+    # 2️⃣  fallback – one cheap GET and one regex; an unchanged page is revalidated, not re-downloaded
+    r = cached_get(url, timeout=timeout)
     r.raise_for_status()                       # raises for 4xx/5xx
     m = re.search(r'ISIN\s*:\s*([A-Z0-9]{12})', r.text, re.I) # Escaped colon for regex
     if m:
@@ -371,7 +393,7 @@ def get_fidelity_open_price(driver, url):
         # if it never appears, we'll still parse whatever loaded
         pass
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
+    soup = parse_html(driver.page_source)
 
     # find the label "Open"
     label = soup.find(
@@ -397,874 +419,145 @@ def get_fidelity_open_price(driver, url):
     num = m.group(1).replace(",", "")
     return float(num)
 
-def get_nasdaq_european_market_price(driver, url):
-    """
-    Navigate to a NASDAQ European market page and scrape the share price.
-    Returns a float or raises ValueError.
-    """
-    driver.get(url)
-    try:
-        # Wait for the page to load
-        WebDriverWait(driver, 30).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        
-        # Allow extra time for JavaScript content to load
-        time.sleep(5)
-    except TimeoutException:
-        raise ValueError("Timed out waiting for page to load")
-
-    soup = BeautifulSoup(driver.page_source, "html.parser")
-    
-    # First approach: Look for text patterns in the entire page
-    page_text = soup.get_text(" ", strip=True)
-    
-    # Extract exchange ID from URL
-    exchange_id_match = re.search(r'id=([A-Z]+)\d+', url)
-    exchange_id = exchange_id_match.group(1) if exchange_id_match else None
-    
-    # Define supported currencies and their priority based on exchange
-    exchange_currencies = {
-        'SSE': ['SEK'],  # Stockholm Stock Exchange - Swedish Krona
-        'HEX': ['EUR'],  # Helsinki Stock Exchange - Euro
-        'CPH': ['DKK'],  # Copenhagen Stock Exchange - Danish Krone
-        'ICE': ['ISK'],  # Iceland Stock Exchange - Icelandic Króna
-        'XETR': ['EUR'], # Deutsche Börse Xetra - Euro
-    }
-    
-    # Get expected currencies based on exchange ID
-    expected_currencies = exchange_currencies.get(exchange_id, ['EUR', 'SEK', 'NOK', 'DKK', 'ISK'])
-    
-    # Build currency patterns based on priority
-    currency_patterns = []
-    for currency in expected_currencies:
-        # Pattern 1: "Currency 123.45" format
-        currency_patterns.append(fr'{currency}\s*([\d\.,]+)')
-        # Pattern 2: "123.45 Currency" format
-        currency_patterns.append(fr'([\d\.,]+)\s*{currency}')
-    
-    # Try each pattern in order of priority
-    for pattern in currency_patterns:
-        matches = re.finditer(pattern, page_text, re.IGNORECASE)
-        for match in matches:
-            # Get the price string (could be in group 1 or 2)
-            price_str = match.group(1) if match.group(1) else match.group(2)
-            
-            # Normalize number format
-            if "," in price_str and "." in price_str:
-                # European format with thousands separator (e.g., "1.234,56")
-                price_normalized = price_str.replace(".", "").replace(",", ".")
-            elif "," in price_str:
-                # European format (e.g., "123,45")
-                price_normalized = price_str.replace(",", ".")
-            else:
-                # US/UK format (e.g., "123.45")
-                price_normalized = price_str
-                
-            try:
-                price_value = float(price_normalized)
-                # Validate price is within reasonable range
-                if 0.01 <= price_value <= 100000:
-                    logging.info(f"Found price: {price_value} {expected_currencies[0]}")
-                    return price_value
-            except ValueError:
-                continue
+# VanEck's ve-tradinginformationblock React component does not render in the old
+# headless mode, so VanEck rows use their own browser: headed when a display is
+# available, otherwise Chrome's --headless=new. It is started on the first VanEck
+# row, reused for the following ones and closed by close_vaneck_driver() at run end.
+VANECK_HEADLESS = None  # None = decide from the display, True/False to force
+_vaneck_lock = threading.Lock()
+_vaneck_browser = None
 
-    # If we get here, we couldn't find a valid price
-    raise ValueError("Could not find valid price on NASDAQ European market page")
 
-def get_nasdaq_market_activity_price(driver, url):
+def create_vaneck_driver(headless=None):
     """
-    Navigate to a NASDAQ market activity page (stocks, ETFs, etc.) and scrape the share price.
-    Returns a float or raises ValueError.
+    Create the Chrome instance used for VanEck pages.
+
+    Args:
+        headless: True for --headless=new, False for a visible window,
+                  None to go headless only when no display is available
     """
-    driver.get(url)
-    try:
-        # Wait for the page to load
-        WebDriverWait(driver, 30).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        
-        # Allow extra time for JavaScript content to load
-        time.sleep(5)
-    except TimeoutException:
-        raise ValueError("Timed out waiting for page to load")
+    if headless is None:
+        headless = sys.platform.startswith("linux") and not os.environ.get("DISPLAY")
+    options = webdriver.ChromeOptions()
+    if headless:
+        # The new headless mode runs the full browser, which renders the React components
+        options.add_argument("--headless=new")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--window-size=1920,1080")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+    logging.info(f"VanEck: starting {'headless (new)' if headless else 'visible'} browser")
+    return create_chrome_driver(options, page_load_timeout=90)
+
+
+def close_vaneck_driver():
+    """Quit the shared VanEck browser, if one was started."""
+    global _vaneck_browser
+    with _vaneck_lock:
+        if _vaneck_browser is None:
+            return
+        stats = _vaneck_browser.stats()
+        _vaneck_browser.close()
+        _vaneck_browser = None
+    logging.info(f"VanEck: closed browser after {stats['pages']} pages in {stats['sessions']} sessions")
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
-    
-    # First try to find the price in the main header area
-    try:
-        # Look for the last price element which typically contains the current price
-        price_element = soup.find("span", class_="symbol-page-header__pricing-price")
-        if price_element and price_element.text:
-            price_text = price_element.text.strip()
-            # Clean the price text (remove $ and commas)
-            price_text = price_text.replace('$', '').replace(',', '')
-            return float(price_text)
-    except (ValueError, AttributeError):
-        pass
-    
-    # If we can't find the price in the header, look through the page content
-    try:
-        # Try to find price inside div with class "symbol-header"
-        header_div = soup.find("div", class_="symbol-header")
-        if header_div:
-            price_spans = header_div.find_all("span")
-            for span in price_spans:
-                text = span.text.strip()
-                if '$' in text:
-                    price_match = re.search(r'\$\s*([\d,]+\.\d{2})', text)
-                    if price_match:
-                        price = price_match.group(1).replace(',', '')
-                        return float(price)
-    except (ValueError, AttributeError):
-        pass
-    
-    # If still not found, try a more general approach for dollar amounts
-    dollar_pattern = re.compile(r'\$\s*([\d,]+\.\d{2})')
-    page_text = soup.get_text()
-    matches = dollar_pattern.findall(page_text)
-    
-    if matches:
-        # Find dollar amounts that look like prices (not volumes, market caps, etc.)
-        possible_prices = []
-        for match in matches:
-            try:
-                price = float(match.replace(',', ''))
-                if 0.1 < price < 10000:  # Reasonable price range
-                    possible_prices.append(price)
-            except ValueError:
-                continue
-        
-        if possible_prices:
-            # Use the most prominent price (often the first one found)
-            return possible_prices[0]
-    
-    raise ValueError("Could not find price on NASDAQ market activity page")
 
-def get_bxswiss_price(driver, url):
+def get_vaneck_price(driver, url):
     """
-    Navigate to a BX Swiss instrument page and scrape the last traded price.
+    Navigate to a VanEck investment page and extract the ACTUAL last traded price from exchange data.
+    This function specifically looks for "Last Traded Price" from Deutsche Börse, Euronext, etc.
+    Uses the shared VanEck browser (see create_vaneck_driver) for React components to load
+    properly; the worker's own driver is not used. VanEck rows are served one at a time.
     Returns a float or raises ValueError.
     """
-    driver.get(url)
-    try:
-        # Wait for the page to load
-        WebDriverWait(driver, 30).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        
-        # Allow extra time for JavaScript content to load
-        time.sleep(5)
-    except TimeoutException:
-        raise ValueError("Timed out waiting for page to load")
+    global _vaneck_browser
+    with _vaneck_lock:
+        if _vaneck_browser is None:
+            _vaneck_browser = ManagedDriver(lambda: create_vaneck_driver(VANECK_HEADLESS),
+                                            label="VanEck browser")
+        error = None
+        try:
+            return _extract_vaneck_price(_vaneck_browser.acquire(), url)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            _vaneck_browser.page_done(error)
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
-    
-    # Try to find the last traded price in the instrument details
+
+def _extract_vaneck_price(visible_driver, url):
+    """Load a VanEck page in the VanEck browser and read the last traded price."""
     try:
-        # Look for a label containing "Last traded"
-        last_traded_elements = soup.find_all(text=re.compile(r"Last traded", re.IGNORECASE))
+        from selenium.webdriver.common.action_chains import ActionChains
         
-        for element in last_traded_elements:
-            # Check the text of the element and nearby elements for a price
-            price_text = element.parent.get_text() if element.parent else ""
-            
-            # Look for currency code followed by numeric value
-            currency_price_match = re.search(r'([A-Z]{3})\s*([\d,\.]+)', price_text)
-            if currency_price_match:
-                currency = currency_price_match.group(1)
-                price_str = currency_price_match.group(2)
-                logging.info(f"Found price: {currency} {price_str}")
-                
-                # Normalize number format
-                price_normalized = price_str.replace(',', '.')
-                return float(price_normalized)
-    except (ValueError, AttributeError) as e:
-        logging.error(f"Error extracting BX Swiss price: {e}")
-    
-    # Try a more general approach if specific element wasn't found
-    try:
-        # Look for text patterns like "Last traded USD 9.365" in the entire page
-        page_text = soup.get_text(" ", strip=True)
-        last_traded_pattern = re.compile(r'Last traded\s+([A-Z]{3})\s+([\d,\.]+)', re.IGNORECASE)
-        match = last_traded_pattern.search(page_text)
+        # Load the page
+        visible_driver.get(url)
         
-        if match:
-            currency = match.group(1)
-            price_str = match.group(2)
-            logging.info(f"Found price using page text: {currency} {price_str}")
-            
-            # Normalize number format
-            price_normalized = price_str.replace(',', '.')
-            return float(price_normalized)
-    except (ValueError, AttributeError) as e:
-        logging.error(f"Error extracting BX Swiss price from page text: {e}")
-    
-    raise ValueError("Could not find last traded price on BX Swiss page")
-
-def get_euronext_price(driver, url):
-    """
-    Navigate to a Euronext live page and scrape the share/valuation price.
-    Returns a float or raises ValueError.
-    """
-    driver.get(url)
-    try:
-        # Wait for the page to load
-        WebDriverWait(driver, 30).until(
+        WebDriverWait(visible_driver, 30).until(
             EC.presence_of_element_located((By.TAG_NAME, "body"))
         )
+        logging.info("VanEck: Page loaded successfully")
         
-        # Allow extra time for JavaScript content to load
-        time.sleep(5)
-    except TimeoutException:
-        raise ValueError("Timed out waiting for page to load")
-
-    # Save the page source to a string for debugging and easier manipulation
-    page_source = driver.page_source
-    soup = BeautifulSoup(page_source, "html.parser")
-    
-    # Log some debug info about what we're searching for
-    logging.debug(f"Looking for valuation price in Euronext page: {url}")
-    
-    # First approach: Look for specific price elements with class names that Euronext might use
-    try:
-        # Try multiple CSS selectors that might contain price information
-        selectors = [
-            "div.stock-infos span.stock-price", 
-            "div.stock-info span.price",
-            "td.euronext-last-price",
-            "span.last-price",
-            "div.price-box",
-            "div.valuation-price",
-            "div.quote-page__price",
-            ".full-data div.data-value",
-            ".product-data div.data-value",
-            ".product-price"
-        ]
-        
-        for selector in selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                text = element.get_text().strip()
-                # Look for currency symbol followed by number
-                match = re.search(r'[€$£]\s*([\d,\.]+)', text)
-                if match:
-                    price_str = match.group(1)
-                    # Handle European number format (replace comma with dot)
-                    price_normalized = price_str.replace(',', '.')
-                    logging.info(f"Found Euronext price using selector '{selector}': {price_normalized}")
-                    return float(price_normalized)
-    except Exception as e:
-        logging.error(f"Error extracting Euronext price using selectors: {e}")
-    
-    # Second approach: Look for tables with price data
-    try:
-        # Find all table rows
-        rows = soup.find_all('tr')
-        for row in rows:
-            # Get the text of the row
-            row_text = row.get_text(" ", strip=True).lower()
-            # Look for rows containing "valuation price" or similar labels
-            if "valuation price" in row_text or "last price" in row_text or "share price" in row_text:
-                # Try to extract a price from this row
-                match = re.search(r'[€$£]\s*([\d,\.]+)', row_text)
-                if match:
-                    price_str = match.group(1)
-                    price_normalized = price_str.replace(',', '.')
-                    logging.info(f"Found Euronext price in table row: {price_normalized}")
-                    return float(price_normalized)
-    except Exception as e:
-        logging.error(f"Error extracting Euronext price from tables: {e}")
-    
-    # Third approach: Extract all possible prices from the page and select the most likely one
-    try:
-        # Find all text containing currency symbols
-        all_text = soup.get_text(" ", strip=True)
-        price_matches = re.finditer(r'(valuation price|last price|share price|price)?\s*[€$£]\s*([\d,\.]+)', all_text, re.IGNORECASE)
-        
-        candidates = []
-        for match in price_matches:
-            label = match.group(1) if match.group(1) else ""
-            price_str = match.group(2)
-            price_normalized = price_str.replace(',', '.')
+        # Wait for trading components to appear
+        try:
+            trading_block = WebDriverWait(visible_driver, 20).until(
+                EC.presence_of_element_located((By.TAG_NAME, "ve-tradinginformationblock"))
+            )
+            logging.info("VanEck: Found trading information block")
+            
+            # Scroll to the component and click to trigger loading
+            visible_driver.execute_script("arguments[0].scrollIntoView(true);", trading_block)
+            time.sleep(3)
             
             try:
-                price_value = float(price_normalized)
-                # Give higher priority to matches with a label
-                priority = 2 if label else 1
-                candidates.append((priority, price_value, label))
-            except ValueError:
-                continue
-        
-        # Sort by priority (labeled prices first)
-        candidates.sort(reverse=True)
-        
-        if candidates:
-            # Take the highest priority price
-            _, best_price, label = candidates[0]
-            label_info = f" (labeled as '{label}')" if label else ""
-            logging.info(f"Found Euronext price{label_info}: {best_price}")
-            return best_price
-    except Exception as e:
-        logging.error(f"Error extracting Euronext prices with general approach: {e}")
-    
-    # Final approach: Look for any number that might be a price
-    try:
-        # Find a string that matches € followed by a number, anywhere in the page
-        all_text = soup.get_text(" ", strip=True)
-        price_pattern = re.compile(r'€\s*([\d,\.]+)', re.IGNORECASE)
-        matches = price_pattern.findall(all_text)
-        
-        if matches:
-            # Take the first match
-            price_str = matches[0]
-            price_normalized = price_str.replace(',', '.')
-            logging.info(f"Found Euronext price with fallback method: {price_normalized}")
-            return float(price_normalized)
-    except Exception as e:
-        logging.error(f"Error extracting Euronext price with fallback method: {e}")
-    
-    raise ValueError("Could not find valuation price on Euronext page")
-
-def get_tmx_price(driver, url):
-    """
-    Navigate to a TMX Money page and scrape the share price.
-    Returns a float or raises ValueError.
-    """
-    driver.get(url)
-    try:
-        # Wait for the page to load
-        WebDriverWait(driver, 30).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        
-        # Allow extra time for JavaScript content to load
-        time.sleep(5)
-    except TimeoutException:
-        raise ValueError("Timed out waiting for page to load")
-
-    soup = BeautifulSoup(driver.page_source, "html.parser")
-    
-    # First approach: Look for the price element with specific class
-    try:
-        # Try multiple possible selectors for price elements
-        price_selectors = [
-            "span.price", 
-            "div.price", 
-            "span.quote-price", 
-            "div.quote-price",
-            "span.last-price",
-            "div.last-price",
-            ".quote-header .price",
-            ".stock-price"
-        ]
+                ActionChains(visible_driver).move_to_element(trading_block).click().perform()
+                logging.info("VanEck: Clicked trading component to trigger loading")
+            except:
+                logging.info("VanEck: Could not click trading component")
+                
+        except:
+            logging.info("VanEck: Trading component not found initially")
         
-        for selector in price_selectors:
-            price_elements = soup.select(selector)
-            for element in price_elements:
-                price_text = element.get_text().strip()
-                # Match price patterns like "$19.90" or "Price:$19.90" or "$19.90 CAD"
-                match = re.search(r'\$\s*([\d,\.]+)', price_text)
-                if match:
-                    price_str = match.group(1)
-                    # Clean the price (remove commas)
-                    price_normalized = price_str.replace(',', '')
-                    logging.info(f"Found TMX price using selector '{selector}': {price_normalized}")
-                    return float(price_normalized)
-    except Exception as e:
-        logging.error(f"Error extracting TMX price from selectors: {e}")
-    
-    # Second approach: Look for text patterns in the page
-    try:
-        # Find text containing "Price:" followed by a dollar amount
-        page_text = soup.get_text(" ", strip=True)
-        price_patterns = [
-            r'Price:\s*\$\s*([\d,\.]+)',  # "Price: $19.90"
-            r'Price\s*\$\s*([\d,\.]+)',   # "Price$19.90"
-            r'Last:\s*\$\s*([\d,\.]+)',   # "Last: $19.90"
-            r'Last Price:\s*\$\s*([\d,\.]+)'  # "Last Price: $19.90"
+        # Execute JavaScript to force React components to load
+        js_scripts = [
+            "window.scrollTo(0, document.body.scrollHeight);",
+            "window.scrollTo(0, 0);",
+            "window.dispatchEvent(new Event('resize'));",
+            "window.dispatchEvent(new Event('scroll'));",
+            """
+            document.querySelectorAll('ve-tradinginformationblock').forEach(function(el) {
+                if (el.connectedCallback) el.connectedCallback();
+                if (el.attributeChangedCallback) el.attributeChangedCallback();
+                el.dispatchEvent(new Event('load'));
+                el.dispatchEvent(new Event('DOMContentLoaded'));
+            });
+            """,
+            """
+            document.querySelectorAll('ve-tradinginformationblock').forEach(function(el) {
+                el.style.display = 'block';
+                el.style.visibility = 'visible';
+            });
+            """
         ]
         
-        for pattern in price_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                price_str = match.group(1)
-                price_normalized = price_str.replace(',', '')
-                logging.info(f"Found TMX price using pattern '{pattern}': {price_normalized}")
-                return float(price_normalized)
-    except Exception as e:
-        logging.error(f"Error extracting TMX price from page text: {e}")
-    
-    # Third approach: Look for any dollar amount in the page that might be a price
-    try:
-        all_text = soup.get_text(" ", strip=True)
-        # Find all dollar amounts in the page
-        dollar_matches = re.finditer(r'\$\s*([\d,\.]+)', all_text)
-        
-        prices = []
-        for match in dollar_matches:
-            price_str = match.group(1)
+        for script in js_scripts:
             try:
-                price_value = float(price_str.replace(',', ''))
-                # Only consider reasonable price values (e.g., not volume or market cap)
-                if 0.1 < price_value < 10000:
-                    prices.append(price_value)
-            except ValueError:
-                continue
-        
-        if prices:
-            # Take the first reasonable price found
-            logging.info(f"Found TMX price using fallback method: {prices[0]}")
-            return prices[0]
-    except Exception as e:
-        logging.error(f"Error extracting TMX price with fallback method: {e}")
-    
-    raise ValueError("Could not find share price on TMX Money page")
-
-def get_london_stock_exchange_price(driver, url):
-    """
-    Navigate to a London Stock Exchange company page and scrape the share price.
-    Returns a float or raises ValueError.
-    """
-    driver.get(url)
-    try:
-        # Wait for the page to load
-        WebDriverWait(driver, 30).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        
-        # Allow extra time for JavaScript content to load
-        time.sleep(5)
-    except TimeoutException:
-        raise ValueError("Timed out waiting for London Stock Exchange page to load")
-
-    soup = BeautifulSoup(driver.page_source, "html.parser")
-    
-    # Method 1: Look for price in specific LSE elements (most reliable)
-    try:
-        # The .last-price selector worked perfectly in testing
-        price_selectors = [
-            ".last-price",
-            "div.price",
-            "span.price", 
-            "div.stock-price",
-            "span.stock-price",
-            "td.price",
-            "div.current-price",
-            "span.current-price",
-            ".price-value",
-            ".quote-price"
-        ]
+                visible_driver.execute_script(script)
+                time.sleep(2)
+            except Exception as e:
+                logging.debug(f"VanEck: JS script error: {e}")
         
-        for selector in price_selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                text = element.get_text().strip()
-                # Look for price patterns
-                price_match = re.search(r'([\d,\.]+)', text)
-                if price_match and len(text) < 50:  # Reasonable length for a price element
-                    price_str = price_match.group(1)
-                    try:
-                        price_value = float(price_str.replace(',', ''))
-                        if 0.01 <= price_value <= 100000:  # Reasonable price range
-                            logging.info(f"Found LSE price using selector '{selector}': {price_value}")
-                            return price_value
-                    except ValueError:
-                        continue
-    except Exception as e:
-        logging.error(f"Error with LSE selector method: {e}")
-    
-    # Method 2: Look for price patterns in text content
-    try:
-        page_text = soup.get_text(" ", strip=True)
+        logging.info("VanEck: JavaScript executed to trigger React components")
         
-        # Look for patterns like "Price (USD) 77.05", "Price 79.88", etc.
-        price_patterns = [
-            r'Price\s*\([^)]+\)\s*([\d,\.]+)',  # "Price (USD) 77.05"
-            r'Price\s+([\d,\.]+)',              # "Price 79.88"
-            r'Current price\s*:?\s*([\d,\.]+)', # "Current price: 77.05"
-            r'Share price\s*:?\s*([\d,\.]+)',   # "Share price: 77.05"
-            r'Last price\s*:?\s*([\d,\.]+)',    # "Last price: 77.05"
-        ]
-        
-        for pattern in price_patterns:
-            matches = re.finditer(pattern, page_text, re.IGNORECASE)
-            for match in matches:
-                price_str = match.group(1)
-                try:
-                    price_value = float(price_str.replace(',', ''))
-                    if 0.01 <= price_value <= 100000:  # Reasonable price range
-                        logging.info(f"Found LSE price using pattern '{pattern}': {price_value}")
-                        return price_value
-                except ValueError:
-                    continue
-    except Exception as e:
-        logging.error(f"Error with LSE pattern method: {e}")
-    
-    # Method 3: Look for table data that might contain prices
-    try:
-        # Look for table rows or data elements
-        table_cells = soup.find_all(['td', 'th', 'div'])
-        for cell in table_cells:
-            cell_text = cell.get_text().strip()
-            # Look for cells that might contain price labels
-            if any(keyword in cell_text.lower() for keyword in ['price', 'last', 'current']):
-                # Check if this cell or nearby cells contain a number
-                next_sibling = cell.find_next_sibling()
-                if next_sibling:
-                    next_text = next_sibling.get_text().strip()
-                    price_match = re.search(r'([\d,\.]+)', next_text)
-                    if price_match:
-                        price_str = price_match.group(1)
-                        try:
-                            price_value = float(price_str.replace(',', ''))
-                            if 0.01 <= price_value <= 100000:
-                                logging.info(f"Found LSE price in table structure: {price_value}")
-                                return price_value
-                        except ValueError:
-                            continue
-                
-                # Also check if the price is in the same cell
-                same_cell_match = re.search(r'([\d,\.]+)', cell_text)
-                if same_cell_match:
-                    price_str = same_cell_match.group(1)
-                    try:
-                        price_value = float(price_str.replace(',', ''))
-                        if 0.01 <= price_value <= 100000:
-                            logging.info(f"Found LSE price in same cell: {price_value}")
-                            return price_value
-                    except ValueError:
-                        continue
-    except Exception as e:
-        logging.error(f"Error with LSE table method: {e}")
-    
-    raise ValueError("Could not find share price on London Stock Exchange page")
-
-def get_cboe_us_price(driver, url):
-    """
-    Navigate to a CBOE US equities page and scrape the last price.
-    Returns a float or raises ValueError.
-    """
-    driver.get(url)
-    try:
-        # Wait for the page to load
-        WebDriverWait(driver, 30).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        
-        # Allow extra time for JavaScript content to load
-        time.sleep(5)
-    except TimeoutException:
-        raise ValueError("Timed out waiting for CBOE US page to load")
-
-    soup = BeautifulSoup(driver.page_source, "html.parser")
-    
-    # Method 1: Look for "Last Price" label and value
-    try:
-        page_text = soup.get_text(" ", strip=True)
-        
-        # Look for patterns like "Last Price 12.81"
-        last_price_patterns = [
-            r'Last\s+Price\s+([\d,\.]+)',  # "Last Price 12.81"
-            r'Last\s+Price:\s*([\d,\.]+)', # "Last Price: 12.81"
-            r'Last\s+Price\s*\$\s*([\d,\.]+)', # "Last Price $12.81"
-        ]
-        
-        for pattern in last_price_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                price_str = match.group(1)
-                try:
-                    price_value = float(price_str.replace(',', ''))
-                    if 0.01 <= price_value <= 100000:  # Reasonable price range
-                        logging.info(f"Found CBOE US price using pattern '{pattern}': {price_value}")
-                        return price_value
-                except ValueError:
-                    continue
-    except Exception as e:
-        logging.error(f"Error with CBOE US pattern method: {e}")
-    
-    # Method 2: Look for table rows or data elements containing "Last Price"
-    try:
-        # Look for table cells, divs, spans that might contain price data
-        elements = soup.find_all(['td', 'th', 'div', 'span'])
-        for element in elements:
-            element_text = element.get_text().strip()
-            if 'last price' in element_text.lower():
-                # Extract number from this element or nearby elements
-                price_match = re.search(r'([\d,\.]+)', element_text)
-                if price_match:
-                    price_str = price_match.group(1)
-                    try:
-                        price_value = float(price_str.replace(',', ''))
-                        if 0.01 <= price_value <= 100000:
-                            logging.info(f"Found CBOE US price in element: {price_value}")
-                            return price_value
-                    except ValueError:
-                        continue
-                
-                # Check next sibling for price value
-                next_sibling = element.find_next_sibling()
-                if next_sibling:
-                    sibling_text = next_sibling.get_text().strip()
-                    price_match = re.search(r'([\d,\.]+)', sibling_text)
-                    if price_match:
-                        price_str = price_match.group(1)
-                        try:
-                            price_value = float(price_str.replace(',', ''))
-                            if 0.01 <= price_value <= 100000:
-                                logging.info(f"Found CBOE US price in sibling: {price_value}")
-                                return price_value
-                        except ValueError:
-                            continue
-    except Exception as e:
-        logging.error(f"Error with CBOE US element method: {e}")
-    
-    # Method 3: Look for CSS selectors that might contain price data
-    try:
-        price_selectors = [
-            ".last-price",
-            ".price-value",
-            ".market-price",
-            ".quote-price",
-            "[data-price]",
-            ".price"
-        ]
-        
-        for selector in price_selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                text = element.get_text().strip()
-                price_match = re.search(r'([\d,\.]+)', text)
-                if price_match and len(text) < 50:
-                    price_str = price_match.group(1)
-                    try:
-                        price_value = float(price_str.replace(',', ''))
-                        if 0.01 <= price_value <= 100000:
-                            logging.info(f"Found CBOE US price using selector '{selector}': {price_value}")
-                            return price_value
-                    except ValueError:
-                        continue
-    except Exception as e:
-        logging.error(f"Error with CBOE US selector method: {e}")
-    
-    raise ValueError("Could not find last price on CBOE US page")
-
-def get_cboe_au_price(driver, url):
-    """
-    Navigate to a CBOE AU equities page and scrape the last traded price.
-    Returns a float or raises ValueError.
-    """
-    driver.get(url)
-    try:
-        # Wait for the page to load
-        WebDriverWait(driver, 30).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        
-        # Allow extra time for JavaScript content to load
-        time.sleep(5)
-    except TimeoutException:
-        raise ValueError("Timed out waiting for CBOE AU page to load")
-
-    soup = BeautifulSoup(driver.page_source, "html.parser")
-    
-    # Method 1: Look for "Last Traded / Best Bid" label and value
-    try:
-        page_text = soup.get_text(" ", strip=True)
-        
-        # Look for patterns like "Last Traded / Best Bid (AUD) 16.810"
-        last_traded_patterns = [
-            r'Last\s+Traded\s*/\s*Best\s+Bid\s*\([^)]+\)\s*([\d,\.]+)',  # "Last Traded / Best Bid (AUD) 16.810"
-            r'Last\s+Traded\s*(?:/\s*Best\s+Bid)?\s*([\d,\.]+)',         # "Last Traded 16.810"
-            r'Best\s+Bid\s*\([^)]+\)\s*([\d,\.]+)',                      # "Best Bid (AUD) 16.810"
-            r'Last\s+Price\s*\([^)]+\)\s*([\d,\.]+)',                    # "Last Price (AUD) 16.810"
-        ]
-        
-        for pattern in last_traded_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                price_str = match.group(1)
-                try:
-                    price_value = float(price_str.replace(',', ''))
-                    if 0.01 <= price_value <= 100000:  # Reasonable price range
-                        logging.info(f"Found CBOE AU price using pattern '{pattern}': {price_value}")
-                        return price_value
-                except ValueError:
-                    continue
-    except Exception as e:
-        logging.error(f"Error with CBOE AU pattern method: {e}")
-    
-    # Method 2: Look for table rows or data elements containing price labels
-    try:
-        # Look for table cells, divs, spans that might contain price data
-        elements = soup.find_all(['td', 'th', 'div', 'span'])
-        for element in elements:
-            element_text = element.get_text().strip()
-            # Check for various price-related keywords
-            if any(keyword in element_text.lower() for keyword in ['last traded', 'best bid', 'last price']):
-                # Extract number from this element or nearby elements
-                price_match = re.search(r'([\d,\.]+)', element_text)
-                if price_match:
-                    price_str = price_match.group(1)
-                    try:
-                        price_value = float(price_str.replace(',', ''))
-                        if 0.01 <= price_value <= 100000:
-                            logging.info(f"Found CBOE AU price in element: {price_value}")
-                            return price_value
-                    except ValueError:
-                        continue
-                
-                # Check next sibling for price value
-                next_sibling = element.find_next_sibling()
-                if next_sibling:
-                    sibling_text = next_sibling.get_text().strip()
-                    price_match = re.search(r'([\d,\.]+)', sibling_text)
-                    if price_match:
-                        price_str = price_match.group(1)
-                        try:
-                            price_value = float(price_str.replace(',', ''))
-                            if 0.01 <= price_value <= 100000:
-                                logging.info(f"Found CBOE AU price in sibling: {price_value}")
-                                return price_value
-                        except ValueError:
-                            continue
-    except Exception as e:
-        logging.error(f"Error with CBOE AU element method: {e}")
-    
-    # Method 3: Look for CSS selectors that might contain price data
-    try:
-        price_selectors = [
-            ".last-traded",
-            ".best-bid",
-            ".last-price",
-            ".price-value",
-            ".market-price",
-            ".quote-price",
-            "[data-price]",
-            ".price"
-        ]
-        
-        for selector in price_selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                text = element.get_text().strip()
-                price_match = re.search(r'([\d,\.]+)', text)
-                if price_match and len(text) < 50:
-                    price_str = price_match.group(1)
-                    try:
-                        price_value = float(price_str.replace(',', ''))
-                        if 0.01 <= price_value <= 100000:
-                            logging.info(f"Found CBOE AU price using selector '{selector}': {price_value}")
-                            return price_value
-                    except ValueError:
-                        continue
-    except Exception as e:
-        logging.error(f"Error with CBOE AU selector method: {e}")
-    
-    raise ValueError("Could not find last traded price on CBOE AU page")
-
-def get_vaneck_price(driver, url):
-    """
-    Navigate to a VanEck investment page and extract the ACTUAL last traded price from exchange data.
-    This function specifically looks for "Last Traded Price" from Deutsche Börse, Euronext, etc.
-    Uses visible browser mode for React components to load properly.
-    Returns a float or raises ValueError.
-    """
-    # For VanEck, we need to use a visible browser for React components to work
-    # Save current options and create new visible driver if needed
-    current_options = driver.options if hasattr(driver, 'options') else None
-    visible_driver = None
-    
-    try:
-        # Create a new visible driver specifically for VanEck
-        from selenium import webdriver
-        from selenium.webdriver.chrome.service import Service as ChromeService
-        from webdriver_manager.chrome import ChromeDriverManager
-        from selenium.webdriver.common.action_chains import ActionChains
-        
-        options = webdriver.ChromeOptions()
-        # Do NOT use headless mode - React components need visible browser
-        options.add_argument("--disable-gpu")
-        options.add_argument("--window-size=1920,1080")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-        
-        visible_driver = webdriver.Chrome(
-            service=ChromeService(ChromeDriverManager().install()),
-            options=options
-        )
-        visible_driver.set_page_load_timeout(90)
-        
-        # Load the page
-        visible_driver.get(url)
-        
-        WebDriverWait(visible_driver, 30).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        logging.info("VanEck: Page loaded successfully")
-        
-        # Wait for trading components to appear
-        try:
-            trading_block = WebDriverWait(visible_driver, 20).until(
-                EC.presence_of_element_located((By.TAG_NAME, "ve-tradinginformationblock"))
-            )
-            logging.info("VanEck: Found trading information block")
-            
-            # Scroll to the component and click to trigger loading
-            visible_driver.execute_script("arguments[0].scrollIntoView(true);", trading_block)
-            time.sleep(3)
-            
-            try:
-                ActionChains(visible_driver).move_to_element(trading_block).click().perform()
-                logging.info("VanEck: Clicked trading component to trigger loading")
-            except:
-                logging.info("VanEck: Could not click trading component")
-                
-        except:
-            logging.info("VanEck: Trading component not found initially")
-        
-        # Execute JavaScript to force React components to load
-        js_scripts = [
-            "window.scrollTo(0, document.body.scrollHeight);",
-            "window.scrollTo(0, 0);",
-            "window.dispatchEvent(new Event('resize'));",
-            "window.dispatchEvent(new Event('scroll'));",
-            """
-            document.querySelectorAll('ve-tradinginformationblock').forEach(function(el) {
-                if (el.connectedCallback) el.connectedCallback();
-                if (el.attributeChangedCallback) el.attributeChangedCallback();
-                el.dispatchEvent(new Event('load'));
-                el.dispatchEvent(new Event('DOMContentLoaded'));
-            });
-            """,
-            """
-            document.querySelectorAll('ve-tradinginformationblock').forEach(function(el) {
-                el.style.display = 'block';
-                el.style.visibility = 'visible';
-            });
-            """
-        ]
-        
-        for script in js_scripts:
-            try:
-                visible_driver.execute_script(script)
-                time.sleep(2)
-            except Exception as e:
-                logging.debug(f"VanEck: JS script error: {e}")
-        
-        logging.info("VanEck: JavaScript executed to trigger React components")
-        
-        # Monitor for trading data to appear (30 seconds max)
-        max_attempts = 15  # 30 seconds
+        # Monitor for trading data to appear (30 seconds max)
+        max_attempts = 15  # 30 seconds
         
         for attempt in range(max_attempts):
             time.sleep(2)
             
             # Get fresh page content
-            soup = BeautifulSoup(visible_driver.page_source, "html.parser")
+            soup = parse_html(visible_driver.page_source)
             page_text = soup.get_text(" ", strip=True)
             
             # Look for trading price patterns
@@ -1345,2041 +638,792 @@ def get_vaneck_price(driver, url):
     except Exception as e:
         logging.error(f"VanEck: Unexpected error: {e}")
         raise ValueError(f"Error extracting VanEck last traded price: {e}")
-        
-    finally:
-        # Always clean up the visible driver
-        if visible_driver:
-            try:
-                visible_driver.quit()
-            except:
-                pass
 
-def fetch_and_extract_data(driver, url, keywords):
+
+def price_extractor_handler(label, extract, result_key, log_failures=False):
     """
-    Fetches content with Selenium, then applies:
-      1. *New* Börse-Frankfurt: Closing price prev trading day
-      2. NASDAQ European market price
-      3. NASDAQ regular market activity price
-      4. BX Swiss instrument price
-      5. Euronext live price
-      6. TMX Money price
-      7. London Stock Exchange price
-      8. CBOE US price
-      9. CBOE AU price
-      10. VanEck price (with multiple exchange detection)
-      11. ProShares logic
-      12. Grayscale logic
-      13. QR Asset Cesta logic
-      14. Montpensier Arbével logic
-      15. Hashdex US logic
-      16. Hashdex Brazil logic
-      17. Xtrackers Galaxy Physical Bitcoin & Ethereum ETCs
-      18. Fidelity "Open" price
-      19. Generic keyword-based fallback
+    Wrap a browser extractor in the error handling every site-specific extractor shares:
+    a ValueError or unexpected error tries the AI fallback before returning an error dict.
+
+    Args:
+        label: site name used in log lines and error messages, e.g. "BX Swiss"
+        extract: function(driver, url) returning the price or raising ValueError,
+            or a "module:function" reference imported on the first call
+        result_key: key of the price in the result dict, e.g. "share price"
+        log_failures: also log ValueErrors before the AI fallback
+
+    Returns:
+        function(driver, url) -> result dict, for PRICE_EXTRACTORS
     """
-    
-    # --- Enhanced Functions for Colored Cell Issues (PRIORITY) ---
-    
-    # --- Grayscale ETF pages (ENHANCED) ---
-    if "grayscale.com" in url.lower():
+    def handler(driver, url):
         try:
-            price = enhanced_grayscale_price_extraction(driver, url)
-            return {"share price": price}
+            price = load_plugin(extract)(driver, url)
+            return {result_key: price}
         except ValueError as e:
-            logging.info(f"Enhanced Grayscale failed for {url}, trying AI fallback: {e}")
+            if log_failures:
+                logging.info(f"{label} failed for {url}, trying AI fallback: {e}")
+            # Try AI fallback before returning error
             ai_result = try_ai_fallback(driver, url)
             if "ai extracted price" in ai_result:
                 return ai_result
-            return {"error": f"Enhanced Grayscale error: {e}"}
+            return {"error": f"{label} error: {e}"}
         except Exception as e:
-            logging.error(f"Enhanced Grayscale unexpected error for {url}: {e}", exc_info=True)
+            logging.error(f"{label} unexpected error for {url}: {e}", exc_info=True)
+            # Try AI fallback before returning error
             ai_result = try_ai_fallback(driver, url)
             if "ai extracted price" in ai_result:
                 return ai_result
-            return {"error": f"Enhanced Grayscale unexpected error: {e}"}
+            return {"error": f"{label} unexpected error: {e}"}
 
-    # --- Valour pages (ENHANCED) ---
-    if "valour.com" in url.lower():
-        try:
-            price = enhanced_valour_price_extraction(driver, url)
-            return {"share price": price}
-        except ValueError as e:
-            logging.info(f"Enhanced Valour failed for {url}, trying AI fallback: {e}")
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"Enhanced Valour error: {e}"}
-        except Exception as e:
-            logging.error(f"Enhanced Valour unexpected error for {url}: {e}", exc_info=True)
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"Enhanced Valour unexpected error: {e}"}
+    handler.label = label
+    handler.extract = extract
+    return handler
 
-    # --- Bitcap pages (ENHANCED) ---
-    if "bitcap.com" in url.lower():
-        try:
-            price = enhanced_bitcap_price_extraction(driver, url)
-            return {"share price": price}
-        except ValueError as e:
-            logging.info(f"Enhanced Bitcap failed for {url}, trying AI fallback: {e}")
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"Enhanced Bitcap error: {e}"}
-        except Exception as e:
-            logging.error(f"Enhanced Bitcap unexpected error for {url}: {e}", exc_info=True)
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"Enhanced Bitcap unexpected error: {e}"}
 
-    # --- Morningstar.be pages (ENHANCED) ---
-    if "morningstar.be" in url.lower():
-        try:
-            price = enhanced_morningstar_price_extraction(driver, url)
-            return {"share price": price}
-        except ValueError as e:
-            logging.info(f"Enhanced Morningstar failed for {url}, trying AI fallback: {e}")
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"Enhanced Morningstar error: {e}"}
-        except Exception as e:
-            logging.error(f"Enhanced Morningstar unexpected error for {url}: {e}", exc_info=True)
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"Enhanced Morningstar unexpected error: {e}"}
-    
-    # --- Börse-Frankfurt: Closing price prev trading day ---
-    if "boerse-frankfurt.de" in url.lower():
-        try:
-            isin = _extract_isin_bf(url)
-            # Try to determine MIC if present in URL, otherwise default to XETR
-            mic_match = re.search(r'[?&]mic=([A-Z]{4})', url, re.IGNORECASE)
-            mic = mic_match.group(1).upper() if mic_match else "XETR"
-            
-            logging.info(f"Boerse Frankfurt API: Fetching ISIN {isin}, MIC {mic} for URL {url}")
-            close_price = get_prev_close_boerse(isin, mic=mic)
-            return {"closing price prev trading day": close_price}
-        except requests.exceptions.RequestException as req_exc:
-            logging.error(f"Boerse Frankfurt network/HTTP error for {url} (ISIN attempt failed or during API call): {req_exc}")
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"Boerse Frankfurt network/HTTP error: {req_exc}"}
-        except ValueError as val_exc: # Catches ISIN not found from _extract_isin_bf or data errors from get_prev_close_boerse
-            logging.error(f"Boerse Frankfurt data error for {url} (e.g., ISIN not found, API data issue): {val_exc}")
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"Boerse Frankfurt data error: {val_exc}"}
-        except Exception as exc: # Catch any other unexpected errors
-            logging.error(f"Boerse Frankfurt unexpected error for {url}: {exc}", exc_info=True)
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"Boerse Frankfurt unexpected error: {exc}"}
+def get_boerse_frankfurt_result(driver, url):
+    """Börse-Frankfurt: closing price of the previous trading day from the API."""
+    try:
+        isin = _extract_isin_bf(url)
+        # Try to determine MIC if present in URL, otherwise default to XETR
+        mic_match = re.search(r'[?&]mic=([A-Z]{4})', url, re.IGNORECASE)
+        mic = mic_match.group(1).upper() if mic_match else "XETR"
 
-    # --- NASDAQ European market pages ---
-    if "nasdaq.com/european-market-activity" in url.lower():
-        try:
-            price = get_nasdaq_european_market_price(driver, url)
-            return {"share price": price}
-        except ValueError as e:
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"NASDAQ European market error: {e}"}
-        except Exception as e:
-            logging.error(f"NASDAQ European market unexpected error for {url}: {e}", exc_info=True)
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"NASDAQ European market unexpected error: {e}"}
-            
-    # --- NASDAQ regular market activity pages ---
-    if "nasdaq.com/market-activity" in url.lower():
-        try:
-            price = get_nasdaq_market_activity_price(driver, url)
-            return {"share price": price}
-        except ValueError as e:
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"NASDAQ market activity error: {e}"}
-        except Exception as e:
-            logging.error(f"NASDAQ market activity unexpected error for {url}: {e}", exc_info=True)
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"NASDAQ market activity unexpected error: {e}"}
+        logging.info(f"Boerse Frankfurt API: Fetching ISIN {isin}, MIC {mic} for URL {url}")
+        close_price = get_prev_close_boerse(isin, mic=mic)
+        return {"closing price prev trading day": close_price}
+    except requests.exceptions.RequestException as req_exc:
+        logging.error(f"Boerse Frankfurt network/HTTP error for {url} (ISIN attempt failed or during API call): {req_exc}")
+        # Try AI fallback before returning error
+        ai_result = try_ai_fallback(driver, url)
+        if "ai extracted price" in ai_result:
+            return ai_result
+        return {"error": f"Boerse Frankfurt network/HTTP error: {req_exc}"}
+    except ValueError as val_exc: # Catches ISIN not found from _extract_isin_bf or data errors from get_prev_close_boerse
+        logging.error(f"Boerse Frankfurt data error for {url} (e.g., ISIN not found, API data issue): {val_exc}")
+        # Try AI fallback before returning error
+        ai_result = try_ai_fallback(driver, url)
+        if "ai extracted price" in ai_result:
+            return ai_result
+        return {"error": f"Boerse Frankfurt data error: {val_exc}"}
+    except Exception as exc: # Catch any other unexpected errors
+        logging.error(f"Boerse Frankfurt unexpected error for {url}: {exc}", exc_info=True)
+        # Try AI fallback before returning error
+        ai_result = try_ai_fallback(driver, url)
+        if "ai extracted price" in ai_result:
+            return ai_result
+        return {"error": f"Boerse Frankfurt unexpected error: {exc}"}
+
+
+def get_morningstar_fr_result(driver, url):
+    """Morningstar France: VL from the HTML page (PDF links are rewritten to the HTML page)."""
+    try:
+        # Check if this is a PDF URL and try to convert it to HTML
+        if "&Format=PDF" in url or ".pdf" in url.lower():
+            logging.info(f"Morningstar France: Detected PDF URL, attempting to convert to HTML: {url}")
+            # Remove PDF parameters to get the HTML version
+            html_url = url.replace("&Format=PDF", "").replace("&format=pdf", "")
+            # Remove DocumentId parameter as well since it's PDF-specific
+            html_url = re.sub(r'&DocumentId=[^&]*', '', html_url)
+            html_url = re.sub(r'\&tab=\d+', '', html_url)  # Remove tab parameter which might be PDF-specific
+            logging.info(f"Morningstar France: Converted URL to: {html_url}")
+            url = html_url  # Use the converted URL
+
+        price = load_plugin("src.price_extractors.morningstar:get_morningstar_fr_price")(driver, url)
+        return {"vl": price}
+    except ValueError as e:
+        # Check if the error is due to PDF format
+        if "&Format=PDF" in url or ".pdf" in url.lower():
+            # Don't try AI fallback for PDF URLs - just return a clear error
+            return {"error": f"PDF document not supported - Morningstar France requires HTML pages for price extraction"}
+        # Try AI fallback before returning error
+        ai_result = try_ai_fallback(driver, url)
+        if "ai extracted price" in ai_result:
+            return ai_result
+        return {"error": f"Morningstar France error: {e}"}
+    except Exception as e:
+        logging.error(f"Morningstar France unexpected error for {url}: {e}", exc_info=True)
+        # Try AI fallback before returning error
+        ai_result = try_ai_fallback(driver, url)
+        if "ai extracted price" in ai_result:
+            return ai_result
+        return {"error": f"Morningstar France unexpected error: {e}"}
 
-    # --- BX Swiss instrument pages ---
-    if "bxswiss.com/instruments" in url.lower():
-        try:
-            price = get_bxswiss_price(driver, url)
-            return {"last traded price": price}
-        except ValueError as e:
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"BX Swiss error: {e}"}
-        except Exception as e:
-            logging.error(f"BX Swiss unexpected error for {url}: {e}", exc_info=True)
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"BX Swiss unexpected error: {e}"}
 
-    # --- Euronext live pages ---
-    if "live.euronext.com" in url.lower():
-        try:
-            price = get_euronext_price(driver, url)
-            return {"valuation price": price}
-        except ValueError as e:
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"Euronext error: {e}"}
-        except Exception as e:
-            logging.error(f"Euronext unexpected error for {url}: {e}", exc_info=True)
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"Euronext unexpected error: {e}"}
+def is_qrasset_cesta(url):
+    """QR Asset fund pages only have a price on their #cesta tab."""
+    return url.lower().endswith("/#cesta")
 
-    # --- TMX Money pages ---
-    if "money.tmx.com" in url.lower():
-        try:
-            price = get_tmx_price(driver, url)
-            return {"share price": price}
-        except ValueError as e:
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"TMX Money error: {e}"}
-        except Exception as e:
-            logging.error(f"TMX Money unexpected error for {url}: {e}", exc_info=True)
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"TMX Money unexpected error: {e}"}
 
-    # --- London Stock Exchange pages ---
-    if "londonstockexchange.com" in url.lower():
-        try:
-            price = get_london_stock_exchange_price(driver, url)
-            return {"share price": price}
-        except ValueError as e:
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"London Stock Exchange error: {e}"}
-        except Exception as e:
-            logging.error(f"London Stock Exchange unexpected error for {url}: {e}", exc_info=True)
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"London Stock Exchange unexpected error: {e}"}
+def fetch_and_extract_data(driver, url, keywords):
+    """
+    Fetches content with Selenium, then applies:
+      1. The site-specific browser extractor registered for the URL's host and
+         path in PRICE_EXTRACTORS (Börse-Frankfurt API, NASDAQ, BX Swiss,
+         Euronext, TMX, LSE, CBOE, VanEck, ...)
+      2. The site-specific BeautifulSoup extractor from SOUP_PRICE_EXTRACTORS
+         (ProShares, Grayscale, QR Asset, Montpensier Arbével, Hashdex, Xtrackers)
+      3. Fidelity "Open" price / SIX-Group previous close
+      4. Generic keyword-based fallback
+
+    Pages handled by a site-specific BeautifulSoup extractor (2) are first
+    tried with a plain HTTP GET and only rendered in Chrome if that finds no
+    price (see fetch_static_price).
+    """
+    # Network events of earlier rows are only read by extractors with a NetworkRule;
+    # drop them every row so they do not pile up in chromedriver's performance log
+    drain_network_log(driver)
+    # Let sites that need images/fonts/etc. load them before any extractor navigates
+    apply_resource_blocking(driver, url)
+    
+    # --- Site-specific browser extractors (registered in PRICE_EXTRACTORS below) ---
+    handler = PRICE_EXTRACTORS.lookup(url)
+    if handler is not None:
+        return handler(driver, url)
+
+    # --- HTTP-first tier: several of the remaining pages are server-rendered, so try a plain
+    # GET with the same BeautifulSoup logic before paying for a full Chrome navigation ---
+    http_result = fetch_static_price(url)
+    if http_result is not None:
+        return http_result
+
+    snapshot = None
+    try:
+        # Load the page once; the BeautifulSoup extractors below all work on this snapshot
+        snapshot = load_snapshot(driver, url, Selector("body", require_text=False), deadline=15)
 
-    # --- CBOE US pages ---
-    if "cboe.com/us" in url.lower():
-        try:
-            price = get_cboe_us_price(driver, url)
-            return {"share price": price}
-        except ValueError as e:
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"CBOE US error: {e}"}
-        except Exception as e:
-            logging.error(f"CBOE US unexpected error for {url}: {e}", exc_info=True)
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"CBOE US unexpected error: {e}"}
+        # --- 8. Fidelity "Open" price ---
+        if "digital.fidelity.com" in url.lower() or "institutional.fidelity.com" in url.lower():
+            try:
+                open_price = get_fidelity_open_price(driver, url)
+                return {"open": open_price}
+            except ValueError as e:
+                return {"error": f"Fidelity scrape error: {e}"}
 
-    # --- CBOE AU pages ---
-    if "cboe.com/au" in url.lower():
-        try:
-            price = get_cboe_au_price(driver, url)
-            return {"share price": price}
-        except ValueError as e:
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"CBOE AU error: {e}"}
-        except Exception as e:
-            logging.error(f"CBOE AU unexpected error for {url}: {e}", exc_info=True)
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"CBOE AU unexpected error: {e}"}
+        # --- SIX-Group "Previous close price" extraction ---
+        if "six-group.com" in url.lower():
+            # 1) Wait until the <dt> for "Previous close price" is in the DOM
+            prev_dt = WebDriverWait(driver, 15).until(
+                EC.presence_of_element_located((
+                    By.XPATH,
+                    "//dt[contains(normalize-space(.), 'Previous close price')]"
+                ))
+            )
+            # 2) Grab its immediately following <dd>
+            dd = prev_dt.find_element(
+                By.XPATH,
+                "following-sibling::dd[1]"
+            )
+            price_text = dd.text.strip()  # e.g. "9.31 USD" or "9.31"
 
-    # --- Morningstar France pages ---
-    if "morningstar.fr" in url.lower():
-        try:
-            # Check if this is a PDF URL and try to convert it to HTML
-            if "&Format=PDF" in url or ".pdf" in url.lower():
-                logging.info(f"Morningstar France: Detected PDF URL, attempting to convert to HTML: {url}")
-                # Remove PDF parameters to get the HTML version
-                html_url = url.replace("&Format=PDF", "").replace("&format=pdf", "")
-                # Remove DocumentId parameter as well since it's PDF-specific
-                html_url = re.sub(r'&DocumentId=[^&]*', '', html_url)
-                html_url = re.sub(r'\&tab=\d+', '', html_url)  # Remove tab parameter which might be PDF-specific
-                logging.info(f"Morningstar France: Converted URL to: {html_url}")
-                url = html_url  # Use the converted URL
+            # 3) Extract number and optional currency
+            # Regex: Group 1 captures the number, Group 2 (optional) captures the currency
+            m = re.search(r"([\d\.,]+)(?:\s*([A-Za-z]{3}))?", price_text)
             
-            price = get_morningstar_fr_price(driver, url)
-            return {"vl": price}
-        except ValueError as e:
-            # Check if the error is due to PDF format
-            if "&Format=PDF" in url or ".pdf" in url.lower():
-                # Don't try AI fallback for PDF URLs - just return a clear error
-                return {"error": f"PDF document not supported - Morningstar France requires HTML pages for price extraction"}
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"Morningstar France error: {e}"}
-        except Exception as e:
-            logging.error(f"Morningstar France unexpected error for {url}: {e}", exc_info=True)
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"Morningstar France unexpected error: {e}"}
-
-    # --- Franklin Templeton pages ---
-    if "franklintempleton.com" in url.lower():
-        try:
-            price = get_franklin_templeton_price(driver, url)
-            return {"market price": price}
-        except ValueError as e:
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"Franklin Templeton error: {e}"}
-        except Exception as e:
-            logging.error(f"Franklin Templeton unexpected error for {url}: {e}", exc_info=True)
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"Franklin Templeton unexpected error: {e}"}
-
-    # --- Amina Group pages ---
-    if "aminagroup.com" in url.lower():
-        try:
-            price = get_aminagroup_price(driver, url)
-            return {"current price": price}
-        except ValueError as e:
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"Amina Group error: {e}"}
-        except Exception as e:
-            logging.error(f"Amina Group unexpected error for {url}: {e}", exc_info=True)
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"Amina Group unexpected error: {e}"}
-
-    # --- Schwab Asset Management pages ---
-    if "schwabassetmanagement.com" in url.lower():
-        try:
-            price = get_schwab_asset_management_price(driver, url)
-            return {"market price": price}
-        except ValueError as e:
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"Schwab Asset Management error: {e}"}
-        except Exception as e:
-            logging.error(f"Schwab Asset Management unexpected error for {url}: {e}", exc_info=True)
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"Schwab Asset Management unexpected error: {e}"}
+            if not m:
+                # If even the number part isn't found with the flexible regex
+                return {"error": f"Could not extract number from SIX Group price '{price_text}'"}
 
-    # --- Evolve ETFs pages ---
-    if "evolveetfs.com" in url.lower():
-        try:
-            price = get_evolve_etfs_price(driver, url)
-            return {"market price": price}
-        except ValueError as e:
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"Evolve ETFs error: {e}"}
-        except Exception as e:
-            logging.error(f"Evolve ETFs unexpected error for {url}: {e}", exc_info=True)
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"Evolve ETFs unexpected error: {e}"}
+            num_raw = m.group(1)
+            currency_code = m.group(2) # This will be None if currency not found
+            
+            # 4) Normalize thousand/decimal separators
+            num_clean = ""
+            num_dots = num_raw.count('.')
+            num_commas = num_raw.count(',')
 
-    # --- 21Shares pages ---
-    if "21shares.com" in url.lower():
-        try:
-            price = get_21shares_price(driver, url)
-            return {"market price": price}
-        except ValueError as e:
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"21Shares error: {e}"}
-        except Exception as e:
-            logging.error(f"21Shares unexpected error for {url}: {e}", exc_info=True)
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"21Shares unexpected error: {e}"}
-
-    # --- Ninepoint pages ---
-    if "ninepoint.com" in url.lower():
-        try:
-            price = get_ninepoint_price(driver, url)
-            return {"market price": price}
-        except ValueError as e:
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"Ninepoint error: {e}"}
-        except Exception as e:
-            logging.error(f"Ninepoint unexpected error for {url}: {e}", exc_info=True)
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"Ninepoint unexpected error: {e}"}
-
-    # --- TradingView pages ---
-    if "tradingview.com" in url.lower():
-        try:
-            price = get_tradingview_price(driver, url)
-            return {"market price": price}
-        except ValueError as e:
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"TradingView error: {e}"}
-        except Exception as e:
-            logging.error(f"TradingView unexpected error for {url}: {e}", exc_info=True)
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"TradingView unexpected error: {e}"}
-
-    # --- BetaShares pages ---
-    if "betashares.com.au" in url.lower():
-        try:
-            price = get_betashares_price(driver, url)
-            return {"market price": price}
-        except ValueError as e:
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"BetaShares error: {e}"}
-        except Exception as e:
-            logging.error(f"BetaShares unexpected error for {url}: {e}", exc_info=True)
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"BetaShares unexpected error: {e}"}
-
-    # --- CSO P Asset pages ---
-    if "csopasset.com" in url.lower():
-        try:
-            price = get_csopasset_price(driver, url)
-            return {"closing price": price}
-        except ValueError as e:
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"CSO P Asset error: {e}"}
-        except Exception as e:
-            logging.error(f"CSO P Asset unexpected error for {url}: {e}", exc_info=True)
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"CSO P Asset unexpected error: {e}"}
-
-    # --- Valour pages ---
-    if "valour.com" in url.lower():
-        try:
-            price = get_valour_price(driver, url)
-            return {"closing price": price}
-        except ValueError as e:
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"Valour error: {e}"}
-        except Exception as e:
-            logging.error(f"Valour unexpected error for {url}: {e}", exc_info=True)
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"Valour unexpected error: {e}"}
-
-    # --- Purpose Investments pages ---
-    if "purposeinvest.com" in url.lower():
-        try:
-            price = get_purposeinvest_price(driver, url)
-            return {"closing price": price}
-        except ValueError as e:
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"Purpose Investments error: {e}"}
-        except Exception as e:
-            logging.error(f"Purpose Investments unexpected error for {url}: {e}", exc_info=True)
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"Purpose Investments unexpected error: {e}"}
-
-    # --- VanEck pages ---
-    if "vaneck.com" in url.lower():
-        try:
-            price = get_vaneck_price(driver, url)
-            return {"last traded price": price}
-        except ValueError as e:
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"VanEck error: {e}"}
-        except Exception as e:
-            logging.error(f"VanEck unexpected error for {url}: {e}", exc_info=True)
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"VanEck unexpected error: {e}"}
-
-    # --- bitcap.com pages ---
-    if "bitcap.com" in url.lower():
-        try:
-            price = get_bitcap_price(driver, url)
-            return {"share price": price}
-        except ValueError as e:
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"bitcap error: {e}"}
-        except Exception as e:
-            logging.error(f"bitcap unexpected error for {url}: {e}", exc_info=True)
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"bitcap unexpected error: {e}"}
-
-    # --- qrasset.com.br pages ---
-    if "qrasset.com.br" in url.lower() and url.lower().endswith("/#cesta"):
-        try:
-            price = get_qrasset_cota_price(driver, url)
-            return {"valor da cota": price}
-        except ValueError as e:
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"QR Asset error: {e}"}
-        except Exception as e:
-            logging.error(f"QR Asset unexpected error for {url}: {e}", exc_info=True)
-            # Try AI fallback before returning error
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-            return {"error": f"QR Asset unexpected error: {e}"}
-
-    # Fallback to other extraction logic if not Börse-Frankfurt or NASDAQ
-    # or if the above failed (though it should return an error dict)
-    
-    try:
-        driver.get(url)
-        WebDriverWait(driver, 15).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-
-        # --- 1. ProShares ETF pages ---
-        if "proshares.com/our-etfs" in url.lower():
-            label = soup.find(text=re.compile(r"Market Price", re.IGNORECASE))
-            if label:
-                price_text = label.find_next(text=re.compile(r"\$\d{1,3}(?:,\d{3})*(?:\.\d{2})?"))
-                if price_text:
-                    num = price_text.strip().replace("$", "").replace(",", "")
-                    try:
-                        return {"market price": float(num)}
-                    except ValueError:
-                        return {"error": f"Could not parse ProShares price '{num}'"}
-                return {"error": "Market Price value not found"}
-            return {"error": "Market Price label not found"}
-
-        # --- 2. Grayscale ETF pages ---
-        if "grayscale.com/funds" in url.lower() or "etfs.grayscale.com" in url.lower():
-            # IMPORTANT: For www.grayscale.com URLs, the content is loaded dynamically with JavaScript
-            # We need to use the already-loaded page content from Selenium (soup is from driver.page_source)
-            
-            # Get the full page text from the already-loaded Selenium page
-            page_text = soup.get_text(" ", strip=True)
-            
-            # Method 1: Look for "Market Price as of MM/DD/YYYY $XX.XX" pattern (MOST RELIABLE)
-            pattern1 = re.search(
-                r'Market Price\s+as\s+of\s+\d{1,2}/\d{1,2}/\d{4}\s*\$\s*([\d,\.]+)', 
-                page_text, re.IGNORECASE
-            )
-            if pattern1:
-                price_str = pattern1.group(1)
-                logging.info(f"Found Grayscale price with 'Market Price as of DATE $PRICE': {price_str}")
-                price_normalized = price_str.replace(',', '')
-                try:
-                    return {"market price": float(price_normalized)}
-                except ValueError:
-                    return {"error": f"Could not parse Grayscale price '{price_str}'"}
-            
-            # Method 2: Look for price before "Market Price as of" pattern 
-            # Pattern: $XX.XX Market Price as of MM/DD/YYYY
-            pattern2 = re.search(
-                r'\$\s*([\d,\.]+)\s+Market Price\s+as\s+of\s+\d{1,2}/\d{1,2}/\d{4}', 
-                page_text, re.IGNORECASE
-            )
-            if pattern2:
-                price_str = pattern2.group(1)
-                logging.info(f"Found Grayscale price with '$PRICE Market Price as of DATE': {price_str}")
-                price_normalized = price_str.replace(',', '')
-                try:
-                    return {"market price": float(price_normalized)}
-                except ValueError:
-                    return {"error": f"Could not parse Grayscale price '{price_str}'"}
-            
-            # Method 3: Look for flexible "Market Price" and "as of" with price nearby
-            # This handles cases where there might be extra text between elements
-            pattern3 = re.search(
-                r'Market Price.*?as\s+of.*?\$\s*([\d,\.]+)', 
-                page_text, re.IGNORECASE | re.DOTALL
-            )
-            if pattern3:
-                price_str = pattern3.group(1)
-                # Filter out obviously wrong values (too large for a fund price)
-                price_normalized = price_str.replace(',', '')
-                try:
-                    price_value = float(price_normalized)
-                    if price_value < 10000:  # Reasonable fund price range
-                        logging.info(f"Found Grayscale price with flexible pattern: {price_str}")
-                        return {"market price": price_value}
-                    else:
-                        logging.info(f"Grayscale price {price_value} seems too large for a fund, continuing search...")
-                except ValueError:
-                    logging.error(f"Could not parse Grayscale price '{price_str}' as float")
-            
-            # Method 4: Look for heading elements with dollar signs that might be prices
-            # Based on the HTML structure like #### $85.76
-            headings = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-            for heading in headings:
-                heading_text = heading.get_text(strip=True)
-                # Look for price patterns in headings
-                price_match = re.search(r'\$\s*([\d,\.]+)', heading_text)
-                if price_match:
-                    price_str = price_match.group(1)
-                    try:
-                        price_value = float(price_str.replace(',', ''))
-                        # Filter for reasonable fund prices (between $0.01 and $10,000)
-                        if 0.01 <= price_value <= 10000:
-                            # Check if this heading is near market price text
-                            next_sibling = heading.find_next_sibling()
-                            if next_sibling and 'market price' in next_sibling.get_text(' ', strip=True).lower():
-                                logging.info(f"Found Grayscale price in heading near 'market price': {price_str}")
-                                return {"market price": price_value}
-                    except ValueError:
-                        continue
-            
-            # Method 5: Look for any reasonable price near "Market Price" text
-            market_price_elements = soup.find_all(
-                lambda tag: tag.name and 'market price' in tag.get_text(' ', strip=True).lower()
-            )
-            
-            for element in market_price_elements:
-                # Check previous and next siblings for prices
-                for sibling in [element.find_previous_sibling(), element.find_next_sibling()]:
-                    if sibling:
-                        sibling_text = sibling.get_text(strip=True)
-                        price_match = re.search(r'\$\s*([\d,\.]+)', sibling_text)
-                        if price_match:
-                            price_str = price_match.group(1)
-                            try:
-                                price_value = float(price_str.replace(',', ''))
-                                if 0.01 <= price_value <= 10000:
-                                    logging.info(f"Found Grayscale price near 'Market Price' element: {price_str}")
-                                    return {"market price": price_value}
-                            except ValueError:
-                                continue
-            
-            return {"error": "Grayscale market price not found"}
-
-        # --- 3. QR Asset Cesta pages ---
-        if "qrasset.com.br" in url.lower() and url.lower().endswith("/#cesta"):
-            label = soup.find("span", class_="label", string=re.compile(r"Valor da Cota", re.IGNORECASE))
-            if not label:
-                return {"error": "Valor da Cota label not found"}
-            value_span = label.find_next_sibling("span", class_="value")
-            if not value_span:
-                return {"error": "Valor da Cota value element not found"}
-            price_text = value_span.get_text(strip=True)
-            price_pattern = re.compile(r"R\$\s*\d{1,3}(?:\.\d{3})*,\d{2}")
-            if not price_pattern.fullmatch(price_text):
-                return {"error": f"Unexpected format '{price_text}'"}
-            num_text = price_text.replace("R$", "").strip().replace(".", "").replace(",", ".")
-            try:
-                return {"valor da cota": float(num_text)}
-            except ValueError:
-                return {"error": f"Could not parse Valor da Cota '{num_text}'"}
-
-        # --- 4. Montpensier Arbével fund pages ---
-        if "montpensier-arbevel.com/fonds/" in url.lower():
-            vl_label = soup.find(text=re.compile(r"^VL$", re.IGNORECASE))
-            if not vl_label:
-                return {"error": "VL label not found"}
-            price_tag = vl_label.find_next(string=re.compile(r"[\d\.\,]+\s*€"))
-            if not price_tag:
-                return {"error": "VL value not found"}
-            raw = price_tag.strip().replace("€","").strip()
-            num = raw.replace(".","").replace(",",".")
-            try:
-                vl = float(num)
-            except ValueError:
-                return {"error": f"Could not parse VL '{raw}'"}
-            result = {"vl": vl}
-            date_tag = price_tag.find_next(string=re.compile(r"au\s*\d{2}/\d{2}/\d{4}", re.IGNORECASE))
-            if date_tag:
-                result["date"] = date_tag.strip()
-            return result
-
-        # --- 5. Hashdex US ETF pages (e.g. https://www.hashdex-etfs.com/NCIQ) ---
-        if "hashdex-etfs.com" in url.lower() or "hashdex-etfs.com" in url.lower():
-            closing = soup.find(
-                lambda tag: tag.name in ("h3","h4")
-                            and re.search(r"Closing Price", tag.get_text(strip=True), re.IGNORECASE)
-            )
-            if not closing:
-                return {"error": "Closing Price label not found"}
-            price_tag = closing.find_previous_sibling(
-                lambda tag: tag.name == "h4"
-                            and re.search(r"USD\s*\d{1,3}(?:,\d{3})*(?:\.\d{2})?", tag.get_text(strip=True))
-            )
-            if not price_tag:
-                return {"error": "Closing Price value not found"}
-            txt = price_tag.get_text(strip=True)
-            m = re.search(r"USD\s*([\d,]+\.\d{2})", txt)
-            if not m:
-                return {"error": f"Unexpected format '{txt}'"}
-            num = m.group(1).replace(",","")
-            try:
-                return {"closing price": float(num)}
-            except ValueError:
-                return {"error": f"Could not parse Closing Price '{num}'"}
-
-        # --- 6. Hashdex Brazil ETF pages (/pt-BR/products/…) ---
-        if url.lower().startswith("https://hashdex.com/pt-br/products/"):
-            page_text = soup.get_text(" ", strip=True)
-            m = re.search(r"Valor da Cota\s*R\$\s*([\d\.]+?,\d{2})", page_text, re.IGNORECASE)
-            if not m:
-                return {"error": "Valor da Cota not found or unexpected format"}
-            num_text = m.group(1).replace(".", "").replace(",", ".")
-            try:
-                return {"valor da cota": float(num_text)}
-            except ValueError:
-                return {"error": f"Could not parse Valor da Cota '{num_text}'"}
-
-        # --- Xtrackers Galaxy Physical Bitcoin & Ethereum ETCs (CH1315732250 & CH1315732268) ---
-        if url.lower().startswith("https://etf.dws.com/") and re.search(
-                r"xtrackers-galaxy-physical-(bitcoin|ethereum)-etc-securities",
-                url.lower()
-            ):
-            # Pull all text and look for "Value per ETC security ... USD"
-            text = soup.get_text(" ", strip=True)
-            m = re.search(r"Value per ETC security.*?([\d\.,]+)\s*USD", text, re.IGNORECASE)
-            if not m:
-                return {"error": "Value per ETC security not found"}
-
-            raw_val = m.group(1)
-            # Normalize both European ("7,57") and US ("18.25") formats:
-            if "," in raw_val and "." in raw_val:
-                # e.g. "1.234,56" → "1234.56"
-                norm = raw_val.replace(".", "").replace(",", ".")
-            elif "," in raw_val:
-                # e.g. "7,57" → "7.57"
-                norm = raw_val.replace(",", ".")
-            else:
-                # e.g. "18.25" → "18.25"
-                norm = raw_val.replace(",", "")
-
-            try:
-                return {"value per etc security": float(norm)}
-            except ValueError:
-                return {"error": f"Could not parse '{raw_val}' as float"}
-
-        # --- 8. Fidelity "Open" price ---
-        if "digital.fidelity.com" in url.lower() or "institutional.fidelity.com" in url.lower():
-            try:
-                open_price = get_fidelity_open_price(driver, url)
-                return {"open": open_price}
-            except ValueError as e:
-                return {"error": f"Fidelity scrape error: {e}"}
-
-        # --- SIX-Group "Previous close price" extraction ---
-        if "six-group.com" in url.lower():
-            driver.get(url)
-            # 1) Wait until the <dt> for "Previous close price" is in the DOM
-            prev_dt = WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((
-                    By.XPATH,
-                    "//dt[contains(normalize-space(.), 'Previous close price')]"
-                ))
-            )
-            # 2) Grab its immediately following <dd>
-            dd = prev_dt.find_element(
-                By.XPATH,
-                "following-sibling::dd[1]"
-            )
-            price_text = dd.text.strip()  # e.g. "9.31 USD" or "9.31"
-
-            # 3) Extract number and optional currency
-            # Regex: Group 1 captures the number, Group 2 (optional) captures the currency
-            m = re.search(r"([\d\.,]+)(?:\s*([A-Za-z]{3}))?", price_text)
-            
-            if not m:
-                # If even the number part isn't found with the flexible regex
-                return {"error": f"Could not extract number from SIX Group price '{price_text}'"}
-
-            num_raw = m.group(1)
-            currency_code = m.group(2) # This will be None if currency not found
-            
-            # 4) Normalize thousand/decimal separators
-            num_clean = ""
-            num_dots = num_raw.count('.')
-            num_commas = num_raw.count(',')
-
-            if num_dots > 0 and num_commas > 0:
-                # Both comma and period exist
-                if num_raw.rfind(',') > num_raw.rfind('.'): # European style: e.g., "1.234,56"
-                    num_clean = num_raw.replace('.', '').replace(',', '.')
-                else: # US style: e.g., "1,234.56"
-                    num_clean = num_raw.replace(',', '')
-            elif num_dots > 0: # Only dots
-                if num_dots > 1: # Multiple dots, assume thousands separators: "1.234.567" -> "1234567" or "2.213" -> "2213"
-                    num_clean = num_raw.replace('.', '')
-                else: # Single dot, assume decimal: "123.45" -> "123.45"
-                    num_clean = num_raw
-            elif num_commas > 0: # Only commas
-                if num_commas > 1: # Multiple commas, assume thousands separators: "1,234,567" -> "1234567"
-                    num_clean = num_raw.replace(',', '')
-                else: # Single comma, assume decimal: "123,45" -> "123.45"
-                    num_clean = num_raw.replace(',', '.')
-            else: # No separators (e.g., "123")
-                num_clean = num_raw
+            if num_dots > 0 and num_commas > 0:
+                # Both comma and period exist
+                if num_raw.rfind(',') > num_raw.rfind('.'): # European style: e.g., "1.234,56"
+                    num_clean = num_raw.replace('.', '').replace(',', '.')
+                else: # US style: e.g., "1,234.56"
+                    num_clean = num_raw.replace(',', '')
+            elif num_dots > 0: # Only dots
+                if num_dots > 1: # Multiple dots, assume thousands separators: "1.234.567" -> "1234567" or "2.213" -> "2213"
+                    num_clean = num_raw.replace('.', '')
+                else: # Single dot, assume decimal: "123.45" -> "123.45"
+                    num_clean = num_raw
+            elif num_commas > 0: # Only commas
+                if num_commas > 1: # Multiple commas, assume thousands separators: "1,234,567" -> "1234567"
+                    num_clean = num_raw.replace(',', '')
+                else: # Single comma, assume decimal: "123,45" -> "123.45"
+                    num_clean = num_raw.replace(',', '.')
+            else: # No separators (e.g., "123")
+                num_clean = num_raw
 
             try:
                 price_val = float(num_clean)
             except ValueError:
-                return {"error": f"Could not parse number from SIX Group '{num_clean}' (original: '{price_text}')"}
-
-            result_data = {"previous close": price_val}
-            if currency_code: # Only add currency to the result if it was actually found
-                result_data["currency"] = currency_code.upper()
-            
-            return result_data
-
-        # --- 9. Generic keyword-based fallback (KEEP THIS AS LAST RESORT) ---
-        extracted = {}
-        page_text = " ".join(soup.strings).lower()
-        for keyword in keywords:
-            pat = re.compile(
-                rf"\b{re.escape(keyword.lower())}\b[^\d]*?([0-9,]+\.?[0-9]*)",
-                re.IGNORECASE
-            )
-            m = pat.search(page_text)
-            if m:
-                raw = m.group(1)
-                cleaned = re.sub(r"[^\d\.]", "", raw)
-                try:
-                    if cleaned.count('.') > 1 or not cleaned.replace('.', '', 1).isdigit():
-                        raise ValueError
-                    potential_price = float(cleaned)
-                    
-                    # ENHANCED: Use validation to filter out invalid prices
-                    if is_valid_share_price(potential_price, page_text, url):
-                        extracted[keyword] = potential_price
-                    else:
-                        logging.debug(f"Generic fallback rejected invalid price {potential_price} for keyword '{keyword}' on {url}")
-                        extracted[keyword] = f"Error: invalid price value '{raw}' (likely not a share price)"
-                except ValueError:
-                    extracted[keyword] = f"Error: cannot parse '{raw}'"
-        
-        # If generic fallback found something valid, return it
-        if extracted and any(isinstance(v, float) for v in extracted.values()):
-            return extracted
-        
-        # If no traditional method worked, try AI fallback as final resort
-        logging.info(f"All traditional methods failed for {url}, trying AI fallback...")
-        ai_result = try_ai_fallback(driver, url)
-        if "ai extracted price" in ai_result:
-            return ai_result
-        
-        # If even AI failed, return the generic fallback results (if any) or empty dict
-        return extracted if extracted else {}
-
-    except Exception as e:
-        logging.error(f"Error processing URL {url}: {e}", exc_info=True)
-        # Try AI fallback as final resort even for unexpected exceptions
-        try:
-            logging.info(f"Unexpected error occurred for {url}, trying AI fallback...")
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                return ai_result
-        except Exception as ai_e:
-            logging.error(f"AI fallback also failed for {url}: {ai_e}")
-        
-        return {"error": str(e)}
-
-def _bf_get_salt(session: requests.Session) -> str:
-    """Grab the tracing-salt from the current main.*.js bundle."""
-    r = session.get("https://www.boerse-frankfurt.de/")
-    r.raise_for_status() # Ensure we got a valid response
-    
-    # Try the new pattern first (without leading slash)
-    match = re.search(r'src="(main\.[^"]+\.js)"', r.text)
-    if not match:
-        # Try the old pattern (with leading slash) as fallback
-        match = re.search(r'src="/(main\.[^"]+\.js)"', r.text)
-    
-    if not match:
-        raise ValueError("Could not find main JS bundle in Boerse Frankfurt homepage.")
-    
-    bundle_path = match.group(1)
-    # Ensure the path starts with / for the URL construction
-    if not bundle_path.startswith('/'):
-        bundle_path = '/' + bundle_path
-        
-    js_url = f"https://www.boerse-frankfurt.de{bundle_path}"
-    js_r = session.get(js_url)
-    js_r.raise_for_status()
-    js = js_r.text
-    salt_match = re.search(r'salt:"(\w+)"', js)
-    if not salt_match:
-        raise ValueError("Could not find salt in Boerse Frankfurt JS bundle.")
-    return salt_match.group(1)
-
-def _bf_headers(url: str, salt: str) -> dict:
-    now      = datetime.utcnow()
-    localnow = datetime.now()
-    ts       = now.isoformat(timespec="milliseconds") + "Z"
-    trace_id = hashlib.md5(f"{ts}{url}{salt}".encode()).hexdigest()
-    xsec     = hashlib.md5(localnow.strftime("%Y%m%d%H%M").encode()).hexdigest()
-    return {
-        "accept": "application/json, text/plain, */*",
-        "client-date": ts,
-        "x-client-traceid": trace_id,
-        "x-security": xsec,
-        "origin": "https://www.boerse-frankfurt.de",
-        "referer": "https://www.boerse-frankfurt.de/",
-    }
-
-def get_prev_close_boerse(isin: str, mic: str = "XETR") -> float:
-    """Lightweight – no Selenium – fetch of 'Closing price prev trading day'."""
-    sess = requests.Session()
-    # Add a user-agent to the session, as some servers might require it.
-    sess.headers.update({
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-    })
-    salt = _bf_get_salt(sess)
-
-    # previous *trading* day (naive)
-    prev = date.today()
-    # Adjust for weekend: if today is Sat, prev is Fri. If Sun, prev is Fri.
-    if prev.weekday() == 5: # Saturday
-        prev -= timedelta(days=1)
-    elif prev.weekday() == 6: # Sunday
-        prev -= timedelta(days=2)
-    
-    # Now, ensure 'prev' is the last *trading* day by checking again
-    # and decrementing if it's a weekend or the current day.
-    # This loop handles the case where today is Monday, so prev becomes Sunday, then Saturday, then Friday.
-    # It also handles the initial decrement if today is a weekday.
-    prev -= timedelta(days=1) # Go to previous day
-    while prev.weekday() >= 5: # Skip Saturday (5) or Sunday (6)
-        prev -= timedelta(days=1)
-
-
-    params = {
-        "isin": isin,
-        "mic": mic,
-        "minDate": prev.isoformat(),
-        "maxDate": prev.isoformat(),
-        "limit": 1,
-        "cleanSplit": "false",
-        "cleanPayout": "false",
-        "cleanSubscription": "false",
-    }
-    api_url_base = "https://api.boerse-frankfurt.de/v1/data/price_history"
-    query_string = urlencode(params)
-    full_url = f"{api_url_base}?{query_string}"
-    
-    r = sess.get(full_url, headers=_bf_headers(full_url, salt), timeout=(5, 15)) # Increased connect timeout slightly
-    r.raise_for_status() # Will raise an HTTPError if the HTTP request returned an unsuccessful status code
-    
-    response_json = r.json()
-    data = response_json.get("data") # Use .get for safer access
-    
-    if not data or not isinstance(data, list) or len(data) == 0:
-        raise ValueError(f"No price data returned from API for ISIN {isin} on {prev.isoformat()}. Response: {response_json}")
-    
-    # Check if 'close' key exists and is a number
-    if "close" not in data[0] or not isinstance(data[0]["close"], (int, float)):
-        raise ValueError(f"Unexpected data format: 'close' field missing or not a number in {data[0]}. Response: {response_json}")
-        
-    return float(data[0]["close"])
-
-def is_blue_cell(cell):
-    """
-    Check if a cell has any blue-ish color (simplified detection)
-    Returns True if the cell appears to be blue, False otherwise
-    """
-    try:
-        if cell.fill and hasattr(cell.fill, 'fgColor') and cell.fill.fgColor:
-            color = cell.fill.fgColor
-            # Check different color representations
-            if hasattr(color, 'rgb') and color.rgb:
-                # Handle both string and RGB object types
-                rgb_value = color.rgb
-                if hasattr(rgb_value, 'value'):  # RGB object case
-                    rgb_value = rgb_value.value if rgb_value.value else str(rgb_value)
-                elif not isinstance(rgb_value, str):  # Other object types
-                    rgb_value = str(rgb_value)
-                
-                # Remove alpha channel if present (ARGB format)
-                if isinstance(rgb_value, str) and len(rgb_value) == 8:  # ARGB format
-                    rgb_value = rgb_value[2:]  # Remove first 2 characters (alpha)
-                
-                # Simplified blue detection - check if it contains blue-ish values
-                # Look for various shades of blue (not just the exact #00B0F0)
-                if isinstance(rgb_value, str) and len(rgb_value) >= 6:
-                    # Convert to uppercase for consistent checking
-                    rgb_upper = rgb_value.upper()
-                    # Check for common blue patterns
-                    blue_patterns = [
-                        '00B0F0',  # Original target blue
-                        '0000FF',  # Pure blue
-                        '4472C4',  # Another common blue
-                        '5B9BD5',  # Light blue
-                        '2F75B5',  # Dark blue
-                    ]
-                    
-                    # Check if it matches any blue pattern or if blue component is dominant
-                    for pattern in blue_patterns:
-                        if pattern in rgb_upper:
-                            return True
-                    
-                    # Check if the blue component (last 2 digits) is significantly higher than red/green
-                    try:
-                        if len(rgb_upper) == 6:
-                            red = int(rgb_upper[0:2], 16)
-                            green = int(rgb_upper[2:4], 16)
-                            blue = int(rgb_upper[4:6], 16)
-                            # Consider it blue if blue component is much higher than red and green
-                            if blue > 150 and blue > (red + green):
-                                return True
-                    except ValueError:
-                        pass
-                        
-            elif hasattr(color, 'indexed') and color.indexed is not None:
-                # Handle indexed colors - some indexed colors are blue
-                # Common blue indexed colors: 5 (blue), 41 (light blue), etc.
-                blue_indexed = [5, 41, 44, 49]
-                return color.indexed in blue_indexed
-    except Exception:
-        # If anything fails, just return False
-        pass
-    return False
-
-def preserve_cell_color_and_set_value(cell, value):
-    """
-    Set cell value while preserving existing fill color
-    """
-    from openpyxl.styles import PatternFill
-    
-    # Store the current fill properties before modifying
-    current_fill_info = None
-    try:
-        if cell.fill and hasattr(cell.fill, 'patternType') and cell.fill.patternType:
-            # Extract fill properties to recreate later
-            current_fill_info = {
-                'patternType': cell.fill.patternType,
-                'fgColor': None,
-                'bgColor': None
-            }
-            
-            # Try to extract foreground color
-            if hasattr(cell.fill, 'fgColor') and cell.fill.fgColor:
-                current_fill_info['fgColor'] = cell.fill.fgColor
-            
-            # Try to extract background color  
-            if hasattr(cell.fill, 'bgColor') and cell.fill.bgColor:
-                current_fill_info['bgColor'] = cell.fill.bgColor
-    except Exception:
-        # If we can't extract fill info, we'll just set the value without preserving color
-        current_fill_info = None
-    
-    # Set the value
-    cell.value = value
-    
-    # Restore the fill if we extracted the info successfully
-    if current_fill_info and current_fill_info['patternType']:
-        try:
-            # Create a new PatternFill with the same properties
-            new_fill = PatternFill(
-                patternType=current_fill_info['patternType'],
-                fgColor=current_fill_info['fgColor'],
-                bgColor=current_fill_info['bgColor']
-            )
-            cell.fill = new_fill
-        except Exception:
-            # If restoring fails, just leave the cell with its new value
-            pass
-
-def get_bitcap_price(driver, url):
-    """
-    Extract share price from bitcap.com fund pages.
-    
-    Specifically designed for BIT Crypto Opportunities and other BIT Capital funds
-    that display share prices in the format "Share price €81.28*" with optional
-    date information like "*As of 30.4.2025".
-    
-    Args:
-        driver: Selenium WebDriver instance
-        url: Bitcap URL (e.g., https://bitcap.com/en/bit-crypto-opportunities-institutional-en/?confirmed=1)
-    
-    Returns:
-        float: The extracted price value
-        
-    Raises:
-        ValueError: If price extraction fails
-    """
-    try:
-        logging.info(f"Extracting Bitcap price from: {url}")
-        
-        # Navigate to the page
-        driver.get(url)
-        
-        # Wait for the page to load
-        WebDriverWait(driver, 30).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        
-        # Handle potential cookie consent and popups
-        try:
-            consent_selectors = [
-                "button[onclick*='Accept']",
-                "button:contains('Accept')",
-                ".cookie-accept",
-                "#cookie-accept",
-                "button[id*='accept']",
-                "button[class*='accept']",
-                "button[id*='consent']",
-                "button[class*='consent']"
-            ]
-            
-            for selector in consent_selectors:
-                try:
-                    if 'contains' in selector:
-                        consent_button = WebDriverWait(driver, 5).until(
-                            EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Accept')]"))
-                        )
-                    else:
-                        consent_button = WebDriverWait(driver, 5).until(
-                            EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                        )
-                    consent_button.click()
-                    logging.info(f"Bitcap: Clicked consent button")
-                    time.sleep(3)
-                    break
-                except:
-                    continue
-        except Exception as e:
-            logging.debug(f"Bitcap: No consent handling needed: {e}")
-        
-        # Allow extra time for JavaScript content to load
-        time.sleep(8)
-        
-        # Get page source and parse
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-        page_text = soup.get_text(" ", strip=True)
-        
-        # Check if we got an error page
-        if "can't be reached" in page_text.lower() or "err_" in page_text.lower():
-            raise ValueError(f"Website returned error page: {page_text[:200]}")
-        
-        # Method 1: Look for the exact "Share price €XX.XX*" pattern
-        share_price_patterns = [
-            r'Share price\s*€\s*([\d,\.]+)\*?',                    # "Share price €81.28*"
-            r'Share price[^\d]*€\s*([\d,\.]+)\*?',                 # "Share price [anything] €81.28*"
-            r'Share\s+price\s*€\s*([\d,\.]+)\*?',                  # "Share price €81.28*" with spaces
-            r'€\s*([\d,\.]+)\*?\s*Share price',                    # "€81.28* Share price"
-            r'Share\s+price[^\d]*€\s*([\d,\.]+)\*?',               # "Share price [non-digits] €81.28*"
-        ]
-        
-        for pattern in share_price_patterns:
-            matches = re.finditer(pattern, page_text, re.IGNORECASE)
-            for match in matches:
-                raw_price = match.group(1)
-                logging.debug(f"Bitcap pattern '{pattern}' matched: '{raw_price}'")
-                
-                # Clean and normalize the price (handle European format)
-                price_normalized = raw_price.replace(',', '.')
-                try:
-                    price_value = float(price_normalized)
-                    if is_valid_share_price(price_value, page_text, url):
-                        logging.info(f"Bitcap price extracted: €{price_value}")
-                        return price_value
-                except ValueError:
-                    continue
-        
-        # Method 2: Look for price in specific HTML elements with fund/price context
-        try:
-            # Find elements that might contain fund pricing information
-            price_containers = soup.find_all(['div', 'span', 'td', 'p'], 
-                                           class_=re.compile(r'(price|fund|nav|value|quote)', re.I))
-            
-            for container in price_containers:
-                container_text = container.get_text(' ', strip=True)
-                
-                # Look for Euro amounts in fund-related containers
-                euro_match = re.search(r'€\s*([\d,\.]+)\*?', container_text)
-                if euro_match:
-                    raw_price = euro_match.group(1)
-                    try:
-                        price_value = float(raw_price.replace(',', '.'))
-                        if is_valid_share_price(price_value, container_text, url):
-                            logging.info(f"Bitcap price found in container: €{price_value}")
-                            return price_value
-                    except ValueError:
-                        continue
-        except Exception as e:
-            logging.debug(f"Bitcap container method failed: {e}")
-        
-        # Method 3: Look for any Euro amounts with "Share price" context nearby
-        try:
-            # Find all Euro amounts and check their context
-            euro_pattern = r'€\s*([\d,\.]+)\*?'
-            euro_matches = list(re.finditer(euro_pattern, page_text))
-            
-            for match in euro_matches:
-                raw_price = match.group(1)
-                
-                # Check context around the Euro amount (±200 characters)
-                context_start = max(0, match.start() - 200)
-                context_end = min(len(page_text), match.end() + 200)
-                context = page_text[context_start:context_end].lower()
-                
-                # Look for share price indicators in the context
-                price_indicators = ['share price', 'price', 'nav', 'fund price', 'current price']
-                if any(indicator in context for indicator in price_indicators):
-                    try:
-                        price_value = float(raw_price.replace(',', '.'))
-                        if is_valid_share_price(price_value, context, url):
-                            logging.info(f"Bitcap price found with context: €{price_value}")
-                            return price_value
-                    except ValueError:
-                        continue
-        except Exception as e:
-            logging.debug(f"Bitcap context method failed: {e}")
-        
-        # Method 4: Enhanced AI fallback for bitcap specifically
-        try:
-            ai_result = try_ai_fallback(driver, url)
-            if "ai extracted price" in ai_result:
-                ai_price = ai_result["ai extracted price"]
-                if isinstance(ai_price, (int, float)) and is_valid_share_price(ai_price, page_text, url):
-                    logging.info(f"Bitcap AI fallback extracted: €{ai_price}")
-                    return float(ai_price)
-        except Exception as e:
-            logging.debug(f"Bitcap AI fallback failed: {e}")
-        
-        raise ValueError("Could not find share price on bitcap page")
-        
-    except Exception as e:
-        if "Could not find share price" in str(e):
-            raise e
-        else:
-            raise ValueError(f"Bitcap extraction error: {e}")
-
-def is_valid_share_price(price_value, context_text="", url=""):
-    """
-    Comprehensive validation to filter out obvious non-price values.
-    Returns True if the value is likely a real share price, False otherwise.
-    """
-    try:
-        price = float(price_value)
-        
-        # Basic range validation - exclude extremely unreasonable values
-        if price <= 0 or price > 100000:
-            return False
-        
-        # Special case for Amina Group - their certificate prices are whole numbers (like 8.0, 32.0)
-        # and are legitimate share prices even though they end in .0
-        if url and "aminagroup.com" in url.lower():
-            if 0.1 <= price <= 1000:  # Reasonable price range for their certificates
-                # Add extra check to ensure context mentions price
-                if context_text and any(keyword in context_text.lower() for keyword in ["price", "current", "value"]):
-                    return True
-                # Even without context, accept if the price is in reasonable range for crypto trackers
-                return True
-        
-        # ENHANCED .0 DETECTION - Detect ALL forms of .0 values (24.00, 30.0, etc.)
-        # Check if the number has only zeros after the decimal point
-        price_str = str(price)
-        if '.' in price_str:
-            # Split into integer and decimal parts
-            integer_part, decimal_part = price_str.split('.')
-            # Check if decimal part contains only zeros (handles 24.0, 24.00, 24.000, etc.)
-            if decimal_part and all(digit == '0' for digit in decimal_part):
-                is_zero_decimal = True
-                whole_number_value = int(float(price))  # Convert to int for further checks
-            else:
-                is_zero_decimal = False
-                whole_number_value = None
-        else:
-            # It's already a whole number (no decimal point)
-            is_zero_decimal = True
-            whole_number_value = int(price)
-        
-        # If it's a .0 value (including 24.00, 30.0, etc.), apply strict filtering
-        if is_zero_decimal and whole_number_value is not None:
-            
-            # 1. YEAR DETECTION - Reject years (1990-2030)
-            if 1990 <= whole_number_value <= 2030:
-                logging.debug(f"Rejected year value: {price} (detected as .0)")
-                return False
-            
-            # 2. PERCENTAGE VALUES - Common protection/allocation percentages
-            # BUT FIRST check if we have explicit price context that overrides this
-            if context_text:
-                context_lower = context_text.lower()
-                price_keywords = ['price', 'share price', 'market price', 'last price', 'trading price', 
-                                'current price', 'last traded', 'closing price', 'nav', 'quote']
-                has_price_context = any(keyword in context_lower for keyword in price_keywords)
-                
-                # If we have explicit price context, allow reasonable whole number prices
-                if has_price_context and 5 <= whole_number_value <= 200:
-                    logging.debug(f"Accepted .0 value with valid price context: {price}")
-                    return True
-            
-            # Only reject percentage values if no valid price context was found
-            if whole_number_value in [10, 20, 30, 40, 50, 60, 70, 75, 80, 90, 95, 100]:
-                logging.debug(f"Rejected likely percentage value: {price} (detected as .0)")
-                return False
-            
-            # 3. SMALL INTEGERS - Likely version numbers, ratings, etc.
-            if 1 <= whole_number_value <= 5:
-                logging.debug(f"Rejected small integer (likely version/rating): {price} (detected as .0)")
-                return False
-            
-            # 4. TEST VALUES - Common test values
-            if whole_number_value in [123, 1234, 12345]:
-                logging.debug(f"Rejected likely test value: {price} (detected as .0)")
-                return False
-            
-            # 5. SPECIFIC COMMON METADATA - Specific numbers often seen
-            # Exclude 24, 48, 72 (hours), 7, 14, 28, 30, 60, 90 (days)
-            if whole_number_value in [24, 48, 72, 7, 14, 28, 30, 60, 90, 365]:
-                logging.debug(f"Rejected likely time period value: {price} (detected as .0)")
-                return False
-            
-            # 6. DOMAIN-SPECIFIC RULES for .0 values
-            if url:
-                url_lower = url.lower()
-                
-                # Calamos Bitcoin protection ETFs - reject protection percentages
-                if 'calamos.com' in url_lower and whole_number_value in [10, 20, 28, 30, 31, 50, 55, 80, 90, 100]:
-                    logging.debug(f"Rejected Calamos protection percentage: {price} (detected as .0)")
-                    return False
-                
-                # WisdomTree - reject common metadata values
-                if 'wisdomtree.eu' in url_lower and whole_number_value in [1, 2, 3, 4, 5]:
-                    logging.debug(f"Rejected WisdomTree metadata value: {price} (detected as .0)")
-                    return False
-                
-                # NASDAQ - reject volume/market cap indicators
-                if 'nasdaq.com' in url_lower and whole_number_value > 1000:
-                    logging.debug(f"Rejected NASDAQ large value (likely volume/market cap): {price} (detected as .0)")
-                    return False
-            
-            # 7. RANGE VALIDATION for .0 values - Be more restrictive
-            if not (1 <= whole_number_value <= 1000):  # Most stock/ETF prices are in this range
-                # Exception: some crypto can be higher, but not too extreme
-                if not (1000 < whole_number_value <= 10000 and url and ('bitcoin' in url.lower() or 'crypto' in url.lower())):
-                    logging.debug(f"Rejected .0 value outside reasonable price range: {price}")
-                    return False
-            
-            # If we get here and it's a .0 value, it's suspicious but might be valid
-            # Log it as suspicious but allow it through (it will be flagged in the log)
-            logging.debug(f"Suspicious .0 value detected but allowing: {price}")
-            return False
-        
-        # For non-.0 values, apply lighter validation
-        
-        # IMPROVED: Better decimal price validation for small values
-        # Check for expense ratios and other percentage-like decimals
-        if 0 < price < 5:
-            if context_text:
-                context_lower = context_text.lower()
-                # More comprehensive expense ratio detection
-                expense_keywords = ['expense ratio', 'ter', 'fee', 'cost', '%', 'percent', 'expense', 'ratio']
-                if any(keyword in context_lower for keyword in expense_keywords):
-                    logging.debug(f"Rejected likely expense ratio/fee: {price}")
-                    return False
-        
-        # For legitimate decimal values (like 1.0092, 24.37, etc.), be more permissive
-        # If we get here, it's likely a valid price
-        return True
-        
-    except (ValueError, TypeError):
-        return False
-
-def get_qrasset_cota_price(driver, url):
-    """
-    Navigate to a QR Asset fund page and scrape the "COTA EM" price.
-    Looks for patterns like "COTA EM 23/05/2025 R$ 38,09" and extracts "R$ 38,09".
-    Returns a float or raises ValueError.
-    """
-    driver.get(url)
-    try:
-        # Wait for the page to load
-        WebDriverWait(driver, 30).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        
-        # Allow extra time for JavaScript content to load
-        time.sleep(5)
-    except TimeoutException:
-        raise ValueError("Timed out waiting for QR Asset page to load")
-
-    soup = BeautifulSoup(driver.page_source, "html.parser")
-    
-    # Method 1: Look for "COTA EM" followed by date and price pattern (most specific)
-    try:
-        page_text = soup.get_text(" ", strip=True)
-        
-        # Look for "COTA EM DD/MM/YYYY R$ XX,XX" pattern
-        cota_patterns = [
-            r'COTA\s+EM\s+\d{1,2}/\d{1,2}/\d{4}\s+R\$\s*([\d,\.]+)',  # "COTA EM 23/05/2025 R$ 38,09"
-            r'COTA\s+EM[^R]*R\$\s*([\d,\.]+)',                        # "COTA EM [anything] R$ 38,09"
-            r'COTA[^R]*R\$\s*([\d,\.]+)',                             # "COTA [anything] R$ 38,09"
-        ]
-        
-        for pattern in cota_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                price_str = match.group(1)
-                logging.info(f"Found QR Asset COTA price with pattern '{pattern}': R$ {price_str}")
-                
-                # Convert Brazilian format (38,09) to float
-                # Handle both "38,09" and "1.234,56" formats
-                if '.' in price_str and ',' in price_str:
-                    # Format: 1.234,56 -> 1234.56
-                    price_normalized = price_str.replace('.', '').replace(',', '.')
-                else:
-                    # Format: 38,09 -> 38.09
-                    price_normalized = price_str.replace(',', '.')
-                
-                try:
-                    price_value = float(price_normalized)
-                    if 0.01 <= price_value <= 100000:  # Reasonable fund price range
-                        return price_value
-                except ValueError:
-                    continue
-    except Exception as e:
-        logging.error(f"Error with QR Asset pattern method: {e}")
-    
-    # Method 2: Look for span elements with "COTA" context
-    try:
-        # Find elements containing "COTA" text
-        cota_elements = soup.find_all(
-            lambda tag: tag.name and 'cota' in tag.get_text(' ', strip=True).lower()
-        )
-        
-        for element in cota_elements:
-            element_text = element.get_text(' ', strip=True)
-            # Look for Brazilian Real amounts in this element
-            real_match = re.search(r'R\$\s*([\d,\.]+)', element_text)
-            if real_match:
-                price_str = real_match.group(1)
-                try:
-                    # Convert Brazilian format
-                    if '.' in price_str and ',' in price_str:
-                        price_normalized = price_str.replace('.', '').replace(',', '.')
-                    else:
-                        price_normalized = price_str.replace(',', '.')
-                    
-                    price_value = float(price_normalized)
-                    if 0.01 <= price_value <= 100000:
-                        logging.info(f"Found QR Asset price in COTA element: {price_value}")
-                        return price_value
-                except ValueError:
-                    continue
-                    
-            # Also check nearby elements for the price
-            for sibling in [element.find_next_sibling(), element.find_previous_sibling()]:
-                if sibling:
-                    sibling_text = sibling.get_text(' ', strip=True)
-                    real_match = re.search(r'R\$\s*([\d,\.]+)', sibling_text)
-                    if real_match:
-                        price_str = real_match.group(1)
-                        try:
-                            if '.' in price_str and ',' in price_str:
-                                price_normalized = price_str.replace('.', '').replace(',', '.')
-                            else:
-                                price_normalized = price_str.replace(',', '.')
-                            
-                            price_value = float(price_normalized)
-                            if 0.01 <= price_value <= 100000:
-                                logging.info(f"Found QR Asset price in sibling element: {price_value}")
-                                return price_value
-                        except ValueError:
-                            continue
-    except Exception as e:
-        logging.error(f"Error with QR Asset element method: {e}")
-    
-    # Method 3: Look for CSS selectors that might contain price data
-    try:
-        price_selectors = [
-            ".cota-price",
-            ".fund-price",
-            ".current-price",
-            ".value",
-            ".price"
-        ]
-        
-        for selector in price_selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                text = element.get_text(' ', strip=True)
-                real_match = re.search(r'R\$\s*([\d,\.]+)', text)
-                if real_match and len(text) < 100:  # Reasonable length for price element
-                    price_str = real_match.group(1)
-                    try:
-                        if '.' in price_str and ',' in price_str:
-                            price_normalized = price_str.replace('.', '').replace(',', '.')
-                        else:
-                            price_normalized = price_str.replace(',', '.')
-                        
-                        price_value = float(price_normalized)
-                        if 0.01 <= price_value <= 100000:
-                            logging.info(f"Found QR Asset price using selector '{selector}': {price_value}")
-                            return price_value
-                    except ValueError:
-                        continue
-    except Exception as e:
-        logging.error(f"Error with QR Asset selector method: {e}")
-    
-    raise ValueError("Could not find COTA price on QR Asset page")
-
-def get_morningstar_fr_price(driver, url):
-    """
-    Navigate to a Morningstar France fund page and scrape the VL (Valeur Liquidative) price.
-    Returns a float or raises ValueError.
-    """
-    driver.get(url)
-    try:
-        # Wait for the page to load
-        WebDriverWait(driver, 30).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        
-        # Allow extra time for JavaScript content to load
-        time.sleep(5)
-    except TimeoutException:
-        raise ValueError("Timed out waiting for Morningstar France page to load")
-
-    soup = BeautifulSoup(driver.page_source, "html.parser")
-    
-    # Method 1: Look for "VL" followed by date and currency amount (most specific)
-    try:
-        page_text = soup.get_text(" ", strip=True)
-        
-        # Look for patterns like "VL22/05/2025 EUR 11,19" or "VL31/07/2024 GBP 11,03"
-        vl_patterns = [
-            r'VL\d{1,2}/\d{1,2}/\d{4}\s+([A-Z]{3})\s+([\d,\.]+)',  # "VL22/05/2025 EUR 11,19"
-            r'VL\s*\d{1,2}/\d{1,2}/\d{4}\s+([A-Z]{3})\s+([\d,\.]+)',  # "VL 22/05/2025 EUR 11,19"
-            r'Valeur\s+Liquidative.*?([A-Z]{3})\s+([\d,\.]+)',  # "Valeur Liquidative ... EUR 11,19"
-            r'VL.*?([A-Z]{3})\s+([\d,\.]+)',  # "VL ... EUR 11,19"
-        ]
-        
-        for pattern in vl_patterns:
-            matches = re.finditer(pattern, page_text, re.IGNORECASE)
-            for match in matches:
-                currency = match.group(1)
-                price_str = match.group(2)
-                logging.info(f"Found Morningstar FR VL price: {currency} {price_str}")
-                
-                # Convert European number format (11,19) to float
-                if ',' in price_str and '.' not in price_str:
-                    # European format: 11,19 -> 11.19
-                    price_normalized = price_str.replace(',', '.')
-                elif '.' in price_str and ',' in price_str:
-                    # Format: 1.234,56 -> 1234.56
-                    price_normalized = price_str.replace('.', '').replace(',', '.')
-                else:
-                    # US format: 11.19 -> 11.19
-                    price_normalized = price_str
-                
-                try:
-                    price_value = float(price_normalized)
-                    if 0.01 <= price_value <= 100000:  # Reasonable fund price range
-                        return price_value
-                except ValueError:
-                    continue
-    except Exception as e:
-        logging.error(f"Error with Morningstar FR pattern method: {e}")
-    
-    # Method 2: Look for table structure with VL data
-    try:
-        # Find table rows that might contain VL information
-        rows = soup.find_all('tr')
-        for row in rows:
-            row_text = row.get_text(" ", strip=True)
-            # Look for rows containing "VL" and currency amounts
-            if 'vl' in row_text.lower():
-                # Extract currency and amount from this row
-                currency_match = re.search(r'([A-Z]{3})\s+([\d,\.]+)', row_text)
-                if currency_match:
-                    currency = currency_match.group(1)
-                    price_str = currency_match.group(2)
-                    
-                    # Convert European number format
-                    if ',' in price_str and '.' not in price_str:
-                        price_normalized = price_str.replace(',', '.')
-                    elif '.' in price_str and ',' in price_str:
-                        price_normalized = price_str.replace('.', '').replace(',', '.')
-                    else:
-                        price_normalized = price_str
-                    
-                    try:
-                        price_value = float(price_normalized)
-                        if 0.01 <= price_value <= 100000:
-                            logging.info(f"Found Morningstar FR price in table: {currency} {price_value}")
-                            return price_value
-                    except ValueError:
-                        continue
-    except Exception as e:
-        logging.error(f"Error with Morningstar FR table method: {e}")
-    
-    # Method 3: Look for CSS selectors that might contain VL data
-    try:
-        # Look for table cells or divs that might contain the VL price
-        elements = soup.find_all(['td', 'div', 'span'])
-        for element in elements:
-            element_text = element.get_text(" ", strip=True)
-            # Check if this element contains VL-related text
-            if len(element_text) < 100 and ('vl' in element_text.lower() or any(curr in element_text for curr in ['EUR', 'USD', 'GBP'])):
-                # Look for currency and price pattern
-                currency_match = re.search(r'([A-Z]{3})\s+([\d,\.]+)', element_text)
-                if currency_match:
-                    currency = currency_match.group(1)
-                    price_str = currency_match.group(2)
-                    
-                    # Convert European number format
-                    if ',' in price_str and '.' not in price_str:
-                        price_normalized = price_str.replace(',', '.')
-                    elif '.' in price_str and ',' in price_str:
-                        price_normalized = price_str.replace('.', '').replace(',', '.')
-                    else:
-                        price_normalized = price_str
-                    
-                    try:
-                        price_value = float(price_normalized)
-                        if 0.01 <= price_value <= 100000:
-                            logging.info(f"Found Morningstar FR price in element: {currency} {price_value}")
-                            return price_value
-                    except ValueError:
-                        continue
-    except Exception as e:
-        logging.error(f"Error with Morningstar FR element method: {e}")
-    
-    raise ValueError("Could not find VL price on Morningstar France page")
-
-def get_franklin_templeton_price(driver, url):
-    """
-    Navigate to a Franklin Templeton ETF page and scrape the market price or NAV.
-    Returns a float or raises ValueError.
-    """
-    driver.get(url)
-    try:
-        # Wait for the page to load
-        WebDriverWait(driver, 30).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        
-        # Allow extra time for JavaScript content to load (Franklin Templeton loads prices dynamically)
-        time.sleep(8)
-    except TimeoutException:
-        raise ValueError("Timed out waiting for Franklin Templeton page to load")
+                return {"error": f"Could not parse number from SIX Group '{num_clean}' (original: '{price_text}')"}
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
-    
-    # Method 1: Look for "Market Price" patterns (most reliable for ETFs)
-    try:
-        page_text = soup.get_text(" ", strip=True)
+            result_data = {"previous close": price_val}
+            if currency_code: # Only add currency to the result if it was actually found
+                result_data["currency"] = currency_code.upper()
+            
+            return result_data
+
+        soup = snapshot.soup
+
+        # Site-specific BeautifulSoup extractors return their own result (or error)
+        result = extract_price_from_soup(soup, url)
+        if result is not None:
+            return result
+
+        # --- Generic keyword-based fallback (KEEP THIS AS LAST RESORT) ---
+        extracted = extract_keyword_prices(soup, url, keywords)
         
-        # Look for Market Price patterns - these are the primary price indicators for ETFs
-        market_price_patterns = [
-            r'Market\s+Price[^$]*\$\s*([\d,\.]+)',     # "Market Price $XX.XX"
-            r'Market\s+Price.*?\$\s*([\d,\.]+)',       # "Market Price ... $XX.XX"
-        ]
+        # If generic fallback found something valid, return it
+        if has_numeric_price(extracted):
+            return extracted
         
-        for pattern in market_price_patterns:
-            matches = re.finditer(pattern, page_text, re.IGNORECASE)
-            for match in matches:
-                price_str = match.group(1)
-                logging.info(f"Found Franklin Templeton Market Price: ${price_str}")
-                
-                try:
-                    price_value = float(price_str.replace(',', ''))
-                    if 0.01 <= price_value <= 10000:  # Reasonable ETF price range
-                        return price_value
-                except ValueError:
-                    continue
-    except Exception as e:
-        logging.error(f"Error with Franklin Templeton Market Price method: {e}")
-    
-    # Method 2: Look for NAV (Net Asset Value) patterns
-    try:
-        nav_patterns = [
-            r'NAV[^$]*\$\s*([\d,\.]+)',               # "NAV $XX.XX"
-            r'Net\s+Asset\s+Value[^$]*\$\s*([\d,\.]+)', # "Net Asset Value $XX.XX"
-        ]
+        # If no traditional method worked, try AI fallback as final resort
+        logging.info(f"All traditional methods failed for {url}, trying AI fallback...")
+        ai_result = try_ai_fallback(driver, url, snapshot=snapshot)
+        if "ai extracted price" in ai_result:
+            return ai_result
         
-        for pattern in nav_patterns:
-            matches = re.finditer(pattern, page_text, re.IGNORECASE)
-            for match in matches:
-                price_str = match.group(1)
-                logging.info(f"Found Franklin Templeton NAV: ${price_str}")
-                
-                try:
-                    price_value = float(price_str.replace(',', ''))
-                    if 0.01 <= price_value <= 10000:  # Reasonable ETF price range
-                        return price_value
-                except ValueError:
-                    continue
+        # If even AI failed, return the generic fallback results (if any) or empty dict
+        return extracted if extracted else {}
+
     except Exception as e:
-        logging.error(f"Error with Franklin Templeton NAV method: {e}")
-    
-    # Method 3: Look for general price patterns near ETF-related keywords
-    try:
-        # Find price context elements that might contain the main price
-        price_elements = soup.find_all(['div', 'span', 'td'], string=re.compile(r'price|market|nav', re.IGNORECASE))
+        logging.error(f"Error processing URL {url}: {e}", exc_info=True)
+        # Try AI fallback as final resort even for unexpected exceptions
+        try:
+            logging.info(f"Unexpected error occurred for {url}, trying AI fallback...")
+            ai_result = try_ai_fallback(driver, url, snapshot=snapshot)
+            if "ai extracted price" in ai_result:
+                return ai_result
+        except Exception as ai_e:
+            logging.error(f"AI fallback also failed for {url}: {ai_e}")
         
-        for element in price_elements:
-            # Look for dollar amounts in this element and nearby elements
-            element_text = element.get_text(" ", strip=True)
-            
-            # Check this element
-            dollar_match = re.search(r'\$\s*([\d,\.]+)', element_text)
-            if dollar_match:
-                price_str = dollar_match.group(1)
-                try:
-                    price_value = float(price_str.replace(',', ''))
-                    if 1 <= price_value <= 1000:  # More restrictive range for this method
-                        logging.info(f"Found Franklin Templeton price in element: ${price_value}")
-                        return price_value
-                except ValueError:
-                    continue
-            
-            # Check next sibling elements
-            next_sibling = element.find_next_sibling()
-            if next_sibling:
-                sibling_text = next_sibling.get_text(" ", strip=True)
-                dollar_match = re.search(r'\$\s*([\d,\.]+)', sibling_text)
-                if dollar_match:
-                    price_str = dollar_match.group(1)
+        return {"error": str(e)}
+
+def fetch_static_price(url):
+    """
+    Price from a plain HTTP GET of url, for pages with a site-specific
+    BeautifulSoup extractor (SOUP_PRICE_EXTRACTORS).
+
+    The generic keyword fallback is not tried on the unrendered HTML: on pages
+    that fill in the price with JavaScript it finds placeholders or stale
+    numbers, so those pages always go to the browser.
+
+    Returns:
+        The result dict if it holds a numeric price, otherwise None (render in Chrome)
+    """
+    if SOUP_PRICE_EXTRACTORS.lookup(url) is None or not should_try_http(url):
+        return None
+    html = fetch_static_html(url)
+    if html:
+        http_result = extract_price_from_soup(parse_html(html), url)
+        if has_numeric_price(http_result):
+            record_http_result(url, True)
+            logging.info(f"HTTP tier succeeded for {url}: {http_result}")
+            return http_result
+    record_http_result(url, False)
+    logging.info(f"HTTP tier found no price for {url}, escalating to Selenium")
+    return None
+
+def has_numeric_price(result):
+    """Return True if an extraction result contains at least one numeric price."""
+    return bool(result) and any(
+        isinstance(v, (int, float)) and not isinstance(v, bool) for v in result.values()
+    )
+
+# --- Site-specific BeautifulSoup extractors used by extract_price_from_soup ---
+# Registered by host and optional path prefix like PRICE_EXTRACTORS; each takes
+# (soup, url) and returns a result dict.
+SOUP_PRICE_EXTRACTORS = ExtractorRegistry("soup price extractors")
+
+
+def is_xtrackers_galaxy_etc(url):
+    """Only the Galaxy Bitcoin/Ethereum ETC pages on etf.dws.com have the ETC security value."""
+    return re.search(r"xtrackers-galaxy-physical-(bitcoin|ethereum)-etc-securities", url.lower()) is not None
+
+
+@SOUP_PRICE_EXTRACTORS.extractor("proshares.com", "/our-etfs")
+def _proshares_price_from_soup(soup, url):
+    """ProShares ETF pages."""
+    label = soup.find(text=re.compile(r"Market Price", re.IGNORECASE))
+    if label:
+        price_text = label.find_next(text=re.compile(r"\$\d{1,3}(?:,\d{3})*(?:\.\d{2})?"))
+        if price_text:
+            num = price_text.strip().replace("$", "").replace(",", "")
+            try:
+                return {"market price": float(num)}
+            except ValueError:
+                return {"error": f"Could not parse ProShares price '{num}'"}
+        return {"error": "Market Price value not found"}
+    return {"error": "Market Price label not found"}
+
+
+@SOUP_PRICE_EXTRACTORS.extractor("grayscale.com", "/funds")
+@SOUP_PRICE_EXTRACTORS.extractor("etfs.grayscale.com")
+def _grayscale_price_from_soup(soup, url):
+    """Grayscale ETF pages (rendered by Selenium for www.grayscale.com)."""
+    # IMPORTANT: For www.grayscale.com URLs, the content is loaded dynamically with JavaScript
+    # We need to use the already-loaded page content from Selenium (soup is from driver.page_source)
+
+    # Get the full page text from the already-loaded Selenium page
+    page_text = soup.get_text(" ", strip=True)
+
+    # Method 1: Look for "Market Price as of MM/DD/YYYY $XX.XX" pattern (MOST RELIABLE)
+    pattern1 = re.search(
+        r'Market Price\s+as\s+of\s+\d{1,2}/\d{1,2}/\d{4}\s*\$\s*([\d,\.]+)', 
+        page_text, re.IGNORECASE
+    )
+    if pattern1:
+        price_str = pattern1.group(1)
+        logging.info(f"Found Grayscale price with 'Market Price as of DATE $PRICE': {price_str}")
+        price_normalized = price_str.replace(',', '')
+        try:
+            return {"market price": float(price_normalized)}
+        except ValueError:
+            return {"error": f"Could not parse Grayscale price '{price_str}'"}
+
+    # Method 2: Look for price before "Market Price as of" pattern 
+    # Pattern: $XX.XX Market Price as of MM/DD/YYYY
+    pattern2 = re.search(
+        r'\$\s*([\d,\.]+)\s+Market Price\s+as\s+of\s+\d{1,2}/\d{1,2}/\d{4}', 
+        page_text, re.IGNORECASE
+    )
+    if pattern2:
+        price_str = pattern2.group(1)
+        logging.info(f"Found Grayscale price with '$PRICE Market Price as of DATE': {price_str}")
+        price_normalized = price_str.replace(',', '')
+        try:
+            return {"market price": float(price_normalized)}
+        except ValueError:
+            return {"error": f"Could not parse Grayscale price '{price_str}'"}
+
+    # Method 3: Look for flexible "Market Price" and "as of" with price nearby
+    # This handles cases where there might be extra text between elements
+    pattern3 = re.search(
+        r'Market Price.*?as\s+of.*?\$\s*([\d,\.]+)', 
+        page_text, re.IGNORECASE | re.DOTALL
+    )
+    if pattern3:
+        price_str = pattern3.group(1)
+        # Filter out obviously wrong values (too large for a fund price)
+        price_normalized = price_str.replace(',', '')
+        try:
+            price_value = float(price_normalized)
+            if price_value < 10000:  # Reasonable fund price range
+                logging.info(f"Found Grayscale price with flexible pattern: {price_str}")
+                return {"market price": price_value}
+            else:
+                logging.info(f"Grayscale price {price_value} seems too large for a fund, continuing search...")
+        except ValueError:
+            logging.error(f"Could not parse Grayscale price '{price_str}' as float")
+
+    # Method 4: Look for heading elements with dollar signs that might be prices
+    # Based on the HTML structure like #### $85.76
+    headings = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+    for heading in headings:
+        heading_text = heading.get_text(strip=True)
+        # Look for price patterns in headings
+        price_match = re.search(r'\$\s*([\d,\.]+)', heading_text)
+        if price_match:
+            price_str = price_match.group(1)
+            try:
+                price_value = float(price_str.replace(',', ''))
+                # Filter for reasonable fund prices (between $0.01 and $10,000)
+                if 0.01 <= price_value <= 10000:
+                    # Check if this heading is near market price text
+                    next_sibling = heading.find_next_sibling()
+                    if next_sibling and 'market price' in next_sibling.get_text(' ', strip=True).lower():
+                        logging.info(f"Found Grayscale price in heading near 'market price': {price_str}")
+                        return {"market price": price_value}
+            except ValueError:
+                continue
+
+    # Method 5: Look for any reasonable price near "Market Price" text
+    market_price_elements = soup.find_all(
+        lambda tag: tag.name and 'market price' in tag.get_text(' ', strip=True).lower()
+    )
+
+    for element in market_price_elements:
+        # Check previous and next siblings for prices
+        for sibling in [element.find_previous_sibling(), element.find_next_sibling()]:
+            if sibling:
+                sibling_text = sibling.get_text(strip=True)
+                price_match = re.search(r'\$\s*([\d,\.]+)', sibling_text)
+                if price_match:
+                    price_str = price_match.group(1)
                     try:
                         price_value = float(price_str.replace(',', ''))
-                        if 1 <= price_value <= 1000:
-                            logging.info(f"Found Franklin Templeton price in sibling: ${price_value}")
-                            return price_value
+                        if 0.01 <= price_value <= 10000:
+                            logging.info(f"Found Grayscale price near 'Market Price' element: {price_str}")
+                            return {"market price": price_value}
                     except ValueError:
                         continue
-    except Exception as e:
-        logging.error(f"Error with Franklin Templeton element method: {e}")
-    
-    raise ValueError("Could not find market price or NAV on Franklin Templeton page")
 
-def get_schwab_asset_management_price(driver, url):
-    """
-    Navigate to a Schwab Asset Management ETF page and scrape the actual market price.
-    Returns a float or raises ValueError.
-    """
-    driver.get(url)
+    return {"error": "Grayscale market price not found"}
+
+
+@SOUP_PRICE_EXTRACTORS.extractor("qrasset.com.br", match=is_qrasset_cesta)
+def _qrasset_cesta_price_from_soup(soup, url):
+    """QR Asset Cesta pages."""
+    label = soup.find("span", class_="label", string=re.compile(r"Valor da Cota", re.IGNORECASE))
+    if not label:
+        return {"error": "Valor da Cota label not found"}
+    value_span = label.find_next_sibling("span", class_="value")
+    if not value_span:
+        return {"error": "Valor da Cota value element not found"}
+    price_text = value_span.get_text(strip=True)
+    price_pattern = re.compile(r"R\$\s*\d{1,3}(?:\.\d{3})*,\d{2}")
+    if not price_pattern.fullmatch(price_text):
+        return {"error": f"Unexpected format '{price_text}'"}
+    num_text = price_text.replace("R$", "").strip().replace(".", "").replace(",", ".")
+    try:
+        return {"valor da cota": float(num_text)}
+    except ValueError:
+        return {"error": f"Could not parse Valor da Cota '{num_text}'"}
+
+
+@SOUP_PRICE_EXTRACTORS.extractor("montpensier-arbevel.com", "/fonds/")
+def _montpensier_price_from_soup(soup, url):
+    """Montpensier Arbével fund pages."""
+    vl_label = soup.find(text=re.compile(r"^VL$", re.IGNORECASE))
+    if not vl_label:
+        return {"error": "VL label not found"}
+    price_tag = vl_label.find_next(string=re.compile(r"[\d\.\,]+\s*€"))
+    if not price_tag:
+        return {"error": "VL value not found"}
+    raw = price_tag.strip().replace("€","").strip()
+    num = raw.replace(".","").replace(",",".")
+    try:
+        vl = float(num)
+    except ValueError:
+        return {"error": f"Could not parse VL '{raw}'"}
+    result = {"vl": vl}
+    date_tag = price_tag.find_next(string=re.compile(r"au\s*\d{2}/\d{2}/\d{4}", re.IGNORECASE))
+    if date_tag:
+        result["date"] = date_tag.strip()
+    return result
+
+
+@SOUP_PRICE_EXTRACTORS.extractor("hashdex-etfs.com")
+def _hashdex_us_price_from_soup(soup, url):
+    """Hashdex US ETF pages (e.g. https://www.hashdex-etfs.com/NCIQ)."""
+    closing = soup.find(
+        lambda tag: tag.name in ("h3","h4")
+                    and re.search(r"Closing Price", tag.get_text(strip=True), re.IGNORECASE)
+    )
+    if not closing:
+        return {"error": "Closing Price label not found"}
+    price_tag = closing.find_previous_sibling(
+        lambda tag: tag.name == "h4"
+                    and re.search(r"USD\s*\d{1,3}(?:,\d{3})*(?:\.\d{2})?", tag.get_text(strip=True))
+    )
+    if not price_tag:
+        return {"error": "Closing Price value not found"}
+    txt = price_tag.get_text(strip=True)
+    m = re.search(r"USD\s*([\d,]+\.\d{2})", txt)
+    if not m:
+        return {"error": f"Unexpected format '{txt}'"}
+    num = m.group(1).replace(",","")
     try:
-        # Wait for the page to load
-        WebDriverWait(driver, 30).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        
-        # Allow extra time for JavaScript content to load
-        time.sleep(8)
-    except TimeoutException:
-        raise ValueError("Timed out waiting for Schwab page to load")
+        return {"closing price": float(num)}
+    except ValueError:
+        return {"error": f"Could not parse Closing Price '{num}'"}
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
-    
-    # Method 1: Look for market price patterns
+
+@SOUP_PRICE_EXTRACTORS.extractor("hashdex.com", "/pt-br/products/")
+def _hashdex_br_price_from_soup(soup, url):
+    """Hashdex Brazil ETF pages (/pt-BR/products/...)."""
+    page_text = soup.get_text(" ", strip=True)
+    m = re.search(r"Valor da Cota\s*R\$\s*([\d\.]+?,\d{2})", page_text, re.IGNORECASE)
+    if not m:
+        return {"error": "Valor da Cota not found or unexpected format"}
+    num_text = m.group(1).replace(".", "").replace(",", ".")
     try:
-        page_text = soup.get_text(" ", strip=True)
-        
-        # Look for various price patterns
-        price_patterns = [
-            r'Market\s+Price[^$]*\$\s*([\d,\.]+)',     # "Market Price $XX.XX"
-            r'Price[^$]*\$\s*([\d,\.]+)',              # "Price $XX.XX"
-            r'Last\s+Price[^$]*\$\s*([\d,\.]+)',       # "Last Price $XX.XX"
-            r'Current\s+Price[^$]*\$\s*([\d,\.]+)',    # "Current Price $XX.XX"
-            r'NAV[^$]*\$\s*([\d,\.]+)',                # "NAV $XX.XX" (as fallback)
-        ]
-        
-        for pattern in price_patterns:
-            matches = re.finditer(pattern, page_text, re.IGNORECASE)
-            for match in matches:
-                price_str = match.group(1)
-                try:
-                    price_value = float(price_str.replace(',', ''))
-                    # Look for reasonable ETF prices with decimals
-                    if 1 <= price_value <= 500 and price_value != int(price_value):
-                        logging.info(f"Found Schwab price: ${price_value}")
-                        return price_value
-                except ValueError:
-                    continue
-    except Exception as e:
-        logging.error(f"Error with Schwab pattern method: {e}")
-    
-    raise ValueError("Could not find valid market price on Schwab page")
+        return {"valor da cota": float(num_text)}
+    except ValueError:
+        return {"error": f"Could not parse Valor da Cota '{num_text}'"}
+
 
-def get_evolve_etfs_price(driver, url):
+@SOUP_PRICE_EXTRACTORS.extractor("etf.dws.com", match=is_xtrackers_galaxy_etc)
+def _xtrackers_galaxy_price_from_soup(soup, url):
+    """Xtrackers Galaxy Physical Bitcoin & Ethereum ETCs (CH1315732250 & CH1315732268)."""
+    # Pull all text and look for "Value per ETC security ... USD"
+    text = soup.get_text(" ", strip=True)
+    m = re.search(r"Value per ETC security.*?([\d\.,]+)\s*USD", text, re.IGNORECASE)
+    if not m:
+        return {"error": "Value per ETC security not found"}
+
+    raw_val = m.group(1)
+    # Normalize both European ("7,57") and US ("18.25") formats:
+    if "," in raw_val and "." in raw_val:
+        # e.g. "1.234,56" → "1234.56"
+        norm = raw_val.replace(".", "").replace(",", ".")
+    elif "," in raw_val:
+        # e.g. "7,57" → "7.57"
+        norm = raw_val.replace(",", ".")
+    else:
+        # e.g. "18.25" → "18.25"
+        norm = raw_val.replace(",", "")
+
+    try:
+        return {"value per etc security": float(norm)}
+    except ValueError:
+        return {"error": f"Could not parse '{raw_val}' as float"}
+
+
+def extract_price_from_soup(soup, url):
     """
-    Navigate to an Evolve ETFs page and scrape the actual market price.
-    Returns a float or raises ValueError.
+    Site-specific BeautifulSoup extractors for pages that need no browser interaction
+    (see SOUP_PRICE_EXTRACTORS).
+
+    Works on either a plain HTTP response or the Selenium-rendered page.
+    Returns a result dict, or None if no site-specific extractor matches the URL.
     """
-    driver.get(url)
-    try:
-        # Wait for the page to load
-        WebDriverWait(driver, 30).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        
-        # Allow extra time for JavaScript content to load
-        time.sleep(8)
-    except TimeoutException:
-        raise ValueError("Timed out waiting for Evolve ETFs page to load")
+    extractor = SOUP_PRICE_EXTRACTORS.lookup(url)
+    if extractor is None:
+        return None
+    return extractor(soup, url)
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
-    
-    # Method 1: Look for market price patterns
-    try:
-        page_text = soup.get_text(" ", strip=True)
-        
-        # Look for various price patterns (Canadian format)
-        price_patterns = [
-            r'Market\s+Price[^$]*\$\s*([\d,\.]+)',     # "Market Price $XX.XX"
-            r'Price[^$]*\$\s*([\d,\.]+)',              # "Price $XX.XX"
-            r'Last\s+Price[^$]*\$\s*([\d,\.]+)',       # "Last Price $XX.XX"
-            r'Current\s+Price[^$]*\$\s*([\d,\.]+)',    # "Current Price $XX.XX"
-            r'Closing\s+Price[^$]*\$\s*([\d,\.]+)',    # "Closing Price $XX.XX"
-        ]
-        
-        for pattern in price_patterns:
-            matches = re.finditer(pattern, page_text, re.IGNORECASE)
-            for match in matches:
-                price_str = match.group(1)
-                try:
-                    price_value = float(price_str.replace(',', ''))
-                    # Look for reasonable ETF prices with decimals
-                    if 1 <= price_value <= 500 and price_value != int(price_value):
-                        logging.info(f"Found Evolve ETFs price: ${price_value}")
-                        return price_value
-                except ValueError:
-                    continue
-    except Exception as e:
-        logging.error(f"Error with Evolve ETFs pattern method: {e}")
-    
-    raise ValueError("Could not find valid market price on Evolve ETFs page")
+_NUMBER_AFTER_KEYWORD = re.compile(r"[^\d]*?([0-9,]+\.?[0-9]*)")
+_keyword_scanners = {}
 
-def get_21shares_price(driver, url):
+def extract_keyword_prices(soup, url, keywords):
     """
-    Navigate to a 21Shares ETF page and scrape the actual market price.
-    Returns a float or raises ValueError.
+    Generic keyword-based fallback: look for each keyword followed by a number.
+    Returns a dict of keyword -> price (or "Error: ..." string), possibly empty.
+
+    All keywords are located in one pass (src.keyword_scanner); each price is
+    validated against the text around its keyword, not the whole page.
     """
-    driver.get(url)
-    try:
-        # Wait for the page to load
-        WebDriverWait(driver, 30).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        
-        # Allow extra time for JavaScript content to load
-        time.sleep(8)
-    except TimeoutException:
-        raise ValueError("Timed out waiting for 21Shares page to load")
+    extracted = {}
+    page_text = " ".join(soup.strings).lower()
+    scanner = _keyword_scanners.get(tuple(keywords))
+    if scanner is None:
+        scanner = _keyword_scanners[tuple(keywords)] = KeywordScanner(keywords)
+    first_occurrences = scanner.first_occurrences(page_text)
+
+    for keyword in keywords:
+        position = first_occurrences.get(keyword.lower())
+        if position is None:
+            continue
+        m = _NUMBER_AFTER_KEYWORD.match(page_text, position[1])
+        if m:
+            raw = m.group(1)
+            cleaned = re.sub(r"[^\d\.]", "", raw)
+            try:
+                if cleaned.count('.') > 1 or not cleaned.replace('.', '', 1).isdigit():
+                    raise ValueError
+                potential_price = float(cleaned)
+                
+                # ENHANCED: Use validation to filter out invalid prices
+                context = context_window(page_text, position[0], m.end())
+                if is_valid_share_price(potential_price, context, url):
+                    extracted[keyword] = potential_price
+                else:
+                    logging.debug(f"Generic fallback rejected invalid price {potential_price} for keyword '{keyword}' on {url}")
+                    extracted[keyword] = f"Error: invalid price value '{raw}' (likely not a share price)"
+            except ValueError:
+                extracted[keyword] = f"Error: cannot parse '{raw}'"
+
+    return extracted
+
+def _bf_headers(url: str, salt: str) -> dict:
+    now      = datetime.utcnow()
+    localnow = datetime.now()
+    ts       = now.isoformat(timespec="milliseconds") + "Z"
+    trace_id = hashlib.md5(f"{ts}{url}{salt}".encode()).hexdigest()
+    xsec     = hashlib.md5(localnow.strftime("%Y%m%d%H%M").encode()).hexdigest()
+    return {
+        "accept": "application/json, text/plain, */*",
+        "client-date": ts,
+        "x-client-traceid": trace_id,
+        "x-security": xsec,
+        "origin": "https://www.boerse-frankfurt.de",
+        "referer": "https://www.boerse-frankfurt.de/",
+    }
+
+def get_prev_close_boerse(isin: str, mic: str = "XETR") -> float:
+    """
+    Lightweight – no Selenium – fetch of 'Closing price prev trading day'.
+
+    The request is signed with the salt from the shared provider in
+    src/bf_salt.py, so the homepage and JS bundle are only downloaded when the
+    cached salt has expired or the API rejects it.
+    """
+    sess = get_http_session()
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
+    # previous *trading* day (naive)
+    prev = date.today()
+    # Adjust for weekend: if today is Sat, prev is Fri. If Sun, prev is Fri.
+    if prev.weekday() == 5: # Saturday
+        prev -= timedelta(days=1)
+    elif prev.weekday() == 6: # Sunday
+        prev -= timedelta(days=2)
     
-    # Method 1: Look for market price patterns
-    try:
-        page_text = soup.get_text(" ", strip=True)
-        
-        # Look for various price patterns (US format)
-        price_patterns = [
-            r'Market\s+Price[^$]*\$\s*([\d,\.]+)',     # "Market Price $XX.XX"
-            r'Price[^$]*\$\s*([\d,\.]+)',              # "Price $XX.XX"
-            r'Last\s+Price[^$]*\$\s*([\d,\.]+)',       # "Last Price $XX.XX"
-            r'Current\s+Price[^$]*\$\s*([\d,\.]+)',    # "Current Price $XX.XX"
-            r'Closing\s+Price[^$]*\$\s*([\d,\.]+)',    # "Closing Price $XX.XX"
-        ]
-        
-        for pattern in price_patterns:
-            matches = re.finditer(pattern, page_text, re.IGNORECASE)
-            for match in matches:
-                price_str = match.group(1)
-                try:
-                    price_value = float(price_str.replace(',', ''))
-                    # Look for reasonable ETF prices with decimals
-                    if 1 <= price_value <= 500 and price_value != int(price_value):
-                        logging.info(f"Found 21Shares price: ${price_value}")
-                        return price_value
-                except ValueError:
-                    continue
-    except Exception as e:
-        logging.error(f"Error with 21Shares pattern method: {e}")
+    # Now, ensure 'prev' is the last *trading* day by checking again
+    # and decrementing if it's a weekend or the current day.
+    # This loop handles the case where today is Monday, so prev becomes Sunday, then Saturday, then Friday.
+    # It also handles the initial decrement if today is a weekday.
+    prev -= timedelta(days=1) # Go to previous day
+    while prev.weekday() >= 5: # Skip Saturday (5) or Sunday (6)
+        prev -= timedelta(days=1)
+
+
+    params = {
+        "isin": isin,
+        "mic": mic,
+        "minDate": prev.isoformat(),
+        "maxDate": prev.isoformat(),
+        "limit": 1,
+        "cleanSplit": "false",
+        "cleanPayout": "false",
+        "cleanSubscription": "false",
+    }
+    api_url_base = "https://api.boerse-frankfurt.de/v1/data/price_history"
+    query_string = urlencode(params)
+    full_url = f"{api_url_base}?{query_string}"
+    
+    r = salted_get(sess, full_url, _bf_headers, timeout=(5, 15)) # Increased connect timeout slightly
+    r.raise_for_status() # Will raise an HTTPError if the HTTP request returned an unsuccessful status code
+    
+    response_json = r.json()
+    data = response_json.get("data") # Use .get for safer access
+    
+    if not data or not isinstance(data, list) or len(data) == 0:
+        raise ValueError(f"No price data returned from API for ISIN {isin} on {prev.isoformat()}. Response: {response_json}")
     
-    raise ValueError("Could not find valid market price on 21Shares page")
+    # Check if 'close' key exists and is a number
+    if "close" not in data[0] or not isinstance(data[0]["close"], (int, float)):
+        raise ValueError(f"Unexpected data format: 'close' field missing or not a number in {data[0]}. Response: {response_json}")
+        
+    return float(data[0]["close"])
 
-def get_ninepoint_price(driver, url):
+def is_blue_cell(cell):
     """
-    Navigate to a Ninepoint ETF page and scrape the actual market price.
-    Returns a float or raises ValueError.
+    Check if a cell has any blue-ish color (simplified detection)
+    Returns True if the cell appears to be blue, False otherwise
     """
-    driver.get(url)
     try:
-        # Wait for the page to load
-        WebDriverWait(driver, 30).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        
-        # Allow extra time for JavaScript content to load
-        time.sleep(10)  # Increased wait time
-    except TimeoutException:
-        raise ValueError("Timed out waiting for Ninepoint page to load")
+        if cell.fill and hasattr(cell.fill, 'fgColor') and cell.fill.fgColor:
+            color = cell.fill.fgColor
+            # Check different color representations
+            if hasattr(color, 'rgb') and color.rgb:
+                # Handle both string and RGB object types
+                rgb_value = color.rgb
+                if hasattr(rgb_value, 'value'):  # RGB object case
+                    rgb_value = rgb_value.value if rgb_value.value else str(rgb_value)
+                elif not isinstance(rgb_value, str):  # Other object types
+                    rgb_value = str(rgb_value)
+                
+                # Remove alpha channel if present (ARGB format)
+                if isinstance(rgb_value, str) and len(rgb_value) == 8:  # ARGB format
+                    rgb_value = rgb_value[2:]  # Remove first 2 characters (alpha)
+                
+                # Simplified blue detection - check if it contains blue-ish values
+                # Look for various shades of blue (not just the exact #00B0F0)
+                if isinstance(rgb_value, str) and len(rgb_value) >= 6:
+                    # Convert to uppercase for consistent checking
+                    rgb_upper = rgb_value.upper()
+                    # Check for common blue patterns
+                    blue_patterns = [
+                        '00B0F0',  # Original target blue
+                        '0000FF',  # Pure blue
+                        '4472C4',  # Another common blue
+                        '5B9BD5',  # Light blue
+                        '2F75B5',  # Dark blue
+                    ]
+                    
+                    # Check if it matches any blue pattern or if blue component is dominant
+                    for pattern in blue_patterns:
+                        if pattern in rgb_upper:
+                            return True
+                    
+                    # Check if the blue component (last 2 digits) is significantly higher than red/green
+                    try:
+                        if len(rgb_upper) == 6:
+                            red = int(rgb_upper[0:2], 16)
+                            green = int(rgb_upper[2:4], 16)
+                            blue = int(rgb_upper[4:6], 16)
+                            # Consider it blue if blue component is much higher than red and green
+                            if blue > 150 and blue > (red + green):
+                                return True
+                    except ValueError:
+                        pass
+                        
+            elif hasattr(color, 'indexed') and color.indexed is not None:
+                # Handle indexed colors - some indexed colors are blue
+                # Common blue indexed colors: 5 (blue), 41 (light blue), etc.
+                blue_indexed = [5, 41, 44, 49]
+                return color.indexed in blue_indexed
+    except Exception:
+        # If anything fails, just return False
+        pass
+    return False
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
+def preserve_cell_color_and_set_value(cell, value):
+    """
+    Set cell value while preserving existing fill color
+    """
+    from openpyxl.styles import PatternFill
     
-    # Method 1: Look for market price patterns with more flexible matching
+    # Store the current fill properties before modifying
+    current_fill_info = None
     try:
-        page_text = soup.get_text(" ", strip=True)
-        
-        # Look for various price patterns (Canadian format) - more flexible
-        price_patterns = [
-            r'Market\s+Price[^$]*\$\s*([\d,\.]+)',     # "Market Price $XX.XX"
-            r'Price[^$]*\$\s*([\d,\.]+)',              # "Price $XX.XX"
-            r'Last\s+Price[^$]*\$\s*([\d,\.]+)',       # "Last Price $XX.XX"
-            r'Current\s+Price[^$]*\$\s*([\d,\.]+)',    # "Current Price $XX.XX"
-            r'Unit\s+Price[^$]*\$\s*([\d,\.]+)',       # "Unit Price $XX.XX"
-            r'NAV[^$]*\$\s*([\d,\.]+)',                # "NAV $XX.XX"
-            r'Net\s+Asset\s+Value[^$]*\$\s*([\d,\.]+)', # "Net Asset Value $XX.XX"
-            r'\$\s*([\d,\.]+)\s*CAD',                  # "$XX.XX CAD"
-            r'CAD\s*\$\s*([\d,\.]+)',                  # "CAD $XX.XX"
-        ]
-        
-        for pattern in price_patterns:
-            matches = re.finditer(pattern, page_text, re.IGNORECASE)
-            for match in matches:
-                price_str = match.group(1)
-                try:
-                    price_value = float(price_str.replace(',', ''))
-                    # Look for reasonable ETF prices (relaxed criteria)
-                    if 0.1 <= price_value <= 1000:  # More flexible range
-                        logging.info(f"Found Ninepoint price: ${price_value}")
-                        return price_value
-                except ValueError:
-                    continue
-    except Exception as e:
-        logging.error(f"Error with Ninepoint pattern method: {e}")
+        if cell.fill and hasattr(cell.fill, 'patternType') and cell.fill.patternType:
+            # Extract fill properties to recreate later
+            current_fill_info = {
+                'patternType': cell.fill.patternType,
+                'fgColor': None,
+                'bgColor': None
+            }
+            
+            # Try to extract foreground color
+            if hasattr(cell.fill, 'fgColor') and cell.fill.fgColor:
+                current_fill_info['fgColor'] = cell.fill.fgColor
+            
+            # Try to extract background color  
+            if hasattr(cell.fill, 'bgColor') and cell.fill.bgColor:
+                current_fill_info['bgColor'] = cell.fill.bgColor
+    except Exception:
+        # If we can't extract fill info, we'll just set the value without preserving color
+        current_fill_info = None
     
-    # Method 2: Look for any dollar amounts in the page
-    try:
-        all_dollar_matches = re.finditer(r'\$\s*([\d,\.]+)', page_text, re.IGNORECASE)
-        for match in all_dollar_matches:
-            price_str = match.group(1)
-            try:
-                price_value = float(price_str.replace(',', ''))
-                # Look for reasonable ETF prices
-                if 1 <= price_value <= 500 and price_value != int(price_value):
-                    logging.info(f"Found Ninepoint price (general search): ${price_value}")
-                    return price_value
-            except ValueError:
-                continue
-    except Exception as e:
-        logging.error(f"Error with Ninepoint general search: {e}")
+    # Set the value
+    cell.value = value
     
-    raise ValueError("Could not find valid market price on Ninepoint page")
+    # Restore the fill if we extracted the info successfully
+    if current_fill_info and current_fill_info['patternType']:
+        try:
+            # Create a new PatternFill with the same properties
+            new_fill = PatternFill(
+                patternType=current_fill_info['patternType'],
+                fgColor=current_fill_info['fgColor'],
+                bgColor=current_fill_info['bgColor']
+            )
+            cell.fill = new_fill
+        except Exception:
+            # If restoring fails, just leave the cell with its new value
+            pass
 
-def get_tradingview_price(driver, url):
+def get_bitcap_price(driver, url):
     """
-    Navigate to a TradingView symbol page and scrape the share price.
-    Returns a float or raises ValueError.
+    Extract share price from bitcap.com fund pages.
+    
+    Specifically designed for BIT Crypto Opportunities and other BIT Capital funds
+    that display share prices in the format "Share price €81.28*" with optional
+    date information like "*As of 30.4.2025".
+    
+    Args:
+        driver: Selenium WebDriver instance
+        url: Bitcap URL (e.g., https://bitcap.com/en/bit-crypto-opportunities-institutional-en/?confirmed=1)
+    
+    Returns:
+        float: The extracted price value
+        
+    Raises:
+        ValueError: If price extraction fails
     """
     try:
-        logging.info(f"TradingView: Navigating to {url}")
+        logging.info(f"Extracting Bitcap price from: {url}")
+        
+        # Navigate to the page
         driver.get(url)
         
         # Wait for the page to load
@@ -3387,831 +1431,410 @@ def get_tradingview_price(driver, url):
             EC.presence_of_element_located((By.TAG_NAME, "body"))
         )
         
-        # Allow extra time for JavaScript content to load
-        time.sleep(8)  # TradingView uses a lot of JS
-        
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-        
-        # Method 1: Look for price in TradingView-specific selectors
-        try:
-            price_selectors = [
-                "[data-field='last_price']",
-                ".tv-symbol-price-quote__value",
-                ".js-symbol-last",
-                ".last-price",
-                ".current-price",
-                ".price-value",
-                "[class*='price'][class*='last']",
-                "[class*='quote'][class*='price']"
-            ]
-            
-            for selector in price_selectors:
-                elements = soup.select(selector)
-                for element in elements:
-                    text = element.get_text(strip=True)
-                    logging.info(f"TradingView: Found element with selector '{selector}': {text}")
-                    # Look for price patterns (USD, numbers with decimals)
-                    price_match = re.search(r'([\d,]+\.[\d]{2,})', text)
-                    if price_match:
-                        price_str = price_match.group(1)
-                        try:
-                            price_value = float(price_str.replace(',', ''))
-                            if 0.01 <= price_value <= 100000:
-                                logging.info(f"TradingView: Found price using selector '{selector}': {price_value}")
-                                return price_value
-                        except ValueError:
-                            continue
-                            
-        except Exception as e:
-            logging.error(f"TradingView: Error with selector method: {e}")
-        
-        # Method 2: Look for price patterns in text content
+        # Handle potential cookie consent and popups
         try:
-            page_text = soup.get_text(" ", strip=True)
-            
-            # Look for patterns like "27.88USD", "27.88 USD", etc.
-            price_patterns = [
-                r'([\d,]+\.[\d]{2,})\s*USD',          # "27.88USD" or "27.88 USD"
-                r'([\d,]+\.[\d]{2,})\s*\$',           # "27.88$"
-                r'\$\s*([\d,]+\.[\d]{2,})',           # "$27.88"
-                r'Price\s*:?\s*([\d,]+\.[\d]{2,})',   # "Price: 27.88"
-                r'Last\s*:?\s*([\d,]+\.[\d]{2,})',    # "Last: 27.88"
-                r'([\d,]+\.[\d]{2,})\s*−[\d,]+\.[\d]{2,}', # "27.88−0.08−0.29%" pattern
+            consent_selectors = [
+                "button[onclick*='Accept']",
+                "button:contains('Accept')",
+                ".cookie-accept",
+                "#cookie-accept",
+                "button[id*='accept']",
+                "button[class*='accept']",
+                "button[id*='consent']",
+                "button[class*='consent']"
             ]
             
-            for pattern in price_patterns:
-                matches = re.finditer(pattern, page_text, re.IGNORECASE)
-                for match in matches:
-                    price_str = match.group(1)
-                    try:
-                        price_value = float(price_str.replace(',', ''))
-                        if 0.01 <= price_value <= 100000:
-                            logging.info(f"TradingView: Found price using pattern '{pattern}': {price_value}")
-                            return price_value
-                    except ValueError:
-                        continue
-                        
-        except Exception as e:
-            logging.error(f"TradingView: Error with text pattern method: {e}")
-        
-        # Method 3: Look for JSON data in script tags (TradingView often embeds data)
-        try:
-            script_tags = soup.find_all('script')
-            for script in script_tags:
-                script_content = script.get_text() if script.string else ""
-                if 'last_price' in script_content or 'lastPrice' in script_content:
-                    # Look for price values in JSON
-                    price_matches = re.findall(r'"(?:last_price|lastPrice)"\s*:\s*([\d.]+)', script_content)
-                    for price_str in price_matches:
-                        try:
-                            price_value = float(price_str)
-                            if 0.01 <= price_value <= 100000:
-                                logging.info(f"TradingView: Found price in script data: {price_value}")
-                                return price_value
-                        except ValueError:
-                            continue
-                            
-        except Exception as e:
-            logging.error(f"TradingView: Error with script parsing method: {e}")
-        
-        # Method 4: Look for any decimal numbers that could be prices
-        try:
-            # Extract all decimal numbers from the page
-            all_numbers = re.findall(r'\b([\d,]+\.\d{2,})\b', page_text)
-            valid_prices = []
-            for num_str in all_numbers:
+            for selector in consent_selectors:
                 try:
-                    price_value = float(num_str.replace(',', ''))
-                    if 0.01 <= price_value <= 100000:
-                        valid_prices.append(price_value)
-                except ValueError:
+                    if 'contains' in selector:
+                        consent_button = WebDriverWait(driver, 5).until(
+                            EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Accept')]"))
+                        )
+                    else:
+                        consent_button = WebDriverWait(driver, 5).until(
+                            EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
+                        )
+                    consent_button.click()
+                    logging.info(f"Bitcap: Clicked consent button")
+                    time.sleep(3)
+                    break
+                except:
                     continue
-            
-            if valid_prices:
-                # Return the most likely price (often the first one that appears)
-                price_value = valid_prices[0]
-                logging.info(f"TradingView: Found price using general number extraction: {price_value}")
-                return price_value
-                
         except Exception as e:
-            logging.error(f"TradingView: Error with general number extraction: {e}")
-        
-        raise ValueError("Could not find price on TradingView page")
-        
-    except Exception as e:
-        logging.error(f"TradingView: Unexpected error: {e}")
-        raise ValueError(f"TradingView scraping failed: {e}")
-
-def get_betashares_price(driver, url):
-    """
-    Navigate to a BetaShares ETF page and scrape the most accurate market price.
-    Prioritizes NAV/Unit over current price for better precision.
-    Returns a float or raises ValueError.
-    """
-    driver.get(url)
-    try:
-        # Wait for the page to load
-        WebDriverWait(driver, 30).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
+            logging.debug(f"Bitcap: No consent handling needed: {e}")
         
         # Allow extra time for JavaScript content to load
-        time.sleep(12)  # Increased wait time for dynamic pricing
-    except TimeoutException:
-        raise ValueError("Timed out waiting for BetaShares page to load")
-
-    soup = BeautifulSoup(driver.page_source, "html.parser")
-    
-    # Method 1: Look for NAV/Unit (most accurate)
-    try:
+        time.sleep(8)
+        
+        # Get page source and parse
+        soup = parse_html(driver.page_source)
         page_text = soup.get_text(" ", strip=True)
         
-        # Look for NAV/Unit patterns (highest priority)
-        nav_patterns = [
-            r'NAV/Unit[^$]*\$\s*([\d,\.]+)',           # "NAV/Unit* $7.04"
-            r'NAV\s+per\s+Unit[^$]*\$\s*([\d,\.]+)',   # "NAV per Unit $7.04"
-            r'Net\s+Asset\s+Value[^$]*\$\s*([\d,\.]+)', # "Net Asset Value $7.04"
-        ]
+        # Check if we got an error page
+        if "can't be reached" in page_text.lower() or "err_" in page_text.lower():
+            raise ValueError(f"Website returned error page: {page_text[:200]}")
         
-        for pattern in nav_patterns:
-            matches = re.finditer(pattern, page_text, re.IGNORECASE)
-            for match in matches:
-                price_str = match.group(1)
-                try:
-                    price_value = float(price_str.replace(',', ''))
-                    # Look for reasonable ETF prices with decimals
-                    if 1 <= price_value <= 500 and price_value != int(price_value):
-                        logging.info(f"Found BetaShares NAV/Unit: ${price_value}")
-                        return price_value
-                except ValueError:
-                    continue
-    except Exception as e:
-        logging.error(f"Error with BetaShares NAV method: {e}")
-    
-    # Method 2: Look for Current Price with better precision
-    try:
-        # Look for current price patterns with decimal precision
-        price_patterns = [
-            r'Current\s+price[^$]*\$\s*([\d,\.]+)',    # "Current price $ 6.92"
-            r'Last\s+trade[^$]*\$\s*([\d,\.]+)',       # "Last trade* $ 6.92"
-            r'Market\s+Price[^$]*\$\s*([\d,\.]+)',     # "Market Price $6.92"
-            r'Bid[^$]*\$\s*([\d,\.]+)',                # "Bid (delayed) $ 6.93"
-            r'Offer[^$]*\$\s*([\d,\.]+)',              # "Offer (delayed) $ 6.99"
+        # Method 1: Look for the exact "Share price €XX.XX*" pattern
+        share_price_patterns = [
+            r'Share price\s*€\s*([\d,\.]+)\*?',                    # "Share price €81.28*"
+            r'Share price[^\d]*€\s*([\d,\.]+)\*?',                 # "Share price [anything] €81.28*"
+            r'Share\s+price\s*€\s*([\d,\.]+)\*?',                  # "Share price €81.28*" with spaces
+            r'€\s*([\d,\.]+)\*?\s*Share price',                    # "€81.28* Share price"
+            r'Share\s+price[^\d]*€\s*([\d,\.]+)\*?',               # "Share price [non-digits] €81.28*"
         ]
         
-        for pattern in price_patterns:
+        for pattern in share_price_patterns:
             matches = re.finditer(pattern, page_text, re.IGNORECASE)
             for match in matches:
-                price_str = match.group(1)
+                raw_price = match.group(1)
+                logging.debug(f"Bitcap pattern '{pattern}' matched: '{raw_price}'")
+                
+                # Clean and normalize the price (handle European format)
+                price_normalized = raw_price.replace(',', '.')
                 try:
-                    price_value = float(price_str.replace(',', ''))
-                    # Look for reasonable ETF prices with decimals
-                    if 1 <= price_value <= 500 and price_value != int(price_value):
-                        logging.info(f"Found BetaShares current price: ${price_value}")
+                    price_value = float(price_normalized)
+                    if is_valid_share_price(price_value, page_text, url):
+                        logging.info(f"Bitcap price extracted: €{price_value}")
                         return price_value
                 except ValueError:
                     continue
-    except Exception as e:
-        logging.error(f"Error with BetaShares current price method: {e}")
-    
-    raise ValueError("Could not find valid market price on BetaShares page")
-def get_aminagroup_price(driver, url):
-    """
-    Enhanced function to extract price from aminagroup.com URLs.
-    Handles popups, consent dialogs, and has multiple retry attempts.
-    Returns a float or raises ValueError.
-    """
-    max_retries = 3
-    
-    for attempt in range(max_retries):
+        
+        # Method 2: Look for price in specific HTML elements with fund/price context
         try:
-            logging.info(f"Amina Group attempt {attempt + 1} of {max_retries} for URL: {url}")
-            driver.get(url)
-            
-            # Wait for initial page load
-            WebDriverWait(driver, 20).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
+            # Find elements that might contain fund pricing information
+            price_containers = soup.find_all(['div', 'span', 'td', 'p'], 
+                                           class_=re.compile(r'(price|fund|nav|value|quote)', re.I))
             
-            # Handle potential cookie/consent popup
-            try:
-                # Look for common consent/cookie buttons
-                consent_selectors = [
-                    "//button[contains(text(), 'Accept')]",
-                    "//button[contains(text(), 'Continue')]", 
-                    "//button[contains(text(), 'OK')]",
-                    "//button[contains(text(), 'Agree')]",
-                    "//button[@id='accept']",
-                    "//button[@class*='accept']",
-                    "//button[@class*='consent']",
-                    "//*[contains(@class, 'cookie') and contains(@class, 'accept')]//button",
-                    "//*[contains(@class, 'consent') and contains(@class, 'accept')]//button",
-                ]
+            for container in price_containers:
+                container_text = container.get_text(' ', strip=True)
                 
-                for selector in consent_selectors:
+                # Look for Euro amounts in fund-related containers
+                euro_match = re.search(r'€\s*([\d,\.]+)\*?', container_text)
+                if euro_match:
+                    raw_price = euro_match.group(1)
                     try:
-                        button = WebDriverWait(driver, 3).until(
-                            EC.element_to_be_clickable((By.XPATH, selector))
-                        )
-                        button.click()
-                        logging.info(f"Clicked consent button with selector: {selector}")
-                        time.sleep(2)
-                        break
-                    except:
+                        price_value = float(raw_price.replace(',', '.'))
+                        if is_valid_share_price(price_value, container_text, url):
+                            logging.info(f"Bitcap price found in container: €{price_value}")
+                            return price_value
+                    except ValueError:
                         continue
-                        
-            except Exception:
-                pass  # No consent popup found or couldn't handle
-            
-            # Wait for content to load after popup handling
-            time.sleep(3)
-            
-            # Try to find price using multiple methods
-            soup = BeautifulSoup(driver.page_source, "html.parser")
-            page_text = soup.get_text(" ", strip=True)
+        except Exception as e:
+            logging.debug(f"Bitcap container method failed: {e}")
+        
+        # Method 3: Look for any Euro amounts with "Share price" context nearby
+        try:
+            # Find all Euro amounts and check their context
+            euro_pattern = r'€\s*([\d,\.]+)\*?'
+            euro_matches = list(re.finditer(euro_pattern, page_text))
             
-            # Method 1: Look for "Current price" with specific formatting (most reliable)
-            try:
-                current_price_patterns = [
-                    r'Current\s+price\s+([\d,\.]+)\s+USD',  # "Current price 8.0734 USD*"
-                    r'Current\s+Price\s+([\d,\.]+)\s+USD',  # "Current Price 8.0734 USD*"
-                    r'Current\s+price[^\d]*?([\d,\.]+)',    # "Current price 8.0734"
-                    r'Current\s+Price[^\d]*?([\d,\.]+)',    # "Current Price 8.0734"
-                ]
+            for match in euro_matches:
+                raw_price = match.group(1)
                 
-                for pattern in current_price_patterns:
-                    matches = re.finditer(pattern, page_text, re.IGNORECASE)
-                    for match in matches:
-                        price_str = match.group(1)
-                        try:
-                            price_value = float(price_str.replace(',', ''))
-                            if 0.01 <= price_value <= 100000:  # Reasonable range
-                                logging.info(f"Found Amina Group current price: {price_value}")
-                                return price_value
-                        except ValueError:
-                            continue
-            except Exception as e:
-                logging.error(f"Error in Amina Group current price method: {e}")
-            
-            # Method 2: Look in structured data (JSON-LD, microdata)
-            try:
-                scripts = soup.find_all('script', type='application/ld+json')
-                for script in scripts:
+                # Check context around the Euro amount (±200 characters)
+                context_start = max(0, match.start() - 200)
+                context_end = min(len(page_text), match.end() + 200)
+                context = page_text[context_start:context_end].lower()
+                
+                # Look for share price indicators in the context
+                price_indicators = ['share price', 'price', 'nav', 'fund price', 'current price']
+                if any(indicator in context for indicator in price_indicators):
                     try:
-                        import json
-                        data = json.loads(script.string)
-                        # Look for price in structured data
-                        if isinstance(data, dict):
-                            price = data.get('price') or data.get('currentPrice') or data.get('value')
-                            if price and isinstance(price, (int, float, str)):
-                                price_value = float(str(price).replace(',', ''))
-                                if 0.01 <= price_value <= 100000:
-                                    logging.info(f"Found Amina Group price in structured data: {price_value}")
-                                    return price_value
-                    except:
+                        price_value = float(raw_price.replace(',', '.'))
+                        if is_valid_share_price(price_value, context, url):
+                            logging.info(f"Bitcap price found with context: €{price_value}")
+                            return price_value
+                    except ValueError:
                         continue
-            except Exception as e:
-                logging.error(f"Error in Amina Group structured data method: {e}")
-            
-            # Method 3: Look for price near specific elements
-            try:
-                # Find elements that might contain the price
-                price_containers = soup.find_all(['div', 'span', 'p', 'td', 'li'], 
-                    string=re.compile(r'Current\s+(price|Price)', re.IGNORECASE))
-                
-                for container in price_containers:
-                    # Look in the same element and nearby elements
-                    for element in [container, container.parent, container.find_next_sibling()]:
-                        if element:
-                            element_text = element.get_text(' ', strip=True)
-                            price_match = re.search(r'([\d,\.]+)', element_text)
-                            if price_match:
-                                price_str = price_match.group(1)
-                                try:
-                                    price_value = float(price_str.replace(',', ''))
-                                    if 0.01 <= price_value <= 100000:
-                                        logging.info(f"Found Amina Group price near current price element: {price_value}")
-                                        return price_value
-                                except ValueError:
-                                    continue
-            except Exception as e:
-                logging.error(f"Error in Amina Group element method: {e}")
-            
-            # Method 4: Look for NAV patterns as fallback
-            try:
-                nav_patterns = [
-                    r'NAV[^\d]*?([\d,\.]+)',                       # "NAV 1.0"
-                    r'Net\s+Asset\s+Value[^\d]*?([\d,\.]+)',       # "Net Asset Value 1.0"
-                ]
-                
-                for pattern in nav_patterns:
-                    matches = re.finditer(pattern, page_text, re.IGNORECASE)
-                    for match in matches:
-                        price_str = match.group(1)
-                        try:
-                            price_value = float(price_str.replace(',', ''))
-                            if 1.01 <= price_value <= 100000:  # Exclude exactly 1.0 which is suspicious
-                                logging.info(f"Found Amina Group NAV: {price_value}")
-                                return price_value
-                        except ValueError:
-                            continue
-            except Exception as e:
-                logging.error(f"Error in Amina Group NAV method: {e}")
-            
-            # Method 5: Look for any price-like patterns in tables or lists
-            try:
-                tables = soup.find_all('table')
-                for table in tables:
-                    rows = table.find_all('tr')
-                    for row in rows:
-                        row_text = row.get_text(' ', strip=True)
-                        if 'current' in row_text.lower() and 'price' in row_text.lower():
-                            price_match = re.search(r'([\d,\.]+)', row_text)
-                            if price_match:
-                                price_str = price_match.group(1)
-                                try:
-                                    price_value = float(price_str.replace(',', ''))
-                                    if 0.01 <= price_value <= 100000:
-                                        logging.info(f"Found Amina Group price in table: {price_value}")
-                                        return price_value
-                                except ValueError:
-                                    continue
-            except Exception as e:
-                logging.error(f"Error in Amina Group table method: {e}")
-            
-            # If we get here, we couldn't find the price on this attempt
-            if attempt < max_retries - 1:
-                logging.warning(f"Amina Group price not found on attempt {attempt + 1}, retrying...")
-                time.sleep(2)
-                continue
-            else:
-                # Log debug info for the last attempt
-                logging.error(f"Amina Group debug info for {url}:")
-                logging.error(f"Page title: {soup.find('title').get_text() if soup.find('title') else 'No title'}")
-                logging.error(f"Page text preview: {page_text[:500]}...")
-                raise ValueError("Could not find current price on Amina Group page after all attempts")
-                
         except Exception as e:
-            if attempt < max_retries - 1:
-                logging.warning(f"Amina Group error on attempt {attempt + 1}: {e}, retrying...")
-                time.sleep(3)
-                continue
-            else:
-                raise ValueError(f"Amina Group failed to extract price after {max_retries} attempts: {e}")
-
-
-
-def get_valour_price(driver, url):
-    """
-    Navigate to a Valour ETF page and scrape the share price.
-    Pattern found: "Share Price 1.2649 EUR"
-    Returns a float or raises ValueError.
-    """
-    driver.get(url)
-    try:
-        WebDriverWait(driver, 30).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        time.sleep(8)
-    except TimeoutException:
-        raise ValueError("Timed out waiting for Valour page to load")
-
-    soup = BeautifulSoup(driver.page_source, "html.parser")
-    page_text = soup.get_text(" ", strip=True)
-    
-    # Method 1: Look for "Share Price X.XXXX EUR" pattern (most reliable)
-    try:
-        share_price_pattern = r'Share\s+Price\s+([\d,\.]+)\s+EUR'
-        match = re.search(share_price_pattern, page_text, re.IGNORECASE)
-        if match:
-            price_str = match.group(1)
-            price_value = float(price_str.replace(',', ''))
-            if 0.01 <= price_value <= 1000:  # Reasonable ETF price range
-                logging.info(f"Found Valour share price: {price_value} EUR")
-                return price_value
-    except Exception as e:
-        logging.error(f"Error with Valour share price method: {e}")
-    
-    # Method 2: Look for general price patterns near "Price"
-    try:
-        price_patterns = [
-            r'Price[^0-9]*?([\d,\.]+)',           # "Price 1.2649"
-            r'Current\s+Price[^0-9]*?([\d,\.]+)', # "Current Price 1.2649"
-            r'Unit\s+Price[^0-9]*?([\d,\.]+)',    # "Unit Price 1.2649"
-        ]
+            logging.debug(f"Bitcap context method failed: {e}")
         
-        for pattern in price_patterns:
-            matches = re.finditer(pattern, page_text, re.IGNORECASE)
-            for match in matches:
-                price_str = match.group(1)
-                try:
-                    price_value = float(price_str.replace(',', ''))
-                    if 0.01 <= price_value <= 1000:
-                        logging.info(f"Found Valour price: {price_value}")
-                        return price_value
-                except ValueError:
-                    continue
-    except Exception as e:
-        logging.error(f"Error with Valour general price method: {e}")
-    
-    raise ValueError("Could not find valid share price on Valour page")
-
-def get_nasdaq_european_price_v2(driver, url):
-    """
-    Navigate to a NASDAQ European Market page and scrape the price.
-    Pattern found: "SEK 15.86"
-    Returns a float or raises ValueError.
-    """
-    driver.get(url)
-    try:
-        WebDriverWait(driver, 30).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        time.sleep(8)
-    except TimeoutException:
-        raise ValueError("Timed out waiting for NASDAQ European page to load")
-
-    soup = BeautifulSoup(driver.page_source, "html.parser")
-    page_text = soup.get_text(" ", strip=True)
-    
-    # Method 1: Look for "SEK XX.XX" pattern (most reliable for this specific URL)
-    try:
-        sek_pattern = r'SEK\s+([\d,\.]+)'
-        match = re.search(sek_pattern, page_text, re.IGNORECASE)
-        if match:
-            price_str = match.group(1)
-            price_value = float(price_str.replace(',', ''))
-            if 0.01 <= price_value <= 10000:  # Reasonable price range for SEK
-                logging.info(f"Found NASDAQ European price: {price_value} SEK")
-                return price_value
-    except Exception as e:
-        logging.error(f"Error with NASDAQ European SEK method: {e}")
-    
-    # Method 2: Look for other currency patterns
-    try:
-        currency_patterns = [
-            (r'USD\s+([\d,\.]+)', 'USD'),
-            (r'EUR\s+([\d,\.]+)', 'EUR'),
-            (r'Last\s+Sale[^0-9]*?([\d,\.]+)', 'Last Sale'),
-            (r'Current\s+Price[^0-9]*?([\d,\.]+)', 'Current Price'),
-        ]
+        # Method 4: Enhanced AI fallback for bitcap specifically
+        try:
+            ai_result = try_ai_fallback(driver, url)
+            if "ai extracted price" in ai_result:
+                ai_price = ai_result["ai extracted price"]
+                if isinstance(ai_price, (int, float)) and is_valid_share_price(ai_price, page_text, url):
+                    logging.info(f"Bitcap AI fallback extracted: €{ai_price}")
+                    return float(ai_price)
+        except Exception as e:
+            logging.debug(f"Bitcap AI fallback failed: {e}")
         
-        for pattern, desc in currency_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                price_str = match.group(1)
-                try:
-                    price_value = float(price_str.replace(',', ''))
-                    if 0.01 <= price_value <= 10000:
-                        logging.info(f"Found NASDAQ European {desc}: {price_value}")
-                        return price_value
-                except ValueError:
-                    continue
-    except Exception as e:
-        logging.error(f"Error with NASDAQ European currency method: {e}")
-    
-    raise ValueError("Could not find valid price on NASDAQ European page")
-
-def get_purposeinvest_price(driver, url):
-    """
-    Navigate to a Purpose Investments ETF page and scrape the NAV.
-    Pattern found: "NAV $4.80"
-    Returns a float or raises ValueError.
-    """
-    driver.get(url)
-    try:
-        WebDriverWait(driver, 30).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        time.sleep(8)
-    except TimeoutException:
-        raise ValueError("Timed out waiting for Purpose Investments page to load")
-
-    soup = BeautifulSoup(driver.page_source, "html.parser")
-    page_text = soup.get_text(" ", strip=True)
-    
-    # Method 1: Look for "NAV $X.XX" pattern (most reliable)
-    try:
-        nav_pattern = r'NAV\s+\$\s*([\d,\.]+)'
-        match = re.search(nav_pattern, page_text, re.IGNORECASE)
-        if match:
-            price_str = match.group(1)
-            price_value = float(price_str.replace(',', ''))
-            if 0.01 <= price_value <= 1000:  # Reasonable ETF NAV range
-                logging.info(f"Found Purpose Investments NAV: ${price_value}")
-                return price_value
-    except Exception as e:
-        logging.error(f"Error with Purpose Investments NAV method: {e}")
-    
-    # Method 2: Look for other price patterns
-    try:
-        price_patterns = [
-            r'Unit\s+Price[^$]*\$\s*([\d,\.]+)',    # "Unit Price $X.XX"
-            r'Market\s+Price[^$]*\$\s*([\d,\.]+)',  # "Market Price $X.XX"
-            r'Closing\s+Price[^$]*\$\s*([\d,\.]+)', # "Closing Price $X.XX"
-            r'Price[^$]*\$\s*([\d,\.]+)',           # "Price $X.XX"
-        ]
+        raise ValueError("Could not find share price on bitcap page")
         
-        for pattern in price_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                price_str = match.group(1)
-                try:
-                    price_value = float(price_str.replace(',', ''))
-                    if 0.01 <= price_value <= 1000:
-                        logging.info(f"Found Purpose Investments price: ${price_value}")
-                        return price_value
-                except ValueError:
-                    continue
     except Exception as e:
-        logging.error(f"Error with Purpose Investments price method: {e}")
-    
-    raise ValueError("Could not find valid NAV/price on Purpose Investments page")
+        if "Could not find share price" in str(e):
+            raise e
+        else:
+            raise ValueError(f"Bitcap extraction error: {e}")
 
-def get_csopasset_price(driver, url):
+def is_valid_share_price(price_value, context_text="", url=""):
     """
-    Navigate to a CSO P Asset page and scrape the actual market price.
-    Handles both HKD and USD pricing.
-    Returns a float or raises ValueError.
+    Comprehensive validation to filter out obvious non-price values.
+    Returns True if the value is likely a real share price, False otherwise.
     """
-    driver.get(url)
     try:
-        # Wait for the page to load
-        WebDriverWait(driver, 30).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
+        price = float(price_value)
         
-        # Allow extra time for JavaScript content to load
-        time.sleep(12)  # Increased wait time for dynamic pricing
-    except TimeoutException:
-        raise ValueError("Timed out waiting for CSO P Asset page to load")
-
-    soup = BeautifulSoup(driver.page_source, "html.parser")
-    
-    # Method 1: Look for Closing Price (most reliable)
-    try:
-        page_text = soup.get_text(" ", strip=True)
+        # Basic range validation - exclude extremely unreasonable values
+        if price <= 0 or price > 100000:
+            return False
+        
+        # Special case for Amina Group - their certificate prices are whole numbers (like 8.0, 32.0)
+        # and are legitimate share prices even though they end in .0
+        if url and "aminagroup.com" in url.lower():
+            if 0.1 <= price <= 1000:  # Reasonable price range for their certificates
+                # Add extra check to ensure context mentions price
+                if context_text and any(keyword in context_text.lower() for keyword in ["price", "current", "value"]):
+                    return True
+                # Even without context, accept if the price is in reasonable range for crypto trackers
+                return True
+        
+        # ENHANCED .0 DETECTION - Detect ALL forms of .0 values (24.00, 30.0, etc.)
+        # Check if the number has only zeros after the decimal point
+        price_str = str(price)
+        if '.' in price_str:
+            # Split into integer and decimal parts
+            integer_part, decimal_part = price_str.split('.')
+            # Check if decimal part contains only zeros (handles 24.0, 24.00, 24.000, etc.)
+            if decimal_part and all(digit == '0' for digit in decimal_part):
+                is_zero_decimal = True
+                whole_number_value = int(float(price))  # Convert to int for further checks
+            else:
+                is_zero_decimal = False
+                whole_number_value = None
+        else:
+            # It's already a whole number (no decimal point)
+            is_zero_decimal = True
+            whole_number_value = int(price)
+        
+        # If it's a .0 value (including 24.00, 30.0, etc.), apply strict filtering
+        if is_zero_decimal and whole_number_value is not None:
+            
+            # 1. YEAR DETECTION - Reject years (1990-2030)
+            if 1990 <= whole_number_value <= 2030:
+                logging.debug(f"Rejected year value: {price} (detected as .0)")
+                return False
+            
+            # 2. PERCENTAGE VALUES - Common protection/allocation percentages
+            # BUT FIRST check if we have explicit price context that overrides this
+            if context_text:
+                context_lower = context_text.lower()
+                price_keywords = ['price', 'share price', 'market price', 'last price', 'trading price', 
+                                'current price', 'last traded', 'closing price', 'nav', 'quote']
+                has_price_context = any(keyword in context_lower for keyword in price_keywords)
+                
+                # If we have explicit price context, allow reasonable whole number prices
+                if has_price_context and 5 <= whole_number_value <= 200:
+                    logging.debug(f"Accepted .0 value with valid price context: {price}")
+                    return True
+            
+            # Only reject percentage values if no valid price context was found
+            if whole_number_value in [10, 20, 30, 40, 50, 60, 70, 75, 80, 90, 95, 100]:
+                logging.debug(f"Rejected likely percentage value: {price} (detected as .0)")
+                return False
+            
+            # 3. SMALL INTEGERS - Likely version numbers, ratings, etc.
+            if 1 <= whole_number_value <= 5:
+                logging.debug(f"Rejected small integer (likely version/rating): {price} (detected as .0)")
+                return False
+            
+            # 4. TEST VALUES - Common test values
+            if whole_number_value in [123, 1234, 12345]:
+                logging.debug(f"Rejected likely test value: {price} (detected as .0)")
+                return False
+            
+            # 5. SPECIFIC COMMON METADATA - Specific numbers often seen
+            # Exclude 24, 48, 72 (hours), 7, 14, 28, 30, 60, 90 (days)
+            if whole_number_value in [24, 48, 72, 7, 14, 28, 30, 60, 90, 365]:
+                logging.debug(f"Rejected likely time period value: {price} (detected as .0)")
+                return False
+            
+            # 6. DOMAIN-SPECIFIC RULES for .0 values
+            if url:
+                url_lower = url.lower()
+                
+                # Calamos Bitcoin protection ETFs - reject protection percentages
+                if 'calamos.com' in url_lower and whole_number_value in [10, 20, 28, 30, 31, 50, 55, 80, 90, 100]:
+                    logging.debug(f"Rejected Calamos protection percentage: {price} (detected as .0)")
+                    return False
+                
+                # WisdomTree - reject common metadata values
+                if 'wisdomtree.eu' in url_lower and whole_number_value in [1, 2, 3, 4, 5]:
+                    logging.debug(f"Rejected WisdomTree metadata value: {price} (detected as .0)")
+                    return False
+                
+                # NASDAQ - reject volume/market cap indicators
+                if 'nasdaq.com' in url_lower and whole_number_value > 1000:
+                    logging.debug(f"Rejected NASDAQ large value (likely volume/market cap): {price} (detected as .0)")
+                    return False
+            
+            # 7. RANGE VALIDATION for .0 values - Be more restrictive
+            if not (1 <= whole_number_value <= 1000):  # Most stock/ETF prices are in this range
+                # Exception: some crypto can be higher, but not too extreme
+                if not (1000 < whole_number_value <= 10000 and url and ('bitcoin' in url.lower() or 'crypto' in url.lower())):
+                    logging.debug(f"Rejected .0 value outside reasonable price range: {price}")
+                    return False
+            
+            # If we get here and it's a .0 value, it's suspicious but might be valid
+            # Log it as suspicious but allow it through (it will be flagged in the log)
+            logging.debug(f"Suspicious .0 value detected but allowing: {price}")
+            return False
         
-        # Look for closing price patterns - be more specific to avoid dates
-        closing_patterns = [
-            r'Closing\s+Price\s+as\s+of\s+[\d-]+\s+([\d,\.]+)',  # "Closing Price as of 22-May-2025 38.500"
-            r'38\.500',                                           # Direct match for the specific price we saw
-            r'38\.2800',                                          # Intra-day price we saw
-            r'38\.3621',                                          # NAV price we saw
-            r'38\.2721',                                          # Another NAV price we saw
-        ]
+        # For non-.0 values, apply lighter validation
         
-        for pattern in closing_patterns:
-            matches = re.finditer(pattern, page_text, re.IGNORECASE)
-            for match in matches:
-                if pattern.startswith(r'38\.'):  # Direct price matches
-                    price_str = match.group(0)
-                else:
-                    price_str = match.group(1)
-                try:
-                    price_value = float(price_str.replace(',', ''))
-                    # Look for reasonable prices (HKD range 10-100, USD range 1-20)
-                    if (10 <= price_value <= 100) or (1 <= price_value <= 20):
-                        logging.info(f"Found CSO P Asset closing price: {price_value}")
-                        return price_value
-                except ValueError:
-                    continue
-    except Exception as e:
-        logging.error(f"Error with CSO P Asset closing price method: {e}")
-    
-    # Method 2: Look for Intra-day Market Price
-    try:
-        market_patterns = [
-            r'Intra-day\s+Market\s+Price[^0-9]*([\d,\.]+)',  # "Intra-day Market Price 38.2800"
-            r'Market\s+Price[^0-9]*([\d,\.]+)',              # "Market Price 38.2800"
-        ]
+        # IMPROVED: Better decimal price validation for small values
+        # Check for expense ratios and other percentage-like decimals
+        if 0 < price < 5:
+            if context_text:
+                context_lower = context_text.lower()
+                # More comprehensive expense ratio detection
+                expense_keywords = ['expense ratio', 'ter', 'fee', 'cost', '%', 'percent', 'expense', 'ratio']
+                if any(keyword in context_lower for keyword in expense_keywords):
+                    logging.debug(f"Rejected likely expense ratio/fee: {price}")
+                    return False
         
-        for pattern in market_patterns:
-            matches = re.finditer(pattern, page_text, re.IGNORECASE)
-            for match in matches:
-                price_str = match.group(1)
-                try:
-                    price_value = float(price_str.replace(',', ''))
-                    # Look for reasonable prices
-                    if (10 <= price_value <= 100) or (1 <= price_value <= 20):
-                        logging.info(f"Found CSO P Asset market price: {price_value}")
-                        return price_value
-                except ValueError:
-                    continue
-    except Exception as e:
-        logging.error(f"Error with CSO P Asset market price method: {e}")
-    
-    # Method 3: Look for NAV per Unit (fallback)
-    try:
-        nav_patterns = [
-            r'NAV\s+as\s+of[^0-9]*([\d,\.]+)',              # "NAV as of 22-May-2025 38.3621"
-            r'NAV\s+per\s+Unit[^0-9]*([\d,\.]+)',           # "NAV per Unit 4.9016"
-        ]
+        # For legitimate decimal values (like 1.0092, 24.37, etc.), be more permissive
+        # If we get here, it's likely a valid price
+        return True
         
-        for pattern in nav_patterns:
-            matches = re.finditer(pattern, page_text, re.IGNORECASE)
-            for match in matches:
-                price_str = match.group(1)
-                try:
-                    price_value = float(price_str.replace(',', ''))
-                    # Look for reasonable prices
-                    if (10 <= price_value <= 100) or (1 <= price_value <= 20):
-                        logging.info(f"Found CSO P Asset NAV: {price_value}")
-                        return price_value
-                except ValueError:
-                    continue
-    except Exception as e:
-        logging.error(f"Error with CSO P Asset NAV method: {e}")
-    
-    raise ValueError("Could not find valid market price on CSO P Asset page")
+    except (ValueError, TypeError):
+        return False
 
-def enhanced_grayscale_price_extraction(driver, url):
-    """Enhanced Grayscale price extraction with multiple fallback methods."""
-    driver.get(url)
-    try:
-        WebDriverWait(driver, 15).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-        time.sleep(8)
-    except TimeoutException:
-        raise ValueError("Timed out waiting for Grayscale page to load")
+# Labels passed to fetch_and_extract_data for the generic keyword fallback
+PRICE_KEYWORDS = [
+    "closing price prev trading day", "closing price", "opening price", "share price", "market price", 
+    "last traded price", "valuation price", "vl", "Last Traded Price", "ESTIMATIVA DA COTA", "Market Close",
+    "Value per ETC security", "value per etc security", "ETP Price", "previous close",
+    "valor da cota", "Last Close", "Previous closing price",
+    "Current issue price", "Current price", "Last trade", "open", "last price", "last traded",
+    "ai extracted price"  # NEW: AI fallback keyword
+]
+# Order in which extracted values are preferred when writing column L
+PRICE_PRIORITY_KEYWORDS = [
+    "ai extracted price",  # NEW: Give AI results high priority
+    "closing price prev trading day", "last traded price",
+    "Last Traded Price", "share price", "market price", 
+    "closing price", "opening price", "valuation price", "previous close", "Last Close",
+    "Previous closing price", "vl", "ESTIMATIVA DA COTA", "Market Close", "ETP Price",
+    "Value per ETC security", "value per etc security", "valor da cota", 
+    "Current issue price", "Current price", "Last trade", "open", "last price", "last traded"
+]
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
-    page_text = soup.get_text(" ", strip=True)
-    
-    # Enhanced patterns for Grayscale pages
-    price_patterns = [
-        r'Market\s+Price[:\s]*\$?\s*([\d,]+\.?\d*)',       # Existing
-        r'Share\s+Price[:\s]*\$?\s*([\d,]+\.?\d*)',        # Existing
-        r'Price\s+per\s+Share[:\s]*\$?\s*([\d,]+\.?\d*)',  # New specific common phrase
-        r'Current\s+Price[:\s]*\$?\s*([\d,]+\.?\d*)',      # Existing
-        r'NAV[:\s]*\$?\s*([\d,]+\.?\d*)',                   # Existing
-        r'Last\s+Price[:\s]*\$?\s*([\d,]+\.?\d*)',         # Existing
-        r'Price[:\s]*\$?\s*([\d,]+\.?\d*)',                 # New generic "Price:"
-        r'\$\s*([\d,]+\.?\d*)\s*(?:per\s+share|USD)',       # Existing
-        r'\$\s*([\d,]+\.?\d*)',                             # New, more general dollar amount (as a last resort)
-    ]
-    
-    for pattern in price_patterns:
-        matches = re.findall(pattern, page_text, re.IGNORECASE)
-        for match in matches:
-            try:
-                price_str = match.replace(',', '')
-                price = float(price_str)
-                if 1.0 <= price <= 500.0:
-                    logging.info(f"Enhanced Grayscale: Found price: ${price}")
-                    return price
-            except ValueError:
-                continue
-    
-    raise ValueError("Could not extract valid price from Grayscale page")
+def choose_price_output(results):
+    """
+    Pick the value written to column L from one row's extraction results,
+    using PRICE_PRIORITY_KEYWORDS.
 
-def enhanced_valour_price_extraction(driver, url):
-    """Enhanced Valour price extraction to fix .0 errors."""
-    driver.get(url)
-    try:
-        WebDriverWait(driver, 15).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-        time.sleep(8)
-    except TimeoutException:
-        raise ValueError("Timed out waiting for Valour page to load")
+    Returns:
+        (cell_text, chosen_key, chosen_result) - chosen_key is "error" or
+        "no_data" when no price was found
+    """
+    chosen_result = None
+    chosen_key = None
+
+    if "error" in results and len(results) == 1:
+        out = f"Error: {results['error']}"
+        chosen_result = results['error']
+        chosen_key = "error"
+    elif not results:
+        out = "No matching data found from URL."
+        chosen_result = "No matching data found from URL."
+        chosen_key = "no_data"
+    else:
+        # Find the chosen value based on priority order
+        for key in PRICE_PRIORITY_KEYWORDS:
+            if key in results and isinstance(results[key], (int, float)):
+                chosen_key = key
+                chosen_result = results[key]
+                # Add (AI) tag for AI extracted prices
+                if key == "ai extracted price":
+                    out = f"share price: {results[key]} (AI)"
+                else:
+                    out = f"{key}: {results[key]}"
+                break
+            if chosen_result is None and key in results and isinstance(results[key], str) and results[key].startswith("Error:"):
+                chosen_key = key
+                chosen_result = results[key]
+                out = f"{key}: {results[key]}"
+
+        if chosen_result is None:
+            out = "No data for specified keywords found from URL."
+            chosen_result = "No data for specified keywords found from URL."
+            chosen_key = "no_data"
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
-    page_text = soup.get_text(" ", strip=True)
-    
-    # Patterns requiring at least 2 decimal places to avoid .0 errors
-    patterns = [
-        r'Current\s+Price[:\s]*([\d]+\.[\d]{2,})',
-        r'Market\s+Price[:\s]*([\d]+\.[\d]{2,})',
-        r'NAV[:\s]*([\d]+\.[\d]{2,})',
-        r'Value[:\s]*([\d]+\.[\d]{2,})',
-        r'Price[:\s]*([\d]+\.[\d]{2,})',
-    ]
-    
-    for pattern in patterns:
-        matches = re.findall(pattern, page_text, re.IGNORECASE)
-        for match in matches:
-            try:
-                price = float(match)
-                if 0.01 <= price <= 1000:
-                    logging.info(f"Enhanced Valour: Found decimal price: {price}")
-                    return price
-            except ValueError:
-                continue
-    
-    raise ValueError("Could not extract valid decimal price from Valour page")
+    return out, chosen_key, chosen_result
 
-def enhanced_bitcap_price_extraction(driver, url):
+def cache_price_result(result_cache, url, results):
     """
-    Enhanced Bitcap price extraction with cookie consent handling.
-    Addresses red cell errors due to consent barriers.
-    """
-    driver.get(url)
-    
-    # Handle cookie consent
-    try:
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        
-        consent_selectors = [
-            "button[id*='accept']", "button[class*='accept']",
-            "button[id*='consent']", "button[class*='consent']",
-            "a[id*='accept']", "a[class*='accept']",
-            ".cookie-accept", "#cookie-accept",
-            ".accept-cookies", "#accept-cookies"
-        ]
-        
-        for selector in consent_selectors:
-            try:
-                consent_button = driver.find_element(By.CSS_SELECTOR, selector)
-                if consent_button.is_displayed():
-                    consent_button.click()
-                    logging.info(f"Enhanced Bitcap: Clicked consent button")
-                    time.sleep(3)
-                    break
-            except:
-                continue
-        
-        time.sleep(8)
-        
-    except TimeoutException:
-        raise ValueError("Timed out waiting for Bitcap page to load")
+    Store a row's price in the result cache if the value written to column L is a valid price.
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
-    
-    # Check if still blocked by consent
-    page_text = soup.get_text(" ", strip=True).lower()
-    if any(keyword in page_text for keyword in ['cookie', 'consent', 'accept', 'privacy']):
-        if len(page_text) < 1000:
-            raise ValueError("Blocked by cookie consent - manual intervention needed")
-    
-    # Look for fund price information
-    try:
-        fund_sections = soup.find_all(['div', 'section'], 
-                                    class_=re.compile(r'(fund|price|nav|performance)', re.I))
-        for section in fund_sections:
-            text = section.get_text(strip=True)
-            price_match = re.search(r'([\d,]+\.[\d]{2,})\s*(?:EUR|USD|€|\$)', text)
-            if price_match:
-                try:
-                    price_str = price_match.group(1).replace(',', '')
-                    price = float(price_str)
-                    if 0.1 <= price <= 10000:
-                        logging.info(f"Enhanced Bitcap: Found price: {price}")
-                        return price
-                except ValueError:
-                    continue
-    except Exception as e:
-        logging.debug(f"Enhanced Bitcap method failed: {e}")
-    
-    raise ValueError("Could not extract valid price from Bitcap page")
+    Uses the same choice and validation as the workbook write, so a value reported
+    as an invalid price is never cached and the row is extracted again next run.
 
-def enhanced_morningstar_price_extraction(driver, url):
+    Returns:
+        True if the price was cached
     """
-    Enhanced Morningstar price extraction for Belgian/European sites.
-    Addresses purple cell issues with wrong figures.
+    out, chosen_key, chosen_result = choose_price_output(results)
+    if chosen_key in ("error", "no_data") or isinstance(chosen_result, bool) \
+            or not isinstance(chosen_result, (int, float)):
+        return False
+    if not is_valid_share_price(chosen_result, out, url):
+        return False
+    result_cache.store("price", url, results, value_key=chosen_key)
+    return True
+
+def create_price_driver(page_load_strategy="normal", tab_mode=False):
     """
-    if 'format=pdf' in url.lower() or url.lower().endswith('.pdf'):
-        raise ValueError("PDF URL cannot be processed for price extraction")
-    
-    driver.get(url)
-    try:
-        WebDriverWait(driver, 20).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        time.sleep(10)
-    except TimeoutException:
-        raise ValueError("Timed out waiting for Morningstar page to load")
+    Create a headless Chrome instance configured for price extraction.
+    Each parallel worker calls this to get its own isolated browser.
+    Images, fonts, media and tracker hosts are blocked (see src.driver_factory), and
+    network responses are recorded for extractors with a NetworkRule (src.network_capture).
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
-    
-    # Look for price containers with Morningstar classes
-    try:
-        price_containers = soup.find_all(['div', 'span', 'td'], 
-                                       class_=re.compile(r'(price|nav|value|quote)', re.I))
-        for container in price_containers:
-            text = container.get_text(strip=True)
-            price_match = re.search(r'([\d,]+\.?\d*)\s*(?:EUR|USD|€|\$)', text)
-            if price_match:
-                try:
-                    price_str = price_match.group(1)
-                    # Handle European format
-                    if ',' in price_str and '.' not in price_str:
-                        price_str = price_str.replace(',', '.')
-                    elif ',' in price_str and '.' in price_str:
-                        price_str = price_str.replace('.', '').replace(',', '.')
-                    
-                    price = float(price_str)
-                    if 0.1 <= price <= 10000:
-                        logging.info(f"Enhanced Morningstar: Found price: {price}")
-                        return price
-                except ValueError:
-                    continue
-    except Exception as e:
-        logging.debug(f"Enhanced Morningstar method failed: {e}")
-    
-    raise ValueError("Could not extract valid price from Morningstar page")
+    Args:
+        page_load_strategy: "normal" or "eager" (driver.get() returns at
+                            DOMContentLoaded and extractors wait for their own targets)
+        tab_mode: browser shared by several workers as tabs (src.tab_pool); background
+                  tabs are not throttled, TabDriver.get() does the page load wait and
+                  network capture is off
+    """
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--window-size=1920,1080")
+    options.add_argument(
+        "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
+    )
+    if tab_mode:
+        for argument in TAB_MODE_ARGUMENTS:
+            options.add_argument(argument)
+        return create_chrome_driver(options, page_load_strategy="none", block_resources=True)
+    return create_chrome_driver(options, page_load_timeout=60, page_load_strategy=page_load_strategy,
+                                block_resources=True, capture_network=True)
+
+def main(workers=1, max_per_domain=DEFAULT_MAX_IN_FLIGHT, domain_delay=DEFAULT_MIN_INTERVAL,
+         page_load_strategy="normal", resume=False, vaneck_headless=None, tabs=1,
+         prefetch=False, refresh=False):
+    """
+    Update share prices in column L for every row with a URL in column P.
 
-def main():
+    Args:
+        workers: number of parallel browser workers (1 = serial run)
+        max_per_domain: max rows in flight per registrable domain
+        domain_delay: minimum seconds between requests to the same domain
+        page_load_strategy: Chrome page load strategy for the workers ("normal" or "eager")
+        resume: skip rows already journaled by an unfinished previous run
+        vaneck_headless: run the shared VanEck browser with --headless=new (True),
+                         visibly (False) or decide from the display (None)
+        tabs: run this many rows at once as tabs of a single browser instead of
+              one browser per worker (replaces workers when above 1)
+        prefetch: give each tab a spare tab that starts loading the next row while
+                  the current one is extracted (implies tab mode)
+        refresh: fetch every row even if the result cache holds an unexpired price
+    """
+    global VANECK_HEADLESS
     logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    VANECK_HEADLESS = vaneck_headless
 
     original_workbook_path = "data/Custodians.xlsx"
     workbook_path = "data/Custodians_Results.xlsx"
@@ -4223,6 +1846,7 @@ def main():
     import os
     from urllib.parse import urlparse
     from collections import defaultdict
+    from openpyxl import load_workbook
     
     if os.path.exists(workbook_path):
         os.remove(workbook_path)
@@ -4269,23 +1893,6 @@ def main():
             url_str = str(url) if url else "unknown"
             return url_str[:100] + ("..." if len(url_str) > 100 else "")
 
-    keywords_to_extract = [
-        "closing price prev trading day", "closing price", "opening price", "share price", "market price", 
-        "last traded price", "valuation price", "vl", "Last Traded Price", "ESTIMATIVA DA COTA", "Market Close",
-        "Value per ETC security", "value per etc security", "ETP Price", "previous close",
-        "valor da cota", "Last Close", "Previous closing price",
-        "Current issue price", "Current price", "Last trade", "open", "last price", "last traded",
-        "ai extracted price"  # NEW: AI fallback keyword
-    ]
-    priority_keywords_order = [
-        "ai extracted price",  # NEW: Give AI results high priority
-        "closing price prev trading day", "last traded price", "Last Traded Price", "share price", "market price", 
-        "closing price", "opening price", "valuation price", "previous close", "Last Close",
-        "Previous closing price", "vl", "ESTIMATIVA DA COTA", "Market Close", "ETP Price",
-        "Value per ETC security", "value per etc security", "valor da cota", 
-        "Current issue price", "Current price", "Last trade", "open", "last price", "last traded"
-    ]
-
     try:
         wb = load_workbook(workbook_path)
         if sheet_name not in wb.sheetnames:
@@ -4301,74 +1908,75 @@ def main():
         logging.info("No URLs found to process.")
         return
 
-    options = webdriver.ChromeOptions()
-    options.add_argument("--headless")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--window-size=1920,1080")
-    options.add_argument(
-        "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
-    )
-
-    driver = None
     all_data = {}
+    # Every finished row is journaled so a crashed run can be resumed
+    journal = RunJournal.open("excel_stock_updater", resume=resume)
+    # Prices that cannot have changed since an earlier run are not fetched again
+    result_cache = ResultCache()
+    run_complete = False
+    # With --tabs the workers share one browser, each driving its own tab
+    tab_browser = TabBrowser(lambda: create_price_driver(tab_mode=True)) if tabs > 1 or prefetch else None
 
     try:
-        # Clear webdriver manager cache to force fresh download
-        import os
-        import shutil
-        cache_path = os.path.expanduser("~/.wdm")
-        if os.path.exists(cache_path):
-            try:
-                shutil.rmtree(cache_path)
-                logging.info("Cleared webdriver manager cache")
-            except:
-                pass
-        
-        # Try to get a compatible chromedriver
-        try:
-            chrome_driver_path = ChromeDriverManager().install()
-            logging.info(f"Using chromedriver at: {chrome_driver_path}")
-        except Exception as e:
-            logging.error(f"ChromeDriverManager failed: {e}")
-            # Fallback: try to find chrome in common locations
-            chrome_driver_path = None
-            
-        if chrome_driver_path:
-            driver = webdriver.Chrome(
-                service=ChromeService(chrome_driver_path),
-                options=options
-            )
-        else:
-            # Last resort - let selenium find chromedriver
-            driver = webdriver.Chrome(options=options)
-        driver.set_page_load_timeout(60)  # Set page load timeout to 60 seconds
+        # Resolve chromedriver once (cached by Chrome version) before the workers start
+        resolve_chromedriver()
+
+        # Rows that can never be fetched are recorded up front; the rest go to the workers
+        fetch_rows = {}
         for row, url in rows_urls.items():
-            total_processed += 1
-            logging.info(f"Row {row}: {url}")
-            
             if not isinstance(url, str) or not url.strip().lower().startswith(("http://","https://")):
                 all_data[row] = {"error": "Invalid URL format"}
-                # Only track errors for normal (non-blue) cells
-                cell = ws[f"{dest_col}{row}"]
-                if not is_blue_cell(cell):
-                    domain = track_error_domain(url)
-                    error_domains[domain] += 1
-                    error_urls[domain].append(url)
-                continue
-                
-            if url.lower().endswith(".pdf"):
+            elif url.lower().endswith(".pdf"):
                 all_data[row] = {"error": "PDF file - cannot process"}
-                # Only track errors for normal (non-blue) cells
-                cell = ws[f"{dest_col}{row}"]
-                if not is_blue_cell(cell):
-                    domain = track_error_domain(url)
-                    error_domains[domain] += 1
-                    error_urls[domain].append(url)
+            else:
+                fetch_rows[row] = url
                 continue
 
-            data = fetch_and_extract_data(driver, url, keywords_to_extract)
+            total_processed += 1
+            logging.info(f"Row {row}: {url} - {all_data[row]['error']}")
+            # Only track errors for normal (non-blue) cells
+            cell = ws[f"{dest_col}{row}"]
+            if not is_blue_cell(cell):
+                domain = track_error_domain(url)
+                error_domains[domain] += 1
+                error_urls[domain].append(url)
+
+        resumed_rows = journal.completed(fetch_rows)
+        for row, _, _ in resumed_rows:
+            del fetch_rows[row]
+        if resumed_rows:
+            logging.info(f"Skipping {len(resumed_rows)} rows already done by the interrupted run")
+        cached_rows = [] if refresh else result_cache.fresh_rows("price", fetch_rows)
+        for row, _, _ in cached_rows:
+            del fetch_rows[row]
+        if cached_rows:
+            logging.info(f"Skipping {len(cached_rows)} rows whose cached price has not expired")
+
+        def process_row(driver, row, url):
+            logging.info(f"Row {row}: {url}")
+            return fetch_and_extract_data(driver, url, PRICE_KEYWORDS)
+
+        if tab_browser is not None:
+            logging.info(f"Tab mode: {tabs} tabs in one browser" + (", each with a prefetch tab" if prefetch else ""))
+        fetched = run_rows(
+            fetch_rows,
+            process_row,
+            tab_browser.new_tab if tab_browser else lambda: create_price_driver(page_load_strategy),
+            workers=tabs if tab_browser else workers,
+            max_per_domain=max_per_domain,
+            domain_delay=domain_delay,
+            prefetch=prefetch,
+        )
+        cached = {row for row, _, _ in cached_rows}
+        for row, url, data in itertools.chain(resumed_rows, cached_rows, fetched):
+            total_processed += 1
             all_data[row] = data
-            logging.info(f"Extracted: {data}")
+            if row in fetch_rows:
+                journal.record(row, url, data)
+                cache_price_result(result_cache, url, data)
+                logging.info(f"Row {row} extracted: {data}")
+            else:
+                logging.info(f"Row {row} from {'cache' if row in cached else 'journal'}: {data}")
             
             # Check if successful or error (ENHANCED: only track for normal cells)
             cell = ws[f"{dest_col}{row}"]
@@ -4387,12 +1995,21 @@ def main():
                     error_urls[domain].append(url)
             else:
                 total_successful += 1
+        run_complete = True
 
     except Exception as e:
         logging.error(f"Processing loop error: {e}", exc_info=True)
     finally:
-        if driver:
-            driver.quit()
+        close_vaneck_driver()
+        if tab_browser is not None:
+            tab_browser.close()
+        try:
+            result_cache.save()
+        except OSError as e:
+            logging.error(f"Error saving result cache: {e}")
+
+    # Workers finish in any order - merge results back in row order
+    all_data = dict(sorted(all_data.items()))
 
     # Write back with priority and separate blue/normal cells
     for row, results in all_data.items():
@@ -4405,38 +2022,7 @@ def main():
             logging.info(f"Row {row}: Blue cell detected - excluding from success rate calculation")
         
         # Determine the chosen price/result that will be written to the cell
-        chosen_result = None
-        chosen_key = None
-        
-        if "error" in results and len(results) == 1:
-            out = f"Error: {results['error']}"
-            chosen_result = results['error']
-            chosen_key = "error"
-        elif not results:
-            out = "No matching data found from URL."
-            chosen_result = "No matching data found from URL."
-            chosen_key = "no_data"
-        else:
-            # Find the chosen value based on priority order
-            for key in priority_keywords_order:
-                if key in results and isinstance(results[key], (int, float)):
-                    chosen_key = key
-                    chosen_result = results[key]
-                    # Add (AI) tag for AI extracted prices
-                    if key == "ai extracted price":
-                        out = f"share price: {results[key]} (AI)"
-                    else:
-                        out = f"{key}: {results[key]}"
-                    break
-                if chosen_result is None and key in results and isinstance(results[key], str) and results[key].startswith("Error:"):
-                    chosen_key = key
-                    chosen_result = results[key]
-                    out = f"{key}: {results[key]}"
-            
-            if chosen_result is None:
-                out = "No data for specified keywords found from URL."
-                chosen_result = "No data for specified keywords found from URL."
-                chosen_key = "no_data"
+        out, chosen_key, chosen_result = choose_price_output(results)
         
         # ENHANCED: Check if the CHOSEN result is suspicious using our validation function
         has_invalid_price = False
@@ -4482,8 +2068,12 @@ def main():
     try:
         wb.save(workbook_path)
         logging.info(f"Saved updates to {workbook_path}")
+        if run_complete:
+            journal.finish()
     except Exception as e:
         logging.error(f"Error saving workbook: {e}")
+    finally:
+        journal.close()
     
     # Create a copy of the results as custodians.xlsx (overwriting the original)
     try:
@@ -4634,7 +2224,7 @@ def get_dws_etf_price(driver, url):
         time.sleep(5)
         
         # Get page source and parse with BeautifulSoup
-        soup = BeautifulSoup(driver.page_source, "html.parser")
+        soup = parse_html(driver.page_source)
         page_text = soup.get_text(" ", strip=True)
         
         logging.debug(f"DWS page loaded, content length: {len(page_text)} characters")
@@ -4844,7 +2434,7 @@ def get_invesco_uk_price(driver, url):
         time.sleep(5)
         
         # Get final page source
-        soup = BeautifulSoup(driver.page_source, "html.parser")
+        soup = parse_html(driver.page_source)
         page_text = soup.get_text()
         
         # Method 1: Look for specific CV patterns (as provided in requirements)
@@ -5056,7 +2646,7 @@ def get_invesco_us_price(driver, url):
         time.sleep(3)
         
         # Get page source
-        soup = BeautifulSoup(driver.page_source, "html.parser")
+        soup = parse_html(driver.page_source)
         page_text = soup.get_text()
         
         # Method 1: Look for specific US Invesco patterns from websearch results
@@ -5164,7 +2754,7 @@ def get_yieldmax_etf_price(driver, url):
         
         # Get page source and parse with BeautifulSoup
         page_source = driver.page_source
-        soup = BeautifulSoup(page_source, 'html.parser')
+        soup = parse_html(page_source)
         page_text = soup.get_text()
         
         logging.debug(f"YieldMax page text length: {len(page_text)}")
@@ -5242,5 +2832,174 @@ def get_yieldmax_etf_price(driver, url):
         logging.error(f"Error extracting YieldMax ETF price from {url}: {str(e)}")
         raise ValueError(f"Failed to extract YieldMax ETF price: {str(e)}")
 
+# --- Site-specific browser extractors used by fetch_and_extract_data ---
+# Keyed by host and optional path prefix; the longest matching prefix wins.
+# To support a new site, write get_<site>_price(driver, url) and register it here.
+PRICE_EXTRACTORS = ExtractorRegistry("price extractors")
+PRICE_EXTRACTORS.register("grayscale.com", price_extractor_handler(
+    "Enhanced Grayscale", "src.price_extractors.grayscale:enhanced_grayscale_price_extraction",
+    "share price", log_failures=True))
+PRICE_EXTRACTORS.register("valour.com", price_extractor_handler(
+    "Enhanced Valour", "src.price_extractors.valour:enhanced_valour_price_extraction",
+    "share price", log_failures=True))
+PRICE_EXTRACTORS.register("bitcap.com", price_extractor_handler(
+    "Enhanced Bitcap", "src.price_extractors.bitcap:enhanced_bitcap_price_extraction",
+    "share price", log_failures=True))
+PRICE_EXTRACTORS.register("morningstar.be", price_extractor_handler(
+    "Enhanced Morningstar", "src.price_extractors.morningstar:enhanced_morningstar_price_extraction",
+    "share price", log_failures=True))
+PRICE_EXTRACTORS.register("boerse-frankfurt.de", get_boerse_frankfurt_result)
+PRICE_EXTRACTORS.register("nasdaq.com", price_extractor_handler(
+    "NASDAQ European market", "src.price_extractors.nasdaq:get_nasdaq_european_market_price", "share price"),
+    path_prefix="/european-market-activity")
+PRICE_EXTRACTORS.register("nasdaq.com", price_extractor_handler(
+    "NASDAQ market activity", "src.price_extractors.nasdaq:get_nasdaq_market_activity_price", "share price"),
+    path_prefix="/market-activity")
+PRICE_EXTRACTORS.register("bxswiss.com", price_extractor_handler(
+    "BX Swiss", "src.price_extractors.bxswiss:get_bxswiss_price", "last traded price"),
+    path_prefix="/instruments")
+PRICE_EXTRACTORS.register("live.euronext.com", price_extractor_handler(
+    "Euronext", "src.price_extractors.euronext:get_euronext_price", "valuation price"))
+PRICE_EXTRACTORS.register("money.tmx.com", price_extractor_handler(
+    "TMX Money", "src.price_extractors.tmx:get_tmx_price", "share price"))
+PRICE_EXTRACTORS.register("londonstockexchange.com", price_extractor_handler(
+    "London Stock Exchange", "src.price_extractors.londonstockexchange:get_london_stock_exchange_price",
+    "share price"))
+PRICE_EXTRACTORS.register("cboe.com", price_extractor_handler(
+    "CBOE US", "src.price_extractors.cboe:get_cboe_us_price", "share price"),
+    path_prefix="/us")
+PRICE_EXTRACTORS.register("cboe.com", price_extractor_handler(
+    "CBOE AU", "src.price_extractors.cboe:get_cboe_au_price", "share price"),
+    path_prefix="/au")
+PRICE_EXTRACTORS.register("morningstar.fr", get_morningstar_fr_result)
+PRICE_EXTRACTORS.register("franklintempleton.com", price_extractor_handler(
+    "Franklin Templeton", "src.price_extractors.franklintempleton:get_franklin_templeton_price",
+    "market price"))
+PRICE_EXTRACTORS.register("aminagroup.com", price_extractor_handler(
+    "Amina Group", "src.price_extractors.aminagroup:get_aminagroup_price", "current price"))
+PRICE_EXTRACTORS.register("schwabassetmanagement.com", price_extractor_handler(
+    "Schwab Asset Management", "src.price_extractors.schwab:get_schwab_asset_management_price",
+    "market price"))
+PRICE_EXTRACTORS.register("evolveetfs.com", price_extractor_handler(
+    "Evolve ETFs", "src.price_extractors.evolve:get_evolve_etfs_price", "market price"))
+PRICE_EXTRACTORS.register("21shares.com", price_extractor_handler(
+    "21Shares", "src.price_extractors.twentyoneshares:get_21shares_price", "market price"))
+PRICE_EXTRACTORS.register("ninepoint.com", price_extractor_handler(
+    "Ninepoint", "src.price_extractors.ninepoint:get_ninepoint_price", "market price"))
+PRICE_EXTRACTORS.register("tradingview.com", price_extractor_handler(
+    "TradingView", "src.price_extractors.tradingview:get_tradingview_price", "market price"))
+PRICE_EXTRACTORS.register("betashares.com.au", price_extractor_handler(
+    "BetaShares", "src.price_extractors.betashares:get_betashares_price", "market price"))
+PRICE_EXTRACTORS.register("csopasset.com", price_extractor_handler(
+    "CSO P Asset", "src.price_extractors.csopasset:get_csopasset_price", "closing price"))
+PRICE_EXTRACTORS.register("purposeinvest.com", price_extractor_handler(
+    "Purpose Investments", "src.price_extractors.purposeinvest:get_purposeinvest_price", "closing price"))
+_vaneck_handler = price_extractor_handler("VanEck", get_vaneck_price, "last traded price")
+PRICE_EXTRACTORS.register("vaneck.com", _vaneck_handler)
+PRICE_EXTRACTORS.register("vaneck.com.au", _vaneck_handler)
+PRICE_EXTRACTORS.register("qrasset.com.br", price_extractor_handler(
+    "QR Asset", "src.price_extractors.qrasset:get_qrasset_cota_price", "valor da cota"),
+    match=is_qrasset_cesta)
+
+# Extractors that live in src/price_extractors/, still importable from this module
+# (from excel_stock_updater import get_tmx_price) without importing them all up front
+_PLUGIN_EXTRACTORS = {
+    "get_nasdaq_european_market_price": "src.price_extractors.nasdaq:get_nasdaq_european_market_price",
+    "get_nasdaq_market_activity_price": "src.price_extractors.nasdaq:get_nasdaq_market_activity_price",
+    "get_nasdaq_european_price_v2": "src.price_extractors.nasdaq:get_nasdaq_european_price_v2",
+    "get_bxswiss_price": "src.price_extractors.bxswiss:get_bxswiss_price",
+    "get_euronext_price": "src.price_extractors.euronext:get_euronext_price",
+    "get_tmx_price": "src.price_extractors.tmx:get_tmx_price",
+    "get_london_stock_exchange_price": "src.price_extractors.londonstockexchange:get_london_stock_exchange_price",
+    "get_cboe_us_price": "src.price_extractors.cboe:get_cboe_us_price",
+    "get_cboe_au_price": "src.price_extractors.cboe:get_cboe_au_price",
+    "get_qrasset_cota_price": "src.price_extractors.qrasset:get_qrasset_cota_price",
+    "get_morningstar_fr_price": "src.price_extractors.morningstar:get_morningstar_fr_price",
+    "enhanced_morningstar_price_extraction": "src.price_extractors.morningstar:enhanced_morningstar_price_extraction",
+    "get_franklin_templeton_price": "src.price_extractors.franklintempleton:get_franklin_templeton_price",
+    "get_schwab_asset_management_price": "src.price_extractors.schwab:get_schwab_asset_management_price",
+    "get_evolve_etfs_price": "src.price_extractors.evolve:get_evolve_etfs_price",
+    "get_21shares_price": "src.price_extractors.twentyoneshares:get_21shares_price",
+    "get_ninepoint_price": "src.price_extractors.ninepoint:get_ninepoint_price",
+    "get_tradingview_price": "src.price_extractors.tradingview:get_tradingview_price",
+    "get_betashares_price": "src.price_extractors.betashares:get_betashares_price",
+    "get_aminagroup_price": "src.price_extractors.aminagroup:get_aminagroup_price",
+    "get_purposeinvest_price": "src.price_extractors.purposeinvest:get_purposeinvest_price",
+    "get_csopasset_price": "src.price_extractors.csopasset:get_csopasset_price",
+    "enhanced_grayscale_price_extraction": "src.price_extractors.grayscale:enhanced_grayscale_price_extraction",
+    "enhanced_valour_price_extraction": "src.price_extractors.valour:enhanced_valour_price_extraction",
+    "get_valour_price": "src.price_extractors.valour:get_valour_price",
+    "enhanced_bitcap_price_extraction": "src.price_extractors.bitcap:enhanced_bitcap_price_extraction",
+}
+
+
+def __getattr__(name):
+    reference = _PLUGIN_EXTRACTORS.get(name)
+    if reference is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return load_plugin(reference)
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Update share prices in data/Custodians_Results.xlsx")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of parallel headless Chrome workers (default: 1)"
+    )
+    parser.add_argument(
+        "--max-per-domain",
+        type=int,
+        default=DEFAULT_MAX_IN_FLIGHT,
+        help=f"Max concurrent requests per domain (default: {DEFAULT_MAX_IN_FLIGHT})"
+    )
+    parser.add_argument(
+        "--domain-delay",
+        type=float,
+        default=DEFAULT_MIN_INTERVAL,
+        help=f"Minimum seconds between requests to the same domain (default: {DEFAULT_MIN_INTERVAL})"
+    )
+    parser.add_argument(
+        "--page-load-strategy",
+        choices=["normal", "eager"],
+        default="normal",
+        help="Chrome page load strategy; 'eager' returns at DOMContentLoaded (default: normal)"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip rows already finished by an interrupted previous run"
+    )
+    parser.add_argument(
+        "--vaneck-headless",
+        action="store_true",
+        default=None,
+        help="Run the VanEck browser with --headless=new instead of a visible window "
+             "(default: visible when a display is available)"
+    )
+    parser.add_argument(
+        "--tabs",
+        type=int,
+        default=1,
+        help="Process this many rows at once as tabs of one headless Chrome instead of "
+             "one Chrome per worker; replaces --workers (default: 1)"
+    )
+    parser.add_argument(
+        "--prefetch",
+        action="store_true",
+        help="Start loading each tab's next row in a spare tab while the current row "
+             "is extracted (runs in tab mode, also with a single tab)"
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Fetch every row, also those whose cached price from an earlier run has not expired"
+    )
+    args = parser.parse_args()
+
+    main(workers=args.workers, max_per_domain=args.max_per_domain, domain_delay=args.domain_delay,
+         page_load_strategy=args.page_load_strategy, resume=args.resume,
+         vaneck_headless=args.vaneck_headless, tabs=args.tabs,
+         prefetch=args.prefetch, refresh=args.refresh)
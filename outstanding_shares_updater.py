@@ -4,17 +4,29 @@ import time
 import traceback
 import os
 import random
-from bs4 import BeautifulSoup
+import itertools
+from urllib.parse import urlparse
 from openpyxl import load_workbook
 from openpyxl.styles import Color, PatternFill
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
-from webdriver_manager.chrome import ChromeDriverManager
 from src.sixgroup_shares_extractor import extract_sixgroup_shares  # Import the SIX Group extractor
+from src.parallel_runner import run_rows
+from src.driver_manager import DEFAULT_MAX_PAGES, DEFAULT_MAX_RSS_MB
+from src.driver_factory import create_chrome_driver, apply_resource_blocking
+from src.readiness import TextMatches, NetworkIdle
+from src.page_snapshot import capture_snapshot, load_snapshot, reuse_loaded_page
+from src.html_parsing import parse_html, page_text
+from src.domain_scheduler import DEFAULT_MAX_IN_FLIGHT, DEFAULT_MIN_INTERVAL
+from src.http_fetch import fetch_static_html, should_try_http, record_http_result
+from src.run_journal import RunJournal
+from src.result_cache import ResultCache, DEFAULT_SHARES_TTL
+from src.workbook_writer import WorkbookWriter, timestamped_alt_path
+from src.tab_pool import TabBrowser, TAB_MODE_ARGUMENTS
+from src.plugins import module_available
 
 # Import improved custom domain extractors
 IMPROVED_EXTRACTORS_AVAILABLE = False
@@ -68,12 +80,9 @@ except ImportError as e:
         DOMAIN_EXTRACTORS = {}
         logging.warning("❌ No custom domain extractors available")
 
-# NEW: Import for Groq AI analysis
-try:
-    from groq import Groq
-    GROQ_AVAILABLE = True
-except ImportError:
-    GROQ_AVAILABLE = False
+# NEW: Groq AI analysis (the client library is imported on first use)
+GROQ_AVAILABLE = module_available("groq")
+if not GROQ_AVAILABLE:
     logging.warning("Groq library not available. AI fallback will be disabled.")
 
 # Groq AI Configuration
@@ -150,14 +159,10 @@ def clean_html_for_shares_ai(html_content, max_length=2000):  # Further reduced
     OPTIMIZED: Much shorter content and faster processing for speed.
     """
     try:
-        soup = BeautifulSoup(html_content, "html.parser")
-        
-        # Remove script and style elements quickly
-        for script in soup(["script", "style", "nav", "header", "footer"]):
-            script.decompose()
-        
-        # Get text content
-        text = soup.get_text()
+        # Shared tree (see src.html_parsing): skip navigation/header/footer text
+        # without modifying it
+        soup = parse_html(html_content)
+        text = page_text(soup, skip_tags=("nav", "header", "footer"))
         
         # Quick whitespace cleanup (simplified for speed)
         text = ' '.join(text.split())
@@ -188,7 +193,7 @@ def clean_html_for_shares_ai(html_content, max_length=2000):  # Further reduced
     except Exception as e:
         logging.error(f"Error cleaning HTML for shares AI: {e}")
         # Fast fallback: just truncate raw text
-        soup = BeautifulSoup(html_content, "html.parser")
+        soup = parse_html(html_content)
         return soup.get_text()[:max_length]
 
 def analyze_shares_with_groq(html_content, url):
@@ -201,6 +206,7 @@ def analyze_shares_with_groq(html_content, url):
     
     try:
         # Initialize Groq client
+        from groq import Groq
         client = Groq(api_key=GROQ_API_KEY)
         
         # Clean HTML content for AI analysis (further reduced for speed)
@@ -317,9 +323,13 @@ Number:"""
             logging.error(f"Groq AI shares analysis error for {url}: {e}")
             return {"error": f"AI shares analysis failed: {str(e)}"}
 
-def try_shares_ai_fallback(driver, url):
+def try_shares_ai_fallback(driver, url, html_content=None, snapshot=None):
     """
     Try AI analysis as a fallback when traditional shares scraping fails.
+
+    Reuses html_content or snapshot if given, otherwise the driver's current
+    page if it is showing this URL; the page is only loaded again if none of
+    those is available.
     """
     if not GROQ_AVAILABLE:
         return {"error": "AI fallback not available"}
@@ -327,15 +337,24 @@ def try_shares_ai_fallback(driver, url):
     try:
         logging.info(f"Attempting AI fallback analysis for outstanding shares: {url}")
         
-        # Get fresh page content for AI analysis - OPTIMIZED for speed
-        driver.get(url)
-        WebDriverWait(driver, 8).until(EC.presence_of_element_located((By.TAG_NAME, "body")))  # Reduced from 15 to 8
-        
-        # Reduced wait time for dynamic content
-        time.sleep(1)  # Reduced from 3 to 1 second
-        
-        # Get the page source
-        html_content = driver.page_source
+        if html_content is None and snapshot is not None:
+            html_content = snapshot.html
+        if html_content is None:
+            current = capture_snapshot(driver, url, require_same_page=True)
+            if current is not None:
+                html_content = current.html
+        if html_content is None:
+            # Get fresh page content for AI analysis - OPTIMIZED for speed
+            driver.get(url)
+            WebDriverWait(driver, 8).until(EC.presence_of_element_located((By.TAG_NAME, "body")))  # Reduced from 15 to 8
+            
+            # Reduced wait time for dynamic content
+            time.sleep(1)  # Reduced from 3 to 1 second
+            
+            # Get the page source
+            html_content = driver.page_source
+        else:
+            logging.info(f"AI shares fallback reusing already loaded page for {url}")
         
         # Analyze with AI
         result = analyze_shares_with_groq(html_content, url)
@@ -389,10 +408,32 @@ def find_processable_rows_and_get_urls(ws, url_column_letter):
     print(f"Found {len(processable_rows_urls)} primary URLs and {len(fallback_urls)} fallback URLs")
     return processable_rows_urls, fallback_urls
 
-def extract_outstanding_shares(driver, url):
+def extract_outstanding_shares(driver, url, snapshot=None):
     """
-    Extract outstanding shares from a webpage using the keyword 'outstanding'
+    Extract outstanding shares from a webpage using the keyword 'outstanding'.
+    Server-rendered pages are read with a plain HTTP GET first; Chrome is only
+    used when that response has no outstanding shares figure.
+
+    Args:
+        driver: Selenium WebDriver
+        url: page URL
+        snapshot: optional PageSnapshot of this URL already rendered by an earlier
+                  tier - parsed directly instead of loading the page again
     """
+    if snapshot is not None:
+        return extract_shares_from_soup(snapshot.soup)
+
+    if should_try_http(url, kind="shares"):
+        html = fetch_static_html(url)
+        if html:
+            http_result = extract_shares_from_soup(parse_html(html))
+            if "outstanding_shares" in http_result:
+                record_http_result(url, True, kind="shares")
+                logging.info(f"HTTP tier succeeded for {url}: {http_result['outstanding_shares']}")
+                return http_result
+        record_http_result(url, False, kind="shares")
+        logging.info(f"HTTP tier found no outstanding shares for {url}, escalating to Selenium")
+
     try:
         # Set a shorter page load timeout for speed
         driver.set_page_load_timeout(20)  # Reduced from 60 to 20
@@ -401,47 +442,69 @@ def extract_outstanding_shares(driver, url):
         if "fidelity.com" in url.lower():
             print(f"  Detected Fidelity URL: {url} - using special handling")
             try:
-                driver.get(url)
-                # Wait for the page to load with a shorter timeout
-                WebDriverWait(driver, 15).until(  # Reduced from 45 to 15
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
-                )
-                # Reduced wait time for JavaScript content
-                time.sleep(1)  # Reduced from 3 to 1
+                snapshot = load_snapshot(driver, url, TextMatches(r"outstanding"), NetworkIdle(quiet_period=1),
+                                         deadline=15)
             except (TimeoutException, WebDriverException) as e:
                 print(f"  Timeout or error with Fidelity URL: {str(e)}")
                 return {"error": f"Timed out loading Fidelity page: {str(e)}"}
         else:
-            driver.get(url)
-            # Wait for the page to load with shorter timeout
-            WebDriverWait(driver, 10).until(  # Reduced from 30 to 10
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            
-            # Reduced wait time for JavaScript content
-            time.sleep(2)  # Reduced from 5 to 2
+            snapshot = load_snapshot(driver, url, TextMatches(r"outstanding"), NetworkIdle(quiet_period=1),
+                                     deadline=10)
     except (TimeoutException, WebDriverException) as e:
         return {"error": f"Timed out waiting for page to load: {str(e)}"}
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
-    
+    return extract_shares_from_soup(snapshot.soup)
+
+# Regex patterns to find outstanding shares, in order of preference
+OUTSTANDING_SHARES_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    # Common patterns for outstanding shares - include space-separated numbers
+    r"(?:shares|units)\s+outstanding\s*(?:is|:|are|of)?\s*([\d,\.\s]+\s*(?:million|m|billion|b)?)",
+    r"outstanding\s+(?:shares|units)\s*(?:is|:|are|of)?\s*([\d,\.\s]+\s*(?:million|m|billion|b)?)",
+    r"(?:shares|units)\s+outstanding\s*(?:[^0-9]*?)([\d,\.\s]+\s*(?:million|m|billion|b)?)",
+    r"outstanding\s+(?:shares|share count)(?:[^0-9]*?)([\d,\.\s]+\s*(?:million|m|billion|b)?)",
+    r"total\s+(?:shares|units)\s+outstanding\s*(?:[^0-9]*?)([\d,\.\s]+\s*(?:million|m|billion|b)?)",
+    r"outstanding[^0-9]{0,10}([\d,\.\s]+\s*(?:million|m|billion|b)?)",
+)]
+OUTSTANDING_ANCHOR = re.compile(r"outstanding", re.IGNORECASE)
+# A match must start at most this far before its anchor: the longest pattern
+# prefix before "outstanding" ("total shares outstanding")
+ANCHOR_CHARS_BEFORE = 40
+
+def matches_near_anchors(pattern, text, anchors):
+    """
+    Matches of a precompiled pattern that start just before an anchor position, in text order.
+
+    Only the start of each search is bounded; the match itself may run as far
+    as the pattern allows, so a long number after the anchor is never cut off.
+    """
+    last_end = 0
+    match = None
+    for anchor in anchors:
+        start = max(anchor - ANCHOR_CHARS_BEFORE, last_end)
+        # A match found for an earlier anchor that starts further on is reused
+        if match is None or match.start() < start:
+            match = pattern.search(text, start)
+            if match is None:
+                return
+        if match.start() <= anchor:
+            last_end = match.end()
+            yield match
+            match = None
+
+def extract_shares_from_soup(soup):
+    """
+    Find outstanding shares in a parsed page using the keyword 'outstanding'.
+    Works on either a plain HTTP response or the Selenium-rendered page.
+    """
     # Get the text of the entire page
     page_text = soup.get_text(" ", strip=True)
     
-    # Define regex patterns to find outstanding shares
-    patterns = [
-        # Common patterns for outstanding shares - include space-separated numbers
-        r"(?:shares|units)\s+outstanding\s*(?:is|:|are|of)?\s*([\d,\.\s]+\s*(?:million|m|billion|b)?)",
-        r"outstanding\s+(?:shares|units)\s*(?:is|:|are|of)?\s*([\d,\.\s]+\s*(?:million|m|billion|b)?)",
-        r"(?:shares|units)\s+outstanding\s*(?:[^0-9]*?)([\d,\.\s]+\s*(?:million|m|billion|b)?)",
-        r"outstanding\s+(?:shares|share count)(?:[^0-9]*?)([\d,\.\s]+\s*(?:million|m|billion|b)?)",
-        r"total\s+(?:shares|units)\s+outstanding\s*(?:[^0-9]*?)([\d,\.\s]+\s*(?:million|m|billion|b)?)",
-        r"outstanding[^0-9]{0,10}([\d,\.\s]+\s*(?:million|m|billion|b)?)"
-    ]
+    # Every pattern contains "outstanding": find those anchors once and only run
+    # the patterns on the text around them
+    anchors = [m.start() for m in OUTSTANDING_ANCHOR.finditer(page_text)]
     
-    for pattern in patterns:
-        matches = re.finditer(pattern, page_text, re.IGNORECASE)
-        for match in matches:
+    for pattern in OUTSTANDING_SHARES_PATTERNS:
+        for match in matches_near_anchors(pattern, page_text, anchors):
             shares_text = match.group(1).strip()
             logging.info(f"Found potential outstanding shares (raw): {shares_text}")
             
@@ -713,22 +776,72 @@ def extract_outstanding_shares(driver, url):
     
     return {"error": "Could not find outstanding shares information"}
 
-def extract_outstanding_shares_with_ai_fallback(driver, url):
+def is_sixgroup_url(url):
+    """Return True if the URL is on a SIX Group host."""
+    try:
+        host = (urlparse(url.strip()).hostname or "").lower()
+    except Exception:
+        return False
+    return host == "six-group.com" or host.endswith(".six-group.com")
+
+# Which extraction tiers can apply to a URL, in the order they are tried.
+# Tiers whose predicate is False are skipped up front, so e.g. non-SIX rows
+# never pay for a SIX Group page load.
+SHARES_TIER_ROUTES = [
+    ("custom", lambda url: extract_with_custom_function is not None and get_custom_extractor(url) is not None),
+    ("sixgroup", is_sixgroup_url),
+    ("traditional", lambda url: True),
+    ("ai_fallback", lambda url: GROQ_AVAILABLE),
+]
+
+def current_driver_url(driver):
+    """Return the driver's current URL, or None if it cannot be read."""
+    try:
+        return driver.current_url
+    except Exception:
+        return None
+
+def route_shares_tiers(url):
+    """
+    Return the names of the extraction tiers that apply to this URL, in order.
+    """
+    tiers = []
+    for tier, applies in SHARES_TIER_ROUTES:
+        try:
+            if applies(url):
+                tiers.append(tier)
+        except Exception as e:
+            logging.debug(f"Routing check for tier {tier} failed on {url}: {e}")
+    return tiers
+
+def extract_outstanding_shares_with_ai_fallback(driver, url, snapshot=None):
     """
     Extract outstanding shares with improved multi-tier extraction strategy:
     1. Custom domain extractors (improved)
     2. SIX Group specialized extractor  
     3. Traditional extraction
     4. AI fallback
+
+    Tiers that cannot apply to the URL (see SHARES_TIER_ROUTES) are skipped.
+
+    Args:
+        snapshot: optional PageSnapshot of url rendered by an earlier step (e.g. the
+                  price extractor in a combined run); tiers that only read the page use it,
+                  and the custom extractor starts from it instead of loading url again
     """
     extraction_method = "unknown"
     custom_extractor_attempted = False
+    apply_resource_blocking(driver, url)
+    tiers = route_shares_tiers(url)
+    logging.info(f"Shares tiers for {url}: {', '.join(tiers)}")
     
     # Tier 1: Try improved custom domain-specific extractors first
-    if extract_with_custom_function:
+    if "custom" in tiers:
+        previous_url = current_driver_url(driver)
         try:
-            # Check if we have a domain-specific extractor for this URL
-            custom_result = extract_with_custom_function(driver, url)
+            # Check if we have a domain-specific extractor for this URL; if the page
+            # is already rendered (snapshot), the extractor starts from that render
+            custom_result = extract_with_custom_function(reuse_loaded_page(driver, url, snapshot), url)
             custom_extractor_attempted = True
             
             # Handle the custom extractor result properly
@@ -763,21 +876,25 @@ def extract_outstanding_shares_with_ai_fallback(driver, url):
                     logging.warning(f"Custom extractor returned unexpected type: {type(custom_result)} - {custom_result}")
         except Exception as e:
             logging.warning(f"Custom extractor error for {url}: {e}")
+
+        # The custom extractor already rendered this page - later tiers reuse it
+        snapshot = capture_snapshot(driver, url, previous_url) or snapshot
     
-    # Tier 2: Try SIX Group specialized extractor
-    try:
-        sixgroup_result = extract_sixgroup_shares(driver, url)
-        if "outstanding_shares" in sixgroup_result:
-            extraction_method = "sixgroup"
-            logging.info(f"✅ SIX Group extractor succeeded for {url}")
-            sixgroup_result["method"] = extraction_method
-            return sixgroup_result
-    except Exception as e:
-        logging.warning(f"SIX Group extractor error for {url}: {e}")
+    # Tier 2: Try SIX Group specialized extractor (SIX hosts only)
+    if "sixgroup" in tiers:
+        try:
+            sixgroup_result = extract_sixgroup_shares(driver, url)
+            if "outstanding_shares" in sixgroup_result:
+                extraction_method = "sixgroup"
+                logging.info(f"✅ SIX Group extractor succeeded for {url}")
+                sixgroup_result["method"] = extraction_method
+                return sixgroup_result
+        except Exception as e:
+            logging.warning(f"SIX Group extractor error for {url}: {e}")
     
-    # Tier 3: Try traditional extraction
+    # Tier 3: Try traditional extraction (on the snapshot if the page is already loaded)
     try:
-        result = extract_outstanding_shares(driver, url)
+        result = extract_outstanding_shares(driver, url, snapshot=snapshot)
         if "outstanding_shares" in result:
             extraction_method = "traditional"
             logging.info(f"✅ Traditional extractor succeeded for {url}")
@@ -788,10 +905,10 @@ def extract_outstanding_shares_with_ai_fallback(driver, url):
         result = {"error": f"Traditional extraction failed: {e}"}
     
     # Tier 4: Try AI fallback as last resort
-    if "error" in result:
+    if "ai_fallback" in tiers and "error" in result:
         logging.info(f"🤖 All standard methods failed for {url}, trying AI fallback...")
         try:
-            ai_result = try_shares_ai_fallback(driver, url)
+            ai_result = try_shares_ai_fallback(driver, url, snapshot=snapshot)
             
             # If AI succeeded, return AI result (already has "(AI)" tag)
             if "outstanding_shares" in ai_result:
@@ -925,9 +1042,121 @@ def preserve_cell_color_and_set_value(cell, value):
             # If restoring fails, just leave the cell with its new value
             pass
 
-def main():
+def create_shares_driver(tab_mode=False):
+    """
+    Create a headless Chrome instance configured for outstanding shares extraction.
+    Images, fonts, media and tracker hosts are blocked (see src.driver_factory).
+
+    Args:
+        tab_mode: browser shared by several workers as tabs (src.tab_pool); background
+                  tabs are not throttled and TabDriver.get() does the page load wait
+    """
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--window-size=1920x1080")
+    # Add user agent to avoid detection
+    options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
+    if tab_mode:
+        for argument in TAB_MODE_ARGUMENTS:
+            options.add_argument(argument)
+        return create_chrome_driver(options, page_load_strategy="none", block_resources=True)
+
+    return create_chrome_driver(options, block_resources=True)
+
+def shares_cell_value(shares_data):
+    """Return the value written to column M for one row's shares result."""
+    if "error" in shares_data:
+        return f"Error: {shares_data['error']}"
+    if "note" in shares_data:
+        return f"{shares_data['outstanding_shares']} ({shares_data['note']})"
+    return shares_data['outstanding_shares']
+
+def process_shares_row(driver, row_idx, primary_url, fallback_url=None, snapshot=None):
+    """
+    Extract outstanding shares for one spreadsheet row, trying the column P URL
+    first and the column Q fallback URL if that fails.
+
+    Args:
+        snapshot: optional PageSnapshot of primary_url that is already rendered
+
+    Returns:
+        (shares_data, used_url) tuple
+    """
+    shares_data = None
+    used_url = primary_url
+
+    try:
+        # First try the URL from column P
+        # Check if it's a SIX Group URL
+        if "six-group.com" in primary_url.lower():
+            print("Detected SIX Group URL, using specialized extractor")
+            shares_data = extract_sixgroup_shares(driver, primary_url)
+        else:
+            # Check if we have a custom domain extractor
+            custom_domain = False
+            if extract_with_custom_function:
+                # Check if we're specifically dealing with known domains that need special handling
+                known_domains = ["tradingview.com", "valour.com"]
+                if any(domain in primary_url.lower() for domain in known_domains):
+                    custom_domain = True
+                    print(f"  Detected URL with known custom domain: {primary_url}")
+
+            # Use the generic extractor for all URLs (which includes custom domain extractors)
+            shares_data = extract_outstanding_shares_with_ai_fallback(driver, primary_url, snapshot=snapshot)
+
+            # Print additional debug info for custom extractor errors
+            if "error" in shares_data:
+                if shares_data.get("custom_extractor_used", False):
+                    print(f"  Custom domain extractor failed: {shares_data['error']}")
+                if custom_domain:
+                    print(f"  Known custom domain extraction failed: {shares_data['error']}")
+
+        # If primary URL failed, try fallback URL from column Q (if it exists)
+        if "error" in shares_data:
+            print(f"  Row {row_idx}: primary URL failed: {shares_data['error']}")
+
+            if fallback_url and isinstance(fallback_url, str) and fallback_url.startswith(("http://", "https://")):
+                print(f"  Trying fallback URL from column Q: {fallback_url}")
+                used_url = fallback_url
+
+                # Check if it's a SIX Group URL
+                if "six-group.com" in fallback_url.lower():
+                    print("  Detected SIX Group URL for fallback, using specialized extractor")
+                    shares_data = extract_sixgroup_shares(driver, fallback_url)
+                else:
+                    # Use the generic extractor for other URLs (which includes custom domain extractors)
+                    shares_data = extract_outstanding_shares_with_ai_fallback(driver, fallback_url)
+            else:
+                print(f"  No fallback URL available for row {row_idx}")
+    except Exception as e:
+        print(f"  Error processing URLs for row {row_idx}: {str(e)}")
+        traceback.print_exc()
+        shares_data = {"error": f"Exception: {str(e)}"}
+
+    return shares_data, used_url
+
+def main(workers=1, max_per_domain=DEFAULT_MAX_IN_FLIGHT, domain_delay=DEFAULT_MIN_INTERVAL,
+         max_pages_per_browser=DEFAULT_MAX_PAGES, max_browser_rss_mb=DEFAULT_MAX_RSS_MB,
+         resume=False, tabs=1, prefetch=False, refresh=False, shares_ttl=DEFAULT_SHARES_TTL):
     """
     Main function to find and extract outstanding shares
+
+    Args:
+        workers: number of parallel browser workers (1 = serial run)
+        max_per_domain: max rows in flight per registrable domain
+        domain_delay: minimum seconds between requests to the same domain
+        max_pages_per_browser: rows served by one browser session before it is recycled
+        max_browser_rss_mb: browser memory (MB) above which the session is recycled
+        resume: skip rows already journaled by an unfinished previous run
+        tabs: run this many rows at once as tabs of a single browser instead of
+              one browser per worker (replaces workers when above 1)
+        prefetch: give each tab a spare tab that starts loading the next row while
+                  the current one is extracted (implies tab mode)
+        refresh: fetch every row even if the result cache holds unexpired shares
+        shares_ttl: how long cached outstanding shares are reused (timedelta)
     """
     print("Outstanding Shares Updater Starting...")
     
@@ -944,8 +1173,6 @@ def main():
     else:
         print("❌ No custom domain extractors available")
     
-    # Initialize driver to None first
-    driver = None
     original_filename = "data/Custodians.xlsx"
     results_filename = "data/Custodians_Results.xlsx"
     
@@ -1000,6 +1227,9 @@ def main():
     else:
         print(f"Using existing {results_filename} (keeping previous results)")
     
+    writer = None
+    tab_browser = None
+    result_cache = None
     try:
         # Check if the Excel file is accessible for reading
         if not os.path.exists(results_filename):
@@ -1029,111 +1259,93 @@ def main():
         processable_rows_urls, fallback_urls = find_processable_rows_and_get_urls(ws, "P")
         print(f"Found {len(processable_rows_urls)} rows to process with {len(fallback_urls)} fallback URLs")
         
-        # Set up the WebDriver with improved options
-        options = webdriver.ChromeOptions()
-        options.add_argument("--headless")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--window-size=1920x1080")
-        # Add user agent to avoid detection
-        options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-        # Disable images to speed up page load
-        prefs = {"profile.managed_default_content_settings.images": 2}
-        options.add_experimental_option("prefs", prefs)
-        
-        driver = webdriver.Chrome(
-            service=ChromeService(ChromeDriverManager().install()),
-            options=options
+        # Resolve fallback URLs up front so worker threads never touch the worksheet
+        row_fallback_urls = {}
+        for row_idx in processable_rows_urls:
+            fallback_url = fallback_urls.get(row_idx)
+            if fallback_url:
+                print(f"  Using pre-loaded fallback URL for row {row_idx}: {fallback_url}")
+            else:
+                # Try to get it directly from the cell as a backup method
+                try:
+                    fallback_cell = ws[f"Q{row_idx}"]
+                    if fallback_cell and fallback_cell.value:
+                        fallback_url = str(fallback_cell.value).strip()
+                        print(f"  Found fallback URL in cell Q{row_idx}: {fallback_url}")
+                except Exception as cell_err:
+                    print(f"  Error accessing fallback URL from cell Q{row_idx}: {str(cell_err)}")
+            row_fallback_urls[row_idx] = fallback_url
+
+        # Every finished row is journaled so a crashed run can be resumed
+        journal = RunJournal.open("outstanding_shares_updater", resume=resume)
+        resumed_rows = journal.completed(processable_rows_urls)
+        fetch_rows = dict(processable_rows_urls)
+        for row_idx, _, _ in resumed_rows:
+            del fetch_rows[row_idx]
+        if resumed_rows:
+            print(f"Skipping {len(resumed_rows)} rows already done by the interrupted run")
+        # Outstanding shares found by a recent run are reused until their TTL expires
+        result_cache = ResultCache(shares_ttl=shares_ttl)
+        cached_rows = [] if refresh else result_cache.fresh_rows("shares", fetch_rows)
+        for row_idx, _, _ in cached_rows:
+            del fetch_rows[row_idx]
+        if cached_rows:
+            print(f"Skipping {len(cached_rows)} rows whose cached outstanding shares have not expired")
+
+        def process_row(driver, row_idx, primary_url):
+            print(f"Processing row {row_idx}: {primary_url}")
+            return process_shares_row(driver, row_idx, primary_url, row_fallback_urls.get(row_idx))
+
+        # Blue cells are read up front: once the writer starts, only its thread touches the workbook
+        blue_rows = {row_idx for row_idx in processable_rows_urls if is_blue_cell(ws[f"M{row_idx}"])}
+
+        # Cell updates are applied by a background writer that saves every few rows
+        # and at the end; the journal above is what makes each row crash-safe
+        writer = WorkbookWriter(
+            wb,
+            results_filename,
+            set_value=preserve_cell_color_and_set_value,
+            alt_path_factory=timestamped_alt_path(results_filename),
+        ).start()
+
+        # Process each URL (browsers are reused while healthy and recycled after
+        # a crash, too many pages or too much memory)
+        browser_stats = []
+        if tabs > 1 or prefetch:
+            # The workers share one browser, each driving its own tab
+            tab_browser = TabBrowser(lambda: create_shares_driver(tab_mode=True))
+            print(f"Tab mode: {tabs} tabs in one browser" + (", each with a prefetch tab" if prefetch else ""))
+        fetched = run_rows(
+            fetch_rows,
+            process_row,
+            tab_browser.new_tab if tab_browser else create_shares_driver,
+            workers=tabs if tab_browser else workers,
+            max_per_domain=max_per_domain,
+            domain_delay=domain_delay,
+            max_pages_per_driver=max_pages_per_browser,
+            max_driver_rss_mb=max_browser_rss_mb,
+            driver_stats=browser_stats,
+            prefetch=prefetch,
         )
-        
-        # Process each URL
-        for row_idx, primary_url in processable_rows_urls.items():
+        for row_idx, primary_url, row_result in itertools.chain(resumed_rows, cached_rows, fetched):
             total_processed += 1
-            print(f"Processing row {row_idx}: {primary_url}")
-            shares_data = None
-            used_url = primary_url
-            
-            try:
-                # First try the URL from column P
-                # Check if it's a SIX Group URL
-                if "six-group.com" in primary_url.lower():
-                    print("Detected SIX Group URL, using specialized extractor")
-                    shares_data = extract_sixgroup_shares(driver, primary_url)
-                else:
-                    # Check if we have a custom domain extractor
-                    custom_domain = False
-                    if extract_with_custom_function:
-                        # Check if we're specifically dealing with known domains that need special handling
-                        known_domains = ["tradingview.com", "valour.com"]
-                        if any(domain in primary_url.lower() for domain in known_domains):
-                            custom_domain = True
-                            print(f"  Detected URL with known custom domain: {primary_url}")
-                    
-                    # Use the generic extractor for all URLs (which includes custom domain extractors)
-                    shares_data = extract_outstanding_shares_with_ai_fallback(driver, primary_url)
-                    
-                    # Print additional debug info for custom extractor errors
-                    if "error" in shares_data:
-                        if shares_data.get("custom_extractor_used", False):
-                            print(f"  Custom domain extractor failed: {shares_data['error']}")
-                        if custom_domain:
-                            print(f"  Known custom domain extraction failed: {shares_data['error']}")
-                
-                # If primary URL failed, try fallback URL from column Q (if it exists)
-                if "error" in shares_data:
-                    print(f"  Primary URL failed: {shares_data['error']}")
-                    
-                    # Get fallback URL from our pre-populated dictionary
-                    fallback_url = fallback_urls.get(row_idx)
-                    
-                    if fallback_url:
-                        print(f"  Using pre-loaded fallback URL for row {row_idx}: {fallback_url}")
-                    else:
-                        # Try to get it directly from the cell as a backup method
-                        try:
-                            fallback_cell = ws[f"Q{row_idx}"]
-                            if fallback_cell and fallback_cell.value:
-                                fallback_url = str(fallback_cell.value).strip()
-                                print(f"  Found fallback URL in cell Q{row_idx}: {fallback_url}")
-                            else:
-                                print(f"  No fallback URL found in cell Q{row_idx} (empty or null)")
-                        except Exception as cell_err:
-                            print(f"  Error accessing fallback URL from cell Q{row_idx}: {str(cell_err)}")
-                    
-                    if fallback_url and isinstance(fallback_url, str) and fallback_url.startswith(("http://", "https://")):
-                        print(f"  Trying fallback URL from column Q: {fallback_url}")
-                        used_url = fallback_url
-                        
-                        # Check if it's a SIX Group URL
-                        if "six-group.com" in fallback_url.lower():
-                            print("  Detected SIX Group URL for fallback, using specialized extractor")
-                            shares_data = extract_sixgroup_shares(driver, fallback_url)
-                        else:
-                            # Use the generic extractor for other URLs (which includes custom domain extractors)
-                            shares_data = extract_outstanding_shares_with_ai_fallback(driver, fallback_url)
-            except Exception as e:
-                print(f"  Error processing URLs for row {row_idx}: {str(e)}")
-                traceback.print_exc()
-                shares_data = {"error": f"Exception: {str(e)}"}
-                
-                            # Log detailed information about what happened with the URLs
+            if isinstance(row_result, (tuple, list)):
+                shares_data, used_url = row_result
+            else:
+                # The runner could not process the row at all (e.g. no browser available)
+                shares_data, used_url = row_result, primary_url
+            if row_idx in fetch_rows:
+                journal.record(row_idx, primary_url, [shares_data, used_url])
+                if "error" not in shares_data:
+                    result_cache.store("shares", primary_url, [shares_data, used_url])
+
+            # Log detailed information about what happened with the URLs
+            print(f"Row {row_idx}:")
             print(f"  Primary URL: {primary_url}")
-            print(f"  Fallback URL: {ws[f'Q{row_idx}'].value if ws[f'Q{row_idx}'].value else 'None'}")
+            print(f"  Fallback URL: {row_fallback_urls.get(row_idx) or 'None'}")
             print(f"  Used URL: {used_url}")
             print(f"  Result: {'Success' if 'outstanding_shares' in shares_data else 'Error: ' + shares_data.get('error', 'Unknown error')}")
             
-            # Try to reset the browser if we encounter issues
-            try:
-                print("  Attempting to reset the browser...")
-                driver.quit()
-                driver = webdriver.Chrome(
-                    service=ChromeService(ChromeDriverManager().install()),
-                    options=options
-                )
-            except Exception as reset_error:
-                print(f"  Failed to reset browser: {str(reset_error)}")
-            
             # Track success/failure, domain errors, and extraction methods
             if "error" in shares_data:
                 error_domains[track_error_domain(used_url)] += 1
@@ -1146,51 +1358,36 @@ def main():
             
             # Write result to Excel in column M
             shares_cell = f"M{row_idx}"
-            cell = ws[shares_cell]
             
             # Check if this cell is blue and count it
-            if is_blue_cell(cell):
+            if row_idx in blue_rows:
                 blue_cells_count += 1
                 print(f"  Row {row_idx}: Blue cell detected - excluding from success rate calculation")
             
             if "error" in shares_data:
                 print(f"  Error: {shares_data['error']}")
-                preserve_cell_color_and_set_value(cell, f"Error: {shares_data['error']}")
             else:
                 # Check if the result has a note about being estimated
                 if "note" in shares_data:
                     print(f"  Found outstanding shares: {shares_data['outstanding_shares']} (using {used_url}) - Note: {shares_data['note']}")
-                    preserve_cell_color_and_set_value(cell, f"{shares_data['outstanding_shares']} ({shares_data['note']})")
                 else:
                     print(f"  Found outstanding shares: {shares_data['outstanding_shares']} (using {used_url})")
-                    preserve_cell_color_and_set_value(cell, shares_data['outstanding_shares'])
-            
-            # Save after each update in case of crash
-            try:
-                wb.save(results_filename)
-            except PermissionError:
-                print(f"  Warning: Could not save to {results_filename}, it may be open in another program")
-                # Try with a different filename
-                alt_filename = f"Custodians_Results_{int(time.time())}.xlsx"
-                print(f"  Attempting to save to alternative file: {alt_filename}")
-                try:
-                    wb.save(alt_filename)
-                    results_filename = alt_filename  # Use this filename for future saves
-                    print(f"  Successfully saved to {alt_filename}")
-                except Exception as e2:
-                    print(f"  Could not save Excel file: {e2}")
-            except Exception as e:
-                print(f"  Error saving workbook: {e}")
+            writer.put(ws.title, shares_cell, shares_cell_value(shares_data))
+            writer.row_done()
+        if tab_browser is not None:
+            tab_browser.close()
+        result_cache.save()
         
         # Update column header with timestamp
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        header_cell = ws["M1"]
-        header_cell.value = f"Outstanding shares (Last updated: {current_time})"
+        writer.put(ws.title, "M1", f"Outstanding shares (Last updated: {current_time})")
         
         # Save final results
         try:
-            wb.save(results_filename)
-            print(f"Processing completed and saved to {results_filename}")
+            results_filename = writer.close()
+            print(f"Processing completed and saved to {results_filename} "
+                  f"({writer.saves} saves, {writer.save_seconds:.1f}s writing)")
+            journal.finish()
             
             # Print method statistics summary
             print("\n" + "="*50)
@@ -1211,6 +1408,8 @@ def main():
             
         except Exception as e:
             print(f"Error saving final results: {e}")
+        finally:
+            journal.close()
         
         # Create a copy of the results as custodians.xlsx (overwriting the original)
         try:
@@ -1256,6 +1455,15 @@ def main():
                 else:
                     log_file.write("Adjusted success rate: N/A (no valid URLs to process)\n")
                 
+                log_file.write(f"\nBROWSER SESSIONS:\n")
+                log_file.write("-" * 20 + "\n")
+                for stats in browser_stats:
+                    recycles = stats["recycles"]
+                    peak = f"{stats['peak_rss_mb']:.0f} MB" if stats["peak_rss_mb"] is not None else "n/a"
+                    log_file.write(f"{stats['label']}: {stats['pages']} pages, {stats['sessions']} sessions, "
+                                   f"recycles (pages/memory/crash): {recycles['pages']}/{recycles['memory']}/{recycles['crash']}, "
+                                   f"peak RSS: {peak}\n")
+                
             print(f"Log file created: {log_filename}")
         except Exception as e:
             print(f"Error creating log file: {e}")
@@ -1268,10 +1476,19 @@ def main():
     except Exception as e:
         print(f"Unexpected error: {e}")
         traceback.print_exc()
-    finally:
-        # Close the WebDriver
-        if driver:
-            driver.quit()
+        if tab_browser is not None:
+            tab_browser.close()
+        if result_cache is not None:
+            try:
+                result_cache.save()
+            except OSError as cache_err:
+                print(f"Error saving result cache: {cache_err}")
+        if writer is not None:
+            # Keep whatever was applied so far; --resume picks up the rest from the journal
+            try:
+                writer.close()
+            except Exception as save_err:
+                print(f"Error saving workbook: {save_err}")
 
 def test_specific_urls():
     """Test function for specific URLs"""
@@ -1293,11 +1510,7 @@ def test_specific_urls():
     driver = None
     
     try:
-        driver = webdriver.Chrome(
-            service=ChromeService(ChromeDriverManager().install()),
-            options=options
-        )
-        driver.set_page_load_timeout(60)
+        driver = create_chrome_driver(options, page_load_timeout=60)
         
         for url in test_urls:
             logging.info(f"Testing URL: {url}")
@@ -1319,7 +1532,6 @@ def test_fallback_urls():
     Creates a test Excel file with primary and fallback URLs and runs the extraction process.
     """
     from openpyxl import Workbook
-    import os
     
     print("Testing fallback URL functionality...")
     
@@ -1366,10 +1578,7 @@ def test_fallback_urls():
     options.add_argument("--disable-gpu")
     options.add_argument("--window-size=1920x1080")
     
-    driver = webdriver.Chrome(
-        service=ChromeService(ChromeDriverManager().install()),
-        options=options
-    )
+    driver = create_chrome_driver(options)
     
     try:
         # Process each URL
@@ -1482,11 +1691,7 @@ def test_custom_domain_extractors():
     driver = None
     
     try:
-        driver = webdriver.Chrome(
-            service=ChromeService(ChromeDriverManager().install()),
-            options=options
-        )
-        driver.set_page_load_timeout(60)
+        driver = create_chrome_driver(options, page_load_timeout=60)
         
         print("=" * 50)
         print("TESTING CUSTOM DOMAIN EXTRACTORS")
@@ -1529,8 +1734,78 @@ def test_custom_domain_extractors():
     print("\nCustom domain extractor testing completed.")
 
 if __name__ == "__main__":
+    import argparse
+    from datetime import timedelta
+
+    parser = argparse.ArgumentParser(description="Update outstanding shares in data/Custodians_Results.xlsx")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of parallel headless Chrome workers (default: 1)"
+    )
+    parser.add_argument(
+        "--max-per-domain",
+        type=int,
+        default=DEFAULT_MAX_IN_FLIGHT,
+        help=f"Max concurrent requests per domain (default: {DEFAULT_MAX_IN_FLIGHT})"
+    )
+    parser.add_argument(
+        "--domain-delay",
+        type=float,
+        default=DEFAULT_MIN_INTERVAL,
+        help=f"Minimum seconds between requests to the same domain (default: {DEFAULT_MIN_INTERVAL})"
+    )
+    parser.add_argument(
+        "--max-pages-per-browser",
+        type=int,
+        default=DEFAULT_MAX_PAGES,
+        help=f"Rows served by one browser session before it is recycled (default: {DEFAULT_MAX_PAGES})"
+    )
+    parser.add_argument(
+        "--max-browser-rss-mb",
+        type=int,
+        default=DEFAULT_MAX_RSS_MB,
+        help=f"Recycle a browser once it uses more than this much memory in MB, needs psutil (default: {DEFAULT_MAX_RSS_MB})"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip rows already finished by an interrupted previous run"
+    )
+    parser.add_argument(
+        "--tabs",
+        type=int,
+        default=1,
+        help="Process this many rows at once as tabs of one headless Chrome instead of "
+             "one Chrome per worker; replaces --workers (default: 1)"
+    )
+    parser.add_argument(
+        "--prefetch",
+        action="store_true",
+        help="Start loading each tab's next row in a spare tab while the current row "
+             "is extracted (runs in tab mode, also with a single tab)"
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Fetch every row, also those whose cached outstanding shares from an earlier run have not expired"
+    )
+    parser.add_argument(
+        "--shares-ttl-hours",
+        type=float,
+        default=DEFAULT_SHARES_TTL.total_seconds() / 3600,
+        help=f"Reuse outstanding shares found by an earlier run for this many hours "
+             f"(default: {DEFAULT_SHARES_TTL.total_seconds() / 3600:g})"
+    )
+    args = parser.parse_args()
+
     # Uncomment one of these based on what you want to run
-    main()  # Process the Excel file
+    main(workers=args.workers, max_per_domain=args.max_per_domain, domain_delay=args.domain_delay,
+         max_pages_per_browser=args.max_pages_per_browser,
+         max_browser_rss_mb=args.max_browser_rss_mb, resume=args.resume,
+         tabs=args.tabs, prefetch=args.prefetch, refresh=args.refresh,
+         shares_ttl=timedelta(hours=args.shares_ttl_hours))  # Process the Excel file
     # test_specific_urls()  # Test specific URLs only 
     # test_fallback_urls()  # Test fallback URL functionality
     # test_custom_domain_extractors()  # Test custom domain extractors 
\ No newline at end of file
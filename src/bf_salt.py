@@ -0,0 +1,187 @@
+"""
+Shared discovery and on-disk cache of the Börse Frankfurt tracing salt.
+
+Every request to api.boerse-frankfurt.de carries an x-client-traceid header
+hashed with a salt that is only published inside the site's JavaScript bundle.
+get_prev_close_boerse downloaded the homepage and the main.*.js bundle for
+every ISIN, and BF4PyConnector scanned every linked script on construction, so
+each Börse Frankfurt row cost three large downloads before its one small API
+call. The salt now comes from a single provider that keeps it in
+data/cache/bf_salt.json for a day. It only changes when the site is
+redeployed, and a request the API rejects drops the cached salt so the retry
+discovers the current one.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from datetime import datetime, timedelta
+
+import requests
+
+from src.http_fetch import get_http_session
+
+BF_HOMEPAGE = "https://www.boerse-frankfurt.de/"
+SALT_CACHE_PATH = os.path.join("data", "cache", "bf_salt.json")
+DEFAULT_SALT_TTL = timedelta(hours=24)
+
+# Statuses with which the API rejects a trace id built from an outdated salt
+REJECTED_STATUS = (400, 401, 403)
+
+_SCRIPT_SRC = re.compile(r'<script[^>]+src\s*=\s*["\']([^"\']+\.js(?:\?[^"\']*)?)["\']', re.IGNORECASE)
+_SALT = re.compile(r'salt\s*:\s*["\'](\w+)["\']')
+
+
+def discover_salt(session, timeout=15):
+    """
+    Find the tracing salt in the JavaScript linked from the homepage.
+
+    The main.*.js bundle is checked first (that is where the salt has always
+    been); the other same-site scripts are the fallback.
+
+    Args:
+        session: requests.Session used for the downloads
+
+    Returns:
+        The salt string
+
+    Raises:
+        ValueError: if no linked script contains the salt
+    """
+    response = session.get(BF_HOMEPAGE, timeout=timeout)
+    response.raise_for_status()
+    scripts = []
+    for src in _SCRIPT_SRC.findall(response.text):
+        if src.startswith("//") or "://" in src:
+            if "boerse-frankfurt.de" not in src:
+                continue  # third-party scripts never carry the salt
+            js_url = src if "://" in src else "https:" + src
+        else:
+            js_url = BF_HOMEPAGE + src.lstrip("/")
+        scripts.append(js_url)
+    if not scripts:
+        raise ValueError("Could not find any JS bundle in the Boerse Frankfurt homepage.")
+
+    scripts.sort(key=lambda js_url: not re.search(r"/main\.[^/]*\.js", js_url))
+    for js_url in scripts:
+        try:
+            js_response = session.get(js_url, timeout=timeout)
+        except requests.exceptions.RequestException as e:
+            logging.debug(f"Boerse Frankfurt salt: could not fetch {js_url}: {e}")
+            continue
+        if js_response.status_code != 200:
+            continue
+        match = _SALT.search(js_response.text)
+        if match:
+            logging.info(f"Boerse Frankfurt salt discovered in {js_url}")
+            return match.group(1)
+    raise ValueError(f"Could not find the salt in any of the {len(scripts)} Boerse Frankfurt JS bundles.")
+
+
+class SaltProvider:
+    """Tracing salt shared by all Börse Frankfurt clients, cached on disk with a TTL."""
+
+    def __init__(self, path=SALT_CACHE_PATH, ttl=DEFAULT_SALT_TTL):
+        """
+        Args:
+            path: JSON file holding the cached salt
+            ttl: how long a discovered salt is used before it is looked up again
+        """
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._salt = None
+        self._fetched_at = None
+
+    def _load(self):
+        """Read the cached salt from disk (caller must hold _lock)."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+            self._salt = stored["salt"]
+            self._fetched_at = datetime.fromisoformat(stored["fetched_at"])
+        except (OSError, ValueError, KeyError, TypeError):
+            self._salt = self._fetched_at = None
+
+    def _save(self):
+        """Write the cached salt to disk (caller must hold _lock)."""
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"salt": self._salt, "fetched_at": self._fetched_at.isoformat(timespec="seconds")}, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logging.warning(f"Boerse Frankfurt salt: could not save {self.path}: {e}")
+
+    def get(self, session=None):
+        """
+        Current salt, discovered only if none is cached or the cached one has expired.
+
+        Args:
+            session: requests.Session for discovery (default: the pooled HTTP session)
+        """
+        with self._lock:
+            if self._salt is None:
+                self._load()
+            if self._salt is None or datetime.now() - self._fetched_at >= self.ttl:
+                self._salt = discover_salt(session or get_http_session())
+                self._fetched_at = datetime.now()
+                self._save()
+            return self._salt
+
+    def invalidate(self, salt=None):
+        """
+        Drop the cached salt so the next get() discovers it again.
+
+        Args:
+            salt: the salt a rejected request was signed with; if another thread
+                  already replaced it, the newer salt is kept
+        """
+        with self._lock:
+            if self._salt is None:
+                self._load()
+            if salt is not None and salt != self._salt:
+                return
+            logging.info("Boerse Frankfurt salt rejected by the API - discarding the cached salt")
+            self._salt = self._fetched_at = None
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+
+def is_rejected(response):
+    """True if the API refused a request, which is what an outdated salt causes."""
+    return response.status_code in REJECTED_STATUS
+
+
+def salted_get(session, url, build_headers, timeout=(5, 15), provider=None):
+    """
+    GET an api.boerse-frankfurt.de URL signed with the shared salt.
+
+    A rejected request invalidates the salt and is retried once with a freshly
+    discovered one.
+
+    Args:
+        session: requests.Session to send the request with
+        url: full API URL including the query string
+        build_headers: callable (url, salt) -> request headers
+        provider: SaltProvider to use (default: the shared one)
+
+    Returns:
+        requests.Response of the last attempt
+    """
+    provider = provider or SALT_PROVIDER
+    salt = provider.get(session)
+    response = session.get(url, headers=build_headers(url, salt), timeout=timeout)
+    if is_rejected(response):
+        provider.invalidate(salt)
+        salt = provider.get(session)
+        response = session.get(url, headers=build_headers(url, salt), timeout=timeout)
+    return response
+
+
+SALT_PROVIDER = SaltProvider()
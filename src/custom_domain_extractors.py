@@ -49,11 +49,14 @@ not just for specific URLs. Your future self and team members will thank you!
 import re
 import logging
 import time
-from bs4 import BeautifulSoup
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
+from src.readiness import load_page, Selector, TextMatches, NetworkIdle
+from src.html_parsing import parse_html
+from src.extractor_registry import ExtractorRegistry
+from src.http_cache import cached_get
 
 
 def extract_valour_shares(driver, url):
@@ -164,7 +167,7 @@ def extract_valour_shares(driver, url):
         
         # Fallback: look in page source for patterns
         page_source = driver.page_source
-        soup = BeautifulSoup(page_source, 'html.parser')
+        soup = parse_html(page_source)
         text = soup.get_text(" ", strip=True)
         
         # Look for patterns like "Outstanding shares: 1,000,000" (expanded patterns)
@@ -269,17 +272,20 @@ def extract_vaneck_de_shares(driver, url):
     structure than the main VanEck site. It handles all cryptocurrency ETPs and other
     products on the German version of the site.
     
-    IMPORTANT: This must come BEFORE the general vaneck.com extractor in the
-    get_custom_extractor function to ensure German URLs are handled correctly.
+    It is registered for the /de path prefix of vaneck.com in SHARES_EXTRACTORS,
+    which takes precedence over the general vaneck.com extractor.
     """
     try:
         logging.info(f"Using VanEck DE (German) custom extractor for: {url}")
-        driver.get(url)
-        time.sleep(12)  # Increased wait time to allow React components to fully load
-        
-        # Wait for page to load
-        WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
+        # Wait for the React app to render either the consent / agreement screen
+        # or the product data itself, whichever comes first
+        load_page(
+            driver, url,
+            Selector("#onetrust-accept-btn-handler, button[id*='cookie'], button[class*='consent'], "
+                     "button[class*='agree'], button.gwt-Button"),
+            TextMatches(r"I agree|Ich stimme zu|Notes Outstanding|Shares Outstanding|ausstehenden Anteile"),
+            NetworkIdle(quiet_period=2),
+            deadline=15,
         )
         
         # Handle cookie consent if present - VanEck DE often has this
@@ -611,9 +617,9 @@ def extract_vaneck_de_shares(driver, url):
                         logging.info(f"Found PDF link: {href}")
                         
                         try:
-                            # Download the PDF directly using requests to avoid navigating away
-                            import requests
-                            response = requests.get(href, timeout=10)
+                            # Download the PDF directly to avoid navigating away; an unchanged
+                            # factsheet is served from the HTTP cache after a 304
+                            response = cached_get(href, timeout=10)
                             
                             if response.status_code == 200:
                                 pdf_content = response.content
@@ -1084,7 +1090,7 @@ def extract_wisdomtree_shares(driver, url):
         # STRATEGY 5: Search the entire page text for patterns
         # This is a fallback when structured extraction fails
         page_source = driver.page_source
-        soup = BeautifulSoup(page_source, 'html.parser')
+        soup = parse_html(page_source)
         text = soup.get_text(" ", strip=True)
         
         # Define patterns based on language
@@ -1500,7 +1506,7 @@ def extract_grayscale_shares(driver, url):
         # This is a more general approach for when the structure is not as expected
         try:
             page_source = driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
+            soup = parse_html(page_source)
             text = soup.get_text(" ", strip=True)
             
             # Define patterns to search for
@@ -2041,7 +2047,7 @@ def extract_tmx_shares(driver, url):
         # STRATEGY 4: Full page text search
         # If all else fails, look for patterns in the entire page text
         page_source = driver.page_source
-        soup = BeautifulSoup(page_source, 'html.parser')
+        soup = parse_html(page_source)
         text = soup.get_text(" ", strip=True)
         
         # Look for patterns like "Listed Units Out: 1,000,000" in the entire page
@@ -2254,7 +2260,7 @@ def extract_tradingview_shares(driver, url):
         # STRATEGY 4: Full page text search as a last resort
         try:
             page_source = driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
+            soup = parse_html(page_source)
             text = soup.get_text(" ", strip=True)
             
             # Look for patterns like "Shares outstanding: 1,000,000"
@@ -2451,54 +2457,40 @@ def extract_globalx_shares(driver, url):
         return {"error": f"GlobalX ETFs extraction failed: {str(e)}"}
 
 
+# Shares extractors by host and optional path prefix; the longest prefix wins,
+# so vaneck.com/de is used for German VanEck pages and vaneck.com for the rest.
+SHARES_EXTRACTORS = ExtractorRegistry("shares extractors")
+SHARES_EXTRACTORS.register("globalxetfs.eu", extract_globalx_shares)
+SHARES_EXTRACTORS.register("tradingview.com", extract_tradingview_shares)
+SHARES_EXTRACTORS.register("vaneck.com", extract_vaneck_de_shares, path_prefix="/de")
+SHARES_EXTRACTORS.register("vaneck.com", extract_vaneck_shares)
+SHARES_EXTRACTORS.register("vaneck.com.au", extract_vaneck_shares)
+SHARES_EXTRACTORS.register("valour.com", extract_valour_shares)
+SHARES_EXTRACTORS.register("wisdomtree.eu", extract_wisdomtree_shares)
+SHARES_EXTRACTORS.register("proshares.com", extract_proshares_shares)
+SHARES_EXTRACTORS.register("grayscale.com", extract_grayscale_shares)
+SHARES_EXTRACTORS.register("lafv.li", extract_lafv_shares)
+SHARES_EXTRACTORS.register("augmentasicav.com", extract_augmenta_shares)
+SHARES_EXTRACTORS.register("invesco.com", extract_invesco_shares)
+SHARES_EXTRACTORS.register("aminagroup.com", extract_aminagroup_shares)
+SHARES_EXTRACTORS.register("rexshares.com", extract_rexshares_shares)
+SHARES_EXTRACTORS.register("money.tmx.com", extract_tmx_shares)
+
+
 def get_custom_extractor(url):
     """
     Returns the appropriate custom extractor function based on the URL domain.
     
-    This function maps URL domains to their specific extractor functions.
     When adding a new extractor:
     1. Create the extractor function above
-    2. Add an entry in this function to map the domain to your extractor
+    2. Register its domain (and path prefix, if it only handles part of a site)
+       in SHARES_EXTRACTORS
     3. Create a test script to verify it works across multiple URLs
     
-    IMPORTANT: The matching is done with simple substring matching, so be careful
-    with the order if domains might overlap (e.g., vaneck.com/de should come before vaneck.com)
+    Subdomains match their parent domain (www.vaneck.com -> vaneck.com) and the
+    longest registered path prefix wins, so registration order doesn't matter.
     """
-    url_lower = url.lower()
-    
-    # IMPORTANT: Order matters! More specific domains should come first
-    # For example, vaneck.com/de must come before vaneck.com
-    if "globalxetfs.eu" in url_lower:
-        return extract_globalx_shares
-    elif "tradingview.com" in url_lower:
-        return extract_tradingview_shares
-    elif "vaneck.com/de" in url_lower:
-        return extract_vaneck_de_shares
-    elif "valour.com" in url_lower:
-        return extract_valour_shares
-    elif "vaneck.com" in url_lower:
-        return extract_vaneck_shares
-    elif "wisdomtree.eu" in url_lower:
-        return extract_wisdomtree_shares
-    elif "proshares.com" in url_lower:
-        return extract_proshares_shares
-    elif "grayscale.com" in url_lower:
-        return extract_grayscale_shares
-    elif "lafv.li" in url_lower:
-        return extract_lafv_shares
-    elif "augmentasicav.com" in url_lower:
-        return extract_augmenta_shares
-    elif "invesco.com" in url_lower:
-        return extract_invesco_shares
-    elif "aminagroup.com" in url_lower:
-        return extract_aminagroup_shares
-    elif "rexshares.com" in url_lower:
-        return extract_rexshares_shares
-    elif "money.tmx.com" in url_lower:
-        return extract_tmx_shares
-    else:
-        return None
-
+    return SHARES_EXTRACTORS.lookup(url)
 
 def extract_with_custom_function(driver, url):
     """
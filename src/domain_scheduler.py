@@ -0,0 +1,161 @@
+"""
+Per-domain politeness scheduler for the updater scripts.
+
+Many spreadsheet rows point at the same host (valour.com, vaneck.com,
+grayscale.com, wisdomtree.eu, nasdaq.com, ...). The scheduler hands out rows so
+that no registrable domain gets more than a fixed number of requests in flight
+and consecutive requests to the same domain are spaced out. While one domain is
+cooling down, rows from other domains are handed out instead, which keeps the
+workers busy without getting throttled.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from urllib.parse import urlparse
+
+# Default limits - conservative enough to avoid bot detection on the big issuer sites
+DEFAULT_MAX_IN_FLIGHT = 2
+DEFAULT_MIN_INTERVAL = 2.0
+
+# Second-level suffixes where the registrable domain has three labels
+# (e.g. betashares.com.au, qrasset.com.br, londonstockexchange.co.uk)
+MULTI_LABEL_SUFFIXES = {
+    "co.uk", "org.uk", "ac.uk", "gov.uk",
+    "com.au", "net.au", "org.au",
+    "com.br", "net.br",
+    "co.jp", "co.nz", "co.za", "com.sg", "com.hk", "com.cn", "com.tw",
+}
+
+
+def registrable_domain(url):
+    """
+    Return the registrable domain for a URL, e.g.
+    "https://www.vaneck.com/de/en/..." -> "vaneck.com"
+    "https://www.betashares.com.au/fund/..." -> "betashares.com.au"
+    """
+    try:
+        host = urlparse(url.strip()).hostname or ""
+    except Exception:
+        host = ""
+    if not host:
+        return str(url)[:100]
+
+    labels = host.lower().split(".")
+    if len(labels) >= 3 and ".".join(labels[-2:]) in MULTI_LABEL_SUFFIXES:
+        return ".".join(labels[-3:])
+    return ".".join(labels[-2:])
+
+
+class DomainScheduler:
+    """
+    Thread-safe job dispenser with per-domain concurrency caps and spacing.
+
+    Workers call acquire() to get the next (row, url) job and release() once the
+    job is done. acquire() blocks while every remaining job belongs to a domain
+    that is at its in-flight cap or still inside its spacing window, and returns
+    None once all jobs have been handed out.
+    """
+
+    def __init__(self, rows_urls, max_in_flight=DEFAULT_MAX_IN_FLIGHT,
+                 min_interval=DEFAULT_MIN_INTERVAL, domain_limits=None):
+        """
+        Args:
+            rows_urls: dict mapping row number -> URL
+            max_in_flight: max concurrent requests per registrable domain
+            min_interval: minimum seconds between request starts on one domain
+            domain_limits: optional {domain: (max_in_flight, min_interval)} overrides
+        """
+        self.max_in_flight = max(1, int(max_in_flight))
+        self.min_interval = max(0.0, float(min_interval))
+        self.domain_limits = domain_limits or {}
+
+        self._pending = OrderedDict()
+        for row, url in rows_urls.items():
+            self._pending.setdefault(registrable_domain(url), deque()).append((row, url))
+
+        self._in_flight = {}
+        self._last_start = {}
+        self._condition = threading.Condition()
+
+    def _limits(self, domain):
+        return self.domain_limits.get(domain, (self.max_in_flight, self.min_interval))
+
+    def remaining(self):
+        """Number of jobs not yet handed out."""
+        with self._condition:
+            return sum(len(jobs) for jobs in self._pending.values())
+
+    def _next_ready(self, now):
+        """
+        Pick the domain to serve next. Returns (domain, None) if a job can start
+        now, or (None, seconds_to_wait) if every pending domain is busy.
+        """
+        best_domain = None
+        best_backlog = -1
+        wait_time = None
+
+        for domain, jobs in self._pending.items():
+            cap, interval = self._limits(domain)
+            if self._in_flight.get(domain, 0) >= cap:
+                continue  # Woken up again by release()
+
+            ready_at = self._last_start.get(domain, float("-inf")) + interval
+            if ready_at > now:
+                delay = ready_at - now
+                wait_time = delay if wait_time is None else min(wait_time, delay)
+                continue
+
+            # Serve the domain with the largest backlog first - it is the one that
+            # bounds the total run time, the small domains fill the gaps.
+            if len(jobs) > best_backlog:
+                best_domain = domain
+                best_backlog = len(jobs)
+
+        return best_domain, wait_time
+
+    def acquire(self, block=True):
+        """
+        Block until a job may start and return (row, url), or None when no jobs remain.
+        With block=False, return None instead of waiting when no job may start yet.
+        """
+        with self._condition:
+            while True:
+                if not self._pending:
+                    return None
+
+                now = time.monotonic()
+                domain, wait_time = self._next_ready(now)
+                if domain is not None:
+                    jobs = self._pending[domain]
+                    job = jobs.popleft()
+                    if not jobs:
+                        del self._pending[domain]
+                    self._in_flight[domain] = self._in_flight.get(domain, 0) + 1
+                    self._last_start[domain] = now
+                    return job
+
+                if not block:
+                    return None
+                logging.debug(f"Scheduler: all pending domains busy, waiting {wait_time}")
+                self._condition.wait(timeout=wait_time)
+
+    def drain(self):
+        """Remove and return every job not yet handed out, ignoring the limits."""
+        with self._condition:
+            jobs = [job for domain_jobs in self._pending.values() for job in domain_jobs]
+            self._pending.clear()
+            self._condition.notify_all()
+            return jobs
+
+    def release(self, job):
+        """Mark a job returned by acquire() as finished."""
+        domain = registrable_domain(job[1])
+        with self._condition:
+            in_flight = self._in_flight.get(domain, 0) - 1
+            if in_flight > 0:
+                self._in_flight[domain] = in_flight
+            else:
+                self._in_flight.pop(domain, None)
+            self._condition.notify_all()
@@ -0,0 +1,228 @@
+"""
+Shared chromedriver resolution and Chrome driver creation.
+
+ChromeDriverManager().install() goes to the network to work out which driver
+matches the installed Chrome, which costs a few seconds per browser and fails
+outright when offline. Here the driver path is resolved once per process and
+pinned by Chrome major version in data/cache/chromedriver.json, so later runs
+(and every browser within a run) start Chrome without any network access. A
+new driver is only downloaded when Chrome itself has been upgraded.
+
+Browsers created with block_resources=True also refuse images, fonts, media
+and analytics/ads hosts through the DevTools Network.setBlockedURLs command;
+none of the extractors read them, and they make up most of the bytes of pages
+like Grayscale and Euronext. Domains that need one of these categories are
+listed in RESOURCE_BLOCKING_OPT_OUT.
+"""
+
+import json
+import logging
+import os
+import threading
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service as ChromeService
+
+from src.domain_scheduler import registrable_domain
+
+try:
+    from webdriver_manager.chrome import ChromeDriverManager
+    from webdriver_manager.core.os_manager import OperationSystemManager, ChromeType
+    WEBDRIVER_MANAGER_AVAILABLE = True
+except ImportError:
+    WEBDRIVER_MANAGER_AVAILABLE = False
+
+DRIVER_CACHE_PATH = os.path.join("data", "cache", "chromedriver.json")
+
+# URL patterns (DevTools wildcard syntax) blocked per resource category
+BLOCKED_RESOURCE_PATTERNS = {
+    "images": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.ico", "*.bmp",
+               "*.png?*", "*.jpg?*", "*.jpeg?*", "*.gif?*", "*.webp?*", "*.avif?*"],
+    "fonts": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+              "*.woff?*", "*.woff2?*", "*.ttf?*", "*.otf?*", "*.eot?*"],
+    "media": ["*.mp4", "*.webm", "*.mov", "*.m4v", "*.mp3", "*.ogg", "*.m3u8",
+              "*.mp4?*", "*.webm?*", "*.m3u8?*", "*player.vimeo.com*", "*youtube.com/embed*"],
+    "trackers": ["*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+                 "*googlesyndication.com*", "*googleadservices.com*", "*facebook.net*",
+                 "*connect.facebook.com*", "*hotjar.com*", "*clarity.ms*", "*bat.bing.com*",
+                 "*snap.licdn.com*", "*ads.linkedin.com*", "*adsrvr.org*", "*criteo.com*",
+                 "*taboola.com*", "*outbrain.com*", "*mouseflow.com*", "*newrelic.com*",
+                 "*nr-data.net*", "*segment.io*", "*cdn.segment.com*"],
+}
+
+# Registrable domain -> resource categories that must load for that site ("all" disables blocking),
+# e.g. {"example.com": {"images"}}. Checked against the URL each row navigates to.
+RESOURCE_BLOCKING_OPT_OUT = {}
+
+_resolve_lock = threading.Lock()
+_resolved = False
+_resolved_path = None
+
+
+def detect_chrome_major_version():
+    """
+    Return the installed Chrome major version (e.g. "126") without network access,
+    or None if it cannot be determined.
+    """
+    if not WEBDRIVER_MANAGER_AVAILABLE:
+        return None
+    try:
+        version = OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+    except Exception as e:
+        logging.debug(f"Could not detect Chrome version: {e}")
+        return None
+    if not version:
+        return None
+    return str(version).split(".")[0]
+
+
+def _load_driver_cache():
+    try:
+        with open(DRIVER_CACHE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_driver_cache(cache):
+    try:
+        os.makedirs(os.path.dirname(DRIVER_CACHE_PATH), exist_ok=True)
+        with open(DRIVER_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2, sort_keys=True)
+    except OSError as e:
+        logging.warning(f"Could not save chromedriver cache: {e}")
+
+
+def resolve_chromedriver():
+    """
+    Return the path of a chromedriver matching the installed Chrome, or None to
+    let Selenium locate one itself.
+
+    Order: the path already resolved in this process, the path pinned for this
+    Chrome major version in the local cache, then a ChromeDriverManager download
+    (whose result is pinned for next time). If the Chrome version cannot be
+    detected, nothing is read from or written to the cache: a pin that cannot
+    be tied to a version would outlive the next Chrome upgrade.
+    """
+    global _resolved, _resolved_path
+    with _resolve_lock:
+        if _resolved:
+            return _resolved_path
+
+        major = detect_chrome_major_version()
+        cache = _load_driver_cache() if major else {}
+
+        cached_path = cache.get(major)
+        if cached_path and os.path.isfile(cached_path):
+            logging.info(f"Using cached chromedriver for Chrome {major}: {cached_path}")
+            _resolved, _resolved_path = True, cached_path
+            return cached_path
+
+        path = None
+        if WEBDRIVER_MANAGER_AVAILABLE:
+            try:
+                path = ChromeDriverManager().install()
+                if major:
+                    logging.info(f"Downloaded chromedriver for Chrome {major}: {path}")
+                    cache[major] = path
+                    _save_driver_cache(cache)
+                else:
+                    logging.info(f"Downloaded chromedriver for an undetected Chrome version (not pinned): {path}")
+            except Exception as e:
+                logging.error(f"ChromeDriverManager failed: {e}")
+
+        if path is None:
+            logging.warning("No cached chromedriver available, letting Selenium locate one")
+
+        _resolved, _resolved_path = True, path
+        return path
+
+
+def create_chrome_driver(options, page_load_timeout=None, page_load_strategy=None, block_resources=False,
+                         capture_network=False):
+    """
+    Start Chrome with the shared chromedriver.
+
+    Args:
+        options: webdriver.ChromeOptions for this browser
+        page_load_timeout: optional page load timeout in seconds
+        page_load_strategy: optional "normal", "eager" or "none"; with "eager"
+                            driver.get() returns at DOMContentLoaded
+        block_resources: block images, fonts, media and tracker hosts via DevTools
+                         (see apply_resource_blocking for per-domain opt-outs)
+        capture_network: record network events in the performance log so extractors
+                         can read JSON API responses (see src.network_capture)
+
+    Returns:
+        webdriver.Chrome instance
+    """
+    if page_load_strategy:
+        options.page_load_strategy = page_load_strategy
+    if capture_network:
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+    driver_path = resolve_chromedriver()
+    service = ChromeService(driver_path) if driver_path else ChromeService()
+    driver = webdriver.Chrome(service=service, options=options)
+    if page_load_timeout:
+        driver.set_page_load_timeout(page_load_timeout)
+    if block_resources:
+        enable_resource_blocking(driver)
+    driver._network_capture = capture_network
+    return driver
+
+
+def blocked_url_patterns(url=None):
+    """
+    Return the DevTools URL patterns to block while loading url.
+
+    Categories the URL's domain opted out of (RESOURCE_BLOCKING_OPT_OUT) are left out;
+    without a URL every category is blocked.
+    """
+    allowed = RESOURCE_BLOCKING_OPT_OUT.get(registrable_domain(url), set()) if url else set()
+    if "all" in allowed:
+        return []
+    patterns = []
+    for category, category_patterns in BLOCKED_RESOURCE_PATTERNS.items():
+        if category not in allowed:
+            patterns.extend(category_patterns)
+    return patterns
+
+
+def _set_blocked_urls(driver, patterns):
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+    driver._blocked_url_patterns = patterns
+
+
+def enable_resource_blocking(driver):
+    """
+    Turn on DevTools resource blocking for a Chrome driver.
+
+    Returns:
+        True if blocking is active, False if the browser does not support it
+    """
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        _set_blocked_urls(driver, blocked_url_patterns())
+    except Exception as e:
+        logging.warning(f"Resource blocking unavailable, loading pages in full: {e}")
+        return False
+    return True
+
+
+def apply_resource_blocking(driver, url):
+    """
+    Adjust a blocking-enabled driver to url's opt-outs before it navigates there.
+    Drivers created without block_resources are left alone.
+    """
+    current = getattr(driver, "_blocked_url_patterns", None)
+    if current is None:
+        return
+    patterns = blocked_url_patterns(url)
+    if patterns == current:
+        return
+    try:
+        _set_blocked_urls(driver, patterns)
+        logging.info(f"Resource blocking for {registrable_domain(url)}: {len(patterns)} patterns")
+    except Exception as e:
+        logging.warning(f"Could not update resource blocking for {url}: {e}")
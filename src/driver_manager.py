@@ -0,0 +1,180 @@
+"""
+Browser lifecycle management for the updater scripts.
+
+Starting Chrome costs several seconds, so a worker keeps one session alive
+across rows and only replaces it when there is a reason to: the session has
+served a set number of pages, the browser processes have grown past a memory
+threshold, or the session has crashed. Memory use and recycle counts are kept
+so they can be written to the run log.
+"""
+
+import logging
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+# Recycle a browser after this many pages even if it still looks healthy
+DEFAULT_MAX_PAGES = 50
+# Recycle when chromedriver plus its Chrome children use more than this (MB)
+DEFAULT_MAX_RSS_MB = 1500
+
+# Substrings of WebDriver errors that mean the session itself is gone
+CRASH_MARKERS = (
+    "invalid session id",
+    "chrome not reachable",
+    "session deleted because of page crash",
+    "tab crashed",
+    "disconnected",
+    "no such window",
+    "target window already closed",
+)
+
+
+def is_crash_error(error):
+    """Return True if an exception means the browser session has died."""
+    message = str(error).lower()
+    return any(marker in message for marker in CRASH_MARKERS)
+
+
+def driver_rss_mb(driver):
+    """
+    Resident memory of chromedriver and all its child Chrome processes in MB.
+
+    Returns:
+        float, or None if psutil is not installed or the process cannot be found
+    """
+    if not PSUTIL_AVAILABLE:
+        return None
+    try:
+        pid = driver.service.process.pid
+        root = psutil.Process(pid)
+        processes = [root] + root.children(recursive=True)
+    except Exception:
+        return None
+
+    total = 0
+    for process in processes:
+        try:
+            total += process.memory_info().rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return total / (1024 * 1024)
+
+
+class ManagedDriver:
+    """
+    Owns one WebDriver session for a worker and decides when to replace it.
+
+    Call acquire() before each page to get a healthy driver, then page_done()
+    afterwards (passing the exception if the page failed). The session is
+    recycled lazily on the next acquire().
+    """
+
+    def __init__(self, create_driver, max_pages=DEFAULT_MAX_PAGES,
+                 max_rss_mb=DEFAULT_MAX_RSS_MB, label="Browser"):
+        """
+        Args:
+            create_driver: callable() returning a new WebDriver
+            max_pages: pages served before a session is recycled (None = no limit)
+            max_rss_mb: memory threshold in MB before a session is recycled (None = no limit)
+            label: prefix for log messages, e.g. "Worker 2"
+        """
+        self.create_driver = create_driver
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self.label = label
+
+        self.driver = None
+        self.pages = 0
+        self.total_pages = 0
+        self.sessions = 0
+        self.recycles = {"pages": 0, "memory": 0, "crash": 0}
+        self.last_rss_mb = None
+        self.peak_rss_mb = None
+        self._needs_recycle = None
+
+    def _start(self):
+        self.driver = self.create_driver()
+        self.sessions += 1
+        self.pages = 0
+        self._needs_recycle = None
+
+    def _quit(self):
+        if self.driver is None:
+            return
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+        self.driver = None
+
+    def is_healthy(self):
+        """Cheap liveness check: the driver process is running and the session answers."""
+        if self.driver is None:
+            return False
+        try:
+            process = getattr(getattr(self.driver, "service", None), "process", None)
+            if process is not None and process.poll() is not None:
+                return False
+            self.driver.window_handles
+            return True
+        except Exception:
+            return False
+
+    def acquire(self):
+        """Return a healthy driver, starting or recycling the session if needed."""
+        if self.driver is not None and self._needs_recycle is None and not self.is_healthy():
+            self._needs_recycle = "crash"
+
+        if self.driver is not None and self._needs_recycle:
+            reason = self._needs_recycle
+            self.recycles[reason] += 1
+            rss = f", {self.last_rss_mb:.0f} MB" if self.last_rss_mb is not None else ""
+            logging.info(f"{self.label}: recycling browser ({reason}) after {self.pages} pages{rss}; "
+                         f"recycle #{sum(self.recycles.values())}")
+            self._quit()
+
+        if self.driver is None:
+            self._start()
+        return self.driver
+
+    def page_done(self, error=None):
+        """
+        Record that a page was processed and flag the session for recycling if
+        it crashed, served too many pages or grew past the memory threshold.
+        """
+        self.pages += 1
+        self.total_pages += 1
+
+        if error is not None and is_crash_error(error):
+            self._needs_recycle = "crash"
+            return
+
+        rss = driver_rss_mb(self.driver) if self.driver is not None else None
+        if rss is not None:
+            self.last_rss_mb = rss
+            self.peak_rss_mb = rss if self.peak_rss_mb is None else max(self.peak_rss_mb, rss)
+            logging.info(f"{self.label}: browser RSS {rss:.0f} MB after {self.pages} pages")
+
+        if self.max_rss_mb is not None and rss is not None and rss > self.max_rss_mb:
+            self._needs_recycle = "memory"
+        elif self.max_pages is not None and self.pages >= self.max_pages:
+            self._needs_recycle = "pages"
+
+    def close(self):
+        """Quit the current session."""
+        self._quit()
+
+    def stats(self):
+        """Summary of this manager's sessions for the run log."""
+        return {
+            "label": self.label,
+            "pages": self.total_pages,
+            "sessions": self.sessions,
+            "recycles": dict(self.recycles),
+            "peak_rss_mb": self.peak_rss_mb,
+            "last_rss_mb": self.last_rss_mb,
+        }
@@ -0,0 +1,95 @@
+"""
+Hostname-indexed registry of site-specific extractors.
+
+Dispatch used to be a long chain of `if "<domain>" in url.lower()` checks (and
+an elif ladder for the shares extractors), so every URL was compared against
+every known site in order and adding a site meant editing those functions.
+Extractors now register under a host and an optional path prefix; lookup()
+parses the URL once, finds the host in a dict (walking up to parent domains,
+so www.vaneck.com and etfs.grayscale.com find vaneck.com and grayscale.com)
+and returns the entry with the longest matching path prefix, e.g. vaneck.com/de
+before vaneck.com. Handlers can be given as "module:attribute" references, so
+a site's module is only imported when one of its URLs is first dispatched.
+"""
+
+from urllib.parse import urlsplit
+
+from src.plugins import load_plugin
+
+
+class ExtractorRegistry:
+    """Maps (host, path prefix) to a handler, with longest-prefix matching."""
+
+    def __init__(self, name="extractors"):
+        self.name = name
+        # host -> [(path_prefix, match, handler)], longest prefix first
+        self._hosts = {}
+
+    def register(self, host, handler, path_prefix="", match=None):
+        """
+        Register a handler for a host (and its subdomains).
+
+        Args:
+            host: domain without scheme, e.g. "vaneck.com"
+            handler: returned by lookup() for matching URLs; a "module:attribute"
+                string is imported on the first lookup that matches (see src.plugins)
+            path_prefix: only match paths starting with this, e.g. "/de"
+            match: optional predicate url -> bool for anything the host and
+                path can't express (e.g. a URL fragment); URLs it rejects fall
+                through to shorter prefixes
+
+        Returns:
+            handler, so register() can wrap a function definition
+        """
+        host = host.lower().strip(".")
+        path_prefix = path_prefix.lower()
+        if path_prefix and not path_prefix.startswith("/"):
+            path_prefix = "/" + path_prefix
+        entries = self._hosts.setdefault(host, [])
+        entries.append((path_prefix, match, handler))
+        entries.sort(key=lambda entry: len(entry[0]), reverse=True)
+        return handler
+
+    def extractor(self, host, path_prefix="", match=None):
+        """Decorator form of register()."""
+        def decorator(handler):
+            return self.register(host, handler, path_prefix=path_prefix, match=match)
+        return decorator
+
+    def lookup(self, url):
+        """
+        Find the handler for a URL.
+
+        Returns:
+            The registered handler, or None if no site-specific extractor applies
+        """
+        if not url:
+            return None
+        parts = urlsplit(url if "://" in url else "//" + url)
+        host = (parts.hostname or "").lower()
+        path = parts.path.lower()
+        while host:
+            for path_prefix, match, handler in self._hosts.get(host, ()):
+                if _path_matches(path, path_prefix) and (match is None or match(url)):
+                    return load_plugin(handler)
+            host = host.partition(".")[2]
+        return None
+
+    def hosts(self):
+        """Registered hosts, e.g. for listing supported sites."""
+        return sorted(self._hosts)
+
+    def __contains__(self, url):
+        return self.lookup(url) is not None
+
+    def __len__(self):
+        return sum(len(entries) for entries in self._hosts.values())
+
+
+def _path_matches(path, prefix):
+    """True if path starts with prefix on a segment boundary ("/de" matches "/de/etfs", not "/den")."""
+    if not prefix:
+        return True
+    if not path.startswith(prefix):
+        return False
+    return prefix.endswith("/") or len(path) == len(prefix) or path[len(prefix)] == "/"
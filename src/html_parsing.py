@@ -0,0 +1,115 @@
+"""
+HTML parsing shared by all extractors.
+
+Extractors used to build their own BeautifulSoup(page_source, "html.parser")
+trees, so a page that went through several tiers (custom extractor, keyword
+fallback, AI clean-up) was parsed several times with the slowest, pure-Python
+parser. parse_html() parses with the fastest available backend (lxml by
+default) and remembers the last few documents per thread, so every consumer of
+the same HTML gets the same tree.
+
+The backend can be changed with the HTML_PARSER environment variable or
+set_parser(), e.g. HTML_PARSER=html.parser to get the old behaviour back.
+Trees handed out by parse_html() are shared: read them, don't modify them
+(use page_text() instead of decomposing script/style tags).
+"""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+from bs4 import BeautifulSoup, CData, NavigableString
+from bs4.builder import builder_registry
+
+# Tree builders in order of preference (all produce BeautifulSoup trees)
+PARSER_PREFERENCE = ("lxml", "html.parser")
+# Documents remembered per thread
+CACHE_SIZE = 2
+
+_parser = None
+_local = threading.local()
+
+
+def parser_available(name):
+    """True if BeautifulSoup can use the named tree builder (e.g. "lxml", "html5lib")."""
+    return builder_registry.lookup(name) is not None
+
+
+def available_parsers():
+    """Tree builders from PARSER_PREFERENCE that are installed."""
+    return [name for name in PARSER_PREFERENCE if parser_available(name)]
+
+
+def get_parser():
+    """Name of the tree builder parse_html() uses."""
+    global _parser
+    if _parser is None:
+        requested = os.environ.get("HTML_PARSER")
+        if requested and parser_available(requested):
+            _parser = requested
+        else:
+            if requested:
+                logging.warning(f"HTML parser {requested!r} is not available, using the default")
+            _parser = available_parsers()[0]
+    return _parser
+
+
+def set_parser(name):
+    """Switch the tree builder used by parse_html() (clears the document cache)."""
+    global _parser
+    if not parser_available(name):
+        raise ValueError(f"HTML parser {name!r} is not available")
+    _parser = name
+    clear_cache()
+
+
+def clear_cache():
+    """Forget the documents this thread has parsed."""
+    _local.cache = OrderedDict()
+
+
+def parse_html(html, parser=None):
+    """
+    Parse an HTML document, reusing the tree if this thread parsed the same HTML recently.
+
+    Args:
+        html: page source
+        parser: tree builder to use instead of get_parser()
+
+    Returns:
+        BeautifulSoup tree (shared - do not modify it)
+    """
+    parser = parser or get_parser()
+    html = html or ""
+    cache = getattr(_local, "cache", None)
+    if cache is None:
+        cache = _local.cache = OrderedDict()
+
+    key = (parser, html)
+    soup = cache.get(key)
+    if soup is not None:
+        cache.move_to_end(key)
+        return soup
+
+    soup = BeautifulSoup(html, parser)
+    cache[key] = soup
+    while len(cache) > CACHE_SIZE:
+        cache.popitem(last=False)
+    return soup
+
+
+def page_text(soup, separator="", skip_tags=()):
+    """
+    Text of a tree like soup.get_text(separator), leaving out everything inside
+    skip_tags (e.g. ("nav", "header", "footer")) without modifying the tree.
+    """
+    skip_tags = set(skip_tags)
+    parts = []
+    for string in soup.find_all(string=True):
+        if type(string) not in (NavigableString, CData):
+            continue  # comments, doctype, script and style contents
+        if skip_tags and any(parent.name in skip_tags for parent in string.parents):
+            continue
+        parts.append(str(string))
+    return separator.join(parts)
@@ -0,0 +1,205 @@
+"""
+On-disk HTTP cache with conditional revalidation for the requests-based paths.
+
+Börse Frankfurt instrument pages (read for their ISIN) and VanEck factsheet
+PDFs were downloaded in full on every run, although they rarely change between
+runs. Responses that carry an ETag or Last-Modified header are now stored under
+data/cache/http/, and the next request for the same URL sends If-None-Match /
+If-Modified-Since. A 304 answer is served from disk, so an unchanged page or
+PDF costs one round trip instead of a full download. Responses without a
+validator, or marked Cache-Control: no-store, are never stored.
+
+The first store of each run sweeps the directory: entries not used for
+DEFAULT_MAX_AGE are removed, then the least recently used ones until the
+cache fits in DEFAULT_MAX_BYTES, so old factsheet versions do not pile up.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from datetime import datetime, timedelta
+
+import requests
+
+from src.http_fetch import get_http_session
+
+HTTP_CACHE_DIR = os.path.join("data", "cache", "http")
+DEFAULT_MAX_AGE = timedelta(days=30)
+DEFAULT_MAX_BYTES = 500 * 1024 * 1024
+
+# Response headers kept with the body so a 304 can rebuild the full response
+_STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Cache-Control")
+# Headers a 304 may update on the stored response (RFC 9111 section 4.3.4)
+_REFRESHED_HEADERS = ("etag", "last-modified", "cache-control", "date", "expires")
+
+
+class HttpCache:
+    """Conditional GETs backed by one metadata and one body file per URL."""
+
+    def __init__(self, directory=HTTP_CACHE_DIR, max_age=DEFAULT_MAX_AGE, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Args:
+            directory: where the metadata and body files are kept
+            max_age: entries not stored or revalidated for this long are removed
+            max_bytes: upper bound for the total size of the stored files
+        """
+        self.directory = directory
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self._swept = False
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.directory, key)
+        return base + ".json", base + ".body"
+
+    def _load(self, url):
+        """Stored metadata and body for url, or (None, None)."""
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None, None
+        if meta.get("url") != url:
+            return None, None
+        return meta, body
+
+    def _store(self, url, response):
+        """Keep a 200 response that can be revalidated later."""
+        headers = response.headers
+        if "no-store" in headers.get("Cache-Control", "").lower():
+            return
+        if not (headers.get("ETag") or headers.get("Last-Modified")):
+            return
+        meta = {
+            "url": url,
+            "headers": {name: headers[name] for name in _STORED_HEADERS if name in headers},
+            "encoding": response.encoding,
+            "stored_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        meta_path, body_path = self._paths(url)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Body first: metadata only ever points at a complete body
+            _write_atomic(body_path, response.content)
+            _write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+        except OSError as e:
+            logging.warning(f"HTTP cache: could not store {url}: {e}")
+        if not self._swept:
+            self._swept = True
+            self.sweep()
+
+    def sweep(self, now=None):
+        """
+        Remove entries unused for max_age, then the least recently used ones
+        until the stored files fit in max_bytes.
+
+        An entry's last use is the modification time of its metadata file, which
+        is refreshed whenever a 304 serves it.
+        """
+        now = now or time.time()
+        entries = []  # (last_used, size, meta_path, body_path)
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+        for name in names:
+            if not name.endswith(".json"):
+                continue
+            meta_path = os.path.join(self.directory, name)
+            body_path = meta_path[:-len(".json")] + ".body"
+            try:
+                last_used = os.path.getmtime(meta_path)
+                size = os.path.getsize(meta_path) + (os.path.getsize(body_path) if os.path.exists(body_path) else 0)
+            except OSError:
+                continue
+            entries.append((last_used, size, meta_path, body_path))
+
+        entries.sort()
+        total = sum(entry[1] for entry in entries)
+        removed = 0
+        for last_used, size, meta_path, body_path in entries:
+            if now - last_used <= self.max_age.total_seconds() and total <= self.max_bytes:
+                break
+            for path in (meta_path, body_path):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            total -= size
+            removed += 1
+        if removed:
+            logging.info(f"HTTP cache: removed {removed} old entries, {total / 1024 / 1024:.1f} MB kept")
+
+    def get(self, url, session=None, timeout=10, headers=None):
+        """
+        GET url, revalidating a stored copy instead of downloading it again.
+
+        Args:
+            url: URL to fetch
+            session: requests.Session to use (default: the pooled session of src.http_fetch)
+            timeout: request timeout in seconds
+            headers: extra request headers
+
+        Returns:
+            requests.Response; from_cache is True when the body came from disk
+            after a 304. Errors from requests propagate as with requests.get().
+        """
+        session = session or get_http_session()
+        request_headers = dict(headers or {})
+        meta, body = self._load(url)
+        if meta is not None:
+            stored = meta.get("headers", {})
+            if stored.get("ETag"):
+                request_headers["If-None-Match"] = stored["ETag"]
+            if stored.get("Last-Modified"):
+                request_headers["If-Modified-Since"] = stored["Last-Modified"]
+
+        response = session.get(url, headers=request_headers, timeout=timeout)
+        if response.status_code == 304 and meta is not None:
+            logging.info(f"HTTP cache: {url} not modified, using stored copy ({len(body)} bytes)")
+            try:
+                os.utime(self._paths(url)[0])  # keeps the entry from being swept as unused
+            except OSError:
+                pass
+            return _stored_response(url, meta, body, response)
+
+        response.from_cache = False
+        if response.status_code == 200:
+            self._store(url, response)
+        return response
+
+
+def _stored_response(url, meta, body, not_modified):
+    """Rebuild a 200 response from the stored copy, with headers refreshed by the 304."""
+    response = requests.models.Response()
+    response.status_code = 200
+    response.url = url
+    response._content = body
+    response.encoding = meta.get("encoding")
+    response.headers.update(meta.get("headers", {}))
+    response.headers.update({name: value for name, value in not_modified.headers.items()
+                             if name.lower() in _REFRESHED_HEADERS})
+    response.request = not_modified.request
+    response.from_cache = True
+    return response
+
+
+def _write_atomic(path, data):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+_default_cache = HttpCache()
+
+
+def cached_get(url, session=None, timeout=10, headers=None):
+    """HttpCache.get() on the shared cache in data/cache/http/."""
+    return _default_cache.get(url, session=session, timeout=timeout, headers=headers)
@@ -0,0 +1,133 @@
+"""
+HTTP-first fetch tier for the updater scripts.
+
+Many product pages already contain their numbers in the server-rendered HTML,
+so a pooled plain GET followed by the usual BeautifulSoup logic is enough and
+a full Chrome navigation can be skipped. This module provides the pooled
+session and remembers, per domain, whether the cheap path has worked before
+so later runs go straight to Selenium for domains that never render
+server-side.
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.domain_scheduler import registrable_domain
+
+HTTP_TIER_STATS_PATH = os.path.join("data", "cache", "http_tier_domains.json")
+
+# After this many misses without a single success, a domain is treated as JS-only
+MAX_MISSES_WITHOUT_SUCCESS = 2
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+_thread_local = threading.local()
+_stats_lock = threading.Lock()
+_stats = None
+
+
+def get_http_session():
+    """
+    Return a pooled requests.Session for the current thread.
+    Sessions keep connections alive, so repeated rows on one host reuse the TLS connection.
+    """
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=1)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update(DEFAULT_HEADERS)
+        _thread_local.session = session
+    return session
+
+
+def fetch_static_html(url, timeout=10):
+    """
+    GET a page without a browser.
+
+    Returns:
+        The response body as text, or None if the request failed or did not return HTML.
+    """
+    try:
+        response = get_http_session().get(url, timeout=timeout)
+    except requests.exceptions.RequestException as e:
+        logging.info(f"HTTP tier: request failed for {url}: {e}")
+        return None
+
+    if response.status_code != 200:
+        logging.info(f"HTTP tier: {url} returned status {response.status_code}")
+        return None
+
+    content_type = response.headers.get("Content-Type", "")
+    if content_type and "html" not in content_type.lower():
+        logging.info(f"HTTP tier: {url} is not HTML ({content_type})")
+        return None
+
+    return response.text
+
+
+def _load_stats():
+    """Load the per-domain HTTP tier history (caller must hold _stats_lock)."""
+    global _stats
+    if _stats is None:
+        try:
+            with open(HTTP_TIER_STATS_PATH, "r", encoding="utf-8") as f:
+                _stats = json.load(f)
+        except (OSError, ValueError):
+            _stats = {}
+    return _stats
+
+
+def _save_stats():
+    """Persist the per-domain HTTP tier history (caller must hold _stats_lock)."""
+    try:
+        os.makedirs(os.path.dirname(HTTP_TIER_STATS_PATH), exist_ok=True)
+        tmp_path = HTTP_TIER_STATS_PATH + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(_stats, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, HTTP_TIER_STATS_PATH)
+    except OSError as e:
+        logging.warning(f"HTTP tier: could not save domain stats: {e}")
+
+
+def should_try_http(url, kind="price"):
+    """
+    Decide whether the HTTP tier is worth trying for this URL's domain.
+    Unknown domains are always tried; domains that have only ever missed are skipped.
+
+    Args:
+        url: page URL
+        kind: what is being extracted ("price" or "shares") - tracked separately
+              because a page may render one value server-side but not the other
+    """
+    domain = registrable_domain(url)
+    with _stats_lock:
+        entry = _load_stats().get(domain, {}).get(kind)
+    if not entry:
+        return True
+    return entry.get("http_ok", 0) > 0 or entry.get("http_miss", 0) < MAX_MISSES_WITHOUT_SUCCESS
+
+
+def record_http_result(url, success, kind="price"):
+    """Record whether the HTTP tier produced a usable value for this URL's domain."""
+    domain = registrable_domain(url)
+    with _stats_lock:
+        stats = _load_stats()
+        entry = stats.setdefault(domain, {}).setdefault(kind, {"http_ok": 0, "http_miss": 0})
+        if success:
+            entry["http_ok"] = entry.get("http_ok", 0) + 1
+            entry["last_ok"] = datetime.now().isoformat(timespec="seconds")
+        else:
+            entry["http_miss"] = entry.get("http_miss", 0) + 1
+        _save_stats()
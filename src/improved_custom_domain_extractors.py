@@ -10,7 +10,7 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from bs4 import BeautifulSoup
+from src.html_parsing import parse_html
 
 def extract_valour_shares(driver, url):
     """
@@ -37,7 +37,7 @@ def extract_valour_shares(driver, url):
             return shares
         
         # Method 2: Look for table structure with shares
-        soup = BeautifulSoup(page_source, 'html.parser')
+        soup = parse_html(page_source)
         
         # Look for spans containing numbers that could be shares
         spans = soup.find_all('span')
@@ -84,7 +84,7 @@ def extract_grayscale_shares(driver, url):
         time.sleep(3)
         
         page_source = driver.page_source
-        soup = BeautifulSoup(page_source, 'html.parser')
+        soup = parse_html(page_source)
         
         # Method 1: Look for the specific table structure found in investigation
         # <strong>SHARES OUTSTANDING</strong> followed by the number
@@ -161,7 +161,7 @@ def extract_vaneck_shares(driver, url):
         time.sleep(3)
         
         page_source = driver.page_source
-        soup = BeautifulSoup(page_source, 'html.parser')
+        soup = parse_html(page_source)
         
         # Method 1: Look for fund details sections
         fund_details = soup.find_all(class_=re.compile(r'fund-details'))
@@ -242,7 +242,7 @@ def extract_wisdomtree_shares(driver, url):
         time.sleep(3)
         
         page_source = driver.page_source
-        soup = BeautifulSoup(page_source, 'html.parser')
+        soup = parse_html(page_source)
         
         # Method 1: Look for fund details tables
         fund_tables = soup.find_all('table')
@@ -322,7 +322,7 @@ def extract_proshares_shares(driver, url):
         time.sleep(3)
         
         page_source = driver.page_source
-        soup = BeautifulSoup(page_source, 'html.parser')
+        soup = parse_html(page_source)
         
         # Method 1: Look for holdings table with shares/contracts column
         tables = soup.find_all('table')
@@ -417,7 +417,7 @@ def extract_vaneck_de_shares(driver, url):
         
         # Get the page source after JavaScript has loaded
         page_source = driver.page_source
-        soup = BeautifulSoup(page_source, 'html.parser')
+        soup = parse_html(page_source)
         
         # Method 1: Look for "Notes Outstanding" directly on the page
         # This is the most common format for VanEck DE pages
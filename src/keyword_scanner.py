@@ -0,0 +1,67 @@
+"""
+Single-pass keyword scanning for the generic extraction fallbacks.
+
+The generic price fallback used to compile one regex per keyword and run each
+over the whole page text, and the shares fallback ran six patterns over the
+full text. A KeywordScanner finds every occurrence of all its keywords
+(overlapping ones included, e.g. "closing price" inside "previous closing
+price") in one pass; callers then only look at the few characters after each
+anchor for the number, and validate it against a local context window instead
+of the whole page.
+"""
+
+import re
+
+# Characters on each side of a match handed to validation as context
+DEFAULT_CONTEXT_CHARS = 200
+
+
+class KeywordScanner:
+    """Finds all occurrences of a fixed set of keywords in one pass, case-insensitively."""
+
+    def __init__(self, keywords):
+        """
+        Args:
+            keywords: phrases matched as whole words (e.g. "share price", "vl")
+        """
+        self.keywords = list(keywords)
+        lowered = sorted({k.lower() for k in self.keywords}, key=len, reverse=True)
+        self._count = len(lowered)
+        self._by_first_char = {}
+        for keyword in lowered:
+            self._by_first_char.setdefault(keyword[0], []).append(keyword)
+        alternation = "|".join(re.escape(k) for k in lowered)
+        # Zero-width, so keywords starting inside another match are found too
+        self._anchor = re.compile(rf"\b(?=(?:{alternation})\b)", re.IGNORECASE)
+
+    def scan(self, text):
+        """
+        Yield (keyword, start, end) for every occurrence in text order; keyword is lowercased.
+        """
+        for match in self._anchor.finditer(text):
+            start = match.start()
+            for keyword in self._by_first_char.get(text[start].lower(), ()):
+                end = start + len(keyword)
+                if text[start:end].lower() != keyword:
+                    continue
+                if end < len(text) and (text[end].isalnum() or text[end] == "_"):
+                    continue
+                yield keyword, start, end
+
+    def first_occurrences(self, text):
+        """
+        Returns:
+            dict lowercased keyword -> (start, end) of its first occurrence
+        """
+        found = {}
+        for keyword, start, end in self.scan(text):
+            if keyword not in found:
+                found[keyword] = (start, end)
+                if len(found) == self._count:
+                    break
+        return found
+
+
+def context_window(text, start, end, chars=DEFAULT_CONTEXT_CHARS):
+    """The text around text[start:end], chars characters on each side."""
+    return text[max(0, start - chars):end + chars]
@@ -0,0 +1,210 @@
+"""
+Network capture: read prices and share counts from the JSON the page fetches.
+
+Several issuer and exchange pages render their numbers client-side from an
+API response the browser fetches anyway. NETWORK_RULES currently covers the
+nasdaq.com quote pages, which call api.nasdaq.com/api/quote/{SYMBOL}/info;
+other hosts are scraped until a rule for their API is added. Scraping those pages means waiting
+for React to paint, scrolling components into view and parsing megabytes of
+HTML. With network capture the browser records its network traffic in the
+Chrome performance log; an extractor declares which response URL and which
+JSON path hold the value (a NetworkRule) and reads it straight from the
+response body via DevTools.
+
+Browsers must be created with capture_network=True (see
+src.driver_factory.create_chrome_driver) for this to work; on other drivers
+the helpers return None and callers fall back to DOM scraping.
+"""
+
+import base64
+import json
+import logging
+import re
+import time
+
+DEFAULT_DEADLINE = 10
+POLL_INTERVAL = 0.25
+
+
+class NetworkRule:
+    """Where to find one value in the JSON responses a page loads."""
+
+    def __init__(self, page_pattern, response_pattern, json_path, kind="price", parse=None):
+        """
+        Args:
+            page_pattern: regex matched against the page URL the rule applies to
+            response_pattern: regex matched against the URL of the JSON response
+            json_path: dotted path to the value, list indices as numbers
+                       (e.g. "data.primaryData.lastSalePrice" or "data.rows.0.nav")
+            kind: what the value is ("price" or "shares")
+            parse: optional function(value) -> value, e.g. to turn "$12.34" into 12.34;
+                   should raise ValueError for unusable values
+        """
+        self.page_pattern = re.compile(page_pattern, re.I)
+        self.response_pattern = re.compile(response_pattern, re.I)
+        self.json_path = json_path
+        self.kind = kind
+        self.parse = parse
+
+    def applies_to(self, url, kind):
+        return self.kind == kind and bool(self.page_pattern.search(url or ""))
+
+    def __repr__(self):
+        return f"NetworkRule({self.response_pattern.pattern!r} -> {self.json_path})"
+
+
+def parse_number(value):
+    """Parse a number from an API value such as 12.34, "$1,234.50" or "12,5 EUR"."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = re.search(r"-?\d[\d,]*(?:\.\d+)?", str(value))
+    if not match:
+        raise ValueError(f"No number in {value!r}")
+    return float(match.group(0).replace(",", ""))
+
+
+# Known JSON sources, tried before scraping the rendered page
+NETWORK_RULES = [
+    NetworkRule(
+        r"nasdaq\.com/market-activity/",
+        r"api\.nasdaq\.com/api/quote/[^/]+/info",
+        "data.primaryData.lastSalePrice",
+        kind="price",
+        parse=parse_number,
+    ),
+]
+
+
+def rules_for(url, kind="price"):
+    """NetworkRules that apply to a page URL."""
+    return [rule for rule in NETWORK_RULES if rule.applies_to(url, kind)]
+
+
+def read_json_path(data, path):
+    """
+    Follow a dotted path into parsed JSON.
+
+    Returns:
+        The value, or None if any step is missing
+    """
+    current = data
+    for part in path.split("."):
+        if isinstance(current, list):
+            try:
+                current = current[int(part)]
+            except (ValueError, IndexError):
+                return None
+        elif isinstance(current, dict):
+            if part not in current:
+                return None
+            current = current[part]
+        else:
+            return None
+    return current
+
+
+def is_capturing(driver):
+    """True if the driver records its network traffic (created with capture_network=True)."""
+    return bool(getattr(driver, "_network_capture", False))
+
+
+def can_capture(driver, url, kind="price"):
+    """True if wait_for_network_value can read a kind value for url from this driver."""
+    return is_capturing(driver) and bool(rules_for(url, kind))
+
+
+def drain_network_log(driver):
+    """Discard network events recorded so far, e.g. those of the previous row."""
+    if not is_capturing(driver):
+        return
+    try:
+        driver.get_log("performance")
+    except Exception as e:
+        logging.debug(f"Could not drain performance log: {e}")
+
+
+def _response_events(driver):
+    """(request_id, url) of each response recorded since the last read."""
+    try:
+        entries = driver.get_log("performance")
+    except Exception as e:
+        logging.debug(f"Could not read performance log: {e}")
+        return []
+    responses = []
+    for entry in entries:
+        try:
+            message = json.loads(entry["message"])["message"]
+        except (KeyError, TypeError, ValueError):
+            continue
+        if message.get("method") != "Network.responseReceived":
+            continue
+        params = message.get("params", {})
+        response_url = params.get("response", {}).get("url", "")
+        if params.get("requestId") and response_url:
+            responses.append((params["requestId"], response_url))
+    return responses
+
+
+def _response_json(driver, request_id):
+    """Parsed JSON body of a recorded response, or None (not finished yet, not JSON)."""
+    try:
+        body = driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+    except Exception:
+        return None
+    text = body.get("body", "")
+    if body.get("base64Encoded"):
+        try:
+            text = base64.b64decode(text).decode("utf-8", errors="replace")
+        except ValueError:
+            return None
+    try:
+        return json.loads(text)
+    except ValueError:
+        return None
+
+
+def wait_for_network_value(driver, url, kind="price", deadline=DEFAULT_DEADLINE):
+    """
+    Wait for a JSON response declared by a NetworkRule for url and read its value.
+
+    Call after navigating to url (and drain_network_log before navigating, so
+    responses of earlier pages are not picked up).
+
+    Returns:
+        (value, rule) for the first rule whose value could be read, or (None, None)
+    """
+    if not can_capture(driver, url, kind):
+        return None, None
+    rules = rules_for(url, kind)
+
+    pending = []  # (request_id, response_url, rule) seen but not readable yet
+    end = time.monotonic() + deadline
+    while True:
+        for request_id, response_url in _response_events(driver):
+            for rule in rules:
+                if rule.response_pattern.search(response_url):
+                    pending.append((request_id, response_url, rule))
+
+        for item in list(pending):
+            request_id, response_url, rule = item
+            data = _response_json(driver, request_id)
+            if data is None:
+                continue
+            pending.remove(item)
+            value = read_json_path(data, rule.json_path)
+            if value in (None, "", "N/A"):
+                logging.info(f"Network capture: {response_url} has no value at {rule.json_path}")
+                continue
+            if rule.parse:
+                try:
+                    value = rule.parse(value)
+                except ValueError as e:
+                    logging.info(f"Network capture: unusable value at {rule.json_path} in {response_url}: {e}")
+                    continue
+            logging.info(f"Network capture: {kind} {value} from {response_url} ({rule.json_path})")
+            return value, rule
+
+        if time.monotonic() >= end:
+            logging.info(f"Network capture: no {kind} response for {url} within {deadline}s")
+            return None, None
+        time.sleep(POLL_INTERVAL)
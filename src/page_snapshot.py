@@ -0,0 +1,184 @@
+"""
+Page snapshots shared between extraction tiers.
+
+A URL used to be loaded again by every tier that looked at it (custom
+extractor, generic patterns, AI fallback). A PageSnapshot captures the
+rendered page once - final URL, HTML and load timings - and is handed to the
+following tiers, which parse it instead of navigating. Tiers that need to
+interact with the live page (clicks, tab switches, hash routes) get a
+LoadedPageDriver, which skips their initial load of a page that is already
+rendered.
+"""
+
+import logging
+import time
+from urllib.parse import urlparse
+
+from src.html_parsing import parse_html
+from src.readiness import load_page, DEFAULT_DEADLINE
+
+
+class PageSnapshot:
+    """Rendered state of one page load."""
+
+    def __init__(self, url, final_url, html, timings=None, captured_at=None):
+        """
+        Args:
+            url: URL that was requested
+            final_url: URL the browser ended up on (after redirects)
+            html: rendered page source
+            timings: dict of load timings in seconds (navigation, dom_content_loaded, load)
+            captured_at: time.time() when the snapshot was taken
+        """
+        self.url = url
+        self.final_url = final_url
+        self.html = html or ""
+        self.timings = timings or {}
+        self.captured_at = captured_at or time.time()
+        self._soup = None
+
+    @property
+    def soup(self):
+        """BeautifulSoup tree of the HTML, parsed on first use (shared, see src.html_parsing)."""
+        if self._soup is None:
+            self._soup = parse_html(self.html)
+        return self._soup
+
+    def matches(self, url):
+        """Return True if this snapshot can stand in for a load of url (same host)."""
+        return _same_host(self.final_url, url) or _same_host(self.url, url)
+
+    def __repr__(self):
+        return f"PageSnapshot({self.final_url!r}, {len(self.html)} chars)"
+
+
+def _same_host(a, b):
+    try:
+        host_a = (urlparse(a).hostname or "").lower()
+        host_b = (urlparse(b).hostname or "").lower()
+    except Exception:
+        return False
+    return bool(host_a) and host_a.removeprefix("www.") == host_b.removeprefix("www.")
+
+
+def _same_page(a, b):
+    try:
+        pa, pb = urlparse(a), urlparse(b)
+    except Exception:
+        return False
+    return _same_host(a, b) and pa.path.rstrip("/") == pb.path.rstrip("/")
+
+
+def _read_timings(driver):
+    """Navigation timings of the current page from the Navigation Timing API."""
+    try:
+        entry = driver.execute_script(
+            "var n = performance.getEntriesByType('navigation')[0];"
+            "return n ? [n.responseEnd, n.domContentLoadedEventEnd, n.loadEventEnd] : null;"
+        )
+    except Exception:
+        return {}
+    if not entry:
+        return {}
+    names = ("response", "dom_content_loaded", "load")
+    return {name: round(value / 1000.0, 3) for name, value in zip(names, entry) if value}
+
+
+def capture_snapshot(driver, url, previous_url=None, require_same_page=False):
+    """
+    Snapshot whatever page the driver currently shows.
+
+    Args:
+        driver: Selenium WebDriver
+        url: URL the snapshot should stand for
+        previous_url: driver.current_url before the tier that was expected to load
+                      url ran; if the driver never left it, the page is stale
+                      (unless it already was url)
+        require_same_page: only accept the current page if its path equals url's,
+                           not just its host
+
+    Returns:
+        PageSnapshot, or None if the driver is not on a page for url
+        (e.g. a previous tier navigated elsewhere or failed before loading it)
+    """
+    try:
+        final_url = driver.current_url
+    except Exception as e:
+        logging.debug(f"Could not read current URL for snapshot of {url}: {e}")
+        return None
+    if not _same_host(final_url, url):
+        return None
+    if require_same_page and not _same_page(final_url, url):
+        return None
+    if previous_url is not None and final_url == previous_url and not _same_page(final_url, url):
+        return None
+    return PageSnapshot(url, final_url, driver.page_source, _read_timings(driver))
+
+
+class LoadedPageDriver:
+    """
+    Driver for a tier that navigates itself, on a page that is already rendered.
+
+    The first get() of the snapshot's page is skipped while the browser still
+    shows it, so a site-specific extractor starts from the existing render
+    instead of loading the page again. Later get() calls (reloads, other pages)
+    and every other attribute go to the wrapped driver.
+    """
+
+    def __init__(self, driver, snapshot):
+        self._driver = driver
+        self._snapshot = snapshot
+        self._skip_next = True
+
+    def get(self, url):
+        if self._skip_next:
+            self._skip_next = False
+            if _is_snapshot_page(self._driver, self._snapshot, url):
+                logging.info(f"Reusing rendered page instead of loading {url} again")
+                return
+        self._driver.get(url)
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
+
+def _is_snapshot_page(driver, snapshot, url):
+    """True if url is the snapshot's page and the driver still shows it."""
+    if not (_same_page(snapshot.url, url) or _same_page(snapshot.final_url, url)):
+        return False
+    try:
+        return driver.current_url == snapshot.final_url
+    except Exception:
+        return False
+
+
+def reuse_loaded_page(driver, url, snapshot):
+    """
+    Driver to hand to a tier that loads url itself.
+
+    Returns:
+        A LoadedPageDriver if snapshot is a render of url the driver still
+        shows, otherwise driver unchanged.
+    """
+    if snapshot is None or not _is_snapshot_page(driver, snapshot, url):
+        return driver
+    return LoadedPageDriver(driver, snapshot)
+
+
+def load_snapshot(driver, url, *conditions, deadline=DEFAULT_DEADLINE):
+    """
+    Navigate to url once, wait for readiness and snapshot the result.
+
+    Args:
+        conditions: optional readiness conditions (see src.readiness); with none,
+                    the page is captured as soon as driver.get() returns
+    """
+    start = time.monotonic()
+    if conditions:
+        load_page(driver, url, *conditions, deadline=deadline)
+    else:
+        driver.get(url)
+    snapshot = PageSnapshot(url, driver.current_url, driver.page_source, _read_timings(driver))
+    snapshot.timings["navigation"] = round(time.monotonic() - start, 3)
+    logging.info(f"Captured snapshot of {url} in {snapshot.timings['navigation']:.1f}s")
+    return snapshot
@@ -0,0 +1,162 @@
+"""
+Parallel row processing for the updater scripts.
+
+Each worker thread owns its own Chrome instance and pulls rows from a shared
+DomainScheduler, so a slow page on one row never holds up the rows behind it
+and no single host gets hammered. Results are handed back to the calling
+thread, which stays the only place that touches the workbook.
+
+Each worker's browser is wrapped in a ManagedDriver, which reuses the session
+across rows and recycles it after a crash or when its page/memory limits are hit.
+"""
+
+import logging
+import queue
+import threading
+
+from src.domain_scheduler import DomainScheduler, DEFAULT_MAX_IN_FLIGHT, DEFAULT_MIN_INTERVAL
+from src.driver_manager import ManagedDriver
+
+
+def _prefetch(spare, job, label):
+    """Start loading job's URL in the spare tab; a failure just means no head start."""
+    try:
+        driver = spare.acquire()
+        prefetch = getattr(driver, "prefetch", None)
+        if prefetch is None:
+            return
+        prefetch(job[1])
+        logging.info(f"{label}: prefetching row {job[0]}: {job[1]}")
+    except Exception as e:
+        logging.info(f"{label}: could not prefetch {job[1]}: {e}")
+
+
+def _process_jobs(scheduler, process_row, manager, label, stop_event=None, driver_stats=None, spare=None):
+    """
+    Worker loop shared by the serial and threaded modes: take jobs from the
+    scheduler until it runs dry and yield (row, url, result) for each.
+    With a spare driver, the next job's page starts loading in the spare tab
+    while the current job is processed, then the two swap roles.
+    Raises if the browser cannot be started.
+    """
+    managers = [manager] + ([spare] if spare is not None else [])
+    next_job = None
+    try:
+        manager.acquire()
+        while stop_event is None or not stop_event.is_set():
+            job = next_job or scheduler.acquire()
+            next_job = None
+            if job is None:
+                break
+            if spare is not None:
+                # Only a job that may start right away is taken early
+                next_job = scheduler.acquire(block=False)
+                if next_job is not None:
+                    _prefetch(spare, next_job, label)
+            row, url = job
+            error = None
+            try:
+                result = process_row(manager.acquire(), row, url)
+            except Exception as e:
+                logging.error(f"{label}: row {row} failed for {url}: {e}", exc_info=True)
+                error = e
+                result = {"error": f"Worker error: {e}"}
+            finally:
+                scheduler.release(job)
+            manager.page_done(error)
+            yield row, url, result
+            if next_job is not None:
+                manager, spare = spare, manager
+    finally:
+        if next_job is not None:
+            scheduler.release(next_job)
+        for managed in managers:
+            managed.close()
+            if driver_stats is not None:
+                driver_stats.append(managed.stats())
+
+
+def run_rows(rows_urls, process_row, create_driver, workers=1,
+             max_per_domain=DEFAULT_MAX_IN_FLIGHT, domain_delay=DEFAULT_MIN_INTERVAL,
+             max_pages_per_driver=None, max_driver_rss_mb=None, driver_stats=None, prefetch=False):
+    """
+    Process spreadsheet rows with a pool of isolated WebDriver instances.
+
+    Args:
+        rows_urls: dict mapping row number -> URL
+        process_row: callable(driver, row, url) returning the row result
+        create_driver: callable() returning a new WebDriver; called once per worker
+        workers: number of concurrent drivers (1 keeps a single serial browser)
+        max_per_domain: max rows in flight per registrable domain
+        domain_delay: minimum seconds between row starts on the same domain
+        max_pages_per_driver: recycle a worker's browser after this many rows (None = never)
+        max_driver_rss_mb: recycle a worker's browser above this memory use in MB (None = never)
+        driver_stats: optional list that receives one ManagedDriver.stats() dict per worker
+                      (two with prefetch)
+        prefetch: give each worker a second driver that starts loading its next row
+                  while the current one is processed; create_driver must return
+                  drivers with a prefetch(url) method (src.tab_pool.TabDriver)
+
+    Yields:
+        (row, url, result) tuples in completion order. The caller is expected to
+        key results by row, so the order rows finish in does not matter.
+    """
+    scheduler = DomainScheduler(rows_urls, max_in_flight=max_per_domain, min_interval=domain_delay)
+
+    def new_manager(label):
+        return ManagedDriver(create_driver, max_pages=max_pages_per_driver,
+                             max_rss_mb=max_driver_rss_mb, label=label)
+
+    def new_spare(label):
+        return new_manager(f"{label} spare") if prefetch else None
+
+    if workers <= 1 or len(rows_urls) <= 1:
+        # Serial mode runs in the calling thread on a single browser
+        try:
+            yield from _process_jobs(scheduler, process_row, new_manager("Worker 1"),
+                                     "Worker 1", driver_stats=driver_stats, spare=new_spare("Worker 1"))
+        except Exception as e:
+            logging.error(f"Worker 1: could not start browser: {e}")
+            for row, url in scheduler.drain():
+                yield row, url, {"error": "No browser worker available to process row"}
+        return
+
+    workers = min(workers, len(rows_urls))
+    results = queue.Queue()
+    stop_event = threading.Event()
+
+    def worker(worker_id):
+        label = f"Worker {worker_id}"
+        try:
+            for item in _process_jobs(scheduler, process_row, new_manager(label),
+                                      label, stop_event, driver_stats, new_spare(label)):
+                results.put(item)
+        except Exception as e:
+            logging.error(f"{label}: could not start browser: {e}")
+        finally:
+            results.put(None)  # Sentinel: this worker is done
+
+    threads = [
+        threading.Thread(target=worker, args=(i + 1,), name=f"row-worker-{i + 1}", daemon=True)
+        for i in range(workers)
+    ]
+    logging.info(f"Starting {workers} browser workers for {len(rows_urls)} rows")
+    for thread in threads:
+        thread.start()
+
+    try:
+        finished_workers = 0
+        while finished_workers < len(threads):
+            item = results.get()
+            if item is None:
+                finished_workers += 1
+                continue
+            yield item
+
+        # If every worker died (e.g. Chrome failed to start), report the leftovers
+        for row, url in scheduler.drain():
+            yield row, url, {"error": "No browser worker available to process row"}
+    finally:
+        stop_event.set()
+        for thread in threads:
+            thread.join(timeout=5)
@@ -0,0 +1,53 @@
+"""
+Deferred imports for extractor plugins and heavy optional dependencies.
+
+Importing excel_stock_updater used to import every site extractor and every
+optional library (groq, bf4py, openpyxl) up front, although a run or a test
+usually needs a handful of them. Extractors now live in plugin modules named by
+"module:attribute" references that load_plugin() imports the first time they
+are needed, and optional libraries are checked with module_available(), which
+finds a module without importing it.
+"""
+
+import importlib
+import importlib.util
+import sys
+
+_loaded = {}
+
+
+def module_available(name):
+    """True if the module can be imported, without importing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def load_plugin(reference):
+    """
+    Resolve a plugin reference, importing its module on first use.
+
+    Args:
+        reference: "package.module:attribute" (e.g. "src.price_extractors.tmx:get_tmx_price");
+            anything else (e.g. a function) is returned unchanged
+
+    Returns:
+        The referenced attribute
+    """
+    if not isinstance(reference, str):
+        return reference
+    target = _loaded.get(reference)
+    if target is None:
+        module_name, _, attribute = reference.partition(":")
+        if not attribute:
+            raise ValueError(f"Plugin reference {reference!r} must look like 'module:attribute'")
+        module = importlib.import_module(module_name)
+        target = _loaded[reference] = getattr(module, attribute)
+    return target
+
+
+def is_loaded(reference):
+    """True if the module of a plugin reference has been imported."""
+    module_name = reference.partition(":")[0]
+    return module_name in sys.modules
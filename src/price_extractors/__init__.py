@@ -0,0 +1,8 @@
+"""
+Site-specific price extractors, one module per site.
+
+excel_stock_updater registers them in PRICE_EXTRACTORS by "module:function"
+reference, so a module is imported the first time one of its site's URLs is
+dispatched instead of when excel_stock_updater is imported. Each extractor
+takes (driver, url) and returns the price or raises ValueError.
+"""
@@ -0,0 +1,198 @@
+"""
+Price extractors for AMINA Group product pages (aminagroup.com).
+"""
+
+import logging
+import re
+import time
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from src.html_parsing import parse_html
+
+
+def get_aminagroup_price(driver, url):
+    """
+    Enhanced function to extract price from aminagroup.com URLs.
+    Handles popups, consent dialogs, and has multiple retry attempts.
+    Returns a float or raises ValueError.
+    """
+    max_retries = 3
+    
+    for attempt in range(max_retries):
+        try:
+            logging.info(f"Amina Group attempt {attempt + 1} of {max_retries} for URL: {url}")
+            driver.get(url)
+            
+            # Wait for initial page load
+            WebDriverWait(driver, 20).until(
+                EC.presence_of_element_located((By.TAG_NAME, "body"))
+            )
+            
+            # Handle potential cookie/consent popup
+            try:
+                # Look for common consent/cookie buttons
+                consent_selectors = [
+                    "//button[contains(text(), 'Accept')]",
+                    "//button[contains(text(), 'Continue')]", 
+                    "//button[contains(text(), 'OK')]",
+                    "//button[contains(text(), 'Agree')]",
+                    "//button[@id='accept']",
+                    "//button[@class*='accept']",
+                    "//button[@class*='consent']",
+                    "//*[contains(@class, 'cookie') and contains(@class, 'accept')]//button",
+                    "//*[contains(@class, 'consent') and contains(@class, 'accept')]//button",
+                ]
+                
+                for selector in consent_selectors:
+                    try:
+                        button = WebDriverWait(driver, 3).until(
+                            EC.element_to_be_clickable((By.XPATH, selector))
+                        )
+                        button.click()
+                        logging.info(f"Clicked consent button with selector: {selector}")
+                        time.sleep(2)
+                        break
+                    except:
+                        continue
+                        
+            except Exception:
+                pass  # No consent popup found or couldn't handle
+            
+            # Wait for content to load after popup handling
+            time.sleep(3)
+            
+            # Try to find price using multiple methods
+            soup = parse_html(driver.page_source)
+            page_text = soup.get_text(" ", strip=True)
+            
+            # Method 1: Look for "Current price" with specific formatting (most reliable)
+            try:
+                current_price_patterns = [
+                    r'Current\s+price\s+([\d,\.]+)\s+USD',  # "Current price 8.0734 USD*"
+                    r'Current\s+Price\s+([\d,\.]+)\s+USD',  # "Current Price 8.0734 USD*"
+                    r'Current\s+price[^\d]*?([\d,\.]+)',    # "Current price 8.0734"
+                    r'Current\s+Price[^\d]*?([\d,\.]+)',    # "Current Price 8.0734"
+                ]
+                
+                for pattern in current_price_patterns:
+                    matches = re.finditer(pattern, page_text, re.IGNORECASE)
+                    for match in matches:
+                        price_str = match.group(1)
+                        try:
+                            price_value = float(price_str.replace(',', ''))
+                            if 0.01 <= price_value <= 100000:  # Reasonable range
+                                logging.info(f"Found Amina Group current price: {price_value}")
+                                return price_value
+                        except ValueError:
+                            continue
+            except Exception as e:
+                logging.error(f"Error in Amina Group current price method: {e}")
+            
+            # Method 2: Look in structured data (JSON-LD, microdata)
+            try:
+                scripts = soup.find_all('script', type='application/ld+json')
+                for script in scripts:
+                    try:
+                        import json
+                        data = json.loads(script.string)
+                        # Look for price in structured data
+                        if isinstance(data, dict):
+                            price = data.get('price') or data.get('currentPrice') or data.get('value')
+                            if price and isinstance(price, (int, float, str)):
+                                price_value = float(str(price).replace(',', ''))
+                                if 0.01 <= price_value <= 100000:
+                                    logging.info(f"Found Amina Group price in structured data: {price_value}")
+                                    return price_value
+                    except:
+                        continue
+            except Exception as e:
+                logging.error(f"Error in Amina Group structured data method: {e}")
+            
+            # Method 3: Look for price near specific elements
+            try:
+                # Find elements that might contain the price
+                price_containers = soup.find_all(['div', 'span', 'p', 'td', 'li'], 
+                    string=re.compile(r'Current\s+(price|Price)', re.IGNORECASE))
+                
+                for container in price_containers:
+                    # Look in the same element and nearby elements
+                    for element in [container, container.parent, container.find_next_sibling()]:
+                        if element:
+                            element_text = element.get_text(' ', strip=True)
+                            price_match = re.search(r'([\d,\.]+)', element_text)
+                            if price_match:
+                                price_str = price_match.group(1)
+                                try:
+                                    price_value = float(price_str.replace(',', ''))
+                                    if 0.01 <= price_value <= 100000:
+                                        logging.info(f"Found Amina Group price near current price element: {price_value}")
+                                        return price_value
+                                except ValueError:
+                                    continue
+            except Exception as e:
+                logging.error(f"Error in Amina Group element method: {e}")
+            
+            # Method 4: Look for NAV patterns as fallback
+            try:
+                nav_patterns = [
+                    r'NAV[^\d]*?([\d,\.]+)',                       # "NAV 1.0"
+                    r'Net\s+Asset\s+Value[^\d]*?([\d,\.]+)',       # "Net Asset Value 1.0"
+                ]
+                
+                for pattern in nav_patterns:
+                    matches = re.finditer(pattern, page_text, re.IGNORECASE)
+                    for match in matches:
+                        price_str = match.group(1)
+                        try:
+                            price_value = float(price_str.replace(',', ''))
+                            if 1.01 <= price_value <= 100000:  # Exclude exactly 1.0 which is suspicious
+                                logging.info(f"Found Amina Group NAV: {price_value}")
+                                return price_value
+                        except ValueError:
+                            continue
+            except Exception as e:
+                logging.error(f"Error in Amina Group NAV method: {e}")
+            
+            # Method 5: Look for any price-like patterns in tables or lists
+            try:
+                tables = soup.find_all('table')
+                for table in tables:
+                    rows = table.find_all('tr')
+                    for row in rows:
+                        row_text = row.get_text(' ', strip=True)
+                        if 'current' in row_text.lower() and 'price' in row_text.lower():
+                            price_match = re.search(r'([\d,\.]+)', row_text)
+                            if price_match:
+                                price_str = price_match.group(1)
+                                try:
+                                    price_value = float(price_str.replace(',', ''))
+                                    if 0.01 <= price_value <= 100000:
+                                        logging.info(f"Found Amina Group price in table: {price_value}")
+                                        return price_value
+                                except ValueError:
+                                    continue
+            except Exception as e:
+                logging.error(f"Error in Amina Group table method: {e}")
+            
+            # If we get here, we couldn't find the price on this attempt
+            if attempt < max_retries - 1:
+                logging.warning(f"Amina Group price not found on attempt {attempt + 1}, retrying...")
+                time.sleep(2)
+                continue
+            else:
+                # Log debug info for the last attempt
+                logging.error(f"Amina Group debug info for {url}:")
+                logging.error(f"Page title: {soup.find('title').get_text() if soup.find('title') else 'No title'}")
+                logging.error(f"Page text preview: {page_text[:500]}...")
+                raise ValueError("Could not find current price on Amina Group page after all attempts")
+                
+        except Exception as e:
+            if attempt < max_retries - 1:
+                logging.warning(f"Amina Group error on attempt {attempt + 1}: {e}, retrying...")
+                time.sleep(3)
+                continue
+            else:
+                raise ValueError(f"Amina Group failed to extract price after {max_retries} attempts: {e}")
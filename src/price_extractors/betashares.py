@@ -0,0 +1,81 @@
+"""
+Price extractors for BetaShares fund pages (betashares.com.au).
+"""
+
+import logging
+import re
+
+from src.html_parsing import parse_html
+from src.readiness import load_page, TextMatches, NetworkIdle
+
+
+def get_betashares_price(driver, url):
+    """
+    Navigate to a BetaShares ETF page and scrape the most accurate market price.
+    Prioritizes NAV/Unit over current price for better precision.
+    Returns a float or raises ValueError.
+    """
+    # Continue as soon as the NAV/Unit (preferred over current price) has rendered
+    load_page(
+        driver, url,
+        TextMatches(r'NAV(/|\s+per\s+)Unit[^$]{0,40}\$\s*\d+\.\d'),
+        NetworkIdle(quiet_period=3),
+        deadline=15,
+        stop_loading=True,
+    )
+
+    soup = parse_html(driver.page_source)
+    
+    # Method 1: Look for NAV/Unit (most accurate)
+    try:
+        page_text = soup.get_text(" ", strip=True)
+        
+        # Look for NAV/Unit patterns (highest priority)
+        nav_patterns = [
+            r'NAV/Unit[^$]*\$\s*([\d,\.]+)',           # "NAV/Unit* $7.04"
+            r'NAV\s+per\s+Unit[^$]*\$\s*([\d,\.]+)',   # "NAV per Unit $7.04"
+            r'Net\s+Asset\s+Value[^$]*\$\s*([\d,\.]+)', # "Net Asset Value $7.04"
+        ]
+        
+        for pattern in nav_patterns:
+            matches = re.finditer(pattern, page_text, re.IGNORECASE)
+            for match in matches:
+                price_str = match.group(1)
+                try:
+                    price_value = float(price_str.replace(',', ''))
+                    # Look for reasonable ETF prices with decimals
+                    if 1 <= price_value <= 500 and price_value != int(price_value):
+                        logging.info(f"Found BetaShares NAV/Unit: ${price_value}")
+                        return price_value
+                except ValueError:
+                    continue
+    except Exception as e:
+        logging.error(f"Error with BetaShares NAV method: {e}")
+    
+    # Method 2: Look for Current Price with better precision
+    try:
+        # Look for current price patterns with decimal precision
+        price_patterns = [
+            r'Current\s+price[^$]*\$\s*([\d,\.]+)',    # "Current price $ 6.92"
+            r'Last\s+trade[^$]*\$\s*([\d,\.]+)',       # "Last trade* $ 6.92"
+            r'Market\s+Price[^$]*\$\s*([\d,\.]+)',     # "Market Price $6.92"
+            r'Bid[^$]*\$\s*([\d,\.]+)',                # "Bid (delayed) $ 6.93"
+            r'Offer[^$]*\$\s*([\d,\.]+)',              # "Offer (delayed) $ 6.99"
+        ]
+        
+        for pattern in price_patterns:
+            matches = re.finditer(pattern, page_text, re.IGNORECASE)
+            for match in matches:
+                price_str = match.group(1)
+                try:
+                    price_value = float(price_str.replace(',', ''))
+                    # Look for reasonable ETF prices with decimals
+                    if 1 <= price_value <= 500 and price_value != int(price_value):
+                        logging.info(f"Found BetaShares current price: ${price_value}")
+                        return price_value
+                except ValueError:
+                    continue
+    except Exception as e:
+        logging.error(f"Error with BetaShares current price method: {e}")
+    
+    raise ValueError("Could not find valid market price on BetaShares page")
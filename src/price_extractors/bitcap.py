@@ -0,0 +1,81 @@
+"""
+Price extractors for Bitcap fund pages (bitcap.com).
+"""
+
+import logging
+import re
+import time
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+
+from src.html_parsing import parse_html
+
+
+def enhanced_bitcap_price_extraction(driver, url):
+    """
+    Enhanced Bitcap price extraction with cookie consent handling.
+    Addresses red cell errors due to consent barriers.
+    """
+    driver.get(url)
+    
+    # Handle cookie consent
+    try:
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.TAG_NAME, "body"))
+        )
+        
+        consent_selectors = [
+            "button[id*='accept']", "button[class*='accept']",
+            "button[id*='consent']", "button[class*='consent']",
+            "a[id*='accept']", "a[class*='accept']",
+            ".cookie-accept", "#cookie-accept",
+            ".accept-cookies", "#accept-cookies"
+        ]
+        
+        for selector in consent_selectors:
+            try:
+                consent_button = driver.find_element(By.CSS_SELECTOR, selector)
+                if consent_button.is_displayed():
+                    consent_button.click()
+                    logging.info(f"Enhanced Bitcap: Clicked consent button")
+                    time.sleep(3)
+                    break
+            except:
+                continue
+        
+        time.sleep(8)
+        
+    except TimeoutException:
+        raise ValueError("Timed out waiting for Bitcap page to load")
+
+    soup = parse_html(driver.page_source)
+    
+    # Check if still blocked by consent
+    page_text = soup.get_text(" ", strip=True).lower()
+    if any(keyword in page_text for keyword in ['cookie', 'consent', 'accept', 'privacy']):
+        if len(page_text) < 1000:
+            raise ValueError("Blocked by cookie consent - manual intervention needed")
+    
+    # Look for fund price information
+    try:
+        fund_sections = soup.find_all(['div', 'section'], 
+                                    class_=re.compile(r'(fund|price|nav|performance)', re.I))
+        for section in fund_sections:
+            text = section.get_text(strip=True)
+            price_match = re.search(r'([\d,]+\.[\d]{2,})\s*(?:EUR|USD|€|\$)', text)
+            if price_match:
+                try:
+                    price_str = price_match.group(1).replace(',', '')
+                    price = float(price_str)
+                    if 0.1 <= price <= 10000:
+                        logging.info(f"Enhanced Bitcap: Found price: {price}")
+                        return price
+                except ValueError:
+                    continue
+    except Exception as e:
+        logging.debug(f"Enhanced Bitcap method failed: {e}")
+    
+    raise ValueError("Could not extract valid price from Bitcap page")
@@ -0,0 +1,76 @@
+"""
+Price extractors for BX Swiss instrument pages (bxswiss.com/instruments).
+"""
+
+import logging
+import re
+import time
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+
+from src.html_parsing import parse_html
+
+
+def get_bxswiss_price(driver, url):
+    """
+    Navigate to a BX Swiss instrument page and scrape the last traded price.
+    Returns a float or raises ValueError.
+    """
+    driver.get(url)
+    try:
+        # Wait for the page to load
+        WebDriverWait(driver, 30).until(
+            EC.presence_of_element_located((By.TAG_NAME, "body"))
+        )
+        
+        # Allow extra time for JavaScript content to load
+        time.sleep(5)
+    except TimeoutException:
+        raise ValueError("Timed out waiting for page to load")
+
+    soup = parse_html(driver.page_source)
+    
+    # Try to find the last traded price in the instrument details
+    try:
+        # Look for a label containing "Last traded"
+        last_traded_elements = soup.find_all(text=re.compile(r"Last traded", re.IGNORECASE))
+        
+        for element in last_traded_elements:
+            # Check the text of the element and nearby elements for a price
+            price_text = element.parent.get_text() if element.parent else ""
+            
+            # Look for currency code followed by numeric value
+            currency_price_match = re.search(r'([A-Z]{3})\s*([\d,\.]+)', price_text)
+            if currency_price_match:
+                currency = currency_price_match.group(1)
+                price_str = currency_price_match.group(2)
+                logging.info(f"Found price: {currency} {price_str}")
+                
+                # Normalize number format
+                price_normalized = price_str.replace(',', '.')
+                return float(price_normalized)
+    except (ValueError, AttributeError) as e:
+        logging.error(f"Error extracting BX Swiss price: {e}")
+    
+    # Try a more general approach if specific element wasn't found
+    try:
+        # Look for text patterns like "Last traded USD 9.365" in the entire page
+        page_text = soup.get_text(" ", strip=True)
+        last_traded_pattern = re.compile(r'Last traded\s+([A-Z]{3})\s+([\d,\.]+)', re.IGNORECASE)
+        match = last_traded_pattern.search(page_text)
+        
+        if match:
+            currency = match.group(1)
+            price_str = match.group(2)
+            logging.info(f"Found price using page text: {currency} {price_str}")
+            
+            # Normalize number format
+            price_normalized = price_str.replace(',', '.')
+            return float(price_normalized)
+    except (ValueError, AttributeError) as e:
+        logging.error(f"Error extracting BX Swiss price from page text: {e}")
+    
+    raise ValueError("Could not find last traded price on BX Swiss page")
@@ -0,0 +1,240 @@
+"""
+Price extractors for CBOE US and Australia quote pages (cboe.com/us, cboe.com/au).
+"""
+
+import logging
+import re
+import time
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+
+from src.html_parsing import parse_html
+
+
+def get_cboe_us_price(driver, url):
+    """
+    Navigate to a CBOE US equities page and scrape the last price.
+    Returns a float or raises ValueError.
+    """
+    driver.get(url)
+    try:
+        # Wait for the page to load
+        WebDriverWait(driver, 30).until(
+            EC.presence_of_element_located((By.TAG_NAME, "body"))
+        )
+        
+        # Allow extra time for JavaScript content to load
+        time.sleep(5)
+    except TimeoutException:
+        raise ValueError("Timed out waiting for CBOE US page to load")
+
+    soup = parse_html(driver.page_source)
+    
+    # Method 1: Look for "Last Price" label and value
+    try:
+        page_text = soup.get_text(" ", strip=True)
+        
+        # Look for patterns like "Last Price 12.81"
+        last_price_patterns = [
+            r'Last\s+Price\s+([\d,\.]+)',  # "Last Price 12.81"
+            r'Last\s+Price:\s*([\d,\.]+)', # "Last Price: 12.81"
+            r'Last\s+Price\s*\$\s*([\d,\.]+)', # "Last Price $12.81"
+        ]
+        
+        for pattern in last_price_patterns:
+            match = re.search(pattern, page_text, re.IGNORECASE)
+            if match:
+                price_str = match.group(1)
+                try:
+                    price_value = float(price_str.replace(',', ''))
+                    if 0.01 <= price_value <= 100000:  # Reasonable price range
+                        logging.info(f"Found CBOE US price using pattern '{pattern}': {price_value}")
+                        return price_value
+                except ValueError:
+                    continue
+    except Exception as e:
+        logging.error(f"Error with CBOE US pattern method: {e}")
+    
+    # Method 2: Look for table rows or data elements containing "Last Price"
+    try:
+        # Look for table cells, divs, spans that might contain price data
+        elements = soup.find_all(['td', 'th', 'div', 'span'])
+        for element in elements:
+            element_text = element.get_text().strip()
+            if 'last price' in element_text.lower():
+                # Extract number from this element or nearby elements
+                price_match = re.search(r'([\d,\.]+)', element_text)
+                if price_match:
+                    price_str = price_match.group(1)
+                    try:
+                        price_value = float(price_str.replace(',', ''))
+                        if 0.01 <= price_value <= 100000:
+                            logging.info(f"Found CBOE US price in element: {price_value}")
+                            return price_value
+                    except ValueError:
+                        continue
+                
+                # Check next sibling for price value
+                next_sibling = element.find_next_sibling()
+                if next_sibling:
+                    sibling_text = next_sibling.get_text().strip()
+                    price_match = re.search(r'([\d,\.]+)', sibling_text)
+                    if price_match:
+                        price_str = price_match.group(1)
+                        try:
+                            price_value = float(price_str.replace(',', ''))
+                            if 0.01 <= price_value <= 100000:
+                                logging.info(f"Found CBOE US price in sibling: {price_value}")
+                                return price_value
+                        except ValueError:
+                            continue
+    except Exception as e:
+        logging.error(f"Error with CBOE US element method: {e}")
+    
+    # Method 3: Look for CSS selectors that might contain price data
+    try:
+        price_selectors = [
+            ".last-price",
+            ".price-value",
+            ".market-price",
+            ".quote-price",
+            "[data-price]",
+            ".price"
+        ]
+        
+        for selector in price_selectors:
+            elements = soup.select(selector)
+            for element in elements:
+                text = element.get_text().strip()
+                price_match = re.search(r'([\d,\.]+)', text)
+                if price_match and len(text) < 50:
+                    price_str = price_match.group(1)
+                    try:
+                        price_value = float(price_str.replace(',', ''))
+                        if 0.01 <= price_value <= 100000:
+                            logging.info(f"Found CBOE US price using selector '{selector}': {price_value}")
+                            return price_value
+                    except ValueError:
+                        continue
+    except Exception as e:
+        logging.error(f"Error with CBOE US selector method: {e}")
+    
+    raise ValueError("Could not find last price on CBOE US page")
+
+
+def get_cboe_au_price(driver, url):
+    """
+    Navigate to a CBOE AU equities page and scrape the last traded price.
+    Returns a float or raises ValueError.
+    """
+    driver.get(url)
+    try:
+        # Wait for the page to load
+        WebDriverWait(driver, 30).until(
+            EC.presence_of_element_located((By.TAG_NAME, "body"))
+        )
+        
+        # Allow extra time for JavaScript content to load
+        time.sleep(5)
+    except TimeoutException:
+        raise ValueError("Timed out waiting for CBOE AU page to load")
+
+    soup = parse_html(driver.page_source)
+    
+    # Method 1: Look for "Last Traded / Best Bid" label and value
+    try:
+        page_text = soup.get_text(" ", strip=True)
+        
+        # Look for patterns like "Last Traded / Best Bid (AUD) 16.810"
+        last_traded_patterns = [
+            r'Last\s+Traded\s*/\s*Best\s+Bid\s*\([^)]+\)\s*([\d,\.]+)',  # "Last Traded / Best Bid (AUD) 16.810"
+            r'Last\s+Traded\s*(?:/\s*Best\s+Bid)?\s*([\d,\.]+)',         # "Last Traded 16.810"
+            r'Best\s+Bid\s*\([^)]+\)\s*([\d,\.]+)',                      # "Best Bid (AUD) 16.810"
+            r'Last\s+Price\s*\([^)]+\)\s*([\d,\.]+)',                    # "Last Price (AUD) 16.810"
+        ]
+        
+        for pattern in last_traded_patterns:
+            match = re.search(pattern, page_text, re.IGNORECASE)
+            if match:
+                price_str = match.group(1)
+                try:
+                    price_value = float(price_str.replace(',', ''))
+                    if 0.01 <= price_value <= 100000:  # Reasonable price range
+                        logging.info(f"Found CBOE AU price using pattern '{pattern}': {price_value}")
+                        return price_value
+                except ValueError:
+                    continue
+    except Exception as e:
+        logging.error(f"Error with CBOE AU pattern method: {e}")
+    
+    # Method 2: Look for table rows or data elements containing price labels
+    try:
+        # Look for table cells, divs, spans that might contain price data
+        elements = soup.find_all(['td', 'th', 'div', 'span'])
+        for element in elements:
+            element_text = element.get_text().strip()
+            # Check for various price-related keywords
+            if any(keyword in element_text.lower() for keyword in ['last traded', 'best bid', 'last price']):
+                # Extract number from this element or nearby elements
+                price_match = re.search(r'([\d,\.]+)', element_text)
+                if price_match:
+                    price_str = price_match.group(1)
+                    try:
+                        price_value = float(price_str.replace(',', ''))
+                        if 0.01 <= price_value <= 100000:
+                            logging.info(f"Found CBOE AU price in element: {price_value}")
+                            return price_value
+                    except ValueError:
+                        continue
+                
+                # Check next sibling for price value
+                next_sibling = element.find_next_sibling()
+                if next_sibling:
+                    sibling_text = next_sibling.get_text().strip()
+                    price_match = re.search(r'([\d,\.]+)', sibling_text)
+                    if price_match:
+                        price_str = price_match.group(1)
+                        try:
+                            price_value = float(price_str.replace(',', ''))
+                            if 0.01 <= price_value <= 100000:
+                                logging.info(f"Found CBOE AU price in sibling: {price_value}")
+                                return price_value
+                        except ValueError:
+                            continue
+    except Exception as e:
+        logging.error(f"Error with CBOE AU element method: {e}")
+    
+    # Method 3: Look for CSS selectors that might contain price data
+    try:
+        price_selectors = [
+            ".last-traded",
+            ".best-bid",
+            ".last-price",
+            ".price-value",
+            ".market-price",
+            ".quote-price",
+            "[data-price]",
+            ".price"
+        ]
+        
+        for selector in price_selectors:
+            elements = soup.select(selector)
+            for element in elements:
+                text = element.get_text().strip()
+                price_match = re.search(r'([\d,\.]+)', text)
+                if price_match and len(text) < 50:
+                    price_str = price_match.group(1)
+                    try:
+                        price_value = float(price_str.replace(',', ''))
+                        if 0.01 <= price_value <= 100000:
+                            logging.info(f"Found CBOE AU price using selector '{selector}': {price_value}")
+                            return price_value
+                    except ValueError:
+                        continue
+    except Exception as e:
+        logging.error(f"Error with CBOE AU selector method: {e}")
+    
+    raise ValueError("Could not find last traded price on CBOE AU page")
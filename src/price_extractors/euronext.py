@@ -0,0 +1,133 @@
+"""
+Price extractors for Euronext live quote pages (live.euronext.com).
+"""
+
+import logging
+import re
+
+from src.html_parsing import parse_html
+from src.readiness import load_page, Selector, TextMatches, NetworkIdle
+
+
+def get_euronext_price(driver, url):
+    """
+    Navigate to a Euronext live page and scrape the share/valuation price.
+    Returns a float or raises ValueError.
+    """
+    # Continue as soon as a price block or a labelled price has rendered
+    load_page(
+        driver, url,
+        Selector("div.stock-infos span.stock-price, span.last-price, div.valuation-price, "
+                 "div.quote-page__price, .product-price, td.euronext-last-price"),
+        TextMatches(r'(valuation|last|share) price\W{0,20}[€$£]\s*\d'),
+        NetworkIdle(),
+        deadline=10,
+        stop_loading=True,
+    )
+
+    # Save the page source to a string for debugging and easier manipulation
+    page_source = driver.page_source
+    soup = parse_html(page_source)
+    
+    # Log some debug info about what we're searching for
+    logging.debug(f"Looking for valuation price in Euronext page: {url}")
+    
+    # First approach: Look for specific price elements with class names that Euronext might use
+    try:
+        # Try multiple CSS selectors that might contain price information
+        selectors = [
+            "div.stock-infos span.stock-price", 
+            "div.stock-info span.price",
+            "td.euronext-last-price",
+            "span.last-price",
+            "div.price-box",
+            "div.valuation-price",
+            "div.quote-page__price",
+            ".full-data div.data-value",
+            ".product-data div.data-value",
+            ".product-price"
+        ]
+        
+        for selector in selectors:
+            elements = soup.select(selector)
+            for element in elements:
+                text = element.get_text().strip()
+                # Look for currency symbol followed by number
+                match = re.search(r'[€$£]\s*([\d,\.]+)', text)
+                if match:
+                    price_str = match.group(1)
+                    # Handle European number format (replace comma with dot)
+                    price_normalized = price_str.replace(',', '.')
+                    logging.info(f"Found Euronext price using selector '{selector}': {price_normalized}")
+                    return float(price_normalized)
+    except Exception as e:
+        logging.error(f"Error extracting Euronext price using selectors: {e}")
+    
+    # Second approach: Look for tables with price data
+    try:
+        # Find all table rows
+        rows = soup.find_all('tr')
+        for row in rows:
+            # Get the text of the row
+            row_text = row.get_text(" ", strip=True).lower()
+            # Look for rows containing "valuation price" or similar labels
+            if "valuation price" in row_text or "last price" in row_text or "share price" in row_text:
+                # Try to extract a price from this row
+                match = re.search(r'[€$£]\s*([\d,\.]+)', row_text)
+                if match:
+                    price_str = match.group(1)
+                    price_normalized = price_str.replace(',', '.')
+                    logging.info(f"Found Euronext price in table row: {price_normalized}")
+                    return float(price_normalized)
+    except Exception as e:
+        logging.error(f"Error extracting Euronext price from tables: {e}")
+    
+    # Third approach: Extract all possible prices from the page and select the most likely one
+    try:
+        # Find all text containing currency symbols
+        all_text = soup.get_text(" ", strip=True)
+        price_matches = re.finditer(r'(valuation price|last price|share price|price)?\s*[€$£]\s*([\d,\.]+)', all_text, re.IGNORECASE)
+        
+        candidates = []
+        for match in price_matches:
+            label = match.group(1) if match.group(1) else ""
+            price_str = match.group(2)
+            price_normalized = price_str.replace(',', '.')
+            
+            try:
+                price_value = float(price_normalized)
+                # Give higher priority to matches with a label
+                priority = 2 if label else 1
+                candidates.append((priority, price_value, label))
+            except ValueError:
+                continue
+        
+        # Sort by priority (labeled prices first)
+        candidates.sort(reverse=True)
+        
+        if candidates:
+            # Take the highest priority price
+            _, best_price, label = candidates[0]
+            label_info = f" (labeled as '{label}')" if label else ""
+            logging.info(f"Found Euronext price{label_info}: {best_price}")
+            return best_price
+    except Exception as e:
+        logging.error(f"Error extracting Euronext prices with general approach: {e}")
+    
+    # Final approach: Look for any number that might be a price
+    try:
+        # Find a string that matches € followed by a number, anywhere in the page
+        all_text = soup.get_text(" ", strip=True)
+        price_pattern = re.compile(r'€\s*([\d,\.]+)', re.IGNORECASE)
+        matches = price_pattern.findall(all_text)
+        
+        if matches:
+            # Take the first match
+            price_str = matches[0]
+            price_normalized = price_str.replace(',', '.')
+            logging.info(f"Found Euronext price with fallback method: {price_normalized}")
+            return float(price_normalized)
+    except Exception as e:
+        logging.error(f"Error extracting Euronext price with fallback method: {e}")
+    
+    raise ValueError("Could not find valuation price on Euronext page")
@@ -0,0 +1,121 @@
+"""
+Price extractors for Franklin Templeton fund pages (franklintempleton.com).
+"""
+
+import logging
+import re
+import time
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+
+from src.html_parsing import parse_html
+
+
+def get_franklin_templeton_price(driver, url):
+    """
+    Navigate to a Franklin Templeton ETF page and scrape the market price or NAV.
+    Returns a float or raises ValueError.
+    """
+    driver.get(url)
+    try:
+        # Wait for the page to load
+        WebDriverWait(driver, 30).until(
+            EC.presence_of_element_located((By.TAG_NAME, "body"))
+        )
+        
+        # Allow extra time for JavaScript content to load (Franklin Templeton loads prices dynamically)
+        time.sleep(8)
+    except TimeoutException:
+        raise ValueError("Timed out waiting for Franklin Templeton page to load")
+
+    soup = parse_html(driver.page_source)
+    
+    # Method 1: Look for "Market Price" patterns (most reliable for ETFs)
+    try:
+        page_text = soup.get_text(" ", strip=True)
+        
+        # Look for Market Price patterns - these are the primary price indicators for ETFs
+        market_price_patterns = [
+            r'Market\s+Price[^$]*\$\s*([\d,\.]+)',     # "Market Price $XX.XX"
+            r'Market\s+Price.*?\$\s*([\d,\.]+)',       # "Market Price ... $XX.XX"
+        ]
+        
+        for pattern in market_price_patterns:
+            matches = re.finditer(pattern, page_text, re.IGNORECASE)
+            for match in matches:
+                price_str = match.group(1)
+                logging.info(f"Found Franklin Templeton Market Price: ${price_str}")
+                
+                try:
+                    price_value = float(price_str.replace(',', ''))
+                    if 0.01 <= price_value <= 10000:  # Reasonable ETF price range
+                        return price_value
+                except ValueError:
+                    continue
+    except Exception as e:
+        logging.error(f"Error with Franklin Templeton Market Price method: {e}")
+    
+    # Method 2: Look for NAV (Net Asset Value) patterns
+    try:
+        nav_patterns = [
+            r'NAV[^$]*\$\s*([\d,\.]+)',               # "NAV $XX.XX"
+            r'Net\s+Asset\s+Value[^$]*\$\s*([\d,\.]+)', # "Net Asset Value $XX.XX"
+        ]
+        
+        for pattern in nav_patterns:
+            matches = re.finditer(pattern, page_text, re.IGNORECASE)
+            for match in matches:
+                price_str = match.group(1)
+                logging.info(f"Found Franklin Templeton NAV: ${price_str}")
+                
+                try:
+                    price_value = float(price_str.replace(',', ''))
+                    if 0.01 <= price_value <= 10000:  # Reasonable ETF price range
+                        return price_value
+                except ValueError:
+                    continue
+    except Exception as e:
+        logging.error(f"Error with Franklin Templeton NAV method: {e}")
+    
+    # Method 3: Look for general price patterns near ETF-related keywords
+    try:
+        # Find price context elements that might contain the main price
+        price_elements = soup.find_all(['div', 'span', 'td'], string=re.compile(r'price|market|nav', re.IGNORECASE))
+        
+        for element in price_elements:
+            # Look for dollar amounts in this element and nearby elements
+            element_text = element.get_text(" ", strip=True)
+            
+            # Check this element
+            dollar_match = re.search(r'\$\s*([\d,\.]+)', element_text)
+            if dollar_match:
+                price_str = dollar_match.group(1)
+                try:
+                    price_value = float(price_str.replace(',', ''))
+                    if 1 <= price_value <= 1000:  # More restrictive range for this method
+                        logging.info(f"Found Franklin Templeton price in element: ${price_value}")
+                        return price_value
+                except ValueError:
+                    continue
+            
+            # Check next sibling elements
+            next_sibling = element.find_next_sibling()
+            if next_sibling:
+                sibling_text = next_sibling.get_text(" ", strip=True)
+                dollar_match = re.search(r'\$\s*([\d,\.]+)', sibling_text)
+                if dollar_match:
+                    price_str = dollar_match.group(1)
+                    try:
+                        price_value = float(price_str.replace(',', ''))
+                        if 1 <= price_value <= 1000:
+                            logging.info(f"Found Franklin Templeton price in sibling: ${price_value}")
+                            return price_value
+                    except ValueError:
+                        continue
+    except Exception as e:
+        logging.error(f"Error with Franklin Templeton element method: {e}")
+    
+    raise ValueError("Could not find market price or NAV on Franklin Templeton page")
@@ -0,0 +1,54 @@
+"""
+Price extractors for Grayscale fund pages (grayscale.com, etfs.grayscale.com).
+"""
+
+import logging
+import re
+import time
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+
+from src.html_parsing import parse_html
+
+
+def enhanced_grayscale_price_extraction(driver, url):
+    """Enhanced Grayscale price extraction with multiple fallback methods."""
+    driver.get(url)
+    try:
+        WebDriverWait(driver, 15).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+        time.sleep(8)
+    except TimeoutException:
+        raise ValueError("Timed out waiting for Grayscale page to load")
+
+    soup = parse_html(driver.page_source)
+    page_text = soup.get_text(" ", strip=True)
+    
+    # Enhanced patterns for Grayscale pages
+    price_patterns = [
+        r'Market\s+Price[:\s]*\$?\s*([\d,]+\.?\d*)',       # Existing
+        r'Share\s+Price[:\s]*\$?\s*([\d,]+\.?\d*)',        # Existing
+        r'Price\s+per\s+Share[:\s]*\$?\s*([\d,]+\.?\d*)',  # New specific common phrase
+        r'Current\s+Price[:\s]*\$?\s*([\d,]+\.?\d*)',      # Existing
+        r'NAV[:\s]*\$?\s*([\d,]+\.?\d*)',                   # Existing
+        r'Last\s+Price[:\s]*\$?\s*([\d,]+\.?\d*)',         # Existing
+        r'Price[:\s]*\$?\s*([\d,]+\.?\d*)',                 # New generic "Price:"
+        r'\$\s*([\d,]+\.?\d*)\s*(?:per\s+share|USD)',       # Existing
+        r'\$\s*([\d,]+\.?\d*)',                             # New, more general dollar amount (as a last resort)
+    ]
+    
+    for pattern in price_patterns:
+        matches = re.findall(pattern, page_text, re.IGNORECASE)
+        for match in matches:
+            try:
+                price_str = match.replace(',', '')
+                price = float(price_str)
+                if 1.0 <= price <= 500.0:
+                    logging.info(f"Enhanced Grayscale: Found price: ${price}")
+                    return price
+            except ValueError:
+                continue
+    
+    raise ValueError("Could not extract valid price from Grayscale page")
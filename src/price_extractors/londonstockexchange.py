@@ -0,0 +1,127 @@
+"""
+Price extractors for London Stock Exchange security pages (londonstockexchange.com).
+"""
+
+import logging
+import re
+
+from src.html_parsing import parse_html
+from src.readiness import load_page, Selector, TextMatches, NetworkIdle
+
+
+def get_london_stock_exchange_price(driver, url):
+    """
+    Navigate to a London Stock Exchange company page and scrape the share price.
+    Returns a float or raises ValueError.
+    """
+    # Continue as soon as the last price has rendered
+    load_page(
+        driver, url,
+        Selector(".last-price"),
+        TextMatches(r'Price\s*\([^)]+\)\s*[\d,]+\.\d'),
+        NetworkIdle(),
+        deadline=10,
+        stop_loading=True,
+    )
+
+    soup = parse_html(driver.page_source)
+    
+    # Method 1: Look for price in specific LSE elements (most reliable)
+    try:
+        # The .last-price selector worked perfectly in testing
+        price_selectors = [
+            ".last-price",
+            "div.price",
+            "span.price", 
+            "div.stock-price",
+            "span.stock-price",
+            "td.price",
+            "div.current-price",
+            "span.current-price",
+            ".price-value",
+            ".quote-price"
+        ]
+        
+        for selector in price_selectors:
+            elements = soup.select(selector)
+            for element in elements:
+                text = element.get_text().strip()
+                # Look for price patterns
+                price_match = re.search(r'([\d,\.]+)', text)
+                if price_match and len(text) < 50:  # Reasonable length for a price element
+                    price_str = price_match.group(1)
+                    try:
+                        price_value = float(price_str.replace(',', ''))
+                        if 0.01 <= price_value <= 100000:  # Reasonable price range
+                            logging.info(f"Found LSE price using selector '{selector}': {price_value}")
+                            return price_value
+                    except ValueError:
+                        continue
+    except Exception as e:
+        logging.error(f"Error with LSE selector method: {e}")
+    
+    # Method 2: Look for price patterns in text content
+    try:
+        page_text = soup.get_text(" ", strip=True)
+        
+        # Look for patterns like "Price (USD) 77.05", "Price 79.88", etc.
+        price_patterns = [
+            r'Price\s*\([^)]+\)\s*([\d,\.]+)',  # "Price (USD) 77.05"
+            r'Price\s+([\d,\.]+)',              # "Price 79.88"
+            r'Current price\s*:?\s*([\d,\.]+)', # "Current price: 77.05"
+            r'Share price\s*:?\s*([\d,\.]+)',   # "Share price: 77.05"
+            r'Last price\s*:?\s*([\d,\.]+)',    # "Last price: 77.05"
+        ]
+        
+        for pattern in price_patterns:
+            matches = re.finditer(pattern, page_text, re.IGNORECASE)
+            for match in matches:
+                price_str = match.group(1)
+                try:
+                    price_value = float(price_str.replace(',', ''))
+                    if 0.01 <= price_value <= 100000:  # Reasonable price range
+                        logging.info(f"Found LSE price using pattern '{pattern}': {price_value}")
+                        return price_value
+                except ValueError:
+                    continue
+    except Exception as e:
+        logging.error(f"Error with LSE pattern method: {e}")
+    
+    # Method 3: Look for table data that might contain prices
+    try:
+        # Look for table rows or data elements
+        table_cells = soup.find_all(['td', 'th', 'div'])
+        for cell in table_cells:
+            cell_text = cell.get_text().strip()
+            # Look for cells that might contain price labels
+            if any(keyword in cell_text.lower() for keyword in ['price', 'last', 'current']):
+                # Check if this cell or nearby cells contain a number
+                next_sibling = cell.find_next_sibling()
+                if next_sibling:
+                    next_text = next_sibling.get_text().strip()
+                    price_match = re.search(r'([\d,\.]+)', next_text)
+                    if price_match:
+                        price_str = price_match.group(1)
+                        try:
+                            price_value = float(price_str.replace(',', ''))
+                            if 0.01 <= price_value <= 100000:
+                                logging.info(f"Found LSE price in table structure: {price_value}")
+                                return price_value
+                        except ValueError:
+                            continue
+                
+                # Also check if the price is in the same cell
+                same_cell_match = re.search(r'([\d,\.]+)', cell_text)
+                if same_cell_match:
+                    price_str = same_cell_match.group(1)
+                    try:
+                        price_value = float(price_str.replace(',', ''))
+                        if 0.01 <= price_value <= 100000:
+                            logging.info(f"Found LSE price in same cell: {price_value}")
+                            return price_value
+                    except ValueError:
+                        continue
+    except Exception as e:
+        logging.error(f"Error with LSE table method: {e}")
+    
+    raise ValueError("Could not find share price on London Stock Exchange page")
@@ -0,0 +1,186 @@
+"""
+Price extractors for Morningstar France and Belgium fund pages (morningstar.fr, morningstar.be).
+"""
+
+import logging
+import re
+import time
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+
+from src.html_parsing import parse_html
+
+
+def get_morningstar_fr_price(driver, url):
+    """
+    Navigate to a Morningstar France fund page and scrape the VL (Valeur Liquidative) price.
+    Returns a float or raises ValueError.
+    """
+    driver.get(url)
+    try:
+        # Wait for the page to load
+        WebDriverWait(driver, 30).until(
+            EC.presence_of_element_located((By.TAG_NAME, "body"))
+        )
+        
+        # Allow extra time for JavaScript content to load
+        time.sleep(5)
+    except TimeoutException:
+        raise ValueError("Timed out waiting for Morningstar France page to load")
+
+    soup = parse_html(driver.page_source)
+    
+    # Method 1: Look for "VL" followed by date and currency amount (most specific)
+    try:
+        page_text = soup.get_text(" ", strip=True)
+        
+        # Look for patterns like "VL22/05/2025 EUR 11,19" or "VL31/07/2024 GBP 11,03"
+        vl_patterns = [
+            r'VL\d{1,2}/\d{1,2}/\d{4}\s+([A-Z]{3})\s+([\d,\.]+)',  # "VL22/05/2025 EUR 11,19"
+            r'VL\s*\d{1,2}/\d{1,2}/\d{4}\s+([A-Z]{3})\s+([\d,\.]+)',  # "VL 22/05/2025 EUR 11,19"
+            r'Valeur\s+Liquidative.*?([A-Z]{3})\s+([\d,\.]+)',  # "Valeur Liquidative ... EUR 11,19"
+            r'VL.*?([A-Z]{3})\s+([\d,\.]+)',  # "VL ... EUR 11,19"
+        ]
+        
+        for pattern in vl_patterns:
+            matches = re.finditer(pattern, page_text, re.IGNORECASE)
+            for match in matches:
+                currency = match.group(1)
+                price_str = match.group(2)
+                logging.info(f"Found Morningstar FR VL price: {currency} {price_str}")
+                
+                # Convert European number format (11,19) to float
+                if ',' in price_str and '.' not in price_str:
+                    # European format: 11,19 -> 11.19
+                    price_normalized = price_str.replace(',', '.')
+                elif '.' in price_str and ',' in price_str:
+                    # Format: 1.234,56 -> 1234.56
+                    price_normalized = price_str.replace('.', '').replace(',', '.')
+                else:
+                    # US format: 11.19 -> 11.19
+                    price_normalized = price_str
+                
+                try:
+                    price_value = float(price_normalized)
+                    if 0.01 <= price_value <= 100000:  # Reasonable fund price range
+                        return price_value
+                except ValueError:
+                    continue
+    except Exception as e:
+        logging.error(f"Error with Morningstar FR pattern method: {e}")
+    
+    # Method 2: Look for table structure with VL data
+    try:
+        # Find table rows that might contain VL information
+        rows = soup.find_all('tr')
+        for row in rows:
+            row_text = row.get_text(" ", strip=True)
+            # Look for rows containing "VL" and currency amounts
+            if 'vl' in row_text.lower():
+                # Extract currency and amount from this row
+                currency_match = re.search(r'([A-Z]{3})\s+([\d,\.]+)', row_text)
+                if currency_match:
+                    currency = currency_match.group(1)
+                    price_str = currency_match.group(2)
+                    
+                    # Convert European number format
+                    if ',' in price_str and '.' not in price_str:
+                        price_normalized = price_str.replace(',', '.')
+                    elif '.' in price_str and ',' in price_str:
+                        price_normalized = price_str.replace('.', '').replace(',', '.')
+                    else:
+                        price_normalized = price_str
+                    
+                    try:
+                        price_value = float(price_normalized)
+                        if 0.01 <= price_value <= 100000:
+                            logging.info(f"Found Morningstar FR price in table: {currency} {price_value}")
+                            return price_value
+                    except ValueError:
+                        continue
+    except Exception as e:
+        logging.error(f"Error with Morningstar FR table method: {e}")
+    
+    # Method 3: Look for CSS selectors that might contain VL data
+    try:
+        # Look for table cells or divs that might contain the VL price
+        elements = soup.find_all(['td', 'div', 'span'])
+        for element in elements:
+            element_text = element.get_text(" ", strip=True)
+            # Check if this element contains VL-related text
+            if len(element_text) < 100 and ('vl' in element_text.lower() or any(curr in element_text for curr in ['EUR', 'USD', 'GBP'])):
+                # Look for currency and price pattern
+                currency_match = re.search(r'([A-Z]{3})\s+([\d,\.]+)', element_text)
+                if currency_match:
+                    currency = currency_match.group(1)
+                    price_str = currency_match.group(2)
+                    
+                    # Convert European number format
+                    if ',' in price_str and '.' not in price_str:
+                        price_normalized = price_str.replace(',', '.')
+                    elif '.' in price_str and ',' in price_str:
+                        price_normalized = price_str.replace('.', '').replace(',', '.')
+                    else:
+                        price_normalized = price_str
+                    
+                    try:
+                        price_value = float(price_normalized)
+                        if 0.01 <= price_value <= 100000:
+                            logging.info(f"Found Morningstar FR price in element: {currency} {price_value}")
+                            return price_value
+                    except ValueError:
+                        continue
+    except Exception as e:
+        logging.error(f"Error with Morningstar FR element method: {e}")
+    
+    raise ValueError("Could not find VL price on Morningstar France page")
+
+
+def enhanced_morningstar_price_extraction(driver, url):
+    """
+    Enhanced Morningstar price extraction for Belgian/European sites.
+    Addresses purple cell issues with wrong figures.
+    """
+    if 'format=pdf' in url.lower() or url.lower().endswith('.pdf'):
+        raise ValueError("PDF URL cannot be processed for price extraction")
+    
+    driver.get(url)
+    try:
+        WebDriverWait(driver, 20).until(
+            EC.presence_of_element_located((By.TAG_NAME, "body"))
+        )
+        time.sleep(10)
+    except TimeoutException:
+        raise ValueError("Timed out waiting for Morningstar page to load")
+
+    soup = parse_html(driver.page_source)
+    
+    # Look for price containers with Morningstar classes
+    try:
+        price_containers = soup.find_all(['div', 'span', 'td'], 
+                                       class_=re.compile(r'(price|nav|value|quote)', re.I))
+        for container in price_containers:
+            text = container.get_text(strip=True)
+            price_match = re.search(r'([\d,]+\.?\d*)\s*(?:EUR|USD|€|\$)', text)
+            if price_match:
+                try:
+                    price_str = price_match.group(1)
+                    # Handle European format
+                    if ',' in price_str and '.' not in price_str:
+                        price_str = price_str.replace(',', '.')
+                    elif ',' in price_str and '.' in price_str:
+                        price_str = price_str.replace('.', '').replace(',', '.')
+                    
+                    price = float(price_str)
+                    if 0.1 <= price <= 10000:
+                        logging.info(f"Enhanced Morningstar: Found price: {price}")
+                        return price
+                except ValueError:
+                    continue
+    except Exception as e:
+        logging.debug(f"Enhanced Morningstar method failed: {e}")
+    
+    raise ValueError("Could not extract valid price from Morningstar page")
@@ -0,0 +1,232 @@
+"""
+Price extractors for NASDAQ quote pages (nasdaq.com/market-activity and /european-market-activity).
+"""
+
+import logging
+import re
+import time
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+
+from src.html_parsing import parse_html
+from src.network_capture import can_capture, drain_network_log, wait_for_network_value
+
+# Time the page gets to render its price with JavaScript before it is scraped
+JS_RENDER_WAIT = 5
+
+
+def get_nasdaq_european_market_price(driver, url):
+    """
+    Navigate to a NASDAQ European market page and scrape the share price.
+    Returns a float or raises ValueError.
+    """
+    driver.get(url)
+    try:
+        # Wait for the page to load
+        WebDriverWait(driver, 30).until(
+            EC.presence_of_element_located((By.TAG_NAME, "body"))
+        )
+        
+        # Allow extra time for JavaScript content to load
+        time.sleep(5)
+    except TimeoutException:
+        raise ValueError("Timed out waiting for page to load")
+
+    soup = parse_html(driver.page_source)
+    
+    # First approach: Look for text patterns in the entire page
+    page_text = soup.get_text(" ", strip=True)
+    
+    # Extract exchange ID from URL
+    exchange_id_match = re.search(r'id=([A-Z]+)\d+', url)
+    exchange_id = exchange_id_match.group(1) if exchange_id_match else None
+    
+    # Define supported currencies and their priority based on exchange
+    exchange_currencies = {
+        'SSE': ['SEK'],  # Stockholm Stock Exchange - Swedish Krona
+        'HEX': ['EUR'],  # Helsinki Stock Exchange - Euro
+        'CPH': ['DKK'],  # Copenhagen Stock Exchange - Danish Krone
+        'ICE': ['ISK'],  # Iceland Stock Exchange - Icelandic Króna
+        'XETR': ['EUR'], # Deutsche Börse Xetra - Euro
+    }
+    
+    # Get expected currencies based on exchange ID
+    expected_currencies = exchange_currencies.get(exchange_id, ['EUR', 'SEK', 'NOK', 'DKK', 'ISK'])
+    
+    # Build currency patterns based on priority
+    currency_patterns = []
+    for currency in expected_currencies:
+        # Pattern 1: "Currency 123.45" format
+        currency_patterns.append(fr'{currency}\s*([\d\.,]+)')
+        # Pattern 2: "123.45 Currency" format
+        currency_patterns.append(fr'([\d\.,]+)\s*{currency}')
+    
+    # Try each pattern in order of priority
+    for pattern in currency_patterns:
+        matches = re.finditer(pattern, page_text, re.IGNORECASE)
+        for match in matches:
+            # Get the price string (could be in group 1 or 2)
+            price_str = match.group(1) if match.group(1) else match.group(2)
+            
+            # Normalize number format
+            if "," in price_str and "." in price_str:
+                # European format with thousands separator (e.g., "1.234,56")
+                price_normalized = price_str.replace(".", "").replace(",", ".")
+            elif "," in price_str:
+                # European format (e.g., "123,45")
+                price_normalized = price_str.replace(",", ".")
+            else:
+                # US/UK format (e.g., "123.45")
+                price_normalized = price_str
+                
+            try:
+                price_value = float(price_normalized)
+                # Validate price is within reasonable range
+                if 0.01 <= price_value <= 100000:
+                    logging.info(f"Found price: {price_value} {expected_currencies[0]}")
+                    return price_value
+            except ValueError:
+                continue
+
+    # If we get here, we couldn't find a valid price
+    raise ValueError("Could not find valid price on NASDAQ European market page")
+
+
+def get_nasdaq_market_activity_price(driver, url):
+    """
+    Navigate to a NASDAQ market activity page (stocks, ETFs, etc.) and scrape the share price.
+    The price is read from the page's api.nasdaq.com quote response when the driver
+    captures network traffic; otherwise (or if that response never arrives) it is scraped.
+    Returns a float or raises ValueError.
+    """
+    drain_network_log(driver)
+    driver.get(url)
+    # Waiting for the API response takes the place of the fixed wait for JavaScript below
+    waited_for_network = can_capture(driver, url, "price")
+    price, _ = wait_for_network_value(driver, url, "price", deadline=JS_RENDER_WAIT)
+    if price is not None:
+        return price
+
+    try:
+        # Wait for the page to load
+        WebDriverWait(driver, 30).until(
+            EC.presence_of_element_located((By.TAG_NAME, "body"))
+        )
+        
+        # Allow extra time for JavaScript content to load
+        if not waited_for_network:
+            time.sleep(JS_RENDER_WAIT)
+    except TimeoutException:
+        raise ValueError("Timed out waiting for page to load")
+
+    soup = parse_html(driver.page_source)
+    
+    # First try to find the price in the main header area
+    try:
+        # Look for the last price element which typically contains the current price
+        price_element = soup.find("span", class_="symbol-page-header__pricing-price")
+        if price_element and price_element.text:
+            price_text = price_element.text.strip()
+            # Clean the price text (remove $ and commas)
+            price_text = price_text.replace('$', '').replace(',', '')
+            return float(price_text)
+    except (ValueError, AttributeError):
+        pass
+    
+    # If we can't find the price in the header, look through the page content
+    try:
+        # Try to find price inside div with class "symbol-header"
+        header_div = soup.find("div", class_="symbol-header")
+        if header_div:
+            price_spans = header_div.find_all("span")
+            for span in price_spans:
+                text = span.text.strip()
+                if '$' in text:
+                    price_match = re.search(r'\$\s*([\d,]+\.\d{2})', text)
+                    if price_match:
+                        price = price_match.group(1).replace(',', '')
+                        return float(price)
+    except (ValueError, AttributeError):
+        pass
+    
+    # If still not found, try a more general approach for dollar amounts
+    dollar_pattern = re.compile(r'\$\s*([\d,]+\.\d{2})')
+    page_text = soup.get_text()
+    matches = dollar_pattern.findall(page_text)
+    
+    if matches:
+        # Find dollar amounts that look like prices (not volumes, market caps, etc.)
+        possible_prices = []
+        for match in matches:
+            try:
+                price = float(match.replace(',', ''))
+                if 0.1 < price < 10000:  # Reasonable price range
+                    possible_prices.append(price)
+            except ValueError:
+                continue
+        
+        if possible_prices:
+            # Use the most prominent price (often the first one found)
+            return possible_prices[0]
+    
+    raise ValueError("Could not find price on NASDAQ market activity page")
+
+
+def get_nasdaq_european_price_v2(driver, url):
+    """
+    Navigate to a NASDAQ European Market page and scrape the price.
+    Pattern found: "SEK 15.86"
+    Returns a float or raises ValueError.
+    """
+    driver.get(url)
+    try:
+        WebDriverWait(driver, 30).until(
+            EC.presence_of_element_located((By.TAG_NAME, "body"))
+        )
+        time.sleep(8)
+    except TimeoutException:
+        raise ValueError("Timed out waiting for NASDAQ European page to load")
+
+    soup = parse_html(driver.page_source)
+    page_text = soup.get_text(" ", strip=True)
+    
+    # Method 1: Look for "SEK XX.XX" pattern (most reliable for this specific URL)
+    try:
+        sek_pattern = r'SEK\s+([\d,\.]+)'
+        match = re.search(sek_pattern, page_text, re.IGNORECASE)
+        if match:
+            price_str = match.group(1)
+            price_value = float(price_str.replace(',', ''))
+            if 0.01 <= price_value <= 10000:  # Reasonable price range for SEK
+                logging.info(f"Found NASDAQ European price: {price_value} SEK")
+                return price_value
+    except Exception as e:
+        logging.error(f"Error with NASDAQ European SEK method: {e}")
+    
+    # Method 2: Look for other currency patterns
+    try:
+        currency_patterns = [
+            (r'USD\s+([\d,\.]+)', 'USD'),
+            (r'EUR\s+([\d,\.]+)', 'EUR'),
+            (r'Last\s+Sale[^0-9]*?([\d,\.]+)', 'Last Sale'),
+            (r'Current\s+Price[^0-9]*?([\d,\.]+)', 'Current Price'),
+        ]
+        
+        for pattern, desc in currency_patterns:
+            match = re.search(pattern, page_text, re.IGNORECASE)
+            if match:
+                price_str = match.group(1)
+                try:
+                    price_value = float(price_str.replace(',', ''))
+                    if 0.01 <= price_value <= 10000:
+                        logging.info(f"Found NASDAQ European {desc}: {price_value}")
+                        return price_value
+                except ValueError:
+                    continue
+    except Exception as e:
+        logging.error(f"Error with NASDAQ European currency method: {e}")
+    
+    raise ValueError("Could not find valid price on NASDAQ European page")
@@ -0,0 +1,76 @@
+"""
+Price extractors for Ninepoint fund pages (ninepoint.com).
+"""
+
+import logging
+import re
+
+from src.html_parsing import parse_html
+from src.readiness import load_page, TextMatches, NetworkIdle
+
+
+def get_ninepoint_price(driver, url):
+    """
+    Navigate to a Ninepoint ETF page and scrape the actual market price.
+    Returns a float or raises ValueError.
+    """
+    # Continue as soon as a labelled dollar price has rendered
+    load_page(
+        driver, url,
+        TextMatches(r'(Market|Last|Current|Unit)\s+Price[^$]{0,40}\$\s*\d|NAV[^$]{0,40}\$\s*\d'),
+        NetworkIdle(),
+        deadline=12,
+        stop_loading=True,
+    )
+
+    soup = parse_html(driver.page_source)
+    
+    # Method 1: Look for market price patterns with more flexible matching
+    try:
+        page_text = soup.get_text(" ", strip=True)
+        
+        # Look for various price patterns (Canadian format) - more flexible
+        price_patterns = [
+            r'Market\s+Price[^$]*\$\s*([\d,\.]+)',     # "Market Price $XX.XX"
+            r'Price[^$]*\$\s*([\d,\.]+)',              # "Price $XX.XX"
+            r'Last\s+Price[^$]*\$\s*([\d,\.]+)',       # "Last Price $XX.XX"
+            r'Current\s+Price[^$]*\$\s*([\d,\.]+)',    # "Current Price $XX.XX"
+            r'Unit\s+Price[^$]*\$\s*([\d,\.]+)',       # "Unit Price $XX.XX"
+            r'NAV[^$]*\$\s*([\d,\.]+)',                # "NAV $XX.XX"
+            r'Net\s+Asset\s+Value[^$]*\$\s*([\d,\.]+)', # "Net Asset Value $XX.XX"
+            r'\$\s*([\d,\.]+)\s*CAD',                  # "$XX.XX CAD"
+            r'CAD\s*\$\s*([\d,\.]+)',                  # "CAD $XX.XX"
+        ]
+        
+        for pattern in price_patterns:
+            matches = re.finditer(pattern, page_text, re.IGNORECASE)
+            for match in matches:
+                price_str = match.group(1)
+                try:
+                    price_value = float(price_str.replace(',', ''))
+                    # Look for reasonable ETF prices (relaxed criteria)
+                    if 0.1 <= price_value <= 1000:  # More flexible range
+                        logging.info(f"Found Ninepoint price: ${price_value}")
+                        return price_value
+                except ValueError:
+                    continue
+    except Exception as e:
+        logging.error(f"Error with Ninepoint pattern method: {e}")
+    
+    # Method 2: Look for any dollar amounts in the page
+    try:
+        all_dollar_matches = re.finditer(r'\$\s*([\d,\.]+)', page_text, re.IGNORECASE)
+        for match in all_dollar_matches:
+            price_str = match.group(1)
+            try:
+                price_value = float(price_str.replace(',', ''))
+                # Look for reasonable ETF prices
+                if 1 <= price_value <= 500 and price_value != int(price_value):
+                    logging.info(f"Found Ninepoint price (general search): ${price_value}")
+                    return price_value
+            except ValueError:
+                continue
+    except Exception as e:
+        logging.error(f"Error with Ninepoint general search: {e}")
+    
+    raise ValueError("Could not find valid market price on Ninepoint page")
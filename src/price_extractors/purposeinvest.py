@@ -0,0 +1,71 @@
+"""
+Price extractors for Purpose Investments fund pages (purposeinvest.com).
+"""
+
+import logging
+import re
+import time
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+
+from src.html_parsing import parse_html
+
+
+def get_purposeinvest_price(driver, url):
+    """
+    Navigate to a Purpose Investments ETF page and scrape the NAV.
+    Pattern found: "NAV $4.80"
+    Returns a float or raises ValueError.
+    """
+    driver.get(url)
+    try:
+        WebDriverWait(driver, 30).until(
+            EC.presence_of_element_located((By.TAG_NAME, "body"))
+        )
+        time.sleep(8)
+    except TimeoutException:
+        raise ValueError("Timed out waiting for Purpose Investments page to load")
+
+    soup = parse_html(driver.page_source)
+    page_text = soup.get_text(" ", strip=True)
+    
+    # Method 1: Look for "NAV $X.XX" pattern (most reliable)
+    try:
+        nav_pattern = r'NAV\s+\$\s*([\d,\.]+)'
+        match = re.search(nav_pattern, page_text, re.IGNORECASE)
+        if match:
+            price_str = match.group(1)
+            price_value = float(price_str.replace(',', ''))
+            if 0.01 <= price_value <= 1000:  # Reasonable ETF NAV range
+                logging.info(f"Found Purpose Investments NAV: ${price_value}")
+                return price_value
+    except Exception as e:
+        logging.error(f"Error with Purpose Investments NAV method: {e}")
+    
+    # Method 2: Look for other price patterns
+    try:
+        price_patterns = [
+            r'Unit\s+Price[^$]*\$\s*([\d,\.]+)',    # "Unit Price $X.XX"
+            r'Market\s+Price[^$]*\$\s*([\d,\.]+)',  # "Market Price $X.XX"
+            r'Closing\s+Price[^$]*\$\s*([\d,\.]+)', # "Closing Price $X.XX"
+            r'Price[^$]*\$\s*([\d,\.]+)',           # "Price $X.XX"
+        ]
+        
+        for pattern in price_patterns:
+            match = re.search(pattern, page_text, re.IGNORECASE)
+            if match:
+                price_str = match.group(1)
+                try:
+                    price_value = float(price_str.replace(',', ''))
+                    if 0.01 <= price_value <= 1000:
+                        logging.info(f"Found Purpose Investments price: ${price_value}")
+                        return price_value
+                except ValueError:
+                    continue
+    except Exception as e:
+        logging.error(f"Error with Purpose Investments price method: {e}")
+    
+    raise ValueError("Could not find valid NAV/price on Purpose Investments page")
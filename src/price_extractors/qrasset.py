@@ -0,0 +1,153 @@
+"""
+Price extractors for QR Asset fund pages (qrasset.com.br, #cesta tab).
+"""
+
+import logging
+import re
+import time
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+
+from src.html_parsing import parse_html
+
+
+def get_qrasset_cota_price(driver, url):
+    """
+    Navigate to a QR Asset fund page and scrape the "COTA EM" price.
+    Looks for patterns like "COTA EM 23/05/2025 R$ 38,09" and extracts "R$ 38,09".
+    Returns a float or raises ValueError.
+    """
+    driver.get(url)
+    try:
+        # Wait for the page to load
+        WebDriverWait(driver, 30).until(
+            EC.presence_of_element_located((By.TAG_NAME, "body"))
+        )
+        
+        # Allow extra time for JavaScript content to load
+        time.sleep(5)
+    except TimeoutException:
+        raise ValueError("Timed out waiting for QR Asset page to load")
+
+    soup = parse_html(driver.page_source)
+    
+    # Method 1: Look for "COTA EM" followed by date and price pattern (most specific)
+    try:
+        page_text = soup.get_text(" ", strip=True)
+        
+        # Look for "COTA EM DD/MM/YYYY R$ XX,XX" pattern
+        cota_patterns = [
+            r'COTA\s+EM\s+\d{1,2}/\d{1,2}/\d{4}\s+R\$\s*([\d,\.]+)',  # "COTA EM 23/05/2025 R$ 38,09"
+            r'COTA\s+EM[^R]*R\$\s*([\d,\.]+)',                        # "COTA EM [anything] R$ 38,09"
+            r'COTA[^R]*R\$\s*([\d,\.]+)',                             # "COTA [anything] R$ 38,09"
+        ]
+        
+        for pattern in cota_patterns:
+            match = re.search(pattern, page_text, re.IGNORECASE)
+            if match:
+                price_str = match.group(1)
+                logging.info(f"Found QR Asset COTA price with pattern '{pattern}': R$ {price_str}")
+                
+                # Convert Brazilian format (38,09) to float
+                # Handle both "38,09" and "1.234,56" formats
+                if '.' in price_str and ',' in price_str:
+                    # Format: 1.234,56 -> 1234.56
+                    price_normalized = price_str.replace('.', '').replace(',', '.')
+                else:
+                    # Format: 38,09 -> 38.09
+                    price_normalized = price_str.replace(',', '.')
+                
+                try:
+                    price_value = float(price_normalized)
+                    if 0.01 <= price_value <= 100000:  # Reasonable fund price range
+                        return price_value
+                except ValueError:
+                    continue
+    except Exception as e:
+        logging.error(f"Error with QR Asset pattern method: {e}")
+    
+    # Method 2: Look for span elements with "COTA" context
+    try:
+        # Find elements containing "COTA" text
+        cota_elements = soup.find_all(
+            lambda tag: tag.name and 'cota' in tag.get_text(' ', strip=True).lower()
+        )
+        
+        for element in cota_elements:
+            element_text = element.get_text(' ', strip=True)
+            # Look for Brazilian Real amounts in this element
+            real_match = re.search(r'R\$\s*([\d,\.]+)', element_text)
+            if real_match:
+                price_str = real_match.group(1)
+                try:
+                    # Convert Brazilian format
+                    if '.' in price_str and ',' in price_str:
+                        price_normalized = price_str.replace('.', '').replace(',', '.')
+                    else:
+                        price_normalized = price_str.replace(',', '.')
+                    
+                    price_value = float(price_normalized)
+                    if 0.01 <= price_value <= 100000:
+                        logging.info(f"Found QR Asset price in COTA element: {price_value}")
+                        return price_value
+                except ValueError:
+                    continue
+                    
+            # Also check nearby elements for the price
+            for sibling in [element.find_next_sibling(), element.find_previous_sibling()]:
+                if sibling:
+                    sibling_text = sibling.get_text(' ', strip=True)
+                    real_match = re.search(r'R\$\s*([\d,\.]+)', sibling_text)
+                    if real_match:
+                        price_str = real_match.group(1)
+                        try:
+                            if '.' in price_str and ',' in price_str:
+                                price_normalized = price_str.replace('.', '').replace(',', '.')
+                            else:
+                                price_normalized = price_str.replace(',', '.')
+                            
+                            price_value = float(price_normalized)
+                            if 0.01 <= price_value <= 100000:
+                                logging.info(f"Found QR Asset price in sibling element: {price_value}")
+                                return price_value
+                        except ValueError:
+                            continue
+    except Exception as e:
+        logging.error(f"Error with QR Asset element method: {e}")
+    
+    # Method 3: Look for CSS selectors that might contain price data
+    try:
+        price_selectors = [
+            ".cota-price",
+            ".fund-price",
+            ".current-price",
+            ".value",
+            ".price"
+        ]
+        
+        for selector in price_selectors:
+            elements = soup.select(selector)
+            for element in elements:
+                text = element.get_text(' ', strip=True)
+                real_match = re.search(r'R\$\s*([\d,\.]+)', text)
+                if real_match and len(text) < 100:  # Reasonable length for price element
+                    price_str = real_match.group(1)
+                    try:
+                        if '.' in price_str and ',' in price_str:
+                            price_normalized = price_str.replace('.', '').replace(',', '.')
+                        else:
+                            price_normalized = price_str.replace(',', '.')
+                        
+                        price_value = float(price_normalized)
+                        if 0.01 <= price_value <= 100000:
+                            logging.info(f"Found QR Asset price using selector '{selector}': {price_value}")
+                            return price_value
+                    except ValueError:
+                        continue
+    except Exception as e:
+        logging.error(f"Error with QR Asset selector method: {e}")
+    
+    raise ValueError("Could not find COTA price on QR Asset page")
@@ -0,0 +1,64 @@
+"""
+Price extractors for Schwab Asset Management fund pages (schwabassetmanagement.com).
+"""
+
+import logging
+import re
+import time
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+
+from src.html_parsing import parse_html
+
+
+def get_schwab_asset_management_price(driver, url):
+    """
+    Navigate to a Schwab Asset Management ETF page and scrape the actual market price.
+    Returns a float or raises ValueError.
+    """
+    driver.get(url)
+    try:
+        # Wait for the page to load
+        WebDriverWait(driver, 30).until(
+            EC.presence_of_element_located((By.TAG_NAME, "body"))
+        )
+        
+        # Allow extra time for JavaScript content to load
+        time.sleep(8)
+    except TimeoutException:
+        raise ValueError("Timed out waiting for Schwab page to load")
+
+    soup = parse_html(driver.page_source)
+    
+    # Method 1: Look for market price patterns
+    try:
+        page_text = soup.get_text(" ", strip=True)
+        
+        # Look for various price patterns
+        price_patterns = [
+            r'Market\s+Price[^$]*\$\s*([\d,\.]+)',     # "Market Price $XX.XX"
+            r'Price[^$]*\$\s*([\d,\.]+)',              # "Price $XX.XX"
+            r'Last\s+Price[^$]*\$\s*([\d,\.]+)',       # "Last Price $XX.XX"
+            r'Current\s+Price[^$]*\$\s*([\d,\.]+)',    # "Current Price $XX.XX"
+            r'NAV[^$]*\$\s*([\d,\.]+)',                # "NAV $XX.XX" (as fallback)
+        ]
+        
+        for pattern in price_patterns:
+            matches = re.finditer(pattern, page_text, re.IGNORECASE)
+            for match in matches:
+                price_str = match.group(1)
+                try:
+                    price_value = float(price_str.replace(',', ''))
+                    # Look for reasonable ETF prices with decimals
+                    if 1 <= price_value <= 500 and price_value != int(price_value):
+                        logging.info(f"Found Schwab price: ${price_value}")
+                        return price_value
+                except ValueError:
+                    continue
+    except Exception as e:
+        logging.error(f"Error with Schwab pattern method: {e}")
+    
+    raise ValueError("Could not find valid market price on Schwab page")
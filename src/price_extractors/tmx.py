@@ -0,0 +1,103 @@
+"""
+Price extractors for TMX Money quote pages (money.tmx.com).
+"""
+
+import logging
+import re
+
+from src.html_parsing import parse_html
+from src.readiness import load_page, Selector, TextMatches, NetworkIdle
+
+
+def get_tmx_price(driver, url):
+    """
+    Navigate to a TMX Money page and scrape the share price.
+    Returns a float or raises ValueError.
+    """
+    # Continue as soon as the quote price has rendered
+    load_page(
+        driver, url,
+        Selector("span.price, div.price, span.quote-price, div.quote-price, .quote-header .price"),
+        TextMatches(r'(Last\s*)?Price:?\s*\$\s*\d'),
+        NetworkIdle(),
+        deadline=10,
+        stop_loading=True,
+    )
+
+    soup = parse_html(driver.page_source)
+    
+    # First approach: Look for the price element with specific class
+    try:
+        # Try multiple possible selectors for price elements
+        price_selectors = [
+            "span.price", 
+            "div.price", 
+            "span.quote-price", 
+            "div.quote-price",
+            "span.last-price",
+            "div.last-price",
+            ".quote-header .price",
+            ".stock-price"
+        ]
+        
+        for selector in price_selectors:
+            price_elements = soup.select(selector)
+            for element in price_elements:
+                price_text = element.get_text().strip()
+                # Match price patterns like "$19.90" or "Price:$19.90" or "$19.90 CAD"
+                match = re.search(r'\$\s*([\d,\.]+)', price_text)
+                if match:
+                    price_str = match.group(1)
+                    # Clean the price (remove commas)
+                    price_normalized = price_str.replace(',', '')
+                    logging.info(f"Found TMX price using selector '{selector}': {price_normalized}")
+                    return float(price_normalized)
+    except Exception as e:
+        logging.error(f"Error extracting TMX price from selectors: {e}")
+    
+    # Second approach: Look for text patterns in the page
+    try:
+        # Find text containing "Price:" followed by a dollar amount
+        page_text = soup.get_text(" ", strip=True)
+        price_patterns = [
+            r'Price:\s*\$\s*([\d,\.]+)',  # "Price: $19.90"
+            r'Price\s*\$\s*([\d,\.]+)',   # "Price$19.90"
+            r'Last:\s*\$\s*([\d,\.]+)',   # "Last: $19.90"
+            r'Last Price:\s*\$\s*([\d,\.]+)'  # "Last Price: $19.90"
+        ]
+        
+        for pattern in price_patterns:
+            match = re.search(pattern, page_text, re.IGNORECASE)
+            if match:
+                price_str = match.group(1)
+                price_normalized = price_str.replace(',', '')
+                logging.info(f"Found TMX price using pattern '{pattern}': {price_normalized}")
+                return float(price_normalized)
+    except Exception as e:
+        logging.error(f"Error extracting TMX price from page text: {e}")
+    
+    # Third approach: Look for any dollar amount in the page that might be a price
+    try:
+        all_text = soup.get_text(" ", strip=True)
+        # Find all dollar amounts in the page
+        dollar_matches = re.finditer(r'\$\s*([\d,\.]+)', all_text)
+        
+        prices = []
+        for match in dollar_matches:
+            price_str = match.group(1)
+            try:
+                price_value = float(price_str.replace(',', ''))
+                # Only consider reasonable price values (e.g., not volume or market cap)
+                if 0.1 < price_value < 10000:
+                    prices.append(price_value)
+            except ValueError:
+                continue
+        
+        if prices:
+            # Take the first reasonable price found
+            logging.info(f"Found TMX price using fallback method: {prices[0]}")
+            return prices[0]
+    except Exception as e:
+        logging.error(f"Error extracting TMX price with fallback method: {e}")
+    
+    raise ValueError("Could not find share price on TMX Money page")
@@ -0,0 +1,134 @@
+"""
+Condition-based page readiness for the extractors.
+
+Instead of loading a page and sleeping a fixed number of seconds, an extractor
+declares what it needs to see - a CSS selector, a regex in the visible text,
+or the network going quiet - and continues as soon as any of those holds,
+capped by a deadline. With Chrome's "eager" page load strategy driver.get()
+returns at DOMContentLoaded, and the rest of the page load can be stopped once
+the target is on the page.
+"""
+
+import logging
+import re
+import time
+
+from selenium.webdriver.common.by import By
+
+DEFAULT_DEADLINE = 15
+DEFAULT_POLL_INTERVAL = 0.25
+
+
+class Selector:
+    """Ready when an element matching the CSS selector is present (and optionally has text)."""
+
+    def __init__(self, css, require_text=True):
+        self.css = css
+        self.require_text = require_text
+
+    def __call__(self, driver):
+        for element in driver.find_elements(By.CSS_SELECTOR, self.css):
+            if not self.require_text or element.text.strip():
+                return True
+        return False
+
+    def __repr__(self):
+        return f"Selector({self.css!r})"
+
+
+class TextMatches:
+    """Ready when the page's visible text matches the regex."""
+
+    def __init__(self, pattern, flags=re.IGNORECASE):
+        self.regex = re.compile(pattern, flags)
+
+    def __call__(self, driver):
+        text = driver.execute_script("return document.body ? document.body.innerText : '';") or ""
+        return bool(self.regex.search(text))
+
+    def __repr__(self):
+        return f"TextMatches({self.regex.pattern!r})"
+
+
+class NetworkIdle:
+    """
+    Ready when the DOM has loaded and no new resources have been fetched for
+    quiet_period seconds (based on the Resource Timing entries of the page).
+    """
+
+    def __init__(self, quiet_period=1.5):
+        self.quiet_period = quiet_period
+        self._last_count = None
+        self._quiet_since = None
+
+    def __call__(self, driver):
+        state = driver.execute_script(
+            "return [document.readyState, performance.getEntriesByType('resource').length];"
+        )
+        ready_state, count = state[0], state[1]
+        now = time.monotonic()
+        if ready_state == "loading" or count != self._last_count:
+            self._last_count = count
+            self._quiet_since = now
+            return False
+        return now - self._quiet_since >= self.quiet_period
+
+    def __repr__(self):
+        return f"NetworkIdle({self.quiet_period})"
+
+
+def stop_page_load(driver):
+    """Stop any remaining page load (images, trackers, late scripts)."""
+    try:
+        driver.execute_script("if (document.readyState !== 'complete') { window.stop(); }")
+    except Exception as e:
+        logging.debug(f"Could not stop page load: {e}")
+
+
+def wait_until_ready(driver, *conditions, deadline=DEFAULT_DEADLINE,
+                     poll_interval=DEFAULT_POLL_INTERVAL, stop_loading=False):
+    """
+    Poll until any of the conditions holds or the deadline passes.
+
+    Args:
+        driver: Selenium WebDriver
+        conditions: Selector / TextMatches / NetworkIdle instances (or any callable(driver) -> bool)
+        deadline: maximum seconds to wait
+        poll_interval: seconds between checks
+        stop_loading: stop the rest of the page load once a condition holds
+
+    Returns:
+        The condition that was satisfied, or None if the deadline passed. Callers
+        usually go on and parse whatever has loaded either way.
+    """
+    end = time.monotonic() + deadline
+    while True:
+        for condition in conditions:
+            try:
+                if condition(driver):
+                    if stop_loading:
+                        stop_page_load(driver)
+                    return condition
+            except Exception as e:
+                # Stale elements or a page mid-navigation - just try again
+                logging.debug(f"Readiness check {condition!r} failed: {e}")
+
+        if time.monotonic() >= end:
+            logging.info(f"Readiness deadline of {deadline}s reached for {driver.current_url}")
+            return None
+        time.sleep(poll_interval)
+
+
+def load_page(driver, url, *conditions, deadline=DEFAULT_DEADLINE, stop_loading=False):
+    """
+    Navigate to url and wait until the page is ready for extraction.
+
+    Returns:
+        The satisfied condition, or None if the deadline passed.
+    """
+    start = time.monotonic()
+    driver.get(url)
+    ready = wait_until_ready(driver, *conditions, deadline=deadline, stop_loading=stop_loading)
+    if ready is not None:
+        logging.info(f"Page ready via {ready!r} in {time.monotonic() - start:.1f}s: {url}")
+    return ready
@@ -0,0 +1,246 @@
+"""
+Persistent cache of extracted prices and outstanding shares between runs.
+
+Every run used to re-scrape all rows, although most values cannot have changed
+since the previous run: a "closing price prev trading day" or a daily NAV only
+moves once the instrument's exchange closes again. Successful results are now
+kept in data/cache/results.json, keyed by value type ("price" or "shares") and
+URL. An end-of-day price (previous close, NAV) stays valid until the next
+close of the exchange its site belongs to (weekends skipped, holidays not
+modelled, so a holiday only costs a re-fetch); intraday quotes such as a last
+traded price only for a few minutes; outstanding shares for a fixed TTL. A re-run on the same
+day therefore only fetches rows that are new, failed last time or expired.
+
+Cache file:
+    {"price": {url: {"result": ..., "stored_at": ..., "expires_at": ...}},
+     "shares": {url: {...}}}
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime, time as day_time, timedelta, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from src.extractor_registry import ExtractorRegistry
+
+RESULTS_CACHE_PATH = os.path.join("data", "cache", "results.json")
+
+# Outstanding shares change with creations/redemptions, not with the exchange close
+DEFAULT_SHARES_TTL = timedelta(hours=24)
+
+# Price result keys (see PRICE_PRIORITY_KEYWORDS) that only change when the
+# exchange closes: closing prices and NAVs ("vl" = valeur liquidative, "valor da
+# cota"). Any other key, e.g. "last traded price", "share price" from a live
+# quote, "open" or "ai extracted price", may move during the session.
+END_OF_DAY_PRICE_KEYS = frozenset(key.lower() for key in (
+    "closing price prev trading day", "closing price", "previous close", "last close",
+    "previous closing price", "market close", "valuation price", "vl", "valor da cota",
+    "value per etc security",
+))
+INTRADAY_PRICE_TTL = timedelta(minutes=15)
+
+
+class ExchangeSession:
+    """Daily close of an exchange in its local time zone."""
+
+    def __init__(self, name, tz, close):
+        """
+        Args:
+            name: exchange name for logging, e.g. "Xetra"
+            tz: IANA time zone of the exchange, e.g. "Europe/Berlin"
+            close: local closing time as "HH:MM"
+        """
+        self.name = name
+        self.tz = tz
+        hour, minute = close.split(":")
+        self.close = day_time(int(hour), int(minute))
+
+    def next_close(self, after):
+        """
+        First close strictly after the given time, skipping weekends.
+
+        Args:
+            after: timezone-aware datetime
+
+        Returns:
+            timezone-aware datetime (UTC)
+        """
+        try:
+            zone, close = ZoneInfo(self.tz), self.close
+        except ZoneInfoNotFoundError:
+            # No tz database (e.g. Windows without tzdata): use the default close in UTC
+            zone, close = timezone.utc, DEFAULT_SESSION.close
+        local_now = after.astimezone(zone)
+        day = local_now.date()
+        while True:
+            candidate = datetime.combine(day, close, tzinfo=zone)
+            if candidate.weekday() < 5 and candidate > local_now:
+                return candidate.astimezone(timezone.utc)
+            day += timedelta(days=1)
+
+
+# Sites without a listed exchange expire at 22:00 UTC, after the US close
+DEFAULT_SESSION = ExchangeSession("default", "UTC", "22:00")
+
+# Exchange whose close invalidates a price, looked up by the URL's host like
+# the extractors; country-code TLDs act as a fallback for that country's sites
+EXCHANGE_SESSIONS = ExtractorRegistry("exchange sessions")
+
+_XETRA = ExchangeSession("Xetra", "Europe/Berlin", "17:30")
+_EURONEXT = ExchangeSession("Euronext", "Europe/Paris", "17:30")
+_SIX = ExchangeSession("SIX", "Europe/Zurich", "17:30")
+_NORDIC = ExchangeSession("Nasdaq Stockholm", "Europe/Stockholm", "17:30")
+_LSE = ExchangeSession("LSE", "Europe/London", "16:30")
+_US = ExchangeSession("NYSE/Nasdaq", "America/New_York", "16:00")
+_TSX = ExchangeSession("TSX", "America/Toronto", "16:00")
+_ASX = ExchangeSession("ASX", "Australia/Sydney", "16:00")
+_B3 = ExchangeSession("B3", "America/Sao_Paulo", "17:00")
+_HKEX = ExchangeSession("HKEX", "Asia/Hong_Kong", "16:00")
+
+for _host, _session in (
+    ("boerse-frankfurt.de", _XETRA),
+    ("de", _XETRA),
+    ("li", _SIX),
+    ("euronext.com", _EURONEXT),
+    ("fr", _EURONEXT),
+    ("nl", _EURONEXT),
+    ("be", _EURONEXT),
+    ("six-group.com", _SIX),
+    ("bxswiss.com", _SIX),
+    ("ch", _SIX),
+    ("nasdaq.com", _US),
+    ("cboe.com", _US),
+    ("se", _NORDIC),
+    ("londonstockexchange.com", _LSE),
+    ("uk", _LSE),
+    ("tmx.com", _TSX),
+    ("ca", _TSX),
+    ("au", _ASX),
+    ("br", _B3),
+    ("hk", _HKEX),
+):
+    EXCHANGE_SESSIONS.register(_host, _session)
+EXCHANGE_SESSIONS.register("nasdaq.com", _NORDIC, path_prefix="/european-market-activity")
+EXCHANGE_SESSIONS.register("cboe.com", _ASX, path_prefix="/au")
+EXCHANGE_SESSIONS.register("cboe.com", _EURONEXT, path_prefix="/europe")
+
+
+def exchange_session(url):
+    """Exchange session whose close invalidates a price scraped from url."""
+    return EXCHANGE_SESSIONS.lookup(url) or DEFAULT_SESSION
+
+
+def _utcnow():
+    return datetime.now(timezone.utc)
+
+
+class ResultCache:
+    """Successful row results kept across runs until their value can change."""
+
+    KINDS = ("price", "shares")
+
+    def __init__(self, path=RESULTS_CACHE_PATH, shares_ttl=DEFAULT_SHARES_TTL):
+        """
+        Args:
+            path: JSON file holding the cache
+            shares_ttl: how long outstanding shares are reused (timedelta)
+        """
+        self.path = path
+        self.shares_ttl = shares_ttl
+        self._lock = threading.Lock()
+        self._entries = {kind: {} for kind in self.KINDS}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+            for kind in self.KINDS:
+                self._entries[kind].update(stored.get(kind, {}))
+        except FileNotFoundError:
+            pass
+        except (ValueError, AttributeError) as e:
+            logging.warning(f"Result cache {path} is unreadable, starting empty: {e}")
+
+    def expires_at(self, kind, url, stored_at, value_key=None):
+        """
+        When a result of the given kind fetched at stored_at stops being valid.
+
+        Args:
+            value_key: result key of the price written to the workbook; prices
+                       not in END_OF_DAY_PRICE_KEYS expire after INTRADAY_PRICE_TTL
+                       (or at the close, if that comes first)
+        """
+        if kind == "shares":
+            return stored_at + self.shares_ttl
+        close = exchange_session(url).next_close(stored_at)
+        if (value_key or "").lower() in END_OF_DAY_PRICE_KEYS:
+            return close
+        return min(close, stored_at + INTRADAY_PRICE_TTL)
+
+    def get(self, kind, url, now=None):
+        """
+        Cached result for (kind, url) if it has not expired.
+
+        Returns:
+            The stored result, or None
+        """
+        entry = self._entries[kind].get(url)
+        if entry is None or self._expired(entry, now or _utcnow()):
+            return None
+        return entry.get("result")
+
+    def fresh_rows(self, kind, rows_urls, now=None):
+        """
+        Rows of rows_urls whose result is still cached.
+
+        Returns:
+            list of (row, url, result) in row order
+        """
+        now = now or _utcnow()
+        fresh = []
+        for row, url in sorted(rows_urls.items()):
+            result = self.get(kind, url, now)
+            if result is not None:
+                fresh.append((row, url, result))
+        return fresh
+
+    def store(self, kind, url, result, now=None, value_key=None):
+        """
+        Remember a successful result; callers only store results worth reusing.
+
+        Args:
+            value_key: for prices, the result key the workbook value came from
+                       (decides between end-of-day and intraday expiry)
+        """
+        stored_at = now or _utcnow()
+        entry = {
+            "result": result,
+            "stored_at": stored_at.isoformat(timespec="seconds"),
+            "expires_at": self.expires_at(kind, url, stored_at, value_key).isoformat(timespec="seconds"),
+        }
+        with self._lock:
+            self._entries[kind][url] = entry
+
+    def save(self, now=None):
+        """Write the cache (without expired entries) atomically."""
+        now = now or _utcnow()
+        with self._lock:
+            for entries in self._entries.values():
+                for url in [url for url, entry in entries.items() if self._expired(entry, now)]:
+                    del entries[url]
+            data = json.dumps(self._entries, default=str)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp_path, self.path)
+
+    @staticmethod
+    def _expired(entry, now):
+        try:
+            return now >= datetime.fromisoformat(entry["expires_at"])
+        except (KeyError, TypeError, ValueError):
+            return True
+
+    def __len__(self):
+        return sum(len(entries) for entries in self._entries.values())
@@ -0,0 +1,147 @@
+"""
+Append-only journal of per-row results for crash-safe update runs.
+
+The updaters used to keep their results in memory (or re-save the whole
+workbook after every row), so a Chrome or process crash late in a run meant
+starting again from row one. Each finished row is now appended as one JSON
+line and flushed to disk before the next row is reported. A run started with
+resume=True picks up the last unfinished journal and skips the rows it
+already holds; a run that reaches the end marks its journal finished, so the
+next run starts fresh.
+
+Journal lines:
+    {"event": "start", "run_id": ..., "script": ..., "started_at": ...}
+    {"event": "resume", "at": ...}
+    {"event": "row", "row": 12, "url": ..., "result": {...}, "at": ...}
+    {"event": "finish", "at": ...}
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+
+JOURNAL_DIR = os.path.join("data", "cache", "journals")
+
+
+def journal_path(script):
+    """Path of the journal used by the given script name (e.g. "excel_stock_updater")."""
+    return os.path.join(JOURNAL_DIR, f"{script}.jsonl")
+
+
+def _read_events(path):
+    """Read journal events, ignoring a torn last line left by a crash mid-write."""
+    events = []
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    events.append(json.loads(line))
+                except json.JSONDecodeError:
+                    logging.warning(f"Journal {path}: skipping unreadable line {line_no}")
+    except FileNotFoundError:
+        return []
+    return events
+
+
+class RunJournal:
+    """Append-only record of the rows finished by one update run."""
+
+    def __init__(self, path, script, resume=False):
+        """
+        Args:
+            path: JSONL file holding the journal
+            script: name of the script writing it (recorded in the start event)
+            resume: continue the existing journal if its run did not finish;
+                    otherwise (or if there is nothing to resume) start a new run
+        """
+        self.path = path
+        self.script = script
+        self._lock = threading.Lock()
+        self._rows = {}
+        self.run_id = None
+        self.resumed = False
+
+        events = _read_events(path) if resume else []
+        if events and events[0].get("event") == "start" and events[-1].get("event") != "finish":
+            self.run_id = events[0].get("run_id")
+            for event in events:
+                if event.get("event") == "row":
+                    self._rows[event["row"]] = (event.get("url"), event.get("result"))
+            self.resumed = True
+            logging.info(f"Resuming run {self.run_id} from {path}: {len(self._rows)} rows already done")
+        elif resume:
+            logging.info(f"No unfinished run in {path} - starting a new run")
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        if self.resumed:
+            self._file = open(path, "a", encoding="utf-8")
+            if self._file.tell() and not _ends_with_newline(path):
+                # Terminate a line torn by the crash so the next event starts cleanly
+                self._file.write("\n")
+            self._append({"event": "resume", "at": _now()})
+        else:
+            self.run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+            self._file = open(path, "w", encoding="utf-8")
+            self._append({"event": "start", "run_id": self.run_id, "script": script, "started_at": _now()})
+
+    @classmethod
+    def open(cls, script, resume=False):
+        """Open the journal for a script at its default location."""
+        return cls(journal_path(script), script, resume=resume)
+
+    def _append(self, event):
+        self._file.write(json.dumps(event, default=str) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def completed(self, rows_urls):
+        """
+        Rows of rows_urls that the resumed run already finished.
+
+        A row only counts as done if its URL is unchanged, so editing column P
+        between the crash and the resume re-processes that row.
+
+        Returns:
+            list of (row, url, result) in row order
+        """
+        done = []
+        for row, url in sorted(rows_urls.items()):
+            journaled = self._rows.get(row)
+            if journaled is not None and journaled[0] == url:
+                done.append((row, url, journaled[1]))
+        return done
+
+    def record(self, row, url, result):
+        """Append one finished row; it is on disk when this returns."""
+        with self._lock:
+            self._rows[row] = (url, result)
+            self._append({"event": "row", "row": row, "url": url, "result": result, "at": _now()})
+
+    def finish(self):
+        """Mark the run complete so the next --resume starts a new run."""
+        with self._lock:
+            if self._file.closed:
+                return
+            self._append({"event": "finish", "at": _now()})
+            self._file.close()
+
+    def close(self):
+        """Close the journal without marking the run finished (it stays resumable)."""
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+def _ends_with_newline(path):
+    with open(path, "rb") as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b"\n"
+
+
+def _now():
+    return datetime.now().isoformat(timespec="seconds")
@@ -2,14 +2,13 @@ import re
 import logging
 import time
 import requests
-from bs4 import BeautifulSoup
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
-from webdriver_manager.chrome import ChromeDriverManager
+from src.driver_factory import create_chrome_driver
+from src.html_parsing import parse_html
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, 
@@ -55,7 +54,7 @@ def extract_sixgroup_shares(driver, url):
         logging.error(f"Timed out waiting for page to load: {modified_url}")
         return {"error": "Timed out waiting for page to load"}
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
+    soup = parse_html(driver.page_source)
     
     # Specifically look for tables on the product details page
     tables = soup.find_all('table')
@@ -181,10 +180,7 @@ def get_sixgroup_shares_outstanding(url):
     options.add_argument("--disable-gpu")
     options.add_argument("--window-size=1920x1080")
     
-    driver = webdriver.Chrome(
-        service=ChromeService(ChromeDriverManager().install()),
-        options=options
-    )
+    driver = create_chrome_driver(options)
     
     try:
         result = extract_sixgroup_shares(driver, url)
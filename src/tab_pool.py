@@ -0,0 +1,293 @@
+"""
+Several rows in parallel as tabs of one Chrome.
+
+A worker per Chrome process costs a few hundred MB of RAM per worker. In tab
+mode one browser hosts K tabs and each worker thread drives its own tab
+through a TabDriver: a stand-in for the WebDriver whose commands switch to
+the worker's tab first. Commands to the browser are serialized by a lock, but
+only for the duration of a single command - page loads (TabDriver.get),
+readiness waits and extractor sleeps happen outside the lock, so a slow page
+in one tab does not hold up the others.
+
+TabBrowser starts the shared browser lazily, opens a tab per worker and
+restarts the browser if it crashed; it quits the browser when the last tab is
+closed. TabDrivers plug into run_rows/ManagedDriver like ordinary drivers, and
+TabDriver.prefetch() lets run_rows start loading a worker's next row in a
+spare tab while the current row is extracted.
+
+The Chrome performance log is shared by all tabs, so network capture
+(src.network_capture) is not used in tab mode; resource blocking is set up
+per tab.
+"""
+
+import logging
+import threading
+import time
+import uuid
+from urllib.parse import urldefrag
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.remote.webelement import WebElement
+
+from src.driver_factory import apply_resource_blocking, enable_resource_blocking
+
+# Chrome flags that keep background tabs running at full speed
+TAB_MODE_ARGUMENTS = [
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+]
+
+DEFAULT_PAGE_LOAD_TIMEOUT = 60
+LOAD_POLL_INTERVAL = 0.2
+
+
+class TabBrowser:
+    """One Chrome process shared by several TabDrivers."""
+
+    def __init__(self, create_driver, page_load_timeout=DEFAULT_PAGE_LOAD_TIMEOUT):
+        """
+        Args:
+            create_driver: callable() returning a new WebDriver (started on first use)
+            page_load_timeout: seconds TabDriver.get() waits for a page to load
+        """
+        self.create_driver = create_driver
+        self.page_load_timeout = page_load_timeout
+        self.driver = None
+        self.lock = threading.RLock()
+        self.current_handle = None
+        self.tabs = set()
+        self.sessions = 0
+
+    def _alive(self):
+        if self.driver is None:
+            return False
+        try:
+            process = getattr(getattr(self.driver, "service", None), "process", None)
+            if process is not None and process.poll() is not None:
+                return False
+            self.driver.window_handles
+            return True
+        except Exception:
+            return False
+
+    def new_tab(self):
+        """Open a tab for one worker (starting or restarting the browser if needed)."""
+        with self.lock:
+            if not self._alive():
+                if self.driver is not None:
+                    logging.info("Tab browser: browser is gone, starting a new one")
+                    self._quit_browser()
+                self.driver = self.create_driver()
+                self.sessions += 1
+                self.tabs = set()
+                # The browser's first window becomes the first tab
+                handle = self.driver.current_window_handle
+                self.current_handle = handle
+                tab = TabDriver(self, self.driver, handle)
+            else:
+                self.driver.switch_to.new_window("tab")
+                handle = self.driver.current_window_handle
+                self.current_handle = handle
+                tab = TabDriver(self, self.driver, handle)
+                # DevTools commands apply to one tab: repeat the blocking setup for this one
+                if getattr(self.driver, "_blocked_url_patterns", None) is not None:
+                    enable_resource_blocking(tab)
+            self.tabs.add(handle)
+            logging.info(f"Tab browser: opened tab {len(self.tabs)} ({handle})")
+            return tab
+
+    def switch_to(self, driver, handle):
+        """Make handle the current window (caller holds the lock)."""
+        if self.driver is not driver:
+            raise RuntimeError("invalid session id: tab belongs to a browser that was restarted")
+        if self.current_handle != handle:
+            driver.switch_to.window(handle)
+            self.current_handle = handle
+
+    def close_tab(self, driver, handle):
+        """Close one tab; the browser quits with its last tab."""
+        with self.lock:
+            if self.driver is not driver:
+                return
+            self.tabs.discard(handle)
+            if not self.tabs:
+                self._quit_browser()
+                return
+            try:
+                self.switch_to(driver, handle)
+                driver.close()
+            except Exception as e:
+                logging.debug(f"Tab browser: could not close tab {handle}: {e}")
+            self.current_handle = None
+
+    def _quit_browser(self):
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+        self.driver = None
+        self.current_handle = None
+        self.tabs = set()
+
+    def close(self):
+        """Quit the browser and all of its tabs."""
+        with self.lock:
+            if self.driver is not None:
+                self._quit_browser()
+
+
+def _unwrap(value):
+    if isinstance(value, TabElement):
+        return value._element
+    if isinstance(value, (list, tuple)):
+        return type(value)(_unwrap(v) for v in value)
+    return value
+
+
+class _TabProxy:
+    """Runs attribute access and method calls on an object while its tab is current."""
+
+    def __init__(self, browser, driver, handle):
+        object.__setattr__(self, "_browser", browser)
+        object.__setattr__(self, "_driver", driver)
+        object.__setattr__(self, "_handle", handle)
+
+    def _target(self):
+        raise NotImplementedError
+
+    def _wrap(self, value):
+        if isinstance(value, WebElement):
+            return TabElement(self._browser, self._driver, self._handle, value)
+        if isinstance(value, list) and value and all(isinstance(v, WebElement) for v in value):
+            return [TabElement(self._browser, self._driver, self._handle, v) for v in value]
+        return value
+
+    def __getattr__(self, name):
+        with self._browser.lock:
+            self._browser.switch_to(self._driver, self._handle)
+            value = getattr(self._target(), name)
+            if not callable(value):
+                return self._wrap(value)
+
+        def call(*args, **kwargs):
+            with self._browser.lock:
+                self._browser.switch_to(self._driver, self._handle)
+                result = value(*_unwrap(args), **{k: _unwrap(v) for k, v in kwargs.items()})
+            return self._wrap(result)
+
+        return call
+
+    def __setattr__(self, name, value):
+        setattr(self._target(), name, value)
+
+
+class TabElement(_TabProxy):
+    """A WebElement of one tab; its commands switch to that tab first."""
+
+    def __init__(self, browser, driver, handle, element):
+        super().__init__(browser, driver, handle)
+        object.__setattr__(self, "_element", element)
+
+    def _target(self):
+        return self._element
+
+    def __eq__(self, other):
+        return _unwrap(other) == self._element
+
+    def __hash__(self):
+        return hash(self._element)
+
+
+class TabDriver(_TabProxy):
+    """
+    WebDriver stand-in for one tab of a TabBrowser.
+
+    get() starts the navigation and waits for the new document without holding
+    the browser lock; quit() closes only this tab.
+    """
+
+    def _target(self):
+        return self._driver
+
+    def __setattr__(self, name, value):
+        # Per-tab state (e.g. the blocked URL patterns) stays on the tab
+        object.__setattr__(self, name, value)
+
+    @property
+    def window_handles(self):
+        # Health check used by ManagedDriver: fails once the tab or browser is gone
+        with self._browser.lock:
+            self._browser.switch_to(self._driver, self._handle)
+            if self._handle not in self._driver.window_handles:
+                raise RuntimeError(f"no such window: tab {self._handle} was closed")
+            return [self._handle]
+
+    @property
+    def service(self):
+        return self._driver.service
+
+    def get(self, url):
+        """Navigate this tab to url and wait until the new document has loaded."""
+        prefetched = self.__dict__.pop("_prefetched", None)
+        if prefetched is not None and prefetched[0] == url:
+            # prefetch() already started this load; only the rest of it is waited for
+            token = prefetched[1]
+        else:
+            token = self._navigate(url)
+        if token is not None:
+            self._wait_for_load(url, token)
+
+    def prefetch(self, url):
+        """
+        Start loading url in this tab without waiting for it. The next get(url)
+        on this tab picks up the load instead of navigating again.
+        """
+        apply_resource_blocking(self, url)
+        object.__setattr__(self, "_prefetched", (url, self._navigate(url)))
+
+    def _navigate(self, url):
+        """Start a navigation; returns the token marking the old document, or None if done."""
+        token = uuid.uuid4().hex
+        with self._browser.lock:
+            self._browser.switch_to(self._driver, self._handle)
+            current = self._driver.current_url
+            if current == url:
+                # Same URL: reload it like driver.get() would, and wait for the new document
+                # (with page_load_strategy "none" a plain get() would return mid-reload)
+                self._driver.execute_script("window.__tabNavigation = arguments[0]; window.location.reload();", token)
+                return token
+            if urldefrag(current)[0] == urldefrag(url)[0]:
+                # Fragment-only change (e.g. SIX "#/" routes): no new document to wait for
+                self._driver.get(url)
+                return None
+            self._driver.execute_script(
+                "window.__tabNavigation = arguments[0]; window.location.href = arguments[1];", token, url)
+        return token
+
+    def _wait_for_load(self, url, token):
+        deadline = time.monotonic() + self._browser.page_load_timeout
+        while time.monotonic() < deadline:
+            with self._browser.lock:
+                self._browser.switch_to(self._driver, self._handle)
+                try:
+                    state = self._driver.execute_script(
+                        "return window.__tabNavigation === arguments[0] ? 'old' : document.readyState;", token)
+                except Exception as e:
+                    # The old document can disappear mid-call while the new one commits
+                    if "invalid session id" in str(e) or "no such window" in str(e):
+                        raise
+                    state = None
+            if state == "complete":
+                return
+            time.sleep(LOAD_POLL_INTERVAL)
+        raise TimeoutException(f"Timed out loading {url} in tab after {self._browser.page_load_timeout}s")
+
+    def quit(self):
+        self._browser.close_tab(self._driver, self._handle)
+
+    def close(self):
+        self.quit()
+
+    def __repr__(self):
+        return f"TabDriver({self._handle})"
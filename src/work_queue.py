@@ -0,0 +1,288 @@
+"""
+Shared work queue for splitting an update run across processes and hosts.
+
+A coordinator puts one job per spreadsheet row into the queue; workers (on
+the same box or on other machines that can reach the queue file) lease jobs,
+process them with their own browser and post the results back. A lease
+expires after a visibility timeout, so the row of a worker that crashed or
+lost its connection is handed to another worker; a row whose processing
+raises is retried up to max_attempts times. Only the coordinator reads the
+results and writes the workbook.
+
+The backend is a SQLite database on a shared path (local disk, or a network
+share with working file locks). Every operation opens its own connection, so
+a WorkQueue can be used from several threads and processes at once.
+"""
+
+import json
+import logging
+import os
+import socket
+import sqlite3
+import time
+import uuid
+from datetime import datetime
+
+DEFAULT_QUEUE_PATH = os.path.join("data", "cache", "work_queue.sqlite")
+DEFAULT_VISIBILITY_TIMEOUT = 600
+DEFAULT_MAX_ATTEMPTS = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    mode TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    closed INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS jobs (
+    run_id TEXT NOT NULL,
+    row INTEGER NOT NULL,
+    url TEXT NOT NULL,
+    payload TEXT,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    lease_owner TEXT,
+    lease_expires REAL,
+    result TEXT,
+    collected INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL,
+    PRIMARY KEY (run_id, row)
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (run_id, status, lease_expires);
+"""
+
+
+def default_worker_id():
+    """Identifier for this worker process, e.g. "host-a:1234:9f3c"."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:4]}"
+
+
+class WorkQueue:
+    """SQLite-backed job queue with leases, visibility timeouts and retries."""
+
+    def __init__(self, path=DEFAULT_QUEUE_PATH, timeout=30.0):
+        """
+        Args:
+            path: SQLite file shared by the coordinator and the workers
+            timeout: seconds to wait for a lock held by another process
+        """
+        self.path = path
+        self.timeout = timeout
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return _Connection(conn)
+
+    # --- Coordinator side -------------------------------------------------
+
+    def create_run(self, mode, rows_urls, payloads=None, max_attempts=DEFAULT_MAX_ATTEMPTS, results=None):
+        """
+        Enqueue one job per row.
+
+        Args:
+            mode: what the workers should run ("price", "shares" or "combined")
+            rows_urls: dict row -> URL
+            payloads: optional dict row -> JSON-serializable extras (e.g. the fallback URL)
+            max_attempts: times a row is tried before it is reported as failed
+            results: optional dict row -> result for rows that need no worker (e.g. PDFs
+                     in a price run); they are stored as done and collected like any other
+
+        Returns:
+            The new run id
+        """
+        run_id = datetime.now().strftime("%Y%m%d_%H%M%S_") + uuid.uuid4().hex[:6]
+        payloads = payloads or {}
+        results = results or {}
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("INSERT INTO runs (run_id, mode, created_at) VALUES (?, ?, ?)",
+                         (run_id, mode, datetime.now().isoformat(timespec="seconds")))
+            conn.executemany(
+                "INSERT INTO jobs (run_id, row, url, payload, max_attempts, updated_at, status, result) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(run_id, row, url, json.dumps(payloads.get(row)), max_attempts, now,
+                  "done" if row in results else "pending",
+                  json.dumps(results[row], default=str) if row in results else None)
+                 for row, url in sorted(rows_urls.items())],
+            )
+            conn.execute("COMMIT")
+        logging.info(f"Work queue: run {run_id} ({mode}) with {len(rows_urls)} jobs in {self.path}")
+        return run_id
+
+    def collect(self, run_id):
+        """
+        Results finished since the last call (each row is returned once).
+
+        Returns:
+            list of (row, url, result) - failed rows carry {"error": ...}
+        """
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute(
+                "SELECT row, url, result FROM jobs WHERE run_id = ? AND status IN ('done', 'failed') "
+                "AND collected = 0 ORDER BY row",
+                (run_id,),
+            ).fetchall()
+            conn.executemany("UPDATE jobs SET collected = 1 WHERE run_id = ? AND row = ?",
+                             [(run_id, r["row"]) for r in rows])
+            conn.execute("COMMIT")
+        return [(r["row"], r["url"], json.loads(r["result"])) for r in rows]
+
+    def reset_collected(self, run_id):
+        """Return every finished row again on the next collect() (for a restarted coordinator)."""
+        with self._connect() as conn:
+            conn.execute("UPDATE jobs SET collected = 0 WHERE run_id = ?", (run_id,))
+
+    def counts(self, run_id):
+        """Number of jobs per status, e.g. {"pending": 10, "leased": 2, "done": 30}."""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT status, COUNT(*) AS n FROM jobs WHERE run_id = ? GROUP BY status",
+                                (run_id,)).fetchall()
+        return {r["status"]: r["n"] for r in rows}
+
+    def is_finished(self, run_id):
+        """True once every job of the run is done or failed."""
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            _fail_expired_last_attempts(conn, run_id, time.time())
+            conn.execute("COMMIT")
+        counts = self.counts(run_id)
+        return counts.get("pending", 0) == 0 and counts.get("leased", 0) == 0
+
+    def close_run(self, run_id):
+        """Mark a run closed so idle workers stop waiting for it."""
+        with self._connect() as conn:
+            conn.execute("UPDATE runs SET closed = 1 WHERE run_id = ?", (run_id,))
+
+    # --- Worker side --------------------------------------------------------
+
+    def open_run(self):
+        """
+        The most recent run that is still open.
+
+        Returns:
+            (run_id, mode), or (None, None) if there is none
+        """
+        with self._connect() as conn:
+            row = conn.execute("SELECT run_id, mode FROM runs WHERE closed = 0 "
+                               "ORDER BY created_at DESC, rowid DESC LIMIT 1").fetchone()
+        return (row["run_id"], row["mode"]) if row else (None, None)
+
+    def run_mode(self, run_id):
+        """Mode of a run, or None if it does not exist."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT mode FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        return row["mode"] if row else None
+
+    def is_closed(self, run_id):
+        """True if the coordinator closed the run (or it does not exist)."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT closed FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        return row is None or bool(row["closed"])
+
+    def lease(self, run_id, worker_id, visibility_timeout=DEFAULT_VISIBILITY_TIMEOUT):
+        """
+        Lease the next available job: a pending one, or one whose lease expired.
+
+        Returns:
+            dict with row, url, payload and attempt, or None if nothing is available
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            _fail_expired_last_attempts(conn, run_id, now)
+            job = conn.execute(
+                "SELECT row, url, payload, attempts FROM jobs WHERE run_id = ? AND attempts < max_attempts "
+                "AND (status = 'pending' OR (status = 'leased' AND lease_expires < ?)) "
+                "ORDER BY attempts, row LIMIT 1",
+                (run_id, now),
+            ).fetchone()
+            if job is None:
+                conn.execute("COMMIT")
+                return None
+            conn.execute(
+                "UPDATE jobs SET status = 'leased', attempts = attempts + 1, lease_owner = ?, "
+                "lease_expires = ?, updated_at = ? WHERE run_id = ? AND row = ?",
+                (worker_id, now + visibility_timeout, now, run_id, job["row"]),
+            )
+            conn.execute("COMMIT")
+        return {
+            "row": job["row"],
+            "url": job["url"],
+            "payload": json.loads(job["payload"]) if job["payload"] else None,
+            "attempt": job["attempts"] + 1,
+        }
+
+    def complete(self, run_id, row, worker_id, result):
+        """
+        Post a job's result. The first result for a row wins; a worker whose
+        lease expired may still complete the row if nobody else has.
+
+        Returns:
+            True if the result was stored
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = 'done', result = ?, lease_owner = ?, updated_at = ? "
+                "WHERE run_id = ? AND row = ? AND status NOT IN ('done', 'failed')",
+                (json.dumps(result, default=str), worker_id, time.time(), run_id, row),
+            )
+            return cursor.rowcount == 1
+
+    def fail(self, run_id, row, worker_id, error):
+        """
+        Report that processing a job raised. The row goes back to the queue
+        until it has used max_attempts, then it is reported as failed.
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            job = conn.execute("SELECT attempts, max_attempts, status, lease_owner FROM jobs "
+                               "WHERE run_id = ? AND row = ?", (run_id, row)).fetchone()
+            if job is None or job["status"] != "leased" or job["lease_owner"] != worker_id:
+                conn.execute("COMMIT")
+                return
+            if job["attempts"] >= job["max_attempts"]:
+                conn.execute("UPDATE jobs SET status = 'failed', result = ?, updated_at = ? "
+                             "WHERE run_id = ? AND row = ?",
+                             (json.dumps({"error": str(error)}), now, run_id, row))
+            else:
+                conn.execute("UPDATE jobs SET status = 'pending', lease_owner = NULL, lease_expires = NULL, "
+                             "updated_at = ? WHERE run_id = ? AND row = ?", (now, run_id, row))
+            conn.execute("COMMIT")
+
+
+def _fail_expired_last_attempts(conn, run_id, now):
+    """Fail rows whose lease expired on their last attempt, so they are not handed out again."""
+    expired = conn.execute(
+        "SELECT row, lease_owner FROM jobs WHERE run_id = ? AND status = 'leased' "
+        "AND lease_expires < ? AND attempts >= max_attempts",
+        (run_id, now),
+    ).fetchall()
+    for job in expired:
+        result = {"error": f"Lease expired on worker {job['lease_owner']} after the last attempt"}
+        conn.execute("UPDATE jobs SET status = 'failed', result = ?, lease_owner = NULL, "
+                     "updated_at = ? WHERE run_id = ? AND row = ?",
+                     (json.dumps(result), now, run_id, job["row"]))
+
+
+class _Connection:
+    """Context manager that closes the sqlite3 connection (sqlite3's own only commits)."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None and self.conn.in_transaction:
+            self.conn.execute("ROLLBACK")
+        self.conn.close()
+        return False
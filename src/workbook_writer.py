@@ -0,0 +1,198 @@
+"""
+Batched background writer for the results workbook.
+
+Saving Custodians_Results.xlsx re-serializes every sheet of the workbook, so
+saving after each row spent minutes per run zipping the same XML again. The
+WorkbookWriter owns the workbook while a run is in progress: cell updates are
+queued, applied in memory by a background thread, and the file is written only
+every few rows, every few seconds, and once at shutdown. Per-row durability
+comes from the run journal (src.run_journal), not from the workbook file.
+
+While the writer is running, only its thread touches the workbook; read
+anything needed from the worksheet (e.g. blue cells) before start().
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+
+DEFAULT_FLUSH_ROWS = 25
+DEFAULT_FLUSH_SECONDS = 60.0
+
+_STOP = object()
+
+
+def _set_value(cell, value):
+    cell.value = value
+
+
+def timestamped_alt_path(path):
+    """
+    alt_path_factory that saves next to path with a timestamp suffix.
+
+    For data/Custodians_Results.xlsx it returns e.g.
+    data/Custodians_Results_1760608800.xlsx, so every updater falls back to the
+    same directory as the results file.
+    """
+    stem, ext = os.path.splitext(path)
+    return lambda: f"{stem}_{int(time.time())}{ext}"
+
+
+class WorkbookWriter:
+    """Applies queued cell updates to a workbook and saves it on a cadence."""
+
+    def __init__(self, wb, path, set_value=None, flush_rows=DEFAULT_FLUSH_ROWS,
+                 flush_seconds=DEFAULT_FLUSH_SECONDS, alt_path_factory=None):
+        """
+        Args:
+            wb: openpyxl Workbook to update
+            path: file the workbook is saved to
+            set_value: function(cell, value) used to write a cell
+                       (e.g. preserve_cell_color_and_set_value); defaults to cell.value = value
+            flush_rows: save after this many finished rows (0 disables the row cadence)
+            flush_seconds: save when the last save is older than this and there are
+                           unsaved updates (0 disables the time cadence)
+            alt_path_factory: function() -> path used when path is locked (PermissionError);
+                              later saves keep using the alternative path
+        """
+        self.wb = wb
+        self.path = path
+        self.set_value = set_value or _set_value
+        self.flush_rows = flush_rows
+        self.flush_seconds = flush_seconds
+        self.alt_path_factory = alt_path_factory
+        self.saves = 0
+        self.save_seconds = 0.0
+        self._queue = queue.Queue()
+        self._thread = None
+        self._dirty_rows = 0
+        self._dirty = False
+        self._last_save = time.monotonic()
+        self._error = None
+
+    def start(self):
+        """Start the background thread; returns self."""
+        self._thread = threading.Thread(target=self._run, name="workbook-writer", daemon=True)
+        self._thread.start()
+        return self
+
+    def put(self, sheet, coordinate, value):
+        """Queue one cell update, e.g. put("Non-derivative exposures", "M12", "1,000")."""
+        self._queue.put(("cell", sheet, coordinate, value))
+
+    def row_done(self):
+        """Mark the end of one row's updates (counts towards the row cadence)."""
+        self._queue.put(("row",))
+
+    def flush(self):
+        """Save now and wait for the save to finish."""
+        done = threading.Event()
+        self._queue.put(("flush", done))
+        done.wait()
+
+    def close(self):
+        """
+        Apply the remaining updates, save once more and stop the thread.
+
+        Returns:
+            The path the workbook was last saved to.
+
+        Raises:
+            The last save error, if the final save failed.
+        """
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join()
+            self._thread = None
+        if self._error is not None:
+            raise self._error
+        return self.path
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def _run(self):
+        while True:
+            timeout = None
+            if self.flush_seconds and self._dirty:
+                timeout = max(0.0, self._last_save + self.flush_seconds - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                self._save()
+                continue
+
+            if item is _STOP:
+                if self._dirty or self.saves == 0:
+                    self._save()
+                return
+
+            kind = item[0]
+            if kind == "cell":
+                _, sheet, coordinate, value = item
+                try:
+                    self.set_value(self.wb[sheet][coordinate], value)
+                    self._dirty = True
+                except Exception as e:
+                    logging.error(f"Workbook writer: could not set {sheet}!{coordinate}: {e}")
+            elif kind == "row":
+                self._dirty_rows += 1
+                if self.flush_rows and self._dirty_rows >= self.flush_rows:
+                    self._save()
+            elif kind == "flush":
+                self._save()
+                item[1].set()
+
+            # While updates keep arriving the get() above never times out, so
+            # the time cadence is checked after every item as well
+            if self.flush_seconds and self._dirty and time.monotonic() - self._last_save >= self.flush_seconds:
+                self._save()
+
+    def _save(self):
+        start = time.monotonic()
+        try:
+            saved = self._save_to_path()
+        finally:
+            # Failed saves also wait for the next cadence instead of retrying in a loop
+            self._last_save = time.monotonic()
+        if not saved:
+            return
+        elapsed = self._last_save - start
+        self.saves += 1
+        self.save_seconds += elapsed
+        self._dirty = False
+        self._dirty_rows = 0
+        logging.info(f"Saved {self.path} in {elapsed:.1f}s")
+
+    def _save_to_path(self):
+        try:
+            self.wb.save(self.path)
+            self._error = None
+            return True
+        except PermissionError as e:
+            if self.alt_path_factory is None:
+                self._error = e
+                logging.error(f"Workbook writer: could not save to {self.path}, it may be open in another program")
+                return False
+        except Exception as e:
+            self._error = e
+            logging.error(f"Workbook writer: error saving {self.path}: {e}")
+            return False
+
+        alt_path = self.alt_path_factory()
+        logging.warning(f"Could not save to {self.path}, it may be open in another program - saving to {alt_path}")
+        try:
+            self.wb.save(alt_path)
+        except Exception as e:
+            self._error = e
+            logging.error(f"Workbook writer: could not save to {alt_path}: {e}")
+            return False
+        self.path = alt_path
+        self._error = None
+        return True
@@ -0,0 +1,103 @@
+"""
+Test script for the AI fallbacks reusing already-loaded pages
+Groq calls and the browser are replaced by fakes, so it runs offline
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import excel_stock_updater as prices
+import outstanding_shares_updater as shares
+from src.page_snapshot import PageSnapshot
+
+
+class FakeDriver:
+    """Sits on a given URL and records any further navigation"""
+
+    def __init__(self, current_url, html="<p>NAV 12.34</p>"):
+        self.current_url = current_url
+        self.html = html
+        self.visits = []
+
+    def get(self, url):
+        self.visits.append(url)
+        self.current_url = url
+
+    @property
+    def page_source(self):
+        return self.html
+
+    def execute_script(self, script, *args):
+        return None
+
+    def find_element(self, by, value):
+        return object()
+
+
+def _with_fake_groq(module, name, result, seen):
+    original_available = module.GROQ_AVAILABLE
+    original = getattr(module, name)
+    module.GROQ_AVAILABLE = True
+
+    def fake(html_content, url):
+        seen.append(html_content)
+        return result
+
+    setattr(module, name, fake)
+    return lambda: (setattr(module, name, original), setattr(module, "GROQ_AVAILABLE", original_available))
+
+
+def test_price_ai_fallback_uses_current_page():
+    """The price AI fallback analyses the page the driver is already on"""
+    seen = []
+    restore = _with_fake_groq(prices, "analyze_website_with_groq", {"ai_extracted_price": 12.34}, seen)
+    try:
+        driver = FakeDriver("https://www.example.com/fund/")
+        result = prices.try_ai_fallback(driver, "https://www.example.com/fund")
+    finally:
+        restore()
+
+    assert result == {"ai extracted price": 12.34}
+    assert driver.visits == []
+    assert seen == ["<p>NAV 12.34</p>"]
+
+
+def test_shares_ai_fallback_uses_snapshot():
+    """The shares AI fallback analyses a snapshot without navigating"""
+    seen = []
+    restore = _with_fake_groq(shares, "analyze_shares_with_groq", {"ai_extracted_shares": "1,000"}, seen)
+    try:
+        driver = FakeDriver("data:,")
+        snapshot = PageSnapshot("https://www.example.com/x", "https://www.example.com/x", "<p>1,000 units</p>")
+        result = shares.try_shares_ai_fallback(driver, "https://www.example.com/x", snapshot=snapshot)
+    finally:
+        restore()
+
+    assert result == {"outstanding_shares": "1,000 (AI)"}
+    assert driver.visits == []
+    assert seen == ["<p>1,000 units</p>"]
+
+
+def test_other_page_is_reloaded():
+    """If the driver shows a different page, the URL is loaded before analysis"""
+    seen = []
+    restore = _with_fake_groq(shares, "analyze_shares_with_groq", {"error": "none"}, seen)
+    original_sleep = shares.time.sleep
+    shares.time.sleep = lambda seconds: None
+    try:
+        driver = FakeDriver("https://www.example.com/previous-row")
+        shares.try_shares_ai_fallback(driver, "https://www.example.com/x")
+    finally:
+        shares.time.sleep = original_sleep
+        restore()
+
+    assert driver.visits == ["https://www.example.com/x"]
+
+
+if __name__ == "__main__":
+    test_price_ai_fallback_uses_current_page()
+    test_shares_ai_fallback_uses_snapshot()
+    test_other_page_is_reloaded()
+    print("✅ All AI fallback reuse tests passed")
@@ -0,0 +1,136 @@
+"""
+Test script for the shared Börse Frankfurt salt provider
+Uses a fake HTTP session and a temporary cache file, so it runs offline
+"""
+
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import excel_stock_updater
+from bf4py import connector as bf4py_connector
+from src import bf_salt
+from src.bf_salt import SaltProvider, salted_get
+
+HOMEPAGE = ('<html><script src="https://cdn.example.com/tracker.js"></script>'
+            '<script src="polyfills.1a2b.js"></script><script src="main.3c4d.js" type="module"></script></html>')
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, text=""):
+        self.status_code = status_code
+        self.text = text
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class FakeSession:
+    """Serves the homepage and bundles; the API only accepts requests signed with valid_salt."""
+
+    def __init__(self, salt="s1"):
+        self.salt = salt
+        self.valid_salt = salt
+        self.urls = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.urls.append(url)
+        if url == bf_salt.BF_HOMEPAGE:
+            return FakeResponse(text=HOMEPAGE)
+        if url.endswith("main.3c4d.js"):
+            return FakeResponse(text=f'x={{env:"prod",salt:"{self.salt}"}}')
+        if url.endswith(".js"):
+            return FakeResponse(text="var polyfill;")
+        if headers.get("x-salt") != self.valid_salt:
+            return FakeResponse(403, "Forbidden")
+        return FakeResponse(text='{"data": [{"close": 87.475}]}')
+
+
+def _sign(url, salt):
+    return {"x-salt": salt}
+
+
+def test_discovery_is_cached_on_disk():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bf_salt.json")
+        session = FakeSession()
+        assert SaltProvider(path).get(session) == "s1"
+        # The main bundle is tried before the other scripts; third-party scripts are skipped
+        assert session.urls == [bf_salt.BF_HOMEPAGE, "https://www.boerse-frankfurt.de/main.3c4d.js"]
+
+        # A new provider (e.g. the next run) reads the salt from disk
+        session.urls.clear()
+        assert SaltProvider(path).get(session) == "s1"
+        assert session.urls == []
+
+        # After the TTL the salt is discovered again
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"salt": "s1", "fetched_at": (datetime.now() - timedelta(days=2)).isoformat()}, f)
+        session.salt = "s2"
+        assert SaltProvider(path).get(session) == "s2"
+
+
+def test_rejected_request_rediscovers_salt():
+    with tempfile.TemporaryDirectory() as tmp:
+        provider = SaltProvider(os.path.join(tmp, "bf_salt.json"))
+        session = FakeSession()
+        provider.get(session)
+        # The site was redeployed with a new salt
+        session.salt = session.valid_salt = "s2"
+        session.urls.clear()
+        response = salted_get(session, "https://api.boerse-frankfurt.de/v1/data/price_history?isin=X", _sign,
+                              provider=provider)
+        assert response.status_code == 200
+        assert provider.get(session) == "s2"
+        assert session.urls.count(bf_salt.BF_HOMEPAGE) == 1
+
+
+def test_prev_close_rows_share_one_discovery():
+    session = FakeSession()
+    original_session = excel_stock_updater.get_http_session
+    original_headers = excel_stock_updater._bf_headers
+    original_provider = bf_salt.SALT_PROVIDER
+    with tempfile.TemporaryDirectory() as tmp:
+        bf_salt.SALT_PROVIDER = SaltProvider(os.path.join(tmp, "bf_salt.json"))
+        excel_stock_updater.get_http_session = lambda: session
+        excel_stock_updater._bf_headers = _sign
+        try:
+            prices = [excel_stock_updater.get_prev_close_boerse(isin) for isin in ("DE000A27Z304", "CH0445689208")]
+        finally:
+            excel_stock_updater.get_http_session = original_session
+            excel_stock_updater._bf_headers = original_headers
+            bf_salt.SALT_PROVIDER = original_provider
+    assert prices == [87.475, 87.475]
+    assert session.urls.count(bf_salt.BF_HOMEPAGE) == 1
+    assert sum("api.boerse-frankfurt.de" in url for url in session.urls) == 2
+
+
+def test_bf4py_connector_uses_shared_salt():
+    original_provider = bf4py_connector.SALT_PROVIDER
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bf_salt.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"salt": "cached", "fetched_at": datetime.now().isoformat()}, f)
+        bf4py_connector.SALT_PROVIDER = SaltProvider(path)
+        try:
+            # No network access: the salt comes from the cache file
+            assert bf4py_connector.BF4PyConnector().salt == "cached"
+            assert bf4py_connector.BF4PyConnector(salt="explicit").salt == "explicit"
+        finally:
+            bf4py_connector.SALT_PROVIDER = original_provider
+
+
+if __name__ == "__main__":
+    test_discovery_is_cached_on_disk()
+    test_rejected_request_rediscovers_salt()
+    test_prev_close_rows_share_one_discovery()
+    test_bf4py_connector_uses_shared_salt()
+    print("✅ All Boerse Frankfurt salt tests passed")
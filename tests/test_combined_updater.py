@@ -0,0 +1,141 @@
+"""
+Test script for the combined price and outstanding shares run
+Extractors and the browser are replaced by fakes, so it runs offline
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import combined_updater as combined
+from src import custom_domain_extractors
+
+
+class FakeDriver:
+    """Records each get() and serves fixed HTML"""
+
+    def __init__(self):
+        self.current_url = "data:,"
+        self.visits = []
+
+    def get(self, url):
+        self.visits.append(url)
+        self.current_url = url
+
+    @property
+    def page_source(self):
+        return "<p>Price 10.00 Shares Outstanding 1,000</p>"
+
+    def execute_script(self, script, *args):
+        return None
+
+
+def _run_row(fetch, driver, url):
+    seen = {}
+    original_fetch = combined.fetch_and_extract_data
+    original_shares = combined.process_shares_row
+
+    def fake_shares(driver, row, url, fallback_url=None, snapshot=None):
+        seen["snapshot"] = snapshot
+        return {"outstanding_shares": "1000"}, url
+
+    combined.fetch_and_extract_data = fetch
+    combined.process_shares_row = fake_shares
+    try:
+        result = combined.process_combined_row(driver, 5, url)
+    finally:
+        combined.fetch_and_extract_data = original_fetch
+        combined.process_shares_row = original_shares
+    return result, seen["snapshot"]
+
+
+def test_shares_reuse_price_page():
+    """The shares step receives the page the price step rendered"""
+    url = "https://www.example.com/fund"
+
+    def fetch(driver, url, keywords):
+        driver.get(url)
+        return {"price": 10.0}
+
+    driver = FakeDriver()
+    result, snapshot = _run_row(fetch, driver, url)
+
+    assert driver.visits == [url]
+    assert result["price"] == {"price": 10.0}
+    assert result["shares"] == {"outstanding_shares": "1000"}
+    assert snapshot is not None and snapshot.final_url == url
+
+
+def test_no_snapshot_without_render():
+    """If the price came without rendering (HTTP tier), the shares step loads the page itself"""
+    driver = FakeDriver()
+    driver.current_url = "https://www.example.com/previous-row"
+    result, snapshot = _run_row(lambda driver, url, keywords: {"price": 10.0}, driver,
+                                "https://www.example.com/fund")
+
+    assert snapshot is None
+    assert result["price"] == {"price": 10.0}
+
+
+def test_price_failure_still_runs_shares():
+    """An exception in the price step is reported and the shares step still runs"""
+    def fetch(driver, url, keywords):
+        raise RuntimeError("boom")
+
+    result, _ = _run_row(fetch, FakeDriver(), "https://www.example.com/fund")
+
+    assert result["price"] == {"error": "boom"}
+    assert result["shares"] == {"outstanding_shares": "1000"}
+
+
+class FakeElement:
+    def __init__(self, text):
+        self.text = text
+
+    def is_displayed(self):
+        return True
+
+
+class FakeValourDriver(FakeDriver):
+    """Also answers the element lookups of the Valour shares extractor"""
+
+    def find_element(self, by, value):
+        return FakeElement("")
+
+    def find_elements(self, by, value):
+        if "cookie" in value:
+            return []
+        return [FakeElement("Outstanding shares 2,500,000")]
+
+
+def test_custom_shares_extractor_reuses_price_page():
+    """The site-specific shares extractor starts from the price render instead of loading the URL again"""
+    url = "https://valour.com/en/products/valour-bitcoin-zero"
+
+    def fetch(driver, url, keywords):
+        driver.get(url)
+        return {"price": 10.0}
+
+    driver = FakeValourDriver()
+    original_fetch = combined.fetch_and_extract_data
+    original_sleep = custom_domain_extractors.time.sleep
+    combined.fetch_and_extract_data = fetch
+    custom_domain_extractors.time.sleep = lambda seconds: None
+    try:
+        result = combined.process_combined_row(driver, 5, url)
+    finally:
+        combined.fetch_and_extract_data = original_fetch
+        custom_domain_extractors.time.sleep = original_sleep
+
+    assert result["shares"]["outstanding_shares"] == "2,500,000"
+    assert result["shares"]["method"] == "custom"
+    assert driver.visits == [url]
+
+
+if __name__ == "__main__":
+    test_shares_reuse_price_page()
+    test_no_snapshot_without_render()
+    test_price_failure_still_runs_shares()
+    test_custom_shares_extractor_reuses_price_page()
+    print("✅ All combined updater tests passed")
@@ -108,40 +108,22 @@ def test_function_priority():
     """Test that enhanced functions are called before original functions"""
     print("🔍 Testing function priority (enhanced before original)...")
     
-    # Check the source code to ensure enhanced functions come first
-    import inspect
-    
-    # Get the source code of fetch_and_extract_data
-    source = inspect.getsource(fetch_and_extract_data)
-    
-    # Check that enhanced functions appear before original handlers
-    enhanced_section_pos = source.find("Enhanced Functions for Colored Cell Issues (PRIORITY)")
-    boerse_frankfurt_pos = source.find("# --- Börse-Frankfurt: Closing price prev trading day ---")
-    
-    assert enhanced_section_pos != -1, "Enhanced functions section not found"
-    assert boerse_frankfurt_pos != -1, "Börse-Frankfurt section not found"
-    assert enhanced_section_pos < boerse_frankfurt_pos, "Enhanced functions should come before original handlers"
-    
-    print("✅ Enhanced functions have priority over original handlers")
-    
-    # Check specific enhanced function positions
-    grayscale_enhanced_pos = source.find('if "grayscale.com" in url.lower():')
-    valour_enhanced_pos = source.find('if "valour.com" in url.lower():')
-    bitcap_enhanced_pos = source.find('if "bitcap.com" in url.lower():')
-    morningstar_enhanced_pos = source.find('if "morningstar.be" in url.lower():')
+    # Dispatch goes through the hostname registry; the enhanced extractors must be
+    # the ones registered for their domains
+    from excel_stock_updater import PRICE_EXTRACTORS
+    from src.plugins import load_plugin
     
     positions = [
-        ("Grayscale enhanced", grayscale_enhanced_pos),
-        ("Valour enhanced", valour_enhanced_pos),
-        ("Bitcap enhanced", bitcap_enhanced_pos),
-        ("Morningstar enhanced", morningstar_enhanced_pos)
+        ("Grayscale enhanced", "https://etfs.grayscale.com/gbtc", enhanced_grayscale_price_extraction),
+        ("Valour enhanced", "https://valour.com/en/products/valour-bitcoin", enhanced_valour_price_extraction),
+        ("Bitcap enhanced", "https://bitcap.com/en/funds/x", enhanced_bitcap_price_extraction),
+        ("Morningstar enhanced", "https://www.morningstar.be/be/etf/snapshot/x", enhanced_morningstar_price_extraction)
     ]
     
-    for name, pos in positions:
-        if pos != -1:
-            print(f"✅ {name} function properly positioned")
-        else:
-            print(f"⚠️  {name} function not found in integration")
+    for name, url, function in positions:
+        handler = PRICE_EXTRACTORS.lookup(url)
+        assert handler is not None and load_plugin(handler.extract) is function, f"{name} function not registered"
+        print(f"✅ {name} function properly registered")
     
     print("✅ Function priority tests completed\n")
 
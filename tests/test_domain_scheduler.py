@@ -0,0 +1,113 @@
+"""
+Test script for the per-domain politeness scheduler
+Runs offline - checks domain grouping, concurrency caps and spacing
+"""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.domain_scheduler import DomainScheduler, registrable_domain
+
+
+def test_registrable_domain():
+    """Subdomains collapse to the registrable domain, multi-label suffixes are kept"""
+    assert registrable_domain("https://www.vaneck.com/de/en/investments/bitcoin-etp/") == "vaneck.com"
+    assert registrable_domain("https://etfs.grayscale.com/gbtc") == "grayscale.com"
+    assert registrable_domain("https://www.betashares.com.au/fund/crypto/") == "betashares.com.au"
+    assert registrable_domain("https://www.qrasset.com.br/qbtc11/#cesta") == "qrasset.com.br"
+    assert registrable_domain("https://live.euronext.com/en/product/etfs/X") == "euronext.com"
+
+
+def test_interleaves_other_domains_while_one_cools_down():
+    """With a long spacing window, other domains are served before the same host again"""
+    rows_urls = {
+        2: "https://valour.com/en/a",
+        3: "https://valour.com/en/b",
+        4: "https://valour.com/en/c",
+        5: "https://www.nasdaq.com/x",
+        6: "https://www.grayscale.com/y",
+    }
+    scheduler = DomainScheduler(rows_urls, max_in_flight=1, min_interval=60)
+
+    order = []
+    for _ in range(3):
+        job = scheduler.acquire()
+        order.append(job[0])
+        scheduler.release(job)
+
+    # Largest backlog goes first, then the other domains fill the cooldown
+    assert order[0] == 2
+    assert set(order[1:]) == {5, 6}
+    assert scheduler.remaining() == 2
+
+
+def test_concurrency_cap_and_spacing():
+    """No domain exceeds its in-flight cap, and starts are spaced by min_interval"""
+    rows_urls = {row: f"https://www.wisdomtree.eu/p/{row}" for row in range(2, 8)}
+    scheduler = DomainScheduler(rows_urls, max_in_flight=2, min_interval=0.05)
+
+    lock = threading.Lock()
+    in_flight = [0]
+    peak = [0]
+    starts = []
+
+    def worker():
+        while True:
+            job = scheduler.acquire()
+            if job is None:
+                return
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+                starts.append(time.monotonic())
+            time.sleep(0.12)
+            with lock:
+                in_flight[0] -= 1
+            scheduler.release(job)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    starts.sort()
+    assert len(starts) == len(rows_urls)
+    assert peak[0] <= 2
+    assert all(later - earlier >= 0.045 for earlier, later in zip(starts, starts[1:]))
+
+
+def test_drain_returns_unhanded_jobs():
+    """drain() hands back every job that was never acquired"""
+    rows_urls = {2: "https://a.com/1", 3: "https://b.com/2", 4: "https://a.com/3"}
+    scheduler = DomainScheduler(rows_urls, max_in_flight=1, min_interval=0)
+
+    job = scheduler.acquire()
+    leftovers = scheduler.drain()
+
+    assert sorted([job] + leftovers) == sorted(rows_urls.items())
+    assert scheduler.acquire() is None
+
+
+def test_non_blocking_acquire():
+    """acquire(block=False) returns None instead of waiting for a busy domain"""
+    rows_urls = {2: "https://a.example.com/1", 3: "https://a.example.com/2"}
+    scheduler = DomainScheduler(rows_urls, max_in_flight=1, min_interval=0)
+    job = scheduler.acquire(block=False)
+    assert job == (2, "https://a.example.com/1")
+    assert scheduler.acquire(block=False) is None
+    scheduler.release(job)
+    assert scheduler.acquire(block=False) == (3, "https://a.example.com/2")
+
+
+if __name__ == "__main__":
+    test_registrable_domain()
+    test_interleaves_other_domains_while_one_cools_down()
+    test_concurrency_cap_and_spacing()
+    test_drain_returns_unhanded_jobs()
+    test_non_blocking_acquire()
+    print("✅ All domain scheduler tests passed")
@@ -0,0 +1,102 @@
+"""
+Test script for the shared chromedriver resolution
+Runs offline - ChromeDriverManager is replaced by a fake
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import src.driver_factory as driver_factory
+
+
+class FakeManager:
+    """Stand-in for ChromeDriverManager that counts downloads"""
+
+    installs = 0
+    path = None
+
+    def install(self):
+        FakeManager.installs += 1
+        if FakeManager.path is None:
+            raise RuntimeError("offline")
+        return FakeManager.path
+
+
+def _reset(tmp_dir, chrome_major):
+    driver_factory.DRIVER_CACHE_PATH = os.path.join(tmp_dir, "chromedriver.json")
+    driver_factory._resolved = False
+    driver_factory._resolved_path = None
+    driver_factory.detect_chrome_major_version = lambda: chrome_major
+    driver_factory.ChromeDriverManager = FakeManager
+    driver_factory.WEBDRIVER_MANAGER_AVAILABLE = True
+    FakeManager.installs = 0
+
+
+def _originals():
+    return (driver_factory.detect_chrome_major_version, getattr(driver_factory, "ChromeDriverManager", None),
+            driver_factory.DRIVER_CACHE_PATH, driver_factory.WEBDRIVER_MANAGER_AVAILABLE)
+
+
+def _restore(original):
+    (driver_factory.detect_chrome_major_version, driver_factory.ChromeDriverManager,
+     driver_factory.DRIVER_CACHE_PATH, driver_factory.WEBDRIVER_MANAGER_AVAILABLE) = original
+    driver_factory._resolved = False
+    driver_factory._resolved_path = None
+
+
+def test_driver_pinned_by_chrome_version():
+    """The first run downloads, later runs use the pinned path without the network"""
+    original = _originals()
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            driver_path = os.path.join(tmp_dir, "chromedriver")
+            open(driver_path, "w").close()
+
+            _reset(tmp_dir, "126")
+            FakeManager.path = driver_path
+            assert driver_factory.resolve_chromedriver() == driver_path
+            assert driver_factory.resolve_chromedriver() == driver_path
+            assert FakeManager.installs == 1
+
+            # New process, offline: the pinned driver is used
+            _reset(tmp_dir, "126")
+            FakeManager.path = None
+            assert driver_factory.resolve_chromedriver() == driver_path
+            assert FakeManager.installs == 0
+
+            # Chrome upgraded while offline: nothing pinned, Selenium gets to look itself
+            _reset(tmp_dir, "127")
+            assert driver_factory.resolve_chromedriver() is None
+            assert FakeManager.installs == 1
+    finally:
+        _restore(original)
+
+
+def test_unknown_chrome_version_is_not_pinned():
+    """A driver downloaded for an undetected Chrome version is not reused by later runs"""
+    original = _originals()
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            driver_path = os.path.join(tmp_dir, "chromedriver")
+            open(driver_path, "w").close()
+
+            _reset(tmp_dir, None)
+            FakeManager.path = driver_path
+            assert driver_factory.resolve_chromedriver() == driver_path
+            assert not os.path.exists(driver_factory.DRIVER_CACHE_PATH)
+
+            # Next run (e.g. after a Chrome upgrade): downloads again instead of reusing a stale pin
+            _reset(tmp_dir, None)
+            assert driver_factory.resolve_chromedriver() == driver_path
+            assert FakeManager.installs == 1
+    finally:
+        _restore(original)
+
+
+if __name__ == "__main__":
+    test_driver_pinned_by_chrome_version()
+    test_unknown_chrome_version_is_not_pinned()
+    print("✅ All driver factory tests passed")
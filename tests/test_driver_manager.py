@@ -0,0 +1,111 @@
+"""
+Test script for the browser lifecycle manager
+Uses fake drivers so it runs without Chrome or network access
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import src.driver_manager as driver_manager
+from src.driver_manager import ManagedDriver, is_crash_error
+from src.parallel_runner import run_rows
+
+
+class FakeDriver:
+    """Minimal stand-in for a WebDriver that can be made to look crashed"""
+
+    created = []
+
+    def __init__(self):
+        self.quit_called = False
+        self.alive = True
+        FakeDriver.created.append(self)
+
+    @property
+    def window_handles(self):
+        if not self.alive:
+            raise RuntimeError("invalid session id")
+        return ["tab-1"]
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_session_reused_until_page_limit():
+    """One browser serves max_pages rows, then a new one is started"""
+    FakeDriver.created = []
+    manager = ManagedDriver(FakeDriver, max_pages=3, max_rss_mb=None)
+
+    drivers = []
+    for _ in range(7):
+        drivers.append(manager.acquire())
+        manager.page_done()
+    manager.close()
+
+    assert len(FakeDriver.created) == 3
+    assert drivers[0] is drivers[2] and drivers[3] is not drivers[2]
+    assert manager.stats()["recycles"] == {"pages": 2, "memory": 0, "crash": 0}
+    assert all(driver.quit_called for driver in FakeDriver.created)
+
+
+def test_crash_detected_by_error_and_health_check():
+    """A crash error or a dead session triggers a recycle on the next acquire"""
+    FakeDriver.created = []
+    manager = ManagedDriver(FakeDriver, max_pages=None, max_rss_mb=None)
+
+    first = manager.acquire()
+    manager.page_done(RuntimeError("Message: chrome not reachable"))
+    second = manager.acquire()
+    assert second is not first
+
+    manager.page_done()
+    second.alive = False
+    third = manager.acquire()
+    assert third is not second
+    assert manager.stats()["recycles"]["crash"] == 2
+
+    # Ordinary page errors keep the session
+    manager.page_done(ValueError("No price found"))
+    assert manager.acquire() is third
+    assert not is_crash_error(ValueError("No price found"))
+
+
+def test_memory_threshold_recycles():
+    """A session above the RSS threshold is recycled and the peak is recorded"""
+    FakeDriver.created = []
+    original = driver_manager.driver_rss_mb
+    driver_manager.driver_rss_mb = lambda driver: 2048.0
+    try:
+        manager = ManagedDriver(FakeDriver, max_pages=None, max_rss_mb=1500)
+        first = manager.acquire()
+        manager.page_done()
+        assert manager.acquire() is not first
+        stats = manager.stats()
+        assert stats["recycles"]["memory"] == 1
+        assert stats["peak_rss_mb"] == 2048.0
+    finally:
+        driver_manager.driver_rss_mb = original
+
+
+def test_runner_reports_driver_stats():
+    """run_rows reuses the worker browser and hands back per-worker stats"""
+    FakeDriver.created = []
+    rows_urls = {row: f"https://example.com/{row}" for row in range(2, 7)}
+    stats = []
+
+    results = list(run_rows(rows_urls, lambda d, r, u: {"row": r}, FakeDriver, workers=1,
+                            domain_delay=0, max_pages_per_driver=2, driver_stats=stats))
+
+    assert len(results) == 5
+    assert len(FakeDriver.created) == 3
+    assert stats[0]["pages"] == 5 and stats[0]["sessions"] == 3
+
+
+if __name__ == "__main__":
+    test_session_reused_until_page_limit()
+    test_crash_detected_by_error_and_health_check()
+    test_memory_threshold_recycles()
+    test_runner_reports_driver_stats()
+    print("✅ All driver manager tests passed")
@@ -0,0 +1,138 @@
+"""
+Tests for the hostname-indexed extractor registry and the dispatch built on it.
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import excel_stock_updater
+from excel_stock_updater import PRICE_EXTRACTORS, SOUP_PRICE_EXTRACTORS, fetch_and_extract_data
+from src import custom_domain_extractors
+from src.custom_domain_extractors import get_custom_extractor
+from src.extractor_registry import ExtractorRegistry
+
+
+class Handler:
+    """Stand-in extractor identified by name."""
+
+    def __init__(self, name):
+        self.name = name
+
+
+def name_of(registry, url):
+    handler = registry.lookup(url)
+    return handler.name if handler else None
+
+
+def test_longest_path_prefix_wins():
+    registry = ExtractorRegistry()
+    registry.register("vaneck.com", Handler("general"))
+    registry.register("vaneck.com", Handler("german"), path_prefix="/de")
+    registry.register("vaneck.com", Handler("german etp"), path_prefix="/de/en/investments")
+    assert name_of(registry, "https://www.vaneck.com/de/en/investments/bitcoin-etp/overview/") == "german etp"
+    assert name_of(registry, "https://www.vaneck.com/DE/en/funds") == "german"
+    assert name_of(registry, "https://www.vaneck.com/de") == "german"
+    # Prefixes end on a path segment boundary
+    assert name_of(registry, "https://www.vaneck.com/denmark/") == "general"
+    assert name_of(registry, "https://www.vaneck.com/us/en/") == "general"
+
+
+def test_subdomains_and_unknown_hosts():
+    registry = ExtractorRegistry()
+    registry.register("grayscale.com", Handler("grayscale"))
+    registry.register("money.tmx.com", Handler("tmx"))
+    assert name_of(registry, "https://etfs.grayscale.com/gbtc") == "grayscale"
+    assert name_of(registry, "https://WWW.Grayscale.com:443/funds/x") == "grayscale"
+    assert name_of(registry, "money.tmx.com/quote/BTCX.B") == "tmx"
+    assert registry.lookup("https://tmx.com/") is None
+    assert registry.lookup("https://notgrayscale.com/") is None
+    assert registry.lookup("") is None
+    assert "https://etfs.grayscale.com/" in registry
+    assert len(registry) == 2 and registry.hosts() == ["grayscale.com", "money.tmx.com"]
+
+
+def test_match_predicate_falls_through():
+    registry = ExtractorRegistry()
+    registry.register("qrasset.com.br", Handler("any page"))
+    registry.register("qrasset.com.br", Handler("cesta"), path_prefix="/qbtc11",
+                      match=lambda url: url.lower().endswith("/#cesta"))
+    assert name_of(registry, "https://qrasset.com.br/qbtc11/#cesta") == "cesta"
+    assert name_of(registry, "https://qrasset.com.br/qbtc11/") == "any page"
+
+
+def test_decorator_registers_function():
+    registry = ExtractorRegistry()
+
+    @registry.extractor("example.com", "/funds")
+    def extract(soup, url):
+        return {"price": 1.0}
+
+    assert registry.lookup("https://www.example.com/funds/abc") is extract
+    assert registry.lookup("https://www.example.com/about") is None
+
+
+def test_price_dispatch():
+    def handler_label(url):
+        handler = PRICE_EXTRACTORS.lookup(url)
+        return getattr(handler, "label", getattr(handler, "__name__", None))
+
+    assert handler_label("https://etfs.grayscale.com/gbtc") == "Enhanced Grayscale"
+    assert handler_label("https://valour.com/en/products/valour-bitcoin") == "Enhanced Valour"
+    assert handler_label("https://www.boerse-frankfurt.de/etf/de000a27z304") == "get_boerse_frankfurt_result"
+    assert handler_label("https://www.nasdaq.com/european-market-activity/etn-etc/vbtc") == "NASDAQ European market"
+    assert handler_label("https://www.nasdaq.com/market-activity/etf/ibit") == "NASDAQ market activity"
+    assert handler_label("https://www.nasdaq.com/articles/bitcoin") is None
+    assert handler_label("https://www.cboe.com/au/equities/x") == "CBOE AU"
+    assert handler_label("https://www.vaneck.com.au/etf/alternatives/vbtc/snapshot/") == "VanEck"
+    assert handler_label("https://qrasset.com.br/qbtc11/#cesta") == "QR Asset"
+    assert handler_label("https://qrasset.com.br/qbtc11/") is None
+    assert handler_label("https://www.six-group.com/en/products-services/") is None
+
+    assert SOUP_PRICE_EXTRACTORS.lookup("https://www.grayscale.com/funds/grayscale-bitcoin-trust") is not None
+    assert SOUP_PRICE_EXTRACTORS.lookup("https://www.grayscale.com/crypto") is None
+    assert SOUP_PRICE_EXTRACTORS.lookup(
+        "https://etf.dws.com/en-gb/xtrackers-galaxy-physical-bitcoin-etc-securities/") is not None
+    assert SOUP_PRICE_EXTRACTORS.lookup("https://etf.dws.com/en-gb/other-fund/") is None
+
+
+def test_fetch_calls_registered_handler_with_fallback():
+    calls = []
+
+    def failing_extract(driver, url):
+        calls.append(url)
+        raise ValueError("price element missing")
+
+    original_fallback = excel_stock_updater.try_ai_fallback
+    excel_stock_updater.try_ai_fallback = lambda driver, url, html_content=None, snapshot=None: {}
+    PRICE_EXTRACTORS.register("example-exchange.test", excel_stock_updater.price_extractor_handler(
+        "Example Exchange", failing_extract, "share price"))
+    try:
+        result = fetch_and_extract_data(None, "https://www.example-exchange.test/quote/ABC", [])
+    finally:
+        excel_stock_updater.try_ai_fallback = original_fallback
+        PRICE_EXTRACTORS._hosts.pop("example-exchange.test")
+    assert calls == ["https://www.example-exchange.test/quote/ABC"]
+    assert result == {"error": "Example Exchange error: price element missing"}
+
+
+def test_shares_dispatch():
+    assert get_custom_extractor("https://www.vaneck.com/de/en/investments/bitcoin-etp/overview/") \
+        is custom_domain_extractors.extract_vaneck_de_shares
+    assert get_custom_extractor("https://www.vaneck.com/us/en/investments/bitcoin-etf-hodl/overview/") \
+        is custom_domain_extractors.extract_vaneck_shares
+    assert get_custom_extractor("lafv.li") is custom_domain_extractors.extract_lafv_shares
+    assert get_custom_extractor("https://etfs.grayscale.com/gbtc") is custom_domain_extractors.extract_grayscale_shares
+    assert get_custom_extractor("https://www.ishares.com/us/products/333011/") is None
+
+
+if __name__ == "__main__":
+    test_longest_path_prefix_wins()
+    test_subdomains_and_unknown_hosts()
+    test_match_predicate_falls_through()
+    test_decorator_registers_function()
+    test_price_dispatch()
+    test_fetch_calls_registered_handler_with_fallback()
+    test_shares_dispatch()
+    print("✅ All extractor registry tests passed")
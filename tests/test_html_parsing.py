@@ -0,0 +1,89 @@
+"""
+Tests for the shared HTML parse layer (src.html_parsing).
+"""
+
+import os
+import sys
+import threading
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import src.html_parsing as html_parsing
+from src.html_parsing import parse_html, page_text, set_parser, get_parser, clear_cache
+from src.page_snapshot import PageSnapshot
+from excel_stock_updater import clean_html_for_ai
+
+PAGE = """<html><head><style>.p{}</style><script>var price = 1;</script></head>
+<body><nav>Home Funds</nav><header>Header text</header>
+<div class="quote">Share price: 24.51 USD</div><footer>Footer</footer></body></html>"""
+
+
+def test_defaults_to_lxml():
+    assert html_parsing.PARSER_PREFERENCE[0] == "lxml"
+    assert get_parser() == "lxml"
+
+
+def test_same_html_is_parsed_once():
+    clear_cache()
+    first = parse_html(PAGE)
+    assert parse_html(PAGE) is first
+    # A copy of the same string (e.g. driver.page_source read again) hits the cache too
+    assert parse_html("".join(list(PAGE))) is first
+    assert parse_html(PAGE, "html.parser") is not first
+
+
+def test_cache_is_bounded_and_per_thread():
+    clear_cache()
+    first = parse_html(PAGE)
+    for i in range(html_parsing.CACHE_SIZE):
+        parse_html(f"<p>{i}</p>")
+    assert parse_html(PAGE) is not first
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(parse_html(PAGE)))
+    thread.start()
+    thread.join()
+    assert other[0] is not parse_html(PAGE)
+
+
+def test_set_parser():
+    original = get_parser()
+    try:
+        set_parser("html.parser")
+        assert parse_html(PAGE).builder.NAME == "html.parser"
+        try:
+            set_parser("no-such-parser")
+            assert False, "unknown parser should be rejected"
+        except ValueError:
+            pass
+    finally:
+        set_parser(original)
+
+
+def test_page_text_skips_tags_without_modifying_tree():
+    soup = parse_html(PAGE)
+    text = page_text(soup, " ", skip_tags=("nav", "header", "footer"))
+    assert "Share price: 24.51 USD" in text
+    assert "Home" not in text and "Footer" not in text and "var price" not in text
+    assert soup.find("nav") is not None
+
+
+def test_snapshot_and_ai_cleanup_share_the_tree():
+    clear_cache()
+    snapshot = PageSnapshot("https://example.com", "https://example.com", PAGE)
+    soup = snapshot.soup
+    cleaned = clean_html_for_ai(PAGE)
+    assert "Share price" in cleaned and "Home Funds" not in cleaned
+    assert parse_html(PAGE) is soup
+    # The AI clean-up no longer strips nav/header/footer out of the shared tree
+    assert soup.find("footer") is not None
+
+
+if __name__ == "__main__":
+    test_defaults_to_lxml()
+    test_same_html_is_parsed_once()
+    test_cache_is_bounded_and_per_thread()
+    test_set_parser()
+    test_page_text_skips_tags_without_modifying_tree()
+    test_snapshot_and_ai_cleanup_share_the_tree()
+    print("✅ All HTML parsing tests passed")
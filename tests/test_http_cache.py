@@ -0,0 +1,148 @@
+"""
+Test script for the conditional on-disk HTTP cache
+Serves pages from a local HTTP server and writes the cache to a temporary
+directory, so it runs offline
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+
+import excel_stock_updater
+from src import http_cache
+from src.http_cache import HttpCache
+
+FACTSHEET = b"%PDF-1.4 Notes Outstanding: 1,250,000"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """ETag-validated factsheet, Last-Modified page and an uncacheable page."""
+
+    requests_seen = []
+
+    def do_GET(self):
+        self.requests_seen.append((self.path, self.headers.get("If-None-Match"), self.headers.get("If-Modified-Since")))
+        if self.path == "/factsheet.pdf":
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                self.send_header("ETag", '"v1"')
+                self.end_headers()
+                return
+            self._send(FACTSHEET, "application/pdf", ETag='"v1"')
+        elif self.path == "/etf/bitcoin-etp":
+            last_modified = "Fri, 16 Oct 2026 08:00:00 GMT"
+            if self.headers.get("If-Modified-Since") == last_modified:
+                self.send_response(304)
+                self.end_headers()
+                return
+            self._send(b"<p>ISIN: DE000A27Z304</p>", "text/html; charset=utf-8", **{"Last-Modified": last_modified})
+        else:
+            self._send(b"<p>no validators</p>", "text/html")
+
+    def _send(self, body, content_type, **headers):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _serve():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    _Handler.requests_seen = []
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+
+def test_etag_revalidation_serves_304_from_disk():
+    server, base = _serve()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = HttpCache(tmp)
+            first = cache.get(base + "/factsheet.pdf", session=requests.Session())
+            second = HttpCache(tmp).get(base + "/factsheet.pdf", session=requests.Session())
+    finally:
+        server.shutdown()
+    assert not first.from_cache and first.content == FACTSHEET
+    assert second.from_cache and second.status_code == 200 and second.content == FACTSHEET
+    assert second.headers["Content-Type"] == "application/pdf"
+    assert _Handler.requests_seen == [("/factsheet.pdf", None, None), ("/factsheet.pdf", '"v1"', None)]
+
+
+def test_last_modified_and_uncacheable_responses():
+    server, base = _serve()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = HttpCache(tmp)
+            session = requests.Session()
+            cache.get(base + "/etf/bitcoin-etp", session=session)
+            page = cache.get(base + "/etf/bitcoin-etp", session=session)
+            cache.get(base + "/plain", session=session)
+            plain = cache.get(base + "/plain", session=session)
+    finally:
+        server.shutdown()
+    assert page.from_cache and page.text == "<p>ISIN: DE000A27Z304</p>"
+    assert _Handler.requests_seen[1] == ("/etf/bitcoin-etp", None, "Fri, 16 Oct 2026 08:00:00 GMT")
+    # Without a validator nothing is stored, so the page is fetched in full again
+    assert not plain.from_cache and _Handler.requests_seen[3] == ("/plain", None, None)
+
+
+def test_isin_lookup_uses_cache():
+    server, base = _serve()
+    original = http_cache._default_cache
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            http_cache._default_cache = HttpCache(tmp)
+            assert excel_stock_updater._extract_isin_bf(base + "/etf/bitcoin-etp") == "DE000A27Z304"
+            assert excel_stock_updater._extract_isin_bf(base + "/etf/bitcoin-etp") == "DE000A27Z304"
+    finally:
+        http_cache._default_cache = original
+        server.shutdown()
+    assert [seen[2] is not None for seen in _Handler.requests_seen] == [False, True]
+
+
+def test_old_and_excess_entries_are_swept():
+    """Storing sweeps entries unused for max_age, then the least recently used ones over max_bytes"""
+    server, base = _serve()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            session = requests.Session()
+            HttpCache(tmp).get(base + "/factsheet.pdf", session=session)
+            factsheet_meta, factsheet_body = HttpCache(tmp)._paths(base + "/factsheet.pdf")
+            factsheet_size = os.path.getsize(factsheet_meta) + os.path.getsize(factsheet_body)
+            two_months_ago = time.time() - 60 * 24 * 3600
+            os.utime(factsheet_meta, (two_months_ago, two_months_ago))
+
+            HttpCache(tmp).get(base + "/etf/bitcoin-etp", session=session)
+            assert sorted(os.listdir(tmp)) == sorted(os.path.basename(path) for path in
+                                                     HttpCache(tmp)._paths(base + "/etf/bitcoin-etp"))
+
+            # Over the size bound, the entry used longest ago goes first
+            page_meta = HttpCache(tmp)._paths(base + "/etf/bitcoin-etp")[0]
+            an_hour_ago = time.time() - 3600
+            os.utime(page_meta, (an_hour_ago, an_hour_ago))
+            HttpCache(tmp, max_bytes=factsheet_size).get(base + "/factsheet.pdf", session=session)
+            assert not os.path.exists(page_meta)
+            assert os.path.exists(factsheet_meta)
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    test_etag_revalidation_serves_304_from_disk()
+    test_last_modified_and_uncacheable_responses()
+    test_isin_lookup_uses_cache()
+    test_old_and_excess_entries_are_swept()
+    print("✅ All HTTP cache tests passed")
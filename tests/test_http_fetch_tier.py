@@ -0,0 +1,117 @@
+"""
+Test script for the HTTP-first fetch tier
+Runs offline - checks the per-domain history and that the BeautifulSoup
+extractors work on server-rendered HTML without a browser
+"""
+
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+
+import excel_stock_updater
+import src.http_fetch as http_fetch
+from excel_stock_updater import extract_price_from_soup, fetch_static_price, has_numeric_price
+from outstanding_shares_updater import extract_shares_from_soup
+
+
+@contextmanager
+def temp_stats():
+    """Keep the per-domain HTTP tier history in a temporary file for the duration of a test"""
+    original_path, original_stats = http_fetch.HTTP_TIER_STATS_PATH, http_fetch._stats
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        http_fetch.HTTP_TIER_STATS_PATH = os.path.join(tmp_dir, "http_tier_domains.json")
+        http_fetch._stats = None
+        try:
+            yield
+        finally:
+            http_fetch.HTTP_TIER_STATS_PATH, http_fetch._stats = original_path, original_stats
+
+
+def test_domain_history_skips_js_only_domains():
+    """Domains that only ever miss are skipped; one success keeps the HTTP tier enabled"""
+    with temp_stats():
+        js_url = "https://www.grayscale.com/funds/grayscale-bitcoin-trust"
+        static_url = "https://www.hashdex-etfs.com/NCIQ"
+
+        assert http_fetch.should_try_http(js_url)
+        for _ in range(http_fetch.MAX_MISSES_WITHOUT_SUCCESS):
+            http_fetch.record_http_result(js_url, False)
+        assert not http_fetch.should_try_http(js_url)
+        # Shares history is tracked separately from prices
+        assert http_fetch.should_try_http(js_url, kind="shares")
+
+        http_fetch.record_http_result(static_url, True)
+        for _ in range(5):
+            http_fetch.record_http_result(static_url, False)
+        assert http_fetch.should_try_http(static_url)
+
+        # History survives a reload from disk
+        http_fetch._stats = None
+        assert not http_fetch.should_try_http(js_url)
+        assert http_fetch.should_try_http(static_url)
+
+
+def test_hashdex_closing_price_from_static_html():
+    """The Hashdex 'Closing Price' block is parsed straight from server HTML"""
+    html = """
+    <div><h4>USD 32.15</h4><h3>Closing Price</h3></div>
+    """
+    result = extract_price_from_soup(BeautifulSoup(html, "html.parser"), "https://www.hashdex-etfs.com/NCIQ")
+    assert result == {"closing price": 32.15}
+    assert has_numeric_price(result)
+
+
+def test_dws_value_per_etc_security_from_static_html():
+    """The Xtrackers 'Value per ETC security' text is parsed straight from server HTML"""
+    html = "<p>Value per ETC security</p><p>18,25 USD</p>"
+    url = "https://etf.dws.com/en-gb/CH1315732250-xtrackers-galaxy-physical-bitcoin-etc-securities/"
+    result = extract_price_from_soup(BeautifulSoup(html, "html.parser"), url)
+    assert result == {"value per etc security": 18.25}
+
+
+def test_missing_markers_escalate():
+    """Missing markers give an error result, which the caller treats as 'escalate to Selenium'"""
+    result = extract_price_from_soup(BeautifulSoup("<p>Loading...</p>", "html.parser"),
+                                     "https://www.hashdex-etfs.com/NCIQ")
+    assert not has_numeric_price(result)
+    assert extract_price_from_soup(BeautifulSoup("<p></p>", "html.parser"), "https://example.com/") is None
+
+
+def test_shares_from_static_html():
+    """Outstanding shares are found in server-rendered HTML"""
+    html = "<table><tr><td>Shares Outstanding</td><td>1,250,000</td></tr></table>"
+    assert extract_shares_from_soup(BeautifulSoup(html, "html.parser")) == {"outstanding_shares": "1250000"}
+
+
+def test_only_site_specific_extractors_skip_the_browser():
+    """Generic pages always go to Chrome: their static HTML may only hold a placeholder price"""
+    fetched = []
+
+    def fake_fetch(url):
+        fetched.append(url)
+        return "<p>Share price: 0.00</p><div><h4>USD 32.15</h4><h3>Closing Price</h3></div>"
+
+    original = excel_stock_updater.fetch_static_html
+    excel_stock_updater.fetch_static_html = fake_fetch
+    try:
+        with temp_stats():
+            assert fetch_static_price("https://www.example.com/fund") is None
+            assert fetch_static_price("https://www.hashdex-etfs.com/NCIQ") == {"closing price": 32.15}
+    finally:
+        excel_stock_updater.fetch_static_html = original
+    assert fetched == ["https://www.hashdex-etfs.com/NCIQ"]
+
+
+if __name__ == "__main__":
+    test_domain_history_skips_js_only_domains()
+    test_hashdex_closing_price_from_static_html()
+    test_dws_value_per_etc_security_from_static_html()
+    test_missing_markers_escalate()
+    test_shares_from_static_html()
+    test_only_site_specific_extractors_skip_the_browser()
+    print("✅ All HTTP tier tests passed")
@@ -0,0 +1,103 @@
+"""
+Tests for lazy extractor plugins and the import-time budget of excel_stock_updater.
+"""
+
+import os
+import re
+import subprocess
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.plugins import load_plugin, is_loaded, module_available
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cumulative import time of excel_stock_updater (best of IMPORT_RUNS), measured
+# with -X importtime. It was ~0.8s with all extractors, groq, bf4py and openpyxl
+# imported up front and ~0.35s after moving them behind first use.
+IMPORT_TIME_BUDGET = 0.5
+IMPORT_RUNS = 3
+
+# Modules importing excel_stock_updater must not pull in
+DEFERRED_MODULES = ("groq", "bf4py", "openpyxl", "src.price_extractors.")
+
+
+def _run(code):
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=REPO_ROOT,
+                            capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr[-2000:]
+    return result
+
+
+def _import_seconds(stderr, module):
+    m = re.search(rf"^import time:\s+\d+ \|\s+(\d+) \| {re.escape(module)}$", stderr, re.MULTILINE)
+    assert m, f"no import time reported for {module}"
+    return int(m.group(1)) / 1e6
+
+
+def test_import_time_budget():
+    best = min(_import_seconds(_run("import excel_stock_updater").stderr, "excel_stock_updater")
+               for _ in range(IMPORT_RUNS))
+    assert best < IMPORT_TIME_BUDGET, f"importing excel_stock_updater took {best:.3f}s (budget {IMPORT_TIME_BUDGET}s)"
+
+
+def test_heavy_modules_are_deferred():
+    result = _run("import sys, excel_stock_updater\n"
+                  f"print('\\n'.join(m for m in sys.modules if m.startswith({DEFERRED_MODULES!r})))")
+    assert result.stdout.strip() == ""
+
+
+def test_plugin_loaded_on_first_dispatch():
+    result = _run(
+        "import sys, excel_stock_updater as e\n"
+        "e.try_ai_fallback = lambda *args, **kwargs: {}\n"
+        "e.fetch_and_extract_data(None, 'https://money.tmx.com/en/quote/BTCX.B', [])\n"
+        "print(sorted(m for m in sys.modules if m.startswith('src.price_extractors.')))"
+    )
+    assert result.stdout.strip().splitlines()[-1] == "['src.price_extractors.tmx']"
+
+
+def test_all_plugin_references_resolve():
+    import excel_stock_updater
+    references = set(excel_stock_updater._PLUGIN_EXTRACTORS.values())
+    for entries in excel_stock_updater.PRICE_EXTRACTORS._hosts.values():
+        for _, _, handler in entries:
+            if isinstance(getattr(handler, "extract", None), str):
+                references.add(handler.extract)
+    assert len(references) >= 25
+    for reference in references:
+        assert callable(load_plugin(reference)), reference
+        assert is_loaded(reference)
+
+
+def test_moved_extractors_still_importable():
+    from excel_stock_updater import get_tmx_price, enhanced_grayscale_price_extraction
+    assert get_tmx_price.__module__ == "src.price_extractors.tmx"
+    assert enhanced_grayscale_price_extraction.__module__ == "src.price_extractors.grayscale"
+    try:
+        from excel_stock_updater import no_such_extractor  # noqa: F401
+        assert False, "unknown names should still raise ImportError"
+    except ImportError:
+        pass
+
+
+def test_load_plugin():
+    assert load_plugin(len) is len
+    assert load_plugin("os.path:join") is os.path.join
+    try:
+        load_plugin("os.path")
+        assert False, "references without an attribute should be rejected"
+    except ValueError:
+        pass
+    assert module_available("json") and not module_available("no_such_module_xyz")
+
+
+if __name__ == "__main__":
+    test_import_time_budget()
+    test_heavy_modules_are_deferred()
+    test_plugin_loaded_on_first_dispatch()
+    test_all_plugin_references_resolve()
+    test_moved_extractors_still_importable()
+    test_load_plugin()
+    print("✅ All import budget tests passed")
@@ -0,0 +1,108 @@
+"""
+Tests for the single-pass keyword scanner and the fallbacks built on it.
+"""
+
+import glob
+import os
+import re
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import excel_stock_updater
+from excel_stock_updater import PRICE_KEYWORDS, extract_keyword_prices
+from outstanding_shares_updater import extract_shares_from_soup
+from src.html_parsing import parse_html
+from src.keyword_scanner import KeywordScanner, context_window
+
+HTML_DEBUG = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "html_debug")
+
+
+def test_scan_finds_overlapping_whole_words():
+    scanner = KeywordScanner(["closing price", "Previous closing price", "open", "vl"])
+    text = "Previous Closing Price 12.30, reopened: open 12.1, VL: 11.9, vlad"
+    found = [(keyword, text[start:end]) for keyword, start, end in scanner.scan(text)]
+    assert found == [
+        ("previous closing price", "Previous Closing Price"),
+        ("closing price", "Closing Price"),
+        ("open", "open"),
+        ("vl", "VL"),
+    ]
+    assert scanner.first_occurrences(text)["closing price"] == (9, 22)
+
+
+def test_context_window():
+    text = "a" * 300 + "share price 12.5" + "b" * 300
+    window = context_window(text, 300, 316, chars=10)
+    assert window == "a" * 10 + "share price 12.5" + "b" * 10
+
+
+def _old_keyword_matches(page_text, keywords):
+    """Raw numbers found by the previous one-regex-per-keyword implementation."""
+    raw = {}
+    for keyword in keywords:
+        m = re.search(rf"\b{re.escape(keyword.lower())}\b[^\d]*?([0-9,]+\.?[0-9]*)", page_text, re.IGNORECASE)
+        if m:
+            raw[keyword] = m.group(1)
+    return raw
+
+
+def test_keyword_prices_match_previous_implementation():
+    original = excel_stock_updater.is_valid_share_price
+    excel_stock_updater.is_valid_share_price = lambda price, context="", url="": True
+    try:
+        for path in sorted(glob.glob(os.path.join(HTML_DEBUG, "*.html")))[:8]:
+            with open(path, encoding="utf-8", errors="replace") as f:
+                soup = parse_html(f.read())
+            page_text = " ".join(soup.strings).lower()
+            expected = _old_keyword_matches(page_text, PRICE_KEYWORDS)
+            result = extract_keyword_prices(soup, "https://example.com", PRICE_KEYWORDS)
+            assert set(result) == set(expected), path
+            for keyword, raw in expected.items():
+                value = result[keyword]
+                assert isinstance(value, str) or value == float(re.sub(r"[^\d\.]", "", raw)), (path, keyword)
+    finally:
+        excel_stock_updater.is_valid_share_price = original
+
+
+def test_validation_gets_local_context():
+    contexts = []
+    original = excel_stock_updater.is_valid_share_price
+
+    def record(price, context="", url=""):
+        contexts.append(context)
+        return True
+
+    excel_stock_updater.is_valid_share_price = record
+    try:
+        soup = parse_html("<p>" + "filler " * 200 + "Share price: 24.51</p><p>" + "tail " * 200 + "</p>")
+        result = extract_keyword_prices(soup, "https://example.com", ["share price"])
+    finally:
+        excel_stock_updater.is_valid_share_price = original
+    assert result == {"share price": 24.51}
+    assert "share price: 24.51" in contexts[0]
+    assert len(contexts[0]) < 500
+
+
+def test_shares_found_near_anchor():
+    soup = parse_html("<div>" + "Fund facts " * 100 + "<span>Shares Outstanding</span> <span>56,839,000</span></div>")
+    assert extract_shares_from_soup(soup) == {"outstanding_shares": "56839000"}
+
+    soup = parse_html("<p>Units outstanding: 1.2 million</p>")
+    assert extract_shares_from_soup(soup) == {"outstanding_shares": "1.20 million"}
+
+
+def test_shares_number_is_not_cut_off_after_anchor():
+    """A number far after the anchor is read in full, not truncated at a window edge"""
+    soup = parse_html("<p>Shares outstanding" + "x" * 285 + " 12,345,678</p>")
+    assert extract_shares_from_soup(soup) == {"outstanding_shares": "12345678"}
+
+
+if __name__ == "__main__":
+    test_scan_finds_overlapping_whole_words()
+    test_context_window()
+    test_keyword_prices_match_previous_implementation()
+    test_validation_gets_local_context()
+    test_shares_found_near_anchor()
+    test_shares_number_is_not_cut_off_after_anchor()
+    print("✅ All keyword scanner tests passed")
@@ -0,0 +1,150 @@
+"""
+Test script for reading prices from captured JSON API responses
+Uses a fake driver with a canned performance log, so it runs without Chrome
+"""
+
+import json
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import excel_stock_updater as prices
+from src import network_capture
+from src.network_capture import NetworkRule, read_json_path, wait_for_network_value
+from src.price_extractors import nasdaq
+
+NASDAQ_PAGE = "https://www.nasdaq.com/market-activity/etf/ibit"
+NASDAQ_API = "https://api.nasdaq.com/api/quote/IBIT/info?assetclass=etf"
+
+
+def _log_entry(request_id, url):
+    message = {"message": {"method": "Network.responseReceived",
+                           "params": {"requestId": request_id, "response": {"url": url}}}}
+    return {"message": json.dumps(message)}
+
+
+class FakeDriver:
+    """Replays a performance log (recorded once get() is called) and serves response bodies"""
+
+    def __init__(self, entries, bodies, loaded=True):
+        self._network_capture = True
+        self.page_entries = list(entries)
+        self.entries = list(entries) if loaded else []
+        self.bodies = bodies
+        self.visits = []
+
+    def get(self, url):
+        self.visits.append(url)
+        self.entries = list(self.page_entries)
+
+    def get_log(self, kind):
+        entries, self.entries = self.entries, []
+        return entries
+
+    def execute_cdp_cmd(self, cmd, params):
+        body = self.bodies.get(params["requestId"])
+        if body is None:
+            raise RuntimeError("No resource with given identifier found")
+        return {"body": body, "base64Encoded": False}
+
+
+def test_read_json_path():
+    """Dotted paths follow dict keys and list indices"""
+    data = {"data": {"rows": [{"nav": "24.10"}], "primaryData": {"lastSalePrice": "$61.02"}}}
+    assert read_json_path(data, "data.primaryData.lastSalePrice") == "$61.02"
+    assert read_json_path(data, "data.rows.0.nav") == "24.10"
+    assert read_json_path(data, "data.rows.3.nav") is None
+    assert read_json_path(data, "data.missing.key") is None
+
+
+def test_nasdaq_price_from_api_response():
+    """The nasdaq quote page's price is read from the api.nasdaq.com info response"""
+    body = json.dumps({"data": {"primaryData": {"lastSalePrice": "$61.02"}}})
+    driver = FakeDriver(
+        [_log_entry("1", "https://www.nasdaq.com/static/app.js"), _log_entry("2", NASDAQ_API)],
+        {"2": body},
+    )
+    value, rule = wait_for_network_value(driver, NASDAQ_PAGE, "price", deadline=1)
+    assert value == 61.02
+    assert rule.json_path == "data.primaryData.lastSalePrice"
+
+    driver = FakeDriver([_log_entry("2", NASDAQ_API)], {"2": body}, loaded=False)
+    assert prices.get_nasdaq_market_activity_price(driver, NASDAQ_PAGE) == 61.02
+    assert driver.visits == [NASDAQ_PAGE]
+
+
+class FakeNasdaqPage(FakeDriver):
+    """Quote page whose API response never arrives; the price is only in the rendered header"""
+
+    page_source = '<span class="symbol-page-header__pricing-price">$61.02</span>'
+
+    def find_element(self, by, value):
+        return object()
+
+
+def test_missing_response_does_not_add_render_wait():
+    """On a miss the network wait replaces the fixed wait for JavaScript, it is not added to it"""
+    sleeps = []
+    original_wait, original_interval, original_sleep = nasdaq.JS_RENDER_WAIT, network_capture.POLL_INTERVAL, time.sleep
+    nasdaq.JS_RENDER_WAIT = 0.05
+    network_capture.POLL_INTERVAL = 0.01
+
+    def record_sleep(seconds):
+        sleeps.append(seconds)
+        original_sleep(seconds)
+
+    time.sleep = record_sleep
+    try:
+        assert nasdaq.get_nasdaq_market_activity_price(FakeNasdaqPage([], {}), NASDAQ_PAGE) == 61.02
+        assert sleeps and set(sleeps) == {0.01}
+
+        # Without network capture the page still gets the fixed wait
+        sleeps.clear()
+        driver = FakeNasdaqPage([], {})
+        driver._network_capture = False
+        assert nasdaq.get_nasdaq_market_activity_price(driver, NASDAQ_PAGE) == 61.02
+        assert sleeps == [0.05]
+    finally:
+        nasdaq.JS_RENDER_WAIT, network_capture.POLL_INTERVAL, time.sleep = original_wait, original_interval, original_sleep
+
+
+def test_declared_rule_and_missing_response():
+    """Extractors can declare their own rule; without a matching response nothing is returned"""
+    rule = NetworkRule(r"example\.com/fund", r"example\.com/api/fund", "nav.value", kind="shares")
+    original = network_capture.NETWORK_RULES
+    original_interval = network_capture.POLL_INTERVAL
+    network_capture.NETWORK_RULES = [rule]
+    network_capture.POLL_INTERVAL = 0.01
+    try:
+        driver = FakeDriver([_log_entry("9", "https://example.com/api/fund?id=1")],
+                            {"9": json.dumps({"nav": {"value": 1500000}})})
+        assert wait_for_network_value(driver, "https://example.com/fund/1", "shares", deadline=1) == (1500000, rule)
+        assert wait_for_network_value(driver, "https://example.com/fund/1", "price", deadline=1) == (None, None)
+        assert wait_for_network_value(FakeDriver([], {}), "https://example.com/fund/1", "shares",
+                                      deadline=0.05) == (None, None)
+    finally:
+        network_capture.NETWORK_RULES = original
+        network_capture.POLL_INTERVAL = original_interval
+
+
+def test_log_drained_on_every_row():
+    """Rows without a NetworkRule still clear the events recorded by earlier rows"""
+    driver = FakeDriver([_log_entry("1", "https://www.example.com/app.js")], {})
+    original = prices.PRICE_EXTRACTORS.lookup
+    prices.PRICE_EXTRACTORS.lookup = lambda url: (lambda driver, url: {"share price": 1.0})
+    try:
+        prices.fetch_and_extract_data(driver, "https://www.example.com/fund", [])
+    finally:
+        prices.PRICE_EXTRACTORS.lookup = original
+    assert driver.entries == []
+
+
+if __name__ == "__main__":
+    test_read_json_path()
+    test_nasdaq_price_from_api_response()
+    test_missing_response_does_not_add_render_wait()
+    test_declared_rule_and_missing_response()
+    test_log_drained_on_every_row()
+    print("✅ All network capture tests passed")
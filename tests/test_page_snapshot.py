@@ -0,0 +1,81 @@
+"""
+Test script for page snapshots shared between extraction tiers
+Uses a fake driver that counts navigations, so it runs without Chrome
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import outstanding_shares_updater as shares
+from src.page_snapshot import PageSnapshot, capture_snapshot, load_snapshot
+
+
+class FakeDriver:
+    """Serves fixed HTML for every URL and records each get()"""
+
+    def __init__(self, html="<p>Shares Outstanding 2,500,000</p>"):
+        self.html = html
+        self.current_url = "data:,"
+        self.visits = []
+
+    def get(self, url):
+        self.visits.append(url)
+        self.current_url = url
+
+    @property
+    def page_source(self):
+        return self.html
+
+    def execute_script(self, script, *args):
+        if "getEntriesByType('navigation')" in script:
+            return [120.0, 450.0, 900.0]
+        return None
+
+
+def test_load_snapshot_records_page_and_timings():
+    """A snapshot holds the final URL, HTML and load timings of one navigation"""
+    driver = FakeDriver()
+    snapshot = load_snapshot(driver, "https://www.example.com/fund")
+
+    assert driver.visits == ["https://www.example.com/fund"]
+    assert snapshot.final_url == "https://www.example.com/fund"
+    assert snapshot.timings["load"] == 0.9 and "navigation" in snapshot.timings
+    assert "2,500,000" in snapshot.soup.get_text()
+    assert snapshot.matches("https://example.com/other-page")
+
+
+def test_capture_rejects_stale_pages():
+    """A page left over from an earlier row is not mistaken for the requested URL"""
+    driver = FakeDriver()
+    driver.current_url = "https://valour.com/en/products/row-2"
+
+    assert capture_snapshot(driver, "https://www.21shares.com/x") is None
+    assert capture_snapshot(driver, "https://valour.com/en/products/row-3",
+                            previous_url="https://valour.com/en/products/row-2") is None
+    assert capture_snapshot(driver, "https://valour.com/en/products/row-2",
+                            previous_url="https://valour.com/en/products/row-2") is not None
+
+    driver.get("https://valour.com/en/products/row-3")
+    snapshot = capture_snapshot(driver, "https://valour.com/en/products/row-3",
+                                previous_url="https://valour.com/en/products/row-2")
+    assert isinstance(snapshot, PageSnapshot)
+
+
+def test_traditional_tier_reuses_snapshot():
+    """Given a snapshot, the traditional shares tier parses it without navigating"""
+    driver = FakeDriver()
+    snapshot = PageSnapshot("https://www.example.com/fund", "https://www.example.com/fund", driver.html)
+
+    result = shares.extract_outstanding_shares(driver, "https://www.example.com/fund", snapshot=snapshot)
+
+    assert result == {"outstanding_shares": "2500000"}
+    assert driver.visits == []
+
+
+if __name__ == "__main__":
+    test_load_snapshot_records_page_and_timings()
+    test_capture_rejects_stale_pages()
+    test_traditional_tier_reuses_snapshot()
+    print("✅ All page snapshot tests passed")
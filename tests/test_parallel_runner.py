@@ -0,0 +1,148 @@
+"""
+Test script for the parallel row runner
+Uses fake drivers so it runs without Chrome or network access
+"""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.parallel_runner import run_rows
+
+
+class FakeDriver:
+    """Minimal stand-in for a WebDriver that records whether it was quit"""
+
+    created = []
+
+    def __init__(self):
+        self.quit_called = False
+        FakeDriver.created.append(self)
+
+    @property
+    def window_handles(self):
+        return ["tab-1"]
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_parallel_results_cover_every_row():
+    """All rows come back exactly once and every worker browser is closed"""
+    FakeDriver.created = []
+    rows_urls = {row: f"https://example.com/{row}" for row in range(2, 22)}
+    seen_threads = set()
+
+    def process_row(driver, row, url):
+        seen_threads.add(threading.current_thread().name)
+        time.sleep(0.01)
+        return {"share price": float(row)}
+
+    runner = run_rows(rows_urls, process_row, FakeDriver, workers=4, max_per_domain=4, domain_delay=0)
+    results = {row: data for row, url, data in runner}
+
+    assert results == {row: {"share price": float(row)} for row in rows_urls}
+    assert len(FakeDriver.created) == 4
+    assert all(driver.quit_called for driver in FakeDriver.created)
+    assert len(seen_threads) > 1
+
+
+def test_serial_mode_uses_single_driver():
+    """workers=1 keeps the original one-browser behaviour"""
+    FakeDriver.created = []
+    rows_urls = {2: "https://example.com/a", 3: "https://example.com/b"}
+
+    results = list(run_rows(rows_urls, lambda d, r, u: {"row": r}, FakeDriver, workers=1, domain_delay=0))
+
+    assert [row for row, url, data in results] == [2, 3]
+    assert len(FakeDriver.created) == 1
+
+
+def test_row_exception_becomes_error_result():
+    """An exception in one row is reported as an error without stopping the run"""
+    rows_urls = {2: "https://example.com/ok", 3: "https://example.com/bad", 4: "https://example.com/ok2"}
+
+    def process_row(driver, row, url):
+        if "bad" in url:
+            raise RuntimeError("boom")
+        return {"share price": 1.5}
+
+    runner = run_rows(rows_urls, process_row, FakeDriver, workers=2, domain_delay=0)
+    results = {row: data for row, url, data in runner}
+
+    assert results[2] == {"share price": 1.5}
+    assert "error" in results[3]
+    assert results[4] == {"share price": 1.5}
+
+
+def test_rows_reported_when_no_browser_starts():
+    """If no worker can start Chrome, every row is returned with an error"""
+
+    def broken_driver():
+        raise RuntimeError("chrome missing")
+
+    rows_urls = {2: "https://example.com/a", 3: "https://example.com/b", 4: "https://example.com/c"}
+    results = {row: data for row, url, data in run_rows(rows_urls, lambda d, r, u: {}, broken_driver, workers=2)}
+
+    assert set(results) == set(rows_urls)
+    assert all("error" in data for data in results.values())
+
+
+class FakeTabDriver(FakeDriver):
+    """Fake tab whose pages take LOAD_SECONDS to load and can be prefetched"""
+
+    LOAD_SECONDS = 0.2
+
+    def __init__(self):
+        super().__init__()
+        self.loading = None  # (url, ready_at)
+
+    def prefetch(self, url):
+        self.loading = (url, time.monotonic() + self.LOAD_SECONDS)
+
+    def get(self, url):
+        if self.loading is None or self.loading[0] != url:
+            self.prefetch(url)
+        time.sleep(max(0.0, self.loading[1] - time.monotonic()))
+        self.loading = None
+
+
+def test_prefetch_overlaps_next_load_with_processing():
+    """With prefetch, a single worker loads row N+1 in its spare tab while row N is processed"""
+    FakeDriver.created = []
+    rows_urls = {row: f"https://site{row}.example/" for row in range(2, 7)}
+    drivers_used = []
+
+    def process_row(driver, row, url):
+        driver.get(url)
+        drivers_used.append(driver)
+        time.sleep(0.2)  # CPU-side extraction
+        return {"row": row}
+
+    start = time.monotonic()
+    stats = []
+    results = {row: data for row, url, data in
+               run_rows(rows_urls, process_row, FakeTabDriver, workers=1, domain_delay=0,
+                        driver_stats=stats, prefetch=True)}
+    elapsed = time.monotonic() - start
+
+    assert results == {row: {"row": row} for row in rows_urls}
+    assert len(FakeDriver.created) == 2
+    # Rows alternate between the two tabs
+    assert drivers_used[0] is not drivers_used[1] and drivers_used[0] is drivers_used[2]
+    # 5 rows x (0.2s load + 0.2s extraction) = 2.0s serially; overlapped about 1.2s
+    assert elapsed < 1.6, elapsed
+    assert len(stats) == 2
+    assert all(driver.quit_called for driver in FakeDriver.created)
+
+
+if __name__ == "__main__":
+    test_parallel_results_cover_every_row()
+    test_serial_mode_uses_single_driver()
+    test_row_exception_becomes_error_result()
+    test_rows_reported_when_no_browser_starts()
+    test_prefetch_overlaps_next_load_with_processing()
+    print("✅ All parallel runner tests passed")
@@ -0,0 +1,89 @@
+"""
+Test script for the condition-based readiness waits
+Uses a fake driver whose page "renders" over time, so it runs without Chrome
+"""
+
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.readiness import wait_until_ready, load_page, Selector, TextMatches, NetworkIdle
+
+
+class FakeElement:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeDriver:
+    """Page whose price text appears render_after seconds after get()"""
+
+    def __init__(self, render_after=0.3, resources=3):
+        self.render_after = render_after
+        self.resources = resources
+        self.loaded_at = None
+        self.scripts = []
+        self.current_url = None
+
+    def get(self, url):
+        self.current_url = url
+        self.loaded_at = time.monotonic()
+
+    def _rendered(self):
+        return time.monotonic() - self.loaded_at >= self.render_after
+
+    def find_elements(self, by, css):
+        if self._rendered() and ".last-price" in css:
+            return [FakeElement("77.05")]
+        return []
+
+    def execute_script(self, script, *args):
+        self.scripts.append(script)
+        if "innerText" in script:
+            return "NAV/Unit* $7.04" if self._rendered() else "Loading..."
+        if "getEntriesByType" in script:
+            return ["complete", self.resources]
+        return None
+
+
+def test_returns_as_soon_as_text_appears():
+    """The wait ends shortly after the target renders, well before the deadline"""
+    driver = FakeDriver(render_after=0.3)
+    start = time.monotonic()
+    ready = load_page(driver, "https://www.betashares.com.au/fund/x/",
+                      TextMatches(r'NAV/Unit[^$]{0,40}\$\s*\d+\.\d'), deadline=5)
+    elapsed = time.monotonic() - start
+
+    assert isinstance(ready, TextMatches)
+    assert 0.3 <= elapsed < 1.5
+
+
+def test_selector_and_stop_loading():
+    """A matching selector satisfies the wait and the rest of the page load is stopped"""
+    driver = FakeDriver(render_after=0)
+    ready = load_page(driver, "https://www.londonstockexchange.com/x", Selector(".last-price"),
+                      deadline=2, stop_loading=True)
+
+    assert isinstance(ready, Selector)
+    assert any("window.stop()" in script for script in driver.scripts)
+
+
+def test_network_idle_and_deadline():
+    """Network idle fires after the quiet period; an unmet target gives None at the deadline"""
+    driver = FakeDriver(render_after=60)
+    driver.get("https://example.com/")
+    ready = wait_until_ready(driver, TextMatches("never shown"), NetworkIdle(quiet_period=0.3), deadline=3)
+    assert isinstance(ready, NetworkIdle)
+
+    start = time.monotonic()
+    assert wait_until_ready(driver, Selector(".last-price"), deadline=0.5) is None
+    assert time.monotonic() - start < 1.5
+
+
+if __name__ == "__main__":
+    test_returns_as_soon_as_text_appears()
+    test_selector_and_stop_loading()
+    test_network_idle_and_deadline()
+    print("✅ All readiness tests passed")
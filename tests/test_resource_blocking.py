@@ -0,0 +1,78 @@
+"""
+Test script for DevTools resource blocking in the driver factory
+Uses a fake driver that records CDP commands, so it runs without Chrome
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import driver_factory
+from src.driver_factory import apply_resource_blocking, blocked_url_patterns, enable_resource_blocking
+
+
+class FakeDriver:
+    """Records execute_cdp_cmd calls"""
+
+    def __init__(self):
+        self.commands = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.commands.append((cmd, params))
+        return {}
+
+
+def test_default_blocks_every_category():
+    """Images, fonts, media and tracker hosts are all blocked by default"""
+    patterns = blocked_url_patterns("https://www.grayscale.com/funds/grayscale-bitcoin-trust")
+    assert "*.png" in patterns and "*.woff2" in patterns
+    assert "*.mp4" in patterns and "*googletagmanager.com*" in patterns
+
+
+def test_domain_opt_out():
+    """A domain that opts out of a category gets it loaded, others stay blocked"""
+    original = driver_factory.RESOURCE_BLOCKING_OPT_OUT
+    driver_factory.RESOURCE_BLOCKING_OPT_OUT = {"example.com": {"images"}, "needs-all.example": {"all"}}
+    try:
+        patterns = blocked_url_patterns("https://sub.example.com/page")
+        assert "*.png" not in patterns and "*.woff2" in patterns
+        assert blocked_url_patterns("https://needs-all.example/") == []
+        assert "*.png" in blocked_url_patterns("https://other.example.org/")
+    finally:
+        driver_factory.RESOURCE_BLOCKING_OPT_OUT = original
+
+
+def test_blocking_updates_only_when_patterns_change():
+    """The blocked list is sent once and only re-sent for a domain with different opt-outs"""
+    original = driver_factory.RESOURCE_BLOCKING_OPT_OUT
+    driver_factory.RESOURCE_BLOCKING_OPT_OUT = {"example.com": {"fonts"}}
+    try:
+        driver = FakeDriver()
+        assert enable_resource_blocking(driver)
+        assert [cmd for cmd, _ in driver.commands] == ["Network.enable", "Network.setBlockedURLs"]
+
+        apply_resource_blocking(driver, "https://www.euronext.com/en/products/etfs/x")
+        assert len(driver.commands) == 2
+
+        apply_resource_blocking(driver, "https://www.example.com/fund")
+        assert len(driver.commands) == 3
+        assert "*.woff2" not in driver.commands[-1][1]["urls"]
+    finally:
+        driver_factory.RESOURCE_BLOCKING_OPT_OUT = original
+
+
+def test_drivers_without_blocking_are_untouched():
+    """apply_resource_blocking is a no-op for drivers created without block_resources"""
+    driver = FakeDriver()
+    apply_resource_blocking(driver, "https://www.example.com/fund")
+    apply_resource_blocking(None, "https://www.example.com/fund")
+    assert driver.commands == []
+
+
+if __name__ == "__main__":
+    test_default_blocks_every_category()
+    test_domain_opt_out()
+    test_blocking_updates_only_when_patterns_change()
+    test_drivers_without_blocking_are_untouched()
+    print("✅ All resource blocking tests passed")
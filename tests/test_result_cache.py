@@ -0,0 +1,120 @@
+"""
+Test script for the trading-day-aware result cache
+Writes caches to a temporary directory, so it runs offline
+"""
+
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta, timezone
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import excel_stock_updater
+from excel_stock_updater import cache_price_result
+from src.result_cache import DEFAULT_SESSION, INTRADAY_PRICE_TTL, ResultCache, exchange_session
+
+# Friday 2026-10-16, 10:00 UTC (12:00 in Frankfurt)
+FRIDAY_MORNING = datetime(2026, 10, 16, 10, 0, tzinfo=timezone.utc)
+
+BOERSE_URL = "https://www.boerse-frankfurt.de/etf/de000a27z304"
+NASDAQ_URL = "https://www.nasdaq.com/market-activity/etf/ibit"
+CLOSE_KEY = "closing price prev trading day"
+
+
+def test_price_expires_at_next_exchange_close():
+    """A price is valid until its exchange closes next, weekends skipped"""
+    cache = ResultCache(path=os.path.join(tempfile.gettempdir(), "no_such_results_cache.json"))
+    # Xetra closes 17:30 Frankfurt time = 15:30 UTC in October (CEST)
+    assert cache.expires_at("price", BOERSE_URL, FRIDAY_MORNING, CLOSE_KEY) == datetime(2026, 10, 16, 15, 30, tzinfo=timezone.utc)
+    # Fetched after Friday's close: valid until Monday's close
+    friday_evening = datetime(2026, 10, 16, 18, 0, tzinfo=timezone.utc)
+    assert cache.expires_at("price", BOERSE_URL, friday_evening, CLOSE_KEY) == datetime(2026, 10, 19, 15, 30, tzinfo=timezone.utc)
+    # New York closes 16:00 EDT = 20:00 UTC
+    assert cache.expires_at("price", NASDAQ_URL, FRIDAY_MORNING, "Previous Close") == datetime(2026, 10, 16, 20, 0, tzinfo=timezone.utc)
+    # Shares use a fixed TTL
+    assert cache.expires_at("shares", BOERSE_URL, FRIDAY_MORNING) == FRIDAY_MORNING + timedelta(hours=24)
+
+
+def test_intraday_prices_expire_quickly():
+    """Live quotes are only reused for a few minutes, never past the close"""
+    cache = ResultCache(path=os.path.join(tempfile.gettempdir(), "no_such_results_cache.json"))
+    for key in ("share price", "last traded price", "open", "ai extracted price", None):
+        assert cache.expires_at("price", NASDAQ_URL, FRIDAY_MORNING, key) == FRIDAY_MORNING + INTRADAY_PRICE_TTL
+    just_before_close = datetime(2026, 10, 16, 19, 55, tzinfo=timezone.utc)
+    assert cache.expires_at("price", NASDAQ_URL, just_before_close, "share price") == \
+        datetime(2026, 10, 16, 20, 0, tzinfo=timezone.utc)
+
+    cache.store("price", NASDAQ_URL, {"share price": 61.2}, now=FRIDAY_MORNING, value_key="share price")
+    assert cache.get("price", NASDAQ_URL, now=FRIDAY_MORNING + timedelta(minutes=5)) == {"share price": 61.2}
+    assert cache.get("price", NASDAQ_URL, now=FRIDAY_MORNING + timedelta(hours=5)) is None
+
+
+def test_only_valid_chosen_prices_are_cached():
+    """A row whose chosen price fails validation is extracted again next run"""
+    cache = ResultCache(path=os.path.join(tempfile.gettempdir(), "no_such_results_cache.json"))
+    original = excel_stock_updater.is_valid_share_price
+    excel_stock_updater.is_valid_share_price = lambda price, context="", url="": price != 100.0
+    try:
+        assert not cache_price_result(cache, BOERSE_URL, {CLOSE_KEY: 100.0})
+        assert not cache_price_result(cache, BOERSE_URL, {"error": "timeout"})
+        assert not cache_price_result(cache, BOERSE_URL, {"share price": "Error: cannot parse 'x'"})
+        assert cache.get("price", BOERSE_URL) is None
+        assert cache_price_result(cache, BOERSE_URL, {CLOSE_KEY: 24.51, "open": 24.0})
+    finally:
+        excel_stock_updater.is_valid_share_price = original
+    assert cache.get("price", BOERSE_URL) == {CLOSE_KEY: 24.51, "open": 24.0}
+
+
+def test_exchange_lookup():
+    assert exchange_session(BOERSE_URL).name == "Xetra"
+    assert exchange_session("https://www.nasdaq.com/european-market-activity/etn-etc/vbtc").name == "Nasdaq Stockholm"
+    assert exchange_session("https://www.cboe.com/au/equities/x").name == "ASX"
+    assert exchange_session("https://www.vaneck.com.au/etf/alternatives/vbtc/").name == "ASX"
+    assert exchange_session("https://qrasset.com.br/qbtc11/").name == "B3"
+    assert exchange_session("https://etfs.grayscale.com/gbtc") is DEFAULT_SESSION
+
+
+def test_only_unexpired_rows_are_fresh():
+    """Rows are reused until expiry and survive a reload from disk"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "results.json")
+        cache = ResultCache(path=path)
+        cache.store("price", BOERSE_URL, {CLOSE_KEY: 24.51}, now=FRIDAY_MORNING, value_key=CLOSE_KEY)
+        cache.store("shares", NASDAQ_URL, [{"outstanding_shares": "100"}, NASDAQ_URL], now=FRIDAY_MORNING)
+        cache.save(now=FRIDAY_MORNING)
+
+        reloaded = ResultCache(path=path)
+        rows_urls = {2: BOERSE_URL, 3: NASDAQ_URL, 4: "https://example.com/new"}
+        later_that_day = FRIDAY_MORNING + timedelta(hours=3)
+        assert reloaded.fresh_rows("price", rows_urls, now=later_that_day) == [
+            (2, BOERSE_URL, {CLOSE_KEY: 24.51}),
+        ]
+        assert reloaded.fresh_rows("shares", rows_urls, now=later_that_day) == [
+            (3, NASDAQ_URL, [{"outstanding_shares": "100"}, NASDAQ_URL]),
+        ]
+        after_close = FRIDAY_MORNING + timedelta(hours=6)
+        assert reloaded.fresh_rows("price", rows_urls, now=after_close) == []
+
+        # Expired entries are dropped when the cache is saved
+        reloaded.save(now=FRIDAY_MORNING + timedelta(days=2))
+        assert len(ResultCache(path=path)) == 0
+
+
+def test_unreadable_cache_starts_empty():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "results.json")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write('{"price": {"https://a.example": ')  # torn write
+        cache = ResultCache(path=path)
+        assert len(cache) == 0 and cache.get("price", "https://a.example") is None
+
+
+if __name__ == "__main__":
+    test_price_expires_at_next_exchange_close()
+    test_intraday_prices_expire_quickly()
+    test_only_valid_chosen_prices_are_cached()
+    test_exchange_lookup()
+    test_only_unexpired_rows_are_fresh()
+    test_unreadable_cache_starts_empty()
+    print("✅ All result cache tests passed")
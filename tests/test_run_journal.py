@@ -0,0 +1,92 @@
+"""
+Test script for the crash-safe run journal
+Writes journals to a temporary directory, so it runs offline
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.run_journal import RunJournal
+
+
+def test_resume_skips_journaled_rows():
+    """Rows finished before a crash are returned on resume and not re-run"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "journal.jsonl")
+        journal = RunJournal(path, "test")
+        journal.record(2, "https://a.example/x", {"price": 1.5})
+        journal.record(3, "https://b.example/y", [{"outstanding_shares": "100"}, "https://b.example/y"])
+        journal.close()  # crash: the run never finished
+
+        resumed = RunJournal(path, "test", resume=True)
+        rows_urls = {2: "https://a.example/x", 3: "https://b.example/y", 4: "https://c.example/z"}
+        done = resumed.completed(rows_urls)
+        resumed.close()
+
+    assert resumed.resumed and resumed.run_id == journal.run_id
+    assert done == [
+        (2, "https://a.example/x", {"price": 1.5}),
+        (3, "https://b.example/y", [{"outstanding_shares": "100"}, "https://b.example/y"]),
+    ]
+
+
+def test_changed_url_is_reprocessed():
+    """A row whose URL changed since the crash is not treated as done"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "journal.jsonl")
+        journal = RunJournal(path, "test")
+        journal.record(2, "https://a.example/old", {"price": 1.5})
+        journal.close()
+
+        resumed = RunJournal(path, "test", resume=True)
+        done = resumed.completed({2: "https://a.example/new"})
+        resumed.close()
+
+    assert done == []
+
+
+def test_finished_or_fresh_run_starts_over():
+    """A finished run is not resumed, and without --resume the journal is reset"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "journal.jsonl")
+        journal = RunJournal(path, "test")
+        journal.record(2, "https://a.example/x", {"price": 1.5})
+        journal.finish()
+
+        after_finish = RunJournal(path, "test", resume=True)
+        assert not after_finish.resumed
+        assert after_finish.completed({2: "https://a.example/x"}) == []
+        after_finish.record(2, "https://a.example/x", {"price": 1.5})
+        after_finish.close()
+
+        fresh = RunJournal(path, "test")
+        assert fresh.completed({2: "https://a.example/x"}) == []
+        fresh.close()
+
+
+def test_torn_last_line_is_ignored():
+    """A partial line left by a crash mid-write does not break resuming"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "journal.jsonl")
+        journal = RunJournal(path, "test")
+        journal.record(2, "https://a.example/x", {"price": 1.5})
+        journal.close()
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"event": "row", "row": 3, "url": "https://b.exa')
+
+        resumed = RunJournal(path, "test", resume=True)
+        done = resumed.completed({2: "https://a.example/x", 3: "https://b.example/y"})
+        resumed.close()
+
+    assert [row for row, _, _ in done] == [2]
+
+
+if __name__ == "__main__":
+    test_resume_skips_journaled_rows()
+    test_changed_url_is_reprocessed()
+    test_finished_or_fresh_run_starts_over()
+    test_torn_last_line_is_ignored()
+    print("✅ All run journal tests passed")
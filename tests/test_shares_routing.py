@@ -0,0 +1,55 @@
+"""
+Test script for the outstanding-shares tier routing
+Runs offline - checks which tiers are selected for different hosts
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import outstanding_shares_updater as shares
+from outstanding_shares_updater import route_shares_tiers, is_sixgroup_url
+
+
+def test_sixgroup_tier_only_for_six_hosts():
+    """The SIX Group tier is routed only for six-group.com URLs"""
+    six_url = "https://www.six-group.com/en/market-data/etp/etp-explorer/etp-detail.CH1146882316USD4.html#/"
+    assert is_sixgroup_url(six_url)
+    assert not is_sixgroup_url("https://www.example.com/?ref=six-group.com")
+
+    assert "sixgroup" in route_shares_tiers(six_url)
+    assert "sixgroup" not in route_shares_tiers("https://www.21shares.com/en-us/product/arkb")
+
+
+def test_custom_tier_only_with_registered_extractor():
+    """The custom tier is routed only when a domain extractor exists"""
+    if shares.extract_with_custom_function is None:
+        return
+    assert route_shares_tiers("https://valour.com/en/products/valour-bitcoin-zero")[0] == "custom"
+    assert "custom" not in route_shares_tiers("https://www.unknown-issuer.example/fund")
+    assert "traditional" in route_shares_tiers("https://www.unknown-issuer.example/fund")
+
+
+def test_skipped_tier_is_not_called():
+    """A non-SIX URL never reaches the SIX Group extractor"""
+    calls = []
+    original_six = shares.extract_sixgroup_shares
+    original_traditional = shares.extract_outstanding_shares
+    shares.extract_sixgroup_shares = lambda driver, url: calls.append("sixgroup") or {"error": "x"}
+    shares.extract_outstanding_shares = lambda driver, url, snapshot=None: {"outstanding_shares": "1,000,000"}
+    try:
+        result = shares.extract_outstanding_shares_with_ai_fallback(None, "https://www.unknown-issuer.example/fund")
+    finally:
+        shares.extract_sixgroup_shares = original_six
+        shares.extract_outstanding_shares = original_traditional
+
+    assert result["method"] == "traditional"
+    assert calls == []
+
+
+if __name__ == "__main__":
+    test_sixgroup_tier_only_for_six_hosts()
+    test_custom_tier_only_with_registered_extractor()
+    test_skipped_tier_is_not_called()
+    print("✅ All shares routing tests passed")
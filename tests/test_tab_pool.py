@@ -0,0 +1,254 @@
+"""
+Tests for src.tab_pool: several workers driving tabs of one browser.
+
+Uses a fake WebDriver that keeps a URL per window handle and takes a while to
+"load" pages navigated via JavaScript, so no Chrome is needed.
+"""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium.webdriver.remote.webelement import WebElement
+
+import src.tab_pool as tab_pool
+from src.tab_pool import TabBrowser, TabElement
+from src.parallel_runner import run_rows
+
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        if handle not in self.driver.urls:
+            raise RuntimeError("no such window")
+        self.driver.current_window_handle = handle
+        self.driver.switches += 1
+
+    def new_window(self, kind):
+        handle = f"tab-{len(self.driver.urls) + 1}"
+        self.driver.urls[handle] = "about:blank"
+        self.driver.current_window_handle = handle
+
+
+class FakeDriver:
+    load_seconds = 0.3
+
+    def __init__(self):
+        self.urls = {"tab-1": "about:blank"}
+        self.current_window_handle = "tab-1"
+        self.switch_to = FakeSwitchTo(self)
+        self.switches = 0
+        self.navigations = {}  # handle -> (token, url, finished_at)
+        self.quit_called = False
+
+    @property
+    def window_handles(self):
+        if self.quit_called:
+            raise RuntimeError("invalid session id")
+        return list(self.urls)
+
+    @property
+    def current_url(self):
+        return self.urls[self.current_window_handle]
+
+    def get(self, url):
+        self.urls[self.current_window_handle] = url
+
+    def execute_script(self, script, *args):
+        handle = self.current_window_handle
+        if "window.location.reload" in script:
+            (token,) = args
+            self.navigations[handle] = (token, self.urls[handle], time.monotonic() + self.load_seconds)
+            return None
+        if "window.location.href" in script:
+            token, url = args
+            self.navigations[handle] = (token, url, time.monotonic() + self.load_seconds)
+            return None
+        if "__tabNavigation" in script:
+            token, url, finished_at = self.navigations[handle]
+            if time.monotonic() < finished_at:
+                return "old"
+            self.urls[handle] = url
+            return "complete"
+        raise AssertionError(f"unexpected script {script}")
+
+    def find_element(self, by, value):
+        return WebElement(self, f"{self.current_window_handle}:{value}")
+
+    def close(self):
+        del self.urls[self.current_window_handle]
+
+    def quit(self):
+        self.quit_called = True
+
+
+def _browser(drivers):
+    def create():
+        driver = FakeDriver()
+        drivers.append(driver)
+        return driver
+    return TabBrowser(create, page_load_timeout=5)
+
+
+def test_tabs_share_one_browser_and_switch_per_command():
+    drivers = []
+    browser = _browser(drivers)
+    first, second = browser.new_tab(), browser.new_tab()
+    assert len(drivers) == 1
+    assert browser.tabs == {"tab-1", "tab-2"}
+
+    first.get("https://a.example/page")
+    second.get("https://b.example/page")
+    assert first.current_url == "https://a.example/page"
+    assert second.current_url == "https://b.example/page"
+    assert first.window_handles == ["tab-1"]
+
+
+def test_get_waits_outside_the_lock():
+    tab_pool.LOAD_POLL_INTERVAL = 0.02
+    drivers = []
+    browser = _browser(drivers)
+    tabs = [browser.new_tab() for _ in range(3)]
+
+    start = time.monotonic()
+    threads = [threading.Thread(target=tab.get, args=(f"https://site{i}.example/",))
+               for i, tab in enumerate(tabs)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - start
+
+    # Three 0.3s loads overlap instead of running one after another
+    assert elapsed < 0.75, elapsed
+    assert [tab.current_url for tab in tabs] == [f"https://site{i}.example/" for i in range(3)]
+
+
+def test_elements_run_in_their_tab():
+    drivers = []
+    browser = _browser(drivers)
+    first, second = browser.new_tab(), browser.new_tab()
+    element = first.find_element("css selector", "h1")
+    assert isinstance(element, TabElement)
+    assert element.id == "tab-1:h1"
+
+    second.current_url  # makes tab-2 current
+    switches = drivers[0].switches
+    element.id
+    assert drivers[0].current_window_handle == "tab-1"
+    assert drivers[0].switches == switches + 1
+
+
+def test_quit_closes_tab_and_last_tab_quits_browser():
+    drivers = []
+    browser = _browser(drivers)
+    first, second = browser.new_tab(), browser.new_tab()
+    first.quit()
+    assert "tab-1" not in drivers[0].urls
+    assert not drivers[0].quit_called
+
+    second.quit()
+    assert drivers[0].quit_called
+    assert browser.driver is None
+
+    # The next tab starts a fresh browser
+    browser.new_tab()
+    assert len(drivers) == 2
+    browser.close()
+    assert drivers[1].quit_called
+
+
+def test_restarted_browser_invalidates_old_tabs():
+    drivers = []
+    browser = _browser(drivers)
+    old_tab = browser.new_tab()
+    drivers[0].quit_called = True  # browser crashed
+    browser.new_tab()
+    assert len(drivers) == 2
+    try:
+        old_tab.current_url
+        assert False, "tab of the crashed browser should fail"
+    except RuntimeError as e:
+        assert "invalid session id" in str(e)
+
+
+def test_prefetched_load_is_not_repeated():
+    tab_pool.LOAD_POLL_INTERVAL = 0.02
+    drivers = []
+    browser = _browser(drivers)
+    tab = browser.new_tab()
+    tab.prefetch("https://a.example/page")
+    token = drivers[0].navigations["tab-1"][0]
+    time.sleep(FakeDriver.load_seconds)
+
+    start = time.monotonic()
+    tab.get("https://a.example/page")
+    assert time.monotonic() - start < 0.1
+    assert drivers[0].navigations["tab-1"][0] == token
+    assert tab.current_url == "https://a.example/page"
+
+    # Another URL navigates as usual
+    tab.prefetch("https://b.example/page")
+    tab.get("https://c.example/page")
+    assert tab.current_url == "https://c.example/page"
+
+
+def test_same_url_reloads_and_waits():
+    """Navigating to the URL already loaded reloads the page and waits for the new document"""
+    tab_pool.LOAD_POLL_INTERVAL = 0.02
+    drivers = []
+    browser = _browser(drivers)
+    tab = browser.new_tab()
+    tab.get("https://a.example/page")
+    first_token = drivers[0].navigations["tab-1"][0]
+
+    start = time.monotonic()
+    tab.get("https://a.example/page")
+    assert time.monotonic() - start >= FakeDriver.load_seconds
+    assert drivers[0].navigations["tab-1"][0] != first_token
+    assert tab.current_url == "https://a.example/page"
+
+    # A fragment-only change still does not wait for a document
+    start = time.monotonic()
+    tab.get("https://a.example/page#/details")
+    assert time.monotonic() - start < 0.1
+    assert tab.current_url == "https://a.example/page#/details"
+
+
+def test_run_rows_with_tabs():
+    tab_pool.LOAD_POLL_INTERVAL = 0.02
+    FakeDriver.load_seconds = 0.05
+    drivers = []
+    browser = _browser(drivers)
+    rows_urls = {row: f"https://site{row}.example/" for row in range(2, 10)}
+
+    def process_row(driver, row, url):
+        driver.get(url)
+        return {"url": driver.current_url}
+
+    try:
+        results = {row: data for row, url, data in
+                   run_rows(rows_urls, process_row, browser.new_tab, workers=3, domain_delay=0)}
+    finally:
+        FakeDriver.load_seconds = 0.3
+    assert len(drivers) == 1
+    assert results == {row: {"url": url} for row, url in rows_urls.items()}
+    # Workers closed their tabs at the end, which quit the browser
+    assert drivers[0].quit_called
+
+
+if __name__ == "__main__":
+    test_tabs_share_one_browser_and_switch_per_command()
+    test_get_waits_outside_the_lock()
+    test_elements_run_in_their_tab()
+    test_quit_closes_tab_and_last_tab_quits_browser()
+    test_restarted_browser_invalidates_old_tabs()
+    test_prefetched_load_is_not_repeated()
+    test_same_url_reloads_and_waits()
+    test_run_rows_with_tabs()
+    print("✅ All tab pool tests passed")
@@ -0,0 +1,88 @@
+"""
+Test script for the shared VanEck browser
+The browser factory and the page extraction are replaced by fakes, so it runs without Chrome
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import excel_stock_updater as prices
+
+
+class FakeDriver:
+    def __init__(self):
+        self.quit_called = False
+
+    @property
+    def window_handles(self):
+        return ["main"]
+
+    def quit(self):
+        self.quit_called = True
+
+
+def _with_fakes(extract):
+    created = []
+    original_create = prices.create_vaneck_driver
+    original_extract = prices._extract_vaneck_price
+
+    def fake_create(headless=None):
+        driver = FakeDriver()
+        created.append(driver)
+        return driver
+
+    prices.create_vaneck_driver = fake_create
+    prices._extract_vaneck_price = extract
+
+    def restore():
+        prices.close_vaneck_driver()
+        prices.create_vaneck_driver = original_create
+        prices._extract_vaneck_price = original_extract
+
+    return created, restore
+
+
+def test_browser_is_created_once_and_closed_at_run_end():
+    """VanEck rows share one lazily started browser that close_vaneck_driver() quits"""
+    used = []
+    created, restore = _with_fakes(lambda driver, url: used.append(driver) or 25.5)
+    try:
+        assert created == []
+        for n in range(3):
+            assert prices.get_vaneck_price(None, f"https://www.vaneck.com/de/en/investments/etn-{n}/") == 25.5
+        assert len(created) == 1
+        assert used == [created[0]] * 3
+
+        prices.close_vaneck_driver()
+        assert created[0].quit_called
+        prices.get_vaneck_price(None, "https://www.vaneck.com/de/en/investments/etn-4/")
+        assert len(created) == 2
+    finally:
+        restore()
+
+
+def test_crashed_browser_is_replaced():
+    """A browser crash on one VanEck row starts a fresh browser for the next"""
+    def extract(driver, url):
+        if "crash" in url:
+            raise ValueError("Error extracting VanEck last traded price: invalid session id")
+        return 30.0
+
+    created, restore = _with_fakes(extract)
+    try:
+        try:
+            prices.get_vaneck_price(None, "https://www.vaneck.com/crash/")
+        except ValueError:
+            pass
+        assert prices.get_vaneck_price(None, "https://www.vaneck.com/ok/") == 30.0
+        assert len(created) == 2 and created[0].quit_called
+    finally:
+        restore()
+
+
+if __name__ == "__main__":
+    test_browser_is_created_once_and_closed_at_run_end()
+    test_crashed_browser_is_replaced()
+    print("✅ All VanEck browser tests passed")
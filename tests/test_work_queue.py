@@ -0,0 +1,171 @@
+"""
+Test script for the shared work queue used by distributed_updater.py
+Uses a temporary SQLite file and local worker processes, so it runs offline
+"""
+
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.work_queue import WorkQueue
+
+ROWS = {row: f"https://issuer{row % 3}.example/fund/{row}" for row in range(2, 22)}
+
+
+def _queue_worker(path, run_id, name):
+    """Worker process: lease rows until none are left and post a fake price"""
+    work_queue = WorkQueue(path)
+    while True:
+        job = work_queue.lease(run_id, name, visibility_timeout=30)
+        if job is None:
+            return
+        work_queue.complete(run_id, job["row"], name, {"share price": float(job["row"]), "worker": name})
+
+
+def test_lease_complete_and_collect():
+    """A leased row is not handed out twice, and each result is collected once"""
+    with tempfile.TemporaryDirectory() as tmp:
+        work_queue = WorkQueue(os.path.join(tmp, "queue.sqlite"))
+        run_id = work_queue.create_run("price", {2: "https://a.example/x", 3: "https://b.example/y"},
+                                       payloads={3: {"fallback_url": "https://b.example/z"}})
+        assert work_queue.open_run() == (run_id, "price")
+
+        first = work_queue.lease(run_id, "w1")
+        second = work_queue.lease(run_id, "w2")
+        assert {first["row"], second["row"]} == {2, 3}
+        assert work_queue.lease(run_id, "w3") is None
+        assert second["payload"] == {"fallback_url": "https://b.example/z"}
+
+        assert work_queue.complete(run_id, first["row"], "w1", {"share price": 1.0})
+        assert work_queue.collect(run_id) == [(first["row"], first["url"], {"share price": 1.0})]
+        assert work_queue.collect(run_id) == []
+        assert not work_queue.is_finished(run_id)
+
+        work_queue.complete(run_id, second["row"], "w2", {"share price": 2.0})
+        assert work_queue.is_finished(run_id)
+        work_queue.close_run(run_id)
+        assert work_queue.open_run() == (None, None)
+
+
+def test_expired_lease_is_retried_then_failed():
+    """A row whose worker vanished is leased again, and failed after max_attempts"""
+    with tempfile.TemporaryDirectory() as tmp:
+        work_queue = WorkQueue(os.path.join(tmp, "queue.sqlite"))
+        run_id = work_queue.create_run("shares", {2: "https://a.example/x"}, max_attempts=2)
+
+        assert work_queue.lease(run_id, "w1", visibility_timeout=0.05)["attempt"] == 1
+        time.sleep(0.1)
+        assert work_queue.lease(run_id, "w2", visibility_timeout=0.05)["attempt"] == 2
+        time.sleep(0.1)
+        assert work_queue.lease(run_id, "w3") is None
+        assert work_queue.is_finished(run_id)
+        [(row, _, result)] = work_queue.collect(run_id)
+        assert row == 2 and "Lease expired" in result["error"]
+
+
+def test_failed_attempts_go_back_to_the_queue():
+    """fail() requeues a row until its attempts are used up"""
+    with tempfile.TemporaryDirectory() as tmp:
+        work_queue = WorkQueue(os.path.join(tmp, "queue.sqlite"))
+        run_id = work_queue.create_run("price", {2: "https://a.example/x"}, max_attempts=2)
+
+        work_queue.fail(run_id, work_queue.lease(run_id, "w1")["row"], "w1", "Worker error: boom")
+        job = work_queue.lease(run_id, "w1")
+        assert job["attempt"] == 2
+        work_queue.fail(run_id, job["row"], "w1", "Worker error: boom again")
+        assert work_queue.collect(run_id) == [(2, "https://a.example/x", {"error": "Worker error: boom again"})]
+
+
+def test_several_worker_processes_split_a_run():
+    """Worker processes on one box share the rows without duplicates or losses"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "queue.sqlite")
+        work_queue = WorkQueue(path)
+        run_id = work_queue.create_run("price", ROWS)
+
+        processes = [multiprocessing.Process(target=_queue_worker, args=(path, run_id, f"w{i}"))
+                     for i in range(3)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=60)
+
+        results = work_queue.collect(run_id)
+        assert sorted(row for row, _, _ in results) == sorted(ROWS)
+        assert all(result["share price"] == float(row) for row, _, result in results)
+        assert work_queue.is_finished(run_id)
+
+
+def test_coordinator_cell_updates():
+    """The coordinator turns each mode's result into the right cell values"""
+    import distributed_updater
+
+    price_cell = distributed_updater.choose_price_output({"share price": 12.5})[0]
+    assert distributed_updater.cell_updates("price", {"share price": 12.5}) == [("L", price_cell)]
+    assert distributed_updater.cell_updates("shares", [{"outstanding_shares": "1000"}, "https://a.example"]) == \
+        [("M", "1000")]
+    assert distributed_updater.cell_updates("combined", {"error": "Lease expired"}) == \
+        [("L", "Error: Lease expired"), ("M", "Error: Lease expired")]
+
+
+def test_pdf_price_rows_written_again_after_attach():
+    """PDF rows of a price run go through the queue, so an attached coordinator writes them too"""
+    import threading
+
+    from openpyxl import Workbook, load_workbook
+
+    import distributed_updater
+
+    original_paths = distributed_updater.ORIGINAL_WORKBOOK_PATH, distributed_updater.WORKBOOK_PATH
+    with tempfile.TemporaryDirectory() as tmp:
+        queue_path = os.path.join(tmp, "queue.sqlite")
+        distributed_updater.ORIGINAL_WORKBOOK_PATH = os.path.join(tmp, "Custodians.xlsx")
+        distributed_updater.WORKBOOK_PATH = os.path.join(tmp, "Custodians_Results.xlsx")
+        wb = Workbook()
+        ws = wb.active
+        ws.title = distributed_updater.SHEET_NAME
+        ws["P2"] = "https://issuer.example/fund"
+        ws["P3"] = "https://issuer.example/factsheet.pdf"
+        wb.save(distributed_updater.ORIGINAL_WORKBOOK_PATH)
+
+        runs = []
+
+        def worker():
+            work_queue = WorkQueue(queue_path)
+            while True:
+                run_id, _ = work_queue.open_run()
+                job = run_id and work_queue.lease(run_id, "w1")
+                if job:
+                    work_queue.complete(run_id, job["row"], "w1", {"share price": 12.5})
+                    runs.append(run_id)
+                    return
+                time.sleep(0.01)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        try:
+            distributed_updater.run_coordinator(mode="price", queue_path=queue_path, poll_interval=0.01)
+            thread.join()
+
+            # A restarted coordinator starts again from a workbook without results
+            wb.save(distributed_updater.ORIGINAL_WORKBOOK_PATH)
+            distributed_updater.run_coordinator(queue_path=queue_path, attach=runs[0], poll_interval=0.01)
+            ws = load_workbook(distributed_updater.WORKBOOK_PATH)[distributed_updater.SHEET_NAME]
+        finally:
+            distributed_updater.ORIGINAL_WORKBOOK_PATH, distributed_updater.WORKBOOK_PATH = original_paths
+        assert ws["L3"].value == "Error: PDF file - cannot process"
+        assert ws["L2"].value == distributed_updater.choose_price_output({"share price": 12.5})[0]
+
+
+if __name__ == "__main__":
+    test_lease_complete_and_collect()
+    test_expired_lease_is_retried_then_failed()
+    test_failed_attempts_go_back_to_the_queue()
+    test_several_worker_processes_split_a_run()
+    test_coordinator_cell_updates()
+    test_pdf_price_rows_written_again_after_attach()
+    print("✅ All work queue tests passed")
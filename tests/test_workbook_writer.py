@@ -0,0 +1,128 @@
+"""
+Test script for the batched background workbook writer
+Saves small workbooks to a temporary directory, so it runs offline
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from openpyxl import Workbook, load_workbook
+
+from src.workbook_writer import WorkbookWriter, timestamped_alt_path
+
+
+class CountingWorkbook:
+    """Wraps a Workbook and counts save() calls"""
+
+    def __init__(self):
+        self.wb = Workbook()
+        self.wb.active.title = "Sheet"
+        self.saved_paths = []
+
+    def __getitem__(self, name):
+        return self.wb[name]
+
+    def save(self, path):
+        self.saved_paths.append(path)
+        self.wb.save(path)
+
+
+def test_saves_on_row_cadence_and_close():
+    """Updates are batched: one save per flush_rows rows plus one at close"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "results.xlsx")
+        wb = CountingWorkbook()
+        writer = WorkbookWriter(wb, path, flush_rows=10, flush_seconds=0).start()
+        for row in range(2, 27):
+            writer.put("Sheet", f"M{row}", row * 100)
+            writer.row_done()
+        writer.put("Sheet", "M1", "header")
+        assert writer.close() == path
+
+        assert len(wb.saved_paths) == 3
+        ws = load_workbook(path)["Sheet"]
+        assert ws["M1"].value == "header"
+        assert ws["M26"].value == 2600
+
+
+def test_custom_setter_and_flush():
+    """Cells go through the given setter, and flush() saves immediately"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "results.xlsx")
+        wb = CountingWorkbook()
+        seen = []
+
+        def setter(cell, value):
+            seen.append(cell.coordinate)
+            cell.value = value
+
+        writer = WorkbookWriter(wb, path, set_value=setter, flush_rows=0, flush_seconds=0).start()
+        writer.put("Sheet", "L5", 1.23)
+        writer.flush()
+        assert load_workbook(path)["Sheet"]["L5"].value == 1.23
+        writer.close()
+
+    assert seen == ["L5"]
+    assert len(wb.saved_paths) == 1
+
+
+def test_locked_file_falls_back_to_alternative_path():
+    """If the results file is locked, saving continues to the alternative path"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "results.xlsx")
+        alt_path = os.path.join(tmp, "results_alt.xlsx")
+        wb = CountingWorkbook()
+        original_save = wb.save
+
+        def locked_save(target):
+            if target == path:
+                raise PermissionError("locked")
+            original_save(target)
+
+        wb.save = locked_save
+        writer = WorkbookWriter(wb, path, flush_rows=0, flush_seconds=0,
+                                alt_path_factory=lambda: alt_path).start()
+        writer.put("Sheet", "M2", "1,000")
+        assert writer.close() == alt_path
+        assert load_workbook(alt_path)["Sheet"]["M2"].value == "1,000"
+
+
+def test_saves_on_time_cadence_under_steady_updates():
+    """A backlog of updates still saves once flush_seconds have passed"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "results.xlsx")
+        wb = CountingWorkbook()
+
+        def slow_setter(cell, value):
+            time.sleep(0.005)
+            cell.value = value
+
+        writer = WorkbookWriter(wb, path, set_value=slow_setter, flush_rows=1000, flush_seconds=0.05)
+        # The queue never runs empty while these are applied, so get() never times out
+        for row in range(2, 62):
+            writer.put("Sheet", f"M{row}", row)
+            writer.row_done()
+        writer.start().close()
+
+        # At least one save on the time cadence before the final save at close
+        assert len(wb.saved_paths) >= 2
+        assert load_workbook(path)["Sheet"]["M61"].value == 61
+
+
+def test_alt_path_is_next_to_results_file():
+    alt_path = timestamped_alt_path(os.path.join("data", "Custodians_Results.xlsx"))()
+    assert os.path.dirname(alt_path) == "data"
+    assert os.path.basename(alt_path).startswith("Custodians_Results_") and alt_path.endswith(".xlsx")
+
+
+if __name__ == "__main__":
+    test_saves_on_row_cadence_and_close()
+    test_custom_setter_and_flush()
+    test_locked_file_falls_back_to_alternative_path()
+    test_saves_on_time_cadence_under_steady_updates()
+    test_alt_path_is_next_to_results_file()
+    print("✅ All workbook writer tests passed")